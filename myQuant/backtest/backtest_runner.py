@@ -28,14 +28,15 @@ import inspect
 import json
 from datetime import datetime, time
 from types import MappingProxyType
-from typing import Tuple, Any, Dict
+from typing import Tuple, Any, Dict, List
+import numpy as np
 import logging
 import importlib
 import inspect
 import os
 import pandas as pd
 
-from ..utils.logger import setup_from_config, HighPerfLogger
+from ..utils.logger import setup_from_config, HighPerfLogger, get_tracer, TRACE_SIGNAL, TRACE_TRADE, TRACE_STRATEGY_EXIT
 import logging
 # Module-level logger for utility functions only
 logger = logging.getLogger(__name__)
@@ -46,6 +47,12 @@ from ..utils.time_utils import ensure_tz_aware, is_within_session, apply_buffer_
 # Data loader used by the centralized loader / runner
 from ..utils.simple_loader import load_data_simple
 
+# Checkpoint/resume for long runs
+from ..utils.checkpoint import CheckpointManager, make_run_key
+
+# Persistent result cache (identical config + data -> stored trades)
+from ..utils.result_cache import ResultCache, make_cache_key
+
 # Position manager used by the runner
 from ..core.position_manager import PositionManager
 
@@ -90,7 +97,7 @@ def get_strategy(config: dict):
 
     Hard-coded to use researchStrategy for backtesting.
     """
-    strat_mod = importlib.import_module("core.researchStrategy")
+    strat_mod = importlib.import_module("..core.researchStrategy", __package__)
     
     # FIXED: Maintain consistent nested structure, no more flattening
     logger.info("NESTED CONFIG: Using consistent nested configuration structure")
@@ -130,6 +137,12 @@ class BacktestRunner:
         # Create strict config accessor (will raise KeyError on missing keys)
         from ..utils.config_helper import ConfigAccessor
         self.config_accessor = ConfigAccessor(self.config)
+
+        # Fail fast on an unknown diagnostics mode (before any data is loaded)
+        self.diagnostics_mode = self.config_accessor.get_backtest_param('diagnostics_mode')
+        if self.diagnostics_mode not in DIAGNOSTICS_MODES:
+            raise ValueError(f"backtest.diagnostics_mode must be one of {DIAGNOSTICS_MODES}, "
+                             f"got {self.diagnostics_mode!r}")
         
         # Use performance logger for initialization messages
         self.perf_logger.session_start(f"BacktestRunner initialized")
@@ -163,31 +176,48 @@ class BacktestRunner:
         try:
             self.perf_logger.session_start("Starting backtest run")
             
-            # Prepare data
-            self._prepare_data()
+            # Identical config on identical data: rebuild results from stored trades
+            cache = ResultCache.from_config(self.config) if self.data_path else None
+            cache_key = make_cache_key('backtest', self.config, self.data_path) if cache else None
+            cached = cache.get(cache_key) if cache else None
             
-            # Create strategy and position manager with callback
-            self.strategy = ModularIntradayStrategy(self.config)
-            self.position_manager = PositionManager(self.config, strategy_callback=self.strategy.on_position_exit)
-            
-            # Run backtest logic and get trades/performance
-            trades_df, performance = self._run_backtest_logic()
+            if cached is not None:
+                self.perf_logger.session_start(f"Result cache hit: reusing {len(cached['trades'])} trades")
+                initial_capital = cached['initial_capital']
+                trade_records = cached['trades']
+            else:
+                # Prepare data
+                self._prepare_data()
+                
+                # Create strategy and position manager with callback
+                self.strategy = ModularIntradayStrategy(self.config)
+                self.position_manager = PositionManager(self.config, strategy_callback=self.strategy.on_position_exit)
+                
+                # Run backtest logic and get trades/performance
+                trades_df, performance = self._run_backtest_logic()
+                
+                initial_capital = self.position_manager.initial_capital
+                trade_records = []
+                if not trades_df.empty:
+                    for _, trade in trades_df.iterrows():
+                        trade_records.append({
+                            'entry_time': trade['entry_time'],
+                            'exit_time': trade['exit_time'],
+                            'entry_price': trade['entry_price'],
+                            'exit_price': trade['exit_price'],
+                            'quantity': trade['quantity'],
+                            'pnl': trade['net_pnl'],
+                            'commission': trade['commission'],
+                            'exit_reason': trade['exit_reason'],
+                        })
+                if cache is not None:
+                    cache.put(cache_key, {'initial_capital': initial_capital, 'trades': trade_records})
             
             # --- FIX: Populate Results with trades from trades_df ---
-            self.results = BacktestResults(self.position_manager.initial_capital)
+            self.results = BacktestResults(initial_capital)
             self.results.set_config(self.config)  # Pass config for additional info
-            if not trades_df.empty:
-                for _, trade in trades_df.iterrows():
-                    self.results.add_trade({
-                        'entry_time': trade['entry_time'],
-                        'exit_time': trade['exit_time'],
-                        'entry_price': trade['entry_price'],
-                        'exit_price': trade['exit_price'],
-                        'quantity': trade['quantity'],
-                        'pnl': trade['net_pnl'],
-                        'commission': trade['commission'],
-                        'exit_reason': trade['exit_reason'],
-                    })
+            for trade_record in trade_records:
+                self.results.add_trade(trade_record)
             # --- END FIX ---
             
             # Now export results as before
@@ -266,36 +296,22 @@ class BacktestRunner:
         # Initialize PositionManager with nested config (strategy callback not needed for this use case)
         position_manager = PositionManager(config)
         
+        # Diagnostics are computed lazily according to backtest.diagnostics_mode
+        diagnostics_mode = self.diagnostics_mode
+        
         # Skip data loading if df_normalized is provided
         df_normalized = self.data
         if df_normalized is None:
             logger.info("Loading data with centralized loader...")
-            df_normalized, quality_report = load_and_normalize_data(self.data_path, process_as_ticks=True)
+            df_normalized, quality_report = load_and_normalize_data(
+                self.data_path, process_as_ticks=True, diagnostics_mode=diagnostics_mode)
             logger.info(f"Loaded and normalized data. Shape: {df_normalized.shape}. Time range: {df_normalized.index.min()} to {df_normalized.index.max()}")
             if df_normalized.empty:
                 logger.error("CRITICAL: DataFrame is empty after normalization. Cannot proceed.")
                 return pd.DataFrame(), position_manager.get_performance_summary()
         else:
             # Create simple quality report for pre-loaded data
-            total_rows = len(df_normalized)
-            sample_indices = []
-            for chunk_start in range(0, total_rows, 1000):
-                chunk_end = min(chunk_start + 1000, total_rows)
-                if chunk_end - chunk_start >= 5:
-                    step = (chunk_end - chunk_start) // 5
-                    chunk_sample = [chunk_start + i * step for i in range(5)]
-                else:
-                    chunk_sample = list(range(chunk_start, chunk_end))
-                sample_indices.extend(chunk_sample)
-    
-        # Create quality report WITH sample_indices
-        quality_report = type('SimpleQualityReport', (), {
-            'total_rows': len(df_normalized),
-            'rows_processed': len(df_normalized),
-            'rows_dropped': 0,
-            'issues_found': {},
-            'sample_indices': sample_indices  # Add this critical field
-        })
+            quality_report = _build_quality_report(df_normalized, diagnostics_mode)
 
         # Get session configuration
         session_config = config['session']
@@ -316,76 +332,7 @@ class BacktestRunner:
         logger.info(f"Indicators calculated successfully. DataFrame shape: {df_with_indicators.shape}")
         logger.info("=== INCREMENTAL PROCESSING COMPLETE ===")
         
-        if hasattr(quality_report, 'sample_indices'):
-            logger.info("=" * 80)
-            logger.info("STAGE 3: AFTER INDICATOR CALCULATION (Same Rows)")
-            logger.info("=" * 80)
-            
-            for i, idx in enumerate(quality_report.sample_indices[:25]):
-                if idx < len(df_with_indicators):
-                    row_data = df_with_indicators.iloc[idx]
-                    
-                    # Build indicator summary string
-                    indicators = []
-                    if 'fast_ema' in row_data and not pd.isna(row_data['fast_ema']):
-                        indicators.append(f"FastEMA={row_data['fast_ema']:.3f}")
-                    if 'slow_ema' in row_data and not pd.isna(row_data['slow_ema']):
-                        indicators.append(f"SlowEMA={row_data['slow_ema']:.3f}")
-                    if 'vwap' in row_data and not pd.isna(row_data['vwap']):
-                        indicators.append(f"VWAP={row_data['vwap']:.3f}")
-                    if 'macd' in row_data and not pd.isna(row_data['macd']):
-                        indicators.append(f"MACD={row_data['macd']:.4f}")
-                    if 'rsi' in row_data and not pd.isna(row_data['rsi']):
-                        indicators.append(f"RSI={row_data['rsi']:.1f}")
-                    
-                    indicator_str = ", ".join(indicators[:4]) if indicators else "No indicators"
-                    
-                    # Signal status
-                    signals = []
-                    if 'ema_bullish' in row_data:
-                        signals.append(f"EMA_Bull={row_data['ema_bullish']}")
-                    if 'vwap_bullish' in row_data:
-                        signals.append(f"VWAP_Bull={row_data['vwap_bullish']}")
-                    
-                    signal_str = ", ".join(signals) if signals else "No signals"
-                    
-                    logger.info(f"Ind  Row {idx:6d} (Sample {i+1:2d}): "
-                               f"Time={row_data.name}, "
-                               f"Close={row_data.get('close', 'N/A'):8.2f}, "
-                               f"[{indicator_str}], Signals=[{signal_str}]")
-        
-        # Log final indicator status for verification
-        logger.info("Indicators calculated. Final 5 rows:")
-        # Dynamically build column list based on what's available
-        log_columns = get_available_indicator_columns(df_with_indicators)
-        if len(log_columns) > 1:  # More than just 'close'
-            logger.info(f"\n{df_with_indicators[log_columns].tail(5).to_string()}")
-        else:
-            # Use safe column selection for fallback logging
-            fallback_columns = safe_column_selection(df_with_indicators, ['close', 'volume'])
-            logger.info(f"\n{df_with_indicators[fallback_columns].tail(5).to_string()}")
-
-        # Quick EMA diagnostic
-        if 'fast_ema' in df_with_indicators.columns and 'slow_ema' in df_with_indicators.columns:
-            fast_above_slow = (df_with_indicators['fast_ema'] > df_with_indicators['slow_ema']).sum()
-            total_rows = len(df_with_indicators)
-            logger.info(f"EMA DIAGNOSTIC: {fast_above_slow}/{total_rows} rows have fast > slow ({fast_above_slow/total_rows*100:.1f}%)")
-        
-        # VWAP diagnostics (only if VWAP is enabled)
-        if 'vwap' in df_with_indicators.columns:
-            above_vwap = (df_with_indicators['close'] > df_with_indicators['vwap']).sum()
-            logger.info(f"VWAP DIAGNOSTIC: {above_vwap}/{total_rows} rows have price > VWAP ({above_vwap/total_rows*100:.1f}%)")
-        
-        # MACD diagnostics (only if MACD is enabled)
-        if 'macd' in df_with_indicators.columns and 'macd_signal' in df_with_indicators.columns:
-            macd_bullish = (df_with_indicators['macd'] > df_with_indicators['macd_signal']).sum()
-            logger.info(f"MACD DIAGNOSTIC: {macd_bullish}/{total_rows} rows have MACD > Signal ({macd_bullish/total_rows*100:.1f}%)")
-        
-        # Show sample of ALL available indicators
-        available_for_sample = safe_column_selection(df_with_indicators, ['fast_ema', 'slow_ema', 'vwap', 'macd', 'macd_signal', 'rsi', 'htf_ema'])
-        if available_for_sample:
-            sample = df_with_indicators[available_for_sample].dropna().head(10)
-            logger.info(f"Sample indicator values:\n{sample.to_string()}")
+        _log_indicator_diagnostics(df_with_indicators, quality_report.sample_indices, diagnostics_mode)
 
         # Backtest execution loop
         logger.info("Starting backtest execution...")
@@ -396,8 +343,41 @@ class BacktestRunner:
         signals_detected = 0
         entries_attempted = 0
         trades_executed = 0
-         
-        for timestamp, row in df_with_indicators.iterrows():
+
+        # Checkpoint/resume: snapshot cursor + strategy + PositionManager every interval_ticks rows
+        get_checkpoint_param = self.config_accessor.get_checkpoint_param
+        checkpoint_manager = None
+        checkpoint_interval = get_checkpoint_param('interval_ticks')
+        checkpoint_enabled = get_checkpoint_param('enabled')
+        resume = get_checkpoint_param('resume')
+        resume_cursor = 0
+        if checkpoint_enabled or resume:
+            run_key = make_run_key('backtest', self.data_path, config, extra={'rows': len(df_with_indicators)})
+            checkpoint_manager = CheckpointManager.from_config(config, run_key)
+            saved = checkpoint_manager.load_latest() if resume else None
+            if saved:
+                resume_cursor = saved['cursor']
+                position_id = saved['position_id']
+                in_position = saved['in_position']
+                processed_bars, signals_detected, entries_attempted, trades_executed = saved['counters']
+                strategy.restore_checkpoint_state(saved['strategy'])
+                position_manager.restore_checkpoint_state(saved['position_manager'])
+                logger.info(f"Resuming backtest at row {resume_cursor:,} of {len(df_with_indicators):,}")
+
+        tracer = get_tracer()
+        rows = df_with_indicators.iloc[resume_cursor:] if resume_cursor else df_with_indicators
+        for cursor, (timestamp, row) in enumerate(rows.iterrows(), start=resume_cursor):
+            if (checkpoint_enabled and cursor > resume_cursor
+                    and cursor % checkpoint_interval == 0):
+                checkpoint_manager.save({
+                    'cursor': cursor,
+                    'position_id': position_id,
+                    'in_position': in_position,
+                    'counters': (processed_bars, signals_detected, entries_attempted, trades_executed),
+                    'strategy': strategy.get_checkpoint_state(),
+                    'position_manager': position_manager.get_checkpoint_state(),
+                })
+
             processed_bars += 1
             
             # ENSURE timezone awareness for timestamp
@@ -431,8 +411,8 @@ class BacktestRunner:
                 signals_detected += 1
                 entries_attempted += 1
 
-                # Unified signal detection logging
-                self.perf_logger.session_start(f"SIGNAL DETECTED at {now}: Price={row['close']:.2f}")
+                if tracer.enabled:
+                    tracer.record(TRACE_SIGNAL, row['close'])
                 
                 position_id = strategy.open_long(row, now, position_manager)
                 in_position = position_id is not None
@@ -444,10 +424,8 @@ class BacktestRunner:
                         lots = position.current_quantity // position.lot_size if position.lot_size > 0 else position.current_quantity
                         logger.info(f"TRADE EXECUTED: {lots} lots ({position.current_quantity} units) @ {row['close']:.2f}")
                     trades_executed += 1
-                    # Unified trade execution logging
-                    pos = position_manager.positions.get(position_id, {})
-                    qty = getattr(pos, 'current_quantity', getattr(pos, 'quantity', getattr(pos, 'initial_quantity', 0))) if pos else 0
-                    self.perf_logger.session_start(f"TRADE EXECUTED: {position_id} @ {row['close']:.2f} Qty={qty}")
+                    if tracer.enabled:
+                        tracer.record(TRACE_TRADE, row['close'], position.current_quantity if position else 0)
                 else:
                     logger.warning(f"TRADE FAILED: Signal detected but position not opened")
             
@@ -461,7 +439,8 @@ class BacktestRunner:
                     strategy.handle_exit(position_id, last_price, now, position_manager, reason="Strategy Exit")
                     in_position = False
                     position_id = None
-                    logger.debug(f"Strategy exit at {now} @ {last_price:.2f}")
+                    if tracer.enabled:
+                        tracer.record(TRACE_STRATEGY_EXIT, last_price)
             else:
                 # Still allow PositionManager to process positions in edge cases
                 position_manager.process_positions(row, now)
@@ -477,6 +456,9 @@ class BacktestRunner:
                 self.perf_logger.session_start(f"Progress: {processed_bars:,} bars processed, Signals: {signals_detected}, Entries: {entries_attempted}, Trades: {trades_executed}")
         
         logger.info(f"Backtest completed: {signals_detected} signals, {trades_executed} trades executed")
+        tracer.flush()
+        if checkpoint_manager is not None:
+            checkpoint_manager.clear()
         
         # Defensive: flatten any still-open positions at backtest end
         if position_id and position_id in position_manager.positions:
@@ -642,97 +624,161 @@ def run_backtest_debug(strategy, data, position_manager, risk_manager, start_dat
     logger.info("Backtest debug completed")
     return {}
 
-def load_and_normalize_data(data_path: str, process_as_ticks: bool = False) -> Tuple[pd.DataFrame, Any]:
-    """
-    Centralized data loading function with comprehensive row tracking.
-    """
-    logger.info(f"Loading data from: {data_path}")
-    
-    if not os.path.isfile(data_path):
-        raise FileNotFoundError(f"Data file not found: {data_path}")
+DIAGNOSTICS_MODES = ("off", "summary", "full")
 
-    # === STAGE 1: RAW DATA LOADING ===
-    df_raw = load_data_simple(data_path, process_as_ticks)
-    
-    # Calculate sample rows (5 rows every 1000 rows)
-    total_rows = len(df_raw)
-    sample_indices = []
-    
-    for chunk_start in range(0, total_rows, 1000):
-        chunk_end = min(chunk_start + 1000, total_rows)
-        # Select 5 evenly distributed rows within each 1000-row chunk
-        if chunk_end - chunk_start >= 5:
-            step = (chunk_end - chunk_start) // 5
-            chunk_sample = [chunk_start + i * step for i in range(5)]
-        else:
-            # If chunk has less than 5 rows, take all
-            chunk_sample = list(range(chunk_start, chunk_end))
-        sample_indices.extend(chunk_sample)
-    
-    # Remove duplicates and ensure indices are within bounds
-    sample_indices = sorted(list(set(idx for idx in sample_indices if idx < total_rows)))
-    
-    logger.info("=" * 80)
-    logger.info("STAGE 1: RAW DATA SAMPLE (5 rows per 1000)")
-    logger.info("=" * 80)
-    logger.info(f"Sampling {len(sample_indices)} rows from {total_rows} total rows")
-    
-    for i, idx in enumerate(sample_indices[:25]):
-        row_data = df_raw.iloc[idx]
-        logger.info(f"Raw Row {idx:6d} (Sample {i+1:2d}): "
-                   f"Time={row_data.name}, "
-                   f"Close={row_data.get('close', 'N/A'):8.2f}, "
-                   f"Volume={row_data.get('volume', 'N/A'):6.0f}")
-    
-    # === STAGE 2: AFTER NORMALIZATION ===
-    df_normalized = df_raw  # Your normalization happens in simple_loader
-    
-    logger.info("=" * 80)
-    logger.info("STAGE 2: AFTER NORMALIZATION (Same Rows)")
-    logger.info("=" * 80)
-    
-    for i, idx in enumerate(sample_indices[:25]):
-        if idx < len(df_normalized):
-            row_data = df_normalized.iloc[idx]
-            logger.info(f"Norm Row {idx:6d} (Sample {i+1:2d}): "
-                       f"Time={row_data.name}, "
-                       f"Close={row_data.get('close', 'N/A'):8.2f}, "
-                       f"Volume={row_data.get('volume', 'N/A'):6.0f}")
-    
-    # Store sample indices for later use in indicator stage
-    quality_report = type('DetailedQualityReport', (), {
-        'total_rows': len(df_normalized),
-        'rows_processed': len(df_normalized),
+
+def _sample_indices(total_rows: int, chunk_size: int = 1000, per_chunk: int = 5) -> List[int]:
+    """Row indices sampled evenly within each chunk (5 rows per 1000 by default)."""
+    starts = np.arange(0, total_rows, chunk_size)
+    lengths = np.minimum(chunk_size, total_rows - starts)
+    steps = np.maximum(lengths // per_chunk, 1)
+    offsets = np.arange(per_chunk)
+    indices = starts[:, None] + offsets[None, :] * steps[:, None]
+    # Chunks shorter than per_chunk contribute all of their rows
+    valid = offsets[None, :] < np.minimum(lengths, per_chunk)[:, None]
+    return np.unique(indices[valid]).tolist()
+
+
+def _build_quality_report(df: pd.DataFrame, diagnostics_mode: str):
+    """Quality report; sample indices are only computed in 'full' diagnostics mode."""
+    return type('DetailedQualityReport', (), {
+        'total_rows': len(df),
+        'rows_processed': len(df),
         'rows_dropped': 0,
         'issues_found': {},
-        'sample_indices': sample_indices
+        'sample_indices': _sample_indices(len(df)) if diagnostics_mode == "full" else []
     })
-    
-    # Add basic validation (previously handled by DataNormalizer)
-    if df_normalized.isnull().any().any():
-        logger.warning(f"Dataset contains {df_normalized.isnull().sum().sum()} missing values")
-    
-    # Check for negative prices (previously handled by DataNormalizer)
-    neg_prices = (df_normalized['close'] <= 0).sum() if 'close' in df_normalized.columns else 0
-    if neg_prices > 0:
-        logger.warning(f"Dataset contains {neg_prices} negative or zero prices")
-    
+
+
+def _log_sample_rows(df: pd.DataFrame, sample_indices: List[int], label: str):
+    """Log up to 25 sampled rows (close/volume) for a pipeline stage."""
+    sample = df.iloc[sample_indices[:25]]
+    closes = sample['close'].to_numpy() if 'close' in sample.columns else [float('nan')] * len(sample)
+    volumes = sample['volume'].to_numpy() if 'volume' in sample.columns else [float('nan')] * len(sample)
+    for i, (idx, ts, close, volume) in enumerate(zip(sample_indices, sample.index, closes, volumes)):
+        logger.info(f"{label} Row {idx:6d} (Sample {i+1:2d}): Time={ts}, Close={close:8.2f}, Volume={volume:6.0f}")
+
+
+def _log_data_diagnostics(df: pd.DataFrame, quality_report, diagnostics_mode: str):
+    """
+    Data-quality statistics for load_and_normalize_data.
+
+    summary: shape, time range, missing values and non-positive prices (single pass)
+    full:    summary + stage sample rows, hourly distribution and head/tail dumps
+    """
+    if diagnostics_mode == "off" or df.empty:
+        return
+
+    # Single pass over the numeric columns for the data-quality counts
+    missing = int(df.isna().to_numpy().sum())
+    non_positive = int((df['close'].to_numpy() <= 0).sum()) if 'close' in df.columns else 0
+    if missing:
+        logger.warning(f"Dataset contains {missing} missing values")
+    if non_positive:
+        logger.warning(f"Dataset contains {non_positive} negative or zero prices")
+
+    start, end = df.index[0], df.index[-1]
     logger.info("=== COMPLETE DATASET ANALYSIS ===")
-    logger.info(f"Dataset shape: {df_normalized.shape}")
-    logger.info(f"Time range: {df_normalized.index.min()} to {df_normalized.index.max()}")
-    logger.info(f"Total duration: {df_normalized.index.max() - df_normalized.index.min()}")
+    logger.info(f"Dataset shape: {df.shape}")
+    logger.info(f"Time range: {start} to {end}")
+    logger.info(f"Total duration: {end - start}")
+
+    if diagnostics_mode != "full":
+        return
+
+    sample_indices = quality_report.sample_indices
+    logger.info("=" * 80)
+    logger.info("STAGE 1/2: RAW + NORMALIZED DATA SAMPLE (5 rows per 1000)")
+    logger.info("=" * 80)
+    logger.info(f"Sampling {len(sample_indices)} rows from {len(df)} total rows")
+    _log_sample_rows(df, sample_indices, "Norm")
 
-    # Show time distribution
-    time_groups = df_normalized.groupby(df_normalized.index.hour).size()
+    hours = np.bincount(df.index.hour, minlength=24)
     logger.info("Hourly tick distribution:")
-    for hour, count in time_groups.items():
-        logger.info(f"  Hour {hour:02d}: {count:,} ticks")
+    for hour in np.flatnonzero(hours):
+        logger.info(f"  Hour {hour:02d}: {hours[hour]:,} ticks")
 
-    # Show first and last 10 rows with timestamps
+    columns = safe_column_selection(df, ['close', 'volume'])
     logger.info("First 10 rows:")
-    logger.info(f"\n{df_normalized.head(10)[['close', 'volume']].to_string()}")
+    logger.info(f"\n{df.head(10)[columns].to_string()}")
     logger.info("Last 10 rows:")
-    logger.info(f"\n{df_normalized.tail(10)[['close', 'volume']].to_string()}")
+    logger.info(f"\n{df.tail(10)[columns].to_string()}")
+
+
+def _log_indicator_diagnostics(df: pd.DataFrame, sample_indices: List[int], diagnostics_mode: str):
+    """
+    Indicator statistics after calculate_indicators().
+
+    summary: EMA/VWAP/MACD bullish-share counts (one vectorized comparison each)
+    full:    summary + STAGE 3 sample rows, final rows and sample indicator values
+    """
+    if diagnostics_mode == "off" or df.empty:
+        return
+
+    total_rows = len(df)
+    columns = df.columns
+    if 'fast_ema' in columns and 'slow_ema' in columns:
+        fast_above_slow = int((df['fast_ema'].to_numpy() > df['slow_ema'].to_numpy()).sum())
+        logger.info(f"EMA DIAGNOSTIC: {fast_above_slow}/{total_rows} rows have fast > slow ({fast_above_slow/total_rows*100:.1f}%)")
+    if 'vwap' in columns and 'close' in columns:
+        above_vwap = int((df['close'].to_numpy() > df['vwap'].to_numpy()).sum())
+        logger.info(f"VWAP DIAGNOSTIC: {above_vwap}/{total_rows} rows have price > VWAP ({above_vwap/total_rows*100:.1f}%)")
+    if 'macd' in columns and 'macd_signal' in columns:
+        macd_bullish = int((df['macd'].to_numpy() > df['macd_signal'].to_numpy()).sum())
+        logger.info(f"MACD DIAGNOSTIC: {macd_bullish}/{total_rows} rows have MACD > Signal ({macd_bullish/total_rows*100:.1f}%)")
+
+    if diagnostics_mode != "full":
+        return
+
+    logger.info("=" * 80)
+    logger.info("STAGE 3: AFTER INDICATOR CALCULATION (Same Rows)")
+    logger.info("=" * 80)
+    indicator_labels = [('fast_ema', 'FastEMA', '.3f'), ('slow_ema', 'SlowEMA', '.3f'), ('vwap', 'VWAP', '.3f'),
+                        ('macd', 'MACD', '.4f'), ('rsi', 'RSI', '.1f')]
+    signal_columns = [col for col in ('ema_bullish', 'vwap_bullish') if col in columns]
+    for i, idx in enumerate(idx for idx in sample_indices[:25] if idx < total_rows):
+        row_data = df.iloc[idx]
+        indicators = [f"{label}={row_data[col]:{fmt}}" for col, label, fmt in indicator_labels
+                      if col in columns and not pd.isna(row_data[col])]
+        indicator_str = ", ".join(indicators[:4]) if indicators else "No indicators"
+        signal_str = ", ".join(f"{col.replace('_bullish', '').upper()}_Bull={row_data[col]}" for col in signal_columns) or "No signals"
+        logger.info(f"Ind  Row {idx:6d} (Sample {i+1:2d}): "
+                    f"Time={row_data.name}, "
+                    f"Close={row_data.get('close', float('nan')):8.2f}, "
+                    f"[{indicator_str}], Signals=[{signal_str}]")
+
+    logger.info("Indicators calculated. Final 5 rows:")
+    log_columns = get_available_indicator_columns(df)
+    if len(log_columns) <= 1:  # Only 'close' available
+        log_columns = safe_column_selection(df, ['close', 'volume'])
+    logger.info(f"\n{df[log_columns].tail(5).to_string()}")
+
+    available_for_sample = safe_column_selection(df, ['fast_ema', 'slow_ema', 'vwap', 'macd', 'macd_signal', 'rsi', 'htf_ema'])
+    if available_for_sample:
+        sample = df[available_for_sample].dropna().head(10)
+        logger.info(f"Sample indicator values:\n{sample.to_string()}")
+
+
+def load_and_normalize_data(data_path: str, process_as_ticks: bool = False,
+                            diagnostics_mode: str = "summary") -> Tuple[pd.DataFrame, Any]:
+    """
+    Centralized data loading function with optional row tracking.
+
+    diagnostics_mode: 'off' | 'summary' | 'full' (see _log_data_diagnostics).
+    Statistics are only computed for the selected mode.
+    """
+    if diagnostics_mode not in DIAGNOSTICS_MODES:
+        raise ValueError(f"diagnostics_mode must be one of {DIAGNOSTICS_MODES}, got {diagnostics_mode!r}")
+    logger.info(f"Loading data from: {data_path}")
+    
+    if not os.path.isfile(data_path):
+        raise FileNotFoundError(f"Data file not found: {data_path}")
+
+    # Normalization happens in simple_loader
+    df_normalized = load_data_simple(data_path, process_as_ticks)
+    
+    quality_report = _build_quality_report(df_normalized, diagnostics_mode)
+    _log_data_diagnostics(df_normalized, quality_report, diagnostics_mode)
     
     return df_normalized, quality_report
 
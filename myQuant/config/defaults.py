@@ -81,7 +81,10 @@ DEFAULT_CONFIG: Dict[str, Any] = {
         "backup_count": 0,   # Not used
         "log_level_overrides": {},
         "json_event_log": False,  # Disabled
-        "json_event_file": "not_used.jsonl"  # Dummy value
+        "json_event_file": "not_used.jsonl",  # Dummy value
+        "trace_enabled": False,  # Structured per-tick tracing (utils/logger.py TraceBuffer)
+        "trace_buffer_size": 65536,  # Preallocated trace events (ring buffer)
+        "trace_to_log": False  # Format trace events to the 'myQuant.trace' logger on flush
     },
     "debug": {
         # Environment-aware error handling configuration
@@ -274,7 +277,60 @@ DEFAULT_CONFIG: Dict[str, Any] = {
         "close_at_session_end": True,
         "save_results": True,
         "results_dir": r"C:\Users\user\Desktop\BotResults\results\Back Test",
-        "log_level": "INFO"
+        "log_level": "INFO",
+        "diagnostics_mode": "summary"  # Data/indicator diagnostics: "off" | "summary" | "full"
+    },
+    # Checkpoint/resume for long backtests and file-simulation forward tests (matrix runs resume from their results store)
+    "checkpoint": {
+        "enabled": False,            # Periodically persist full engine state
+        "interval_ticks": 50000,     # Rows/ticks between checkpoints
+        "directory": "checkpoints",  # Checkpoint files are keyed by data file + config hash
+        "keep_last": 2,              # Number of checkpoint files retained per run
+        "resume": False              # Resume from the latest matching checkpoint if one exists
+    },
+    # Persistent result cache for matrix and backtest runs (keyed by config + data content + engine version)
+    "result_cache": {
+        "enabled": True,             # Return stored results for identical runs instead of recomputing
+        "directory": "result_cache",
+        "max_size_mb": 512           # Least recently used entries are evicted beyond this size
+    },
+    # Queue-based matrix runs across worker processes/machines (live/matrix_job_queue.py)
+    "matrix_queue": {
+        "heartbeat_seconds": 5.0,    # Worker heartbeat interval
+        "dead_worker_seconds": 30.0, # Jobs of workers silent this long are re-queued
+        "poll_seconds": 0.5,         # Coordinator/idle worker polling interval
+        "max_attempts": 3            # A job whose worker dies this often is recorded as failed
+    },
+    # WebSocket thread -> trading loop tick buffer (live/tick_ring_buffer.py)
+    "tick_buffer": {
+        "capacity": 1000,                  # Preallocated tick slots
+        "overflow_policy": "drop_oldest",  # "drop_oldest" | "drop_newest" | "block" (every drop is counted)
+        "block_timeout_seconds": 0.5,      # block policy: drop the tick if no space frees up within this time
+        "conflate": False,                 # Merge a backlog into one tick (latest price, summed volume, high/low kept for SL/TP)
+        "conflation_threshold": 20         # Queued ticks above which the backlog is conflated
+    },
+    # Several instruments over one WebSocket (live/multi_symbol_trader.py)
+    "multi_symbol": {
+        "instruments": [],          # [{"symbol", "token", "exchange", "instrument_type"}, ...] merged over "instrument" per leg
+        "shared_capital": False     # True: all legs draw on one initial_capital pool
+    },
+    # Backfill of WebSocket outages (live/gap_fill.py): missing ticks are replayed before live ticks resume
+    "gap_fill": {
+        "enabled": False,
+        "source": "candles",              # "candles" (SmartAPI getCandleData) | "recorder" (tick log CSV)
+        "recorder_path": "",              # recorder source: livePrice_*.csv written by the broker tick log
+        "candle_interval": "ONE_MINUTE",  # candles source: getCandleData interval
+        "max_tick_gap_seconds": 10.0,     # Silence longer than this between ticks of an instrument is a gap
+        "max_backfill_minutes": 60        # Longer gaps replay only their last part
+    },
+    # Pooled HTTP client for SmartAPI REST calls and the scrip master download (utils/http_client.py)
+    "http": {
+        "connect_timeout_seconds": 5.0,
+        "read_timeout_seconds": 30.0,
+        "retries": 3,                           # GET retries on connection errors and 429/5xx
+        "backoff_factor": 0.5,                  # Sleep backoff_factor * 2**(retry - 1) between retries
+        "pool_maxsize": 10,                     # Keep-alive connections kept per host
+        "session_validation_ttl_seconds": 300   # A successful session check is trusted this long (0 = always check)
     },
     "live": {
         "paper_trading": True,
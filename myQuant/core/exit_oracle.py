@@ -0,0 +1,235 @@
+"""
+core/exit_oracle.py - Vectorized first-touch exit oracle for risk-parameter research
+
+Given an entry and a price array, computes the exact exit sequence that
+PositionManager.process_positions would produce tick-by-tick:
+- Base SL (fixed stop below entry)
+- Trailing stop (activation on first touch, then running-max of highest price)
+- Tiered take-profits with lot-aligned partial fills
+- Optional forced Session End exit
+
+Instead of walking every tick in Python, the oracle uses numpy running-max
+and first-crossing searches, then resolves the (at most len(tp_points))
+take-profit events in a short scalar loop. Intended for sweeps over
+base_sl_points / tp_points / trail_* where thousands of risk configurations
+are evaluated over the same entry set.
+
+EXACTNESS CONTRACT (mirrors PositionManager, including its quirks):
+- Evaluation order per tick: trailing update -> SL -> trailing stop -> TPs
+- Trailing stop is only checked when its price is truthy (non-zero)
+- All TPs touched on the same tick are sized from the quantity at the start
+  of that tick; a fill larger than the remaining quantity is rejected by
+  close_position_partial and that TP level is consumed without a fill
+- Fills happen at the tick price (no exit slippage), as in process_positions
+
+The oracle reports fills only; costs are left to the caller
+(PositionManager.calculate_total_costs) so the cost model stays in one place.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from ..utils.config_helper import ConfigAccessor
+from .position_manager import ExitReason
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ExitParams:
+    """Risk parameters that drive exits (subset of config['risk'] + lot_size)."""
+    base_sl_points: float
+    tp_points: Sequence[float]
+    tp_percents: Sequence[float]
+    use_trail_stop: bool
+    trail_activation_points: float
+    trail_distance_points: float
+    lot_size: int
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "ExitParams":
+        """Build from a frozen config using the same accessors as PositionManager."""
+        accessor = ConfigAccessor(config)
+        return cls(
+            base_sl_points=accessor.get_risk_param('base_sl_points'),
+            tp_points=tuple(accessor.get_risk_param('tp_points')),
+            tp_percents=tuple(accessor.get_risk_param('tp_percents')),
+            use_trail_stop=accessor.get_risk_param('use_trail_stop'),
+            trail_activation_points=accessor.get_risk_param('trail_activation_points'),
+            trail_distance_points=accessor.get_risk_param('trail_distance_points'),
+            lot_size=int(accessor.get_current_instrument_param('lot_size')),
+        )
+
+
+@dataclass
+class ExitFill:
+    """Single (partial or full) exit produced by the oracle."""
+    index: int
+    price: float
+    quantity: int
+    reason: str
+    gross_pnl: float
+
+
+@dataclass
+class ExitResult:
+    """Exit sequence for one entry."""
+    entry_index: int
+    entry_price: float
+    initial_quantity: int
+    fills: List[ExitFill] = field(default_factory=list)
+    remaining_quantity: int = 0
+    trailing_activated_index: Optional[int] = None
+
+    @property
+    def exit_index(self) -> Optional[int]:
+        """Tick index of the final exit, or None if the position is still open."""
+        if self.remaining_quantity > 0 or not self.fills:
+            return None
+        return self.fills[-1].index
+
+    @property
+    def gross_pnl(self) -> float:
+        return sum(f.gross_pnl for f in self.fills)
+
+
+def _first_true(mask: np.ndarray) -> Optional[int]:
+    """Index of the first True element, or None."""
+    if mask.size == 0:
+        return None
+    idx = int(np.argmax(mask))
+    return idx if mask[idx] else None
+
+
+class ExitOracle:
+    """
+    Vectorized replica of PositionManager exit handling for a single long position.
+
+    Example:
+        >>> oracle = ExitOracle(ExitParams.from_config(frozen_config))
+        >>> result = oracle.simulate(prices, entry_index=120, entry_price=101.5, quantity=150)
+        >>> [(f.index, f.quantity, f.reason) for f in result.fills]
+    """
+
+    def __init__(self, params: ExitParams):
+        if len(params.tp_points) != len(params.tp_percents):
+            raise ValueError("tp_points and tp_percents must have the same length")
+        if params.lot_size <= 0:
+            raise ValueError(f"lot_size must be positive, got {params.lot_size}")
+        self.params = params
+
+    def simulate(self, prices: np.ndarray, entry_index: int, entry_price: float,
+                 quantity: int, session_end_index: Optional[int] = None,
+                 base_sl_points_override: Optional[float] = None) -> ExitResult:
+        """
+        Compute the exit sequence for one position.
+
+        Args:
+            prices: 1-D float array of tick prices (the 'close' fed to process_positions)
+            entry_index: First tick evaluated for exits (the live trader and the
+                backtest loop both run process_positions on the entry tick itself)
+            entry_price: Actual entry price (after slippage), as stored on Position
+            quantity: Initial quantity in units (lot-aligned)
+            session_end_index: First tick at which should_exit_for_session_end() is
+                True; an open position is closed there at that tick's price
+            base_sl_points_override: Same semantics as PositionManager.open_position
+
+        Returns:
+            ExitResult with fills in execution order
+        """
+        p = self.params
+        prices = np.asarray(prices, dtype=np.float64)
+        stop = len(prices) if session_end_index is None else min(session_end_index, len(prices))
+        window = prices[entry_index:stop]
+
+        result = ExitResult(entry_index=entry_index, entry_price=entry_price,
+                            initial_quantity=quantity, remaining_quantity=quantity)
+
+        base_sl = base_sl_points_override if base_sl_points_override is not None else p.base_sl_points
+        stop_loss_price = entry_price - base_sl
+
+        # --- Full-exit triggers: base SL and trailing stop (first touch) ---
+        stop_hit = window <= stop_loss_price
+        trail_hit = np.zeros_like(stop_hit)
+        if p.use_trail_stop and window.size:
+            activated = _first_true(window - entry_price >= p.trail_activation_points)
+            if activated is not None:
+                result.trailing_activated_index = entry_index + activated
+                highest = np.maximum.accumulate(np.maximum(window, entry_price))
+                trail_price = highest - p.trail_distance_points
+                # Activation tick sets the stop from the tick price, not the running high
+                trail_price[activated] = window[activated] - p.trail_distance_points
+                trail_price[:activated] = 0.0
+                trail_hit = (trail_price != 0.0) & (window <= trail_price)
+                trail_hit[:activated] = False
+        full_exit = _first_true(stop_hit | trail_hit)
+        tp_horizon = window.size if full_exit is None else full_exit
+
+        # --- Take-profit first touches before the full exit ---
+        tp_touch: List[Optional[int]] = []
+        for tp in p.tp_points:
+            tp_touch.append(_first_true(window[:tp_horizon] >= entry_price + tp))
+
+        lot = p.lot_size
+        total_lots = quantity // lot
+        last_tp = len(p.tp_points) - 1
+        current = quantity
+        for tick in sorted({t for t in tp_touch if t is not None}):
+            # Quantities are computed against the start-of-tick quantity
+            stale_qty = current
+            planned = []
+            for i, touched in enumerate(tp_touch):
+                if touched != tick:
+                    continue
+                if i < last_tp:
+                    lots_to_exit = max(1, int(total_lots * p.tp_percents[i]))
+                    lots_to_exit = min(lots_to_exit, stale_qty // lot)
+                    exit_qty = lots_to_exit * lot
+                else:
+                    exit_qty = stale_qty
+                if exit_qty > 0:
+                    planned.append((exit_qty, f"Take Profit {i+1}"))
+            price = float(window[tick])
+            for exit_qty, reason in planned:
+                if exit_qty > current:
+                    continue  # Rejected by close_position_partial
+                current -= exit_qty
+                result.fills.append(ExitFill(entry_index + tick, price, exit_qty, reason,
+                                             (price - entry_price) * exit_qty))
+                if current == 0:
+                    break
+            if current == 0:
+                result.remaining_quantity = 0
+                return result
+
+        if full_exit is not None:
+            price = float(window[full_exit])
+            reason = ExitReason.STOP_LOSS.value if stop_hit[full_exit] else ExitReason.TRAILING_STOP.value
+            result.fills.append(ExitFill(entry_index + full_exit, price, current, reason,
+                                         (price - entry_price) * current))
+            current = 0
+        elif session_end_index is not None and session_end_index < len(prices):
+            price = float(prices[session_end_index])
+            result.fills.append(ExitFill(session_end_index, price, current, ExitReason.SESSION_END.value,
+                                         (price - entry_price) * current))
+            current = 0
+
+        result.remaining_quantity = current
+        return result
+
+    def simulate_many(self, prices: np.ndarray, entries: Sequence[tuple],
+                      session_end_index: Optional[int] = None) -> List[ExitResult]:
+        """
+        Evaluate a batch of entries over the same price array.
+
+        Args:
+            prices: 1-D float array of tick prices
+            entries: Iterable of (entry_index, entry_price, quantity)
+            session_end_index: Shared session end tick (see simulate)
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        return [self.simulate(prices, idx, entry_price, qty, session_end_index)
+                for idx, entry_price, qty in entries]
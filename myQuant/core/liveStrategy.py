@@ -12,15 +12,20 @@ import numpy as np
 import logging
 from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime, time, timedelta
+from time import perf_counter_ns
 import pytz
 
 # Initialize module-level logger
 logger = logging.getLogger(__name__)
 from ..utils.time_utils import now_ist, normalize_datetime_to_ist, is_time_to_exit, is_within_session, ensure_tz_aware, apply_buffer_to_time
 from types import MappingProxyType
-from ..utils.logger import HighPerfLogger, increment_tick_counter, get_tick_counter, format_tick_message
+from ..utils.logger import (
+    HighPerfLogger, increment_tick_counter, get_tick_counter, format_tick_message,
+    get_tracer, TRACE_TICK, TRACE_ENTRY_BLOCKED, TRACE_ENTRY_REJECTED
+)
 
 from ..utils.config_helper import ConfigAccessor
+from ..utils.checkpoint import capture_state, restore_state
 from .indicators import IncrementalEMA, IncrementalMACD, IncrementalVWAP, IncrementalATR
 from ..utils.enhanced_error_handler import (
     create_error_handler_from_config, ErrorSeverity, 
@@ -74,6 +79,7 @@ class ModularIntradayStrategy:
         # Let any exception propagate so misconfiguration is detected immediately.
         # Use high-performance logger (FAIL-FAST: requires caller to have run setup_from_config)
         self.perf_logger = HighPerfLogger(__name__, config)
+        self.tracer = get_tracer()
         self.config_accessor = ConfigAccessor(config)
         self.indicators = indicators_module
         self.in_position = False
@@ -345,6 +351,7 @@ class ModularIntradayStrategy:
         Returns:
             True if can enter new position, False if blocked by any condition
         """
+        # Reasons are kept as (template, args) and only formatted if a message is emitted
         gating_reasons = []
         
         # Check SL Regression timer FIRST (updates state if needed)
@@ -353,25 +360,30 @@ class ModularIntradayStrategy:
         # Check trade blocks SECOND (highest priority - user-defined restriction)
         is_blocked, block_desc = self.is_within_trade_block(current_time)
         if is_blocked:
-            gating_reasons.append(f"Within trade block: {block_desc}")
+            gating_reasons.append(("Within trade block: {}", (block_desc,)))
         
         if not self.is_trading_session(current_time):
-            gating_reasons.append(f"Not in trading session (now={current_time.time()}, allowed={self.session_start}-{self.session_end})")
+            gating_reasons.append(("Not in trading session (now={}, allowed={}-{})",
+                                   (current_time.time(), self.session_start, self.session_end)))
         buffer_start, buffer_end = self.get_effective_session_times()
         if current_time.time() < buffer_start:
-            gating_reasons.append(f"Before buffer start ({current_time.time()} < {buffer_start})")
+            gating_reasons.append(("Before buffer start ({} < {})", (current_time.time(), buffer_start)))
         if current_time.time() > buffer_end:
-            gating_reasons.append(f"After buffer end ({current_time.time()} > {buffer_end})")
+            gating_reasons.append(("After buffer end ({} > {})", (current_time.time(), buffer_end)))
         if self.daily_stats['trades_today'] >= self.max_positions_per_day:
-            gating_reasons.append(f"Exceeded max trades: {self.daily_stats['trades_today']} >= {self.max_positions_per_day}")
+            gating_reasons.append(("Exceeded max trades: {} >= {}",
+                                   (self.daily_stats['trades_today'], self.max_positions_per_day)))
         session_start = ensure_tz_aware(datetime.combine(current_time.date(), self.session_start), current_time.tzinfo)
         session_end = ensure_tz_aware(datetime.combine(current_time.date(), self.session_end), current_time.tzinfo)
         if current_time < session_start + timedelta(minutes=self.no_trade_start_minutes):
-            gating_reasons.append(f"In no-trade start period ({current_time.time()} < {session_start.time()} + {self.no_trade_start_minutes}m)")
+            gating_reasons.append(("In no-trade start period ({} < {} + {}m)",
+                                   (current_time.time(), session_start.time(), self.no_trade_start_minutes)))
         if current_time > session_end - timedelta(minutes=self.no_trade_end_minutes):
-            gating_reasons.append(f"In no-trade end period ({current_time.time()} > {session_end.time()} - {self.no_trade_end_minutes}m)")
+            gating_reasons.append(("In no-trade end period ({} > {} - {}m)",
+                                   (current_time.time(), session_end.time(), self.no_trade_end_minutes)))
         if not self._check_consecutive_green_ticks():
-            gating_reasons.append(f"Need {self.consecutive_green_bars_required} green ticks, have {self.green_bars_count}")
+            gating_reasons.append(("Need {} green ticks, have {}",
+                                   (self.consecutive_green_bars_required, self.green_bars_count)))
         
         # Price-Above-Exit Filter check (at END, after all other checks)
         if self.price_above_exit_filter_enabled:
@@ -383,28 +395,33 @@ class ModularIntradayStrategy:
                     min_required_price = self.last_exit_price + self.price_buffer_points
                     
                     if current_price < min_required_price:
-                        shortfall = min_required_price - current_price
-                        gating_reasons.append(
-                            f"Price-Above-Exit filter blocked | "
-                            f"Price ₹{current_price:.2f} < threshold ₹{min_required_price:.2f} "
-                            f"(shortfall {shortfall:.2f}pt) | "
-                            f"Elapsed {time_elapsed:.0f}s/{self.filter_duration_seconds}s"
-                        )
+                        gating_reasons.append((
+                            "Price-Above-Exit filter blocked | "
+                            "Price ₹{:.2f} < threshold ₹{:.2f} "
+                            "(shortfall {:.2f}pt) | "
+                            "Elapsed {:.0f}s/{}s",
+                            (current_price, min_required_price, min_required_price - current_price,
+                             time_elapsed, self.filter_duration_seconds)))
         
         if gating_reasons:
-            # LIGHTWEIGHT: Only enhance logging if we have cached price (no method calls)
-            reason_text = '; '.join(gating_reasons)
-            if hasattr(self, 'prev_tick_price') and self.prev_tick_price:
-                try:
-                    symbol = self.config_accessor.get_instrument_param('symbol')
-                    reason_text += f", {symbol} @ ₹{self.prev_tick_price}"
-                except Exception:
-                    pass  # DEFENSIVE: Never fail on logging enhancement
-            
-            self.perf_logger.entry_blocked(reason_text)
+            if self.tracer.enabled:
+                self.tracer.record(TRACE_ENTRY_BLOCKED, current_price, len(gating_reasons), self.green_bars_count)
+            self.perf_logger.entry_blocked(lambda: self._format_gating_reasons(gating_reasons))
             return False
         return True
 
+    def _format_gating_reasons(self, gating_reasons: List[Tuple[str, tuple]]) -> str:
+        """Format (template, args) gating reasons for the rate-limited ENTRY BLOCKED log."""
+        reason_text = '; '.join(template.format(*args) for template, args in gating_reasons)
+        # LIGHTWEIGHT: Only enhance logging if we have cached price (no method calls)
+        if hasattr(self, 'prev_tick_price') and self.prev_tick_price:
+            try:
+                symbol = self.config_accessor.get_instrument_param('symbol')
+                reason_text += f", {symbol} @ ₹{self.prev_tick_price}"
+            except Exception:
+                pass  # DEFENSIVE: Never fail on logging enhancement
+        return reason_text
+
     def get_effective_session_times(self):
         """
         Get effective session start and end times after applying buffers
@@ -686,43 +703,28 @@ class ModularIntradayStrategy:
         entry_allowed = all(logic_checks)
         
         # Log entry evaluation (only log periodically to avoid spam)
-        if not hasattr(self, '_last_signal_log_time'):
-            self._last_signal_log_time = None
+        if not hasattr(self, '_signal_log_counter'):
             self._signal_log_counter = 0
+            self._last_signal_log_time = None
         
-        self._signal_log_counter += 1
-        # Prefer the tick timestamp (from row) for any logging or time-based checks
-        # in forward-test/file-simulations so logs show CSV times, not runtime now().
-        # Fallback to now_ist() if timestamp not present or invalid.
-        current_time = None
-        try:
-            if isinstance(row, (pd.Series, dict)) and 'timestamp' in row and row['timestamp'] is not None:
-                current_time = row['timestamp']
-                # Convert pandas Timestamp to python datetime if needed
-                if hasattr(current_time, 'to_pydatetime'):
-                    current_time = current_time.to_pydatetime()
-                # Ensure timezone-aware
-                current_time = ensure_tz_aware(current_time, getattr(self, 'timezone', None))
-        except Exception:
-            current_time = None
-
-        if current_time is None:
-            # Last resort: use system now in IST (preserves timezone-awareness)
-            current_time = now_ist()
-        
-        # Log every 300 ticks (~30 seconds at 10 ticks/sec) or when signal changes
-        should_log = (
-            self._signal_log_counter % 300 == 0 or
-            self._last_signal_log_time is None or
-            (current_time - self._last_signal_log_time).total_seconds() > 30
-        )
-        
-        if should_log and not entry_allowed:
-            self._last_signal_log_time = current_time
-            price = row.get('close', row.get('price', 'N/A'))
-            logger.info(f"📊 ENTRY EVALUATION @ ₹{price}: Enabled checks: {', '.join(checks_performed)}")
-            logger.info(f"   ❌ Entry REJECTED - Failed: {'; '.join(failed_checks)}")
-        elif entry_allowed:
+        if not entry_allowed:
+            self._signal_log_counter += 1
+            if self.tracer.enabled:
+                self.tracer.record(TRACE_ENTRY_REJECTED, row.get('close', row.get('price', 0.0)),
+                                   len(failed_checks), len(checks_performed))
+            # Log first rejection, then every 300 (~30 seconds at 10 ticks/sec) or after
+            # 30 seconds of tick time (CSV times in file simulation, not runtime now())
+            current_time = row.get('timestamp')
+            if current_time is None:
+                current_time = now_ist()
+            if (self._signal_log_counter % 300 == 1 or self._last_signal_log_time is None or
+                    (current_time - self._last_signal_log_time).total_seconds() > 30):
+                self._signal_log_counter = 1
+                self._last_signal_log_time = current_time
+                price = row.get('close', row.get('price', 'N/A'))
+                logger.info(f"📊 ENTRY EVALUATION @ ₹{price}: Enabled checks: {', '.join(checks_performed)}")
+                logger.info(f"   ❌ Entry REJECTED - Failed: {'; '.join(failed_checks)}")
+        else:
             # Always log when entry is allowed (rare event) - include green tick info
             price = row.get('close', row.get('price', 'N/A'))
             green_tick_info = f"Green ticks: {self.green_bars_count}/{self.current_green_tick_threshold}"
@@ -836,6 +838,8 @@ class ModularIntradayStrategy:
                     updated_tick = self.process_tick_or_bar(tick)
             else:
                 updated_tick = self.process_tick_or_bar(tick)
+            if 'received_ns' in tick:
+                tick['indicators_ns'] = perf_counter_ns()  # End-to-end latency stage (live/tick_latency.py)
             
             # Phase 0: Check warm-up completion
             if not self.warmup_complete:
@@ -953,6 +957,14 @@ class ModularIntradayStrategy:
 
 
 
+    def get_checkpoint_state(self) -> Dict[str, Any]:
+        """Runtime state (trackers, SL regression, filter, daily stats) for checkpoint/resume."""
+        return capture_state(self)
+
+    def restore_checkpoint_state(self, state: Dict[str, Any]):
+        """Restore state captured by get_checkpoint_state()."""
+        restore_state(self, state)
+
     def reset_daily_counters(self, now: datetime):
         """
         Reset daily counters for a new trading session.
@@ -1028,18 +1040,13 @@ class ModularIntradayStrategy:
         Returns:
             Dict with original tick data plus calculated indicator values
         """
-        # Tick counter and hot-path perf logging
-        increment_tick_counter()
-        if self.perf_logger:
+        # Tick counter and hot-path tracing
+        tick_num = increment_tick_counter()
+        if self.tracer.enabled:
             # STRICT: Use actual values or skip logging if missing
-            close_val = row.get('close', 0) if hasattr(row, 'get') else (row['close'] if 'close' in row else 0)
-            volume_val = row.get('volume') if hasattr(row, 'get') else (row['volume'] if 'volume' in row else None)
-            self.perf_logger.tick_debug(
-                format_tick_message,
-                get_tick_counter(), 
-                close_val, 
-                volume_val
-            )
+            close_val = row.get('close', row.get('price', 0)) if hasattr(row, 'get') else 0
+            volume_val = row.get('volume') if hasattr(row, 'get') else None
+            self.tracer.record(TRACE_TICK, tick_num, close_val or 0.0, volume_val or 0.0)
         try:
             # Phase A: Support both dict and pandas inputs (backward compatibility)
             # New code passes dicts, old code may still pass Series
@@ -598,6 +598,26 @@ class PositionManager:
         self.completed_trades.clear()
         logger.info(f"Position Manager reset with capital: {self.initial_capital:,}")
 
+    def get_checkpoint_state(self) -> Dict[str, Any]:
+        """Runtime state for checkpoint/resume (config-derived settings are rebuilt on init)."""
+        return {
+            'current_capital': self.current_capital,
+            'reserved_margin': self.reserved_margin,
+            'daily_pnl': self.daily_pnl,
+            'positions': self.positions,
+            'completed_trades': self.completed_trades,
+        }
+
+    def restore_checkpoint_state(self, state: Dict[str, Any]):
+        """Restore state captured by get_checkpoint_state()."""
+        self.current_capital = state['current_capital']
+        self.reserved_margin = state['reserved_margin']
+        self.daily_pnl = state['daily_pnl']
+        self.positions = dict(state['positions'])
+        self.completed_trades = list(state['completed_trades'])
+        logger.info(f"Position Manager restored: {len(self.positions)} open positions, "
+                    f"{len(self.completed_trades)} completed trades, capital {self.current_capital:,.2f}")
+
     # Legacy compatibility methods for backtest engine
     def enter_position(self, side: str, price: float, quantity: int, timestamp: datetime,
                        **kwargs) -> Optional[str]:
@@ -23,10 +23,15 @@ from dataclasses import dataclass
 import pytz
 from ..utils.time_utils import is_within_session, ensure_tz_aware, apply_buffer_to_time
 from ..utils.config_helper import ConfigAccessor
+from ..utils.checkpoint import capture_state, restore_state
 from types import MappingProxyType
 from .indicators import IncrementalEMA, IncrementalMACD, IncrementalVWAP, IncrementalATR
 # Use new core logger primitives (no legacy adapters). STRICT: fail-fast if requested.
-from ..utils.logger import HighPerfLogger, increment_tick_counter, get_tick_counter, format_tick_message
+from ..utils.logger import (
+    HighPerfLogger, increment_tick_counter, get_tick_counter, format_tick_message, get_tracer,
+    TRACE_TICK, TRACE_FIRST_TICK, TRACE_GREEN_TICK, TRACE_RED_TICK, TRACE_NOISE_TICK,
+    TRACE_ENTRY_BLOCKED, TRACE_ENTRY_REJECTED, TRACE_SIGNAL_CHECK, TRACE_SESSION_EXIT, TRACE_MISSING_PRICE
+)
 
 # Module uses HighPerfLogger via self.perf_logger (no module-level stdlib logger)
 
@@ -77,6 +82,7 @@ class ModularIntradayStrategy:
         # STRICT / fail-fast: initialize HighPerfLogger (requires frozen MappingProxyType & prior setup).
         # Let any exception propagate so misconfiguration is detected immediately.
         self.perf_logger = HighPerfLogger(__name__, frozen_config)
+        self.tracer = get_tracer()
 
         # --- Strategy section (use values from defaults.py only) ---
         # Use strict API: no 'cast' keyword on accessor; do explicit conversion where needed.
@@ -247,6 +253,14 @@ class ModularIntradayStrategy:
         # Emit concise lifecycle event via performance logger
         self.perf_logger.session_start("Strategy reset to initial state")
 
+    def get_checkpoint_state(self) -> Dict[str, Any]:
+        """Runtime state (trackers, daily stats, counters) for checkpoint/resume."""
+        return capture_state(self)
+
+    def restore_checkpoint_state(self, state: Dict[str, Any]):
+        """Restore state captured by get_checkpoint_state()."""
+        restore_state(self, state)
+
     def reset_incremental_trackers(self):
         """Reset all incremental indicator trackers for clean state."""
         self.ema_fast_tracker = IncrementalEMA(period=self.fast_ema)
@@ -342,10 +356,6 @@ class ModularIntradayStrategy:
             
             rows_processed += 1
             
-            # Log progress every 1000 rows
-            if rows_processed % 1000 == 0:
-                # rate-limited debug via perf_logger
-                self.perf_logger.tick_debug(format_tick_message, get_tick_counter(), 0.0, None)
         
         self.perf_logger.session_end(f"Incremental processing complete: {rows_processed} rows")
  
@@ -378,14 +388,16 @@ class ModularIntradayStrategy:
         Check if positions should be exited based on user-defined session end and buffer
         """
         if not self.is_trading_session(now):
-            self.perf_logger.tick_debug(format_tick_message, get_tick_counter(), 0.0, f"Should exit: Not in trading session {now}")
+            if self.tracer.enabled:
+                self.tracer.record(TRACE_SESSION_EXIT, 1)
             return True
         
         # Get effective end time with buffer
         _, buffer_end = self.get_effective_session_times()
         
         if now.time() >= buffer_end:
-            self.perf_logger.tick_debug(format_tick_message, get_tick_counter(), 0.0, f"Should exit: After buffer end {buffer_end}")
+            if self.tracer.enabled:
+                self.tracer.record(TRACE_SESSION_EXIT, 2)
             return True
         
         return False
@@ -404,39 +416,61 @@ class ModularIntradayStrategy:
         Returns:
             True if can enter new position
         """
+        # Reasons are kept as (template, args) and only formatted if a message is emitted
         gating_reasons = []
         if not self.is_trading_session(current_time):
-            gating_reasons.append(f"Not in trading session (now={current_time.time()}, allowed={self.session_start}-{self.session_end})")
+            gating_reasons.append(("Not in trading session (now={}, allowed={}-{})",
+                                   (current_time.time(), self.session_start, self.session_end)))
         buffer_start, buffer_end = self.get_effective_session_times()
         if current_time.time() < buffer_start:
-            gating_reasons.append(f"Before buffer start ({current_time.time()} < {buffer_start})")
+            gating_reasons.append(("Before buffer start ({} < {})", (current_time.time(), buffer_start)))
         if current_time.time() > buffer_end:
-            gating_reasons.append(f"After buffer end ({current_time.time()} > {buffer_end})")
+            gating_reasons.append(("After buffer end ({} > {})", (current_time.time(), buffer_end)))
         if self.daily_stats['trades_today'] >= self.max_positions_per_day:
-            gating_reasons.append(f"Exceeded max trades: {self.daily_stats['trades_today']} >= {self.max_positions_per_day}")
+            gating_reasons.append(("Exceeded max trades: {} >= {}",
+                                   (self.daily_stats['trades_today'], self.max_positions_per_day)))
         session_start = ensure_tz_aware(datetime.combine(current_time.date(), self.session_start), current_time.tzinfo)
         session_end = ensure_tz_aware(datetime.combine(current_time.date(), self.session_end), current_time.tzinfo)
         if current_time < session_start + timedelta(minutes=self.no_trade_start_minutes):
-            gating_reasons.append(f"In no-trade start period ({current_time.time()} < {session_start.time()} + {self.no_trade_start_minutes}m)")
+            gating_reasons.append(("In no-trade start period ({} < {} + {}m)",
+                                   (current_time.time(), session_start.time(), self.no_trade_start_minutes)))
         if current_time > session_end - timedelta(minutes=self.no_trade_end_minutes):
-            gating_reasons.append(f"In no-trade end period ({current_time.time()} > {session_end.time()} - {self.no_trade_end_minutes}m)")
+            gating_reasons.append(("In no-trade end period ({} > {} - {}m)",
+                                   (current_time.time(), session_end.time(), self.no_trade_end_minutes)))
         if not self._check_consecutive_green_ticks():
-            gating_reasons.append(f"Need {self.consecutive_green_bars_required} green ticks, have {self.green_bars_count}")
+            gating_reasons.append(("Need {} green ticks, have {}",
+                                   (self.consecutive_green_bars_required, self.green_bars_count)))
         if gating_reasons:
-            # Throttle repeated logging of the same blocking reason to prevent spam
-            current_reason = ' | '.join(gating_reasons)
+            if self.tracer.enabled:
+                self.tracer.record(TRACE_ENTRY_BLOCKED, 0.0, len(gating_reasons), self.green_bars_count)
+            # Throttle repeated logging of the same kind of blocking reason to prevent spam
+            current_reason = tuple(template for template, _ in gating_reasons)
             if current_reason == self.last_blocked_reason:
                 self.blocked_reason_count += 1
                 # Only log at intervals to prevent excessive logging
                 if self.blocked_reason_count % self.blocked_reason_log_interval == 0:
-                    self.perf_logger.session_start(f"[ENTRY BLOCKED] at {current_time}: {current_reason} (repeated {self.blocked_reason_count} times)")
+                    repeated = self.blocked_reason_count
+                    self.perf_logger.session_start(
+                        lambda: f"[ENTRY BLOCKED] at {current_time}: {self._format_gating_reasons(gating_reasons)} "
+                                f"(repeated {repeated} times)")
             else:
                 # New blocking reason - reset counter and log immediately
                 self.last_blocked_reason = current_reason
                 self.blocked_reason_count = 1
-                self.perf_logger.session_start(f"[ENTRY BLOCKED] at {current_time}: {current_reason}")
+                self.perf_logger.session_start(
+                    lambda: f"[ENTRY BLOCKED] at {current_time}: {self._format_gating_reasons(gating_reasons)}")
             return False
         return True
+
+    @staticmethod
+    def _format_gating_reasons(gating_reasons: List[Tuple[str, tuple]]) -> str:
+        return ' | '.join(template.format(*args) for template, args in gating_reasons)
+
+    def _format_signal(self, price: float, current_time: datetime, signal_reasons: List[str]) -> str:
+        max_reasons = int(self.config_accessor.get_logging_param('max_signal_reasons'))
+        # If max_reasons is None, do not limit reasons (defaults are in defaults.py only)
+        reasons = signal_reasons if max_reasons is None else signal_reasons[:max_reasons]
+        return f"[SIGNAL] BUY @ {current_time} Price={price:.2f} Reasons={' ; '.join(reasons)}"
     
     def generate_entry_signal(self, row: pd.Series, current_time: datetime) -> TradingSignal:
         """
@@ -462,9 +496,8 @@ class ModularIntradayStrategy:
                 except Exception:
                     # Let exception propagate per standardization (do not log.exception)
                     raise
-            else:
-                # Low-level debug via perf_logger
-                self.perf_logger.tick_debug(format_tick_message, get_tick_counter(), 0.0, "generate_entry_signal: missing close price")
+            elif self.tracer.enabled:
+                self.tracer.record(TRACE_MISSING_PRICE)
         except Exception:
             # Let callers handle unexpected errors (no logger.exception)
             raise
@@ -571,18 +604,13 @@ class ModularIntradayStrategy:
         
         # === FINAL SIGNAL DECISION ===
         # ALL enabled conditions must be True for BUY signal
-        # Logging per signal check
-        # Emit concise structured signal-check event via perf logger
-        self.perf_logger.session_start(
-            f"[SIGNAL] @ {current_time.strftime('%Y-%m-%d %H:%M:%S')} | Price={row.get('close', None)} | "
-            f"indicators: EMA={self.use_ema_crossover}, MACD={self.use_macd}, VWAP={self.use_vwap}, "
-            f"HTF={self.use_htf_trend}, RSI={self.use_rsi_filter}, BB={self.use_bollinger_bands} | "
-            f"condition_values={signal_conditions} | reasons={signal_reasons} | "
-            f"can_enter={self.can_enter_new_position(current_time)} | GreenBars={self.green_bars_count}/{self.consecutive_green_bars_required}"
-        )
-        if not (signal_conditions and all(signal_conditions) and self.can_enter_new_position(current_time)):
-            fail_reasons = [reason for i, reason in enumerate(signal_reasons) if i < len(signal_conditions) and not signal_conditions[i]]
-            self.perf_logger.session_start(f"[ENTRY REJECTED] @ {current_time}: {'; '.join(fail_reasons)}")
+        # Per-check tracing (can_enter_new_position already passed above)
+        if self.tracer.enabled:
+            passed = sum(1 for condition in signal_conditions if condition)
+            self.tracer.record(TRACE_SIGNAL_CHECK, row.get('close', 0.0), passed, len(signal_conditions), 1)
+            if not (signal_conditions and passed == len(signal_conditions)):
+                self.tracer.record(TRACE_ENTRY_REJECTED, row.get('close', 0.0),
+                                   len(signal_conditions) - passed, len(signal_conditions))
         
         if signal_conditions and all(signal_conditions):
             # Calculate stop loss
@@ -591,11 +619,8 @@ class ModularIntradayStrategy:
             # Update tracking
             self.last_signal_time = current_time
 
-            # Event-driven logging (only when enabled)
-            max_reasons = int(self.config_accessor.get_logging_param('max_signal_reasons'))
-            # If max_reasons is None, do not limit reasons (defaults are in defaults.py only)
-            reasons = signal_reasons if max_reasons is None else signal_reasons[:max_reasons]
-            self.perf_logger.session_start(f"[SIGNAL] BUY @ {current_time} Price={row['close']:.2f} Reasons={' ; '.join(reasons)}")
+            # Event-driven logging (formatted only when INFO is enabled)
+            self.perf_logger.session_start(lambda: self._format_signal(row['close'], current_time, signal_reasons))
             
             return TradingSignal(
                 action='BUY',
@@ -610,11 +635,7 @@ class ModularIntradayStrategy:
             failed_reasons = [reason for i, reason in enumerate(signal_reasons) 
                             if i < len(signal_conditions) and not signal_conditions[i]]
             
-            # Event-driven hold logging
-            max_reasons = int(self.config_accessor.get_logging_param('max_signal_reasons'))
-            hold_reasons = failed_reasons if max_reasons is None else failed_reasons[:max_reasons]
-
-            self.perf_logger.session_start(f"[HOLD] @ {current_time} | Reasons: {'; '.join(hold_reasons)}")
+            # Hold decisions are traced above (TRACE_ENTRY_REJECTED); no per-bar log line
             
             return TradingSignal(
                 action='HOLD',
@@ -774,7 +795,9 @@ class ModularIntradayStrategy:
                 
             if self._debug_call_count <= 10:
                 # Short-lived diagnostic via perf logger
-                self.perf_logger.session_start(f"can_open_long called #{self._debug_call_count}: can_enter={can_enter}, should_enter={should_enter}, result={result}")
+                call_count = self._debug_call_count
+                self.perf_logger.session_start(
+                    lambda: f"can_open_long called #{call_count}: can_enter={can_enter}, should_enter={should_enter}, result={result}")
              
             return result
             
@@ -816,7 +839,7 @@ class ModularIntradayStrategy:
                 qty = position_manager.positions[position_id].current_quantity if position_id in position_manager.positions else 0
             except Exception:
                 qty = 0
-            self.perf_logger.session_start(f"Position opened: {position_id} @ {entry_price:.2f} Qty={qty} Symbol={symbol}")
+            self.perf_logger.session_start(lambda: f"Position opened: {position_id} @ {entry_price:.2f} Qty={qty} Symbol={symbol}")
             return position_id
         # If position not opened, emit concise lifecycle event and return None
         self.perf_logger.session_start("Position manager returned None")
@@ -932,10 +955,9 @@ class ModularIntradayStrategy:
         
     def process_tick_or_bar(self, row: pd.Series):
         # Called per tick
-        increment_tick_counter()
-        # use perf_logger.tick_debug for rate-limited debug
-        if self.perf_logger:
-            self.perf_logger.tick_debug(format_tick_message, get_tick_counter(), row.get('close', 0), row.get('volume', None))
+        tick_num = increment_tick_counter()
+        if self.tracer.enabled:
+            self.tracer.record(TRACE_TICK, tick_num, row.get('close', 0) or 0.0, row.get('volume', 0) or 0.0)
         """
         TRUE INCREMENTAL PROCESSING: Update all indicators for a single tick/bar.
         This is the core of incremental processing - called for each data point in sequence.
@@ -1041,7 +1063,8 @@ class ModularIntradayStrategy:
                 # First tick of session or after reset
                 self.green_bars_count = 0
                 self.prev_tick_price = current_price
-                self.perf_logger.tick_debug(format_tick_message, get_tick_counter(), current_price, f"First tick: price={current_price:.2f}, green_count=0")
+                if self.tracer.enabled:
+                    self.tracer.record(TRACE_FIRST_TICK, current_price)
                 return
                 
             # Get noise filter parameters from config
@@ -1058,28 +1081,30 @@ class ModularIntradayStrategy:
                 if current_price > (self.prev_tick_price + min_movement):
                     # Significant upward movement
                     self.green_bars_count += 1
-                    self.perf_logger.tick_debug(format_tick_message, get_tick_counter(), current_price, f"Green tick: {self.prev_tick_price:.2f} -> {current_price:.2f} (delta: {current_price - self.prev_tick_price:.2f} > {min_movement:.2f}), count={self.green_bars_count}")
+                    if self.tracer.enabled:
+                        self.tracer.record(TRACE_GREEN_TICK, self.prev_tick_price, current_price, min_movement, self.green_bars_count)
                 elif current_price < (self.prev_tick_price - min_movement):
                     # Significant downward movement
                     self.green_bars_count = 0
-                    self.perf_logger.tick_debug(format_tick_message, get_tick_counter(), current_price, f"Red tick: {self.prev_tick_price:.2f} -> {current_price:.2f} (delta: {self.prev_tick_price - current_price:.2f} > {min_movement:.2f}), count reset to 0")
-                else:
+                    if self.tracer.enabled:
+                        self.tracer.record(TRACE_RED_TICK, self.prev_tick_price, current_price, min_movement)
+                elif self.tracer.enabled:
                     # Price within noise range - maintain current count
-                    self.perf_logger.tick_debug(format_tick_message, get_tick_counter(), current_price, f"Noise range tick: {self.prev_tick_price:.2f} -> {current_price:.2f} (delta: {abs(current_price - self.prev_tick_price):.2f} <= {min_movement:.2f}), count remains {self.green_bars_count}")
+                    self.tracer.record(TRACE_NOISE_TICK, self.prev_tick_price, current_price, min_movement, self.green_bars_count)
             else:
                 # Original behavior without noise filtering
                 if current_price > self.prev_tick_price:
                     self.green_bars_count += 1
-                    self.perf_logger.tick_debug(format_tick_message, get_tick_counter(), current_price, f"Green tick: {self.prev_tick_price:.2f} -> {current_price:.2f}, count={self.green_bars_count}")
+                    if self.tracer.enabled:
+                        self.tracer.record(TRACE_GREEN_TICK, self.prev_tick_price, current_price, 0.0, self.green_bars_count)
                 else:
                     # Reset counter on price decrease or equal
                     self.green_bars_count = 0
-                    self.perf_logger.tick_debug(format_tick_message, get_tick_counter(), current_price, f"Red tick: {self.prev_tick_price:.2f} -> {current_price:.2f}, count reset to 0")
+                    if self.tracer.enabled:
+                        self.tracer.record(TRACE_RED_TICK, self.prev_tick_price, current_price, 0.0)
             
             # Update previous price for next comparison
             self.prev_tick_price = current_price
-            
-            self.perf_logger.tick_debug(format_tick_message, get_tick_counter(), current_price, f"Green tick count: {self.green_bars_count}/{self.consecutive_green_bars_required}")
         except Exception as e:
             self.perf_logger.session_start(f"Error updating green tick count: {e}")
  
@@ -0,0 +1,495 @@
+"""
+core/signal_arrays.py - Precomputed entry-signal arrays + minimal sequential state machine
+
+Splits liveStrategy entry evaluation into two parts for backtests/matrix sweeps:
+
+1. STATELESS (vectorized, computed once per dataset/config):
+   - Indicator conditions: EMA crossover, VWAP, MACD, HTF trend, RSI, Bollinger Bands
+   - Time gates: trade blocks, session window, start/end buffers, no-trade periods
+   - Green tick streak length (depends only on the price path)
+   - Warm-up mask and session-exit mask
+
+2. STATEFUL (EntryStateMachine, tight per-tick loop without string building):
+   - Green tick threshold (Control Base SL after Base SL exits)
+   - SL regression (reduced Base SL + reversion timer)
+   - Price-Above-Exit filter
+   - Daily trade cap
+   - In-position flag
+
+Indicator values are produced with the same recurrences as the Incremental*
+trackers used by liveStrategy.process_tick_or_bar, so the arrays match the
+tick-by-tick path exactly. run_array_backtest() drives PositionManager in the
+same order as LiveTrader._run_polling_loop (session check -> signal -> entry ->
+process_positions).
+
+The stateless part depends only on the strategy/session/instrument sections
+(see signal_stream_key), so a SignalStream can be computed once and replayed
+with replay_positions() for every risk-parameter variant (matrix risk sweeps).
+SL regression, the Price-Above-Exit filter and Control Base SL feed exits back
+into entries; they live in EntryStateMachine and are replayed per variant.
+
+NOTE: RSI and Bollinger Bands are not computed by liveStrategy; as in the live
+path they only pass when the input data already carries 'rsi' / 'bb_lower' /
+'bb_upper' columns.
+"""
+
+import json
+import logging
+from dataclasses import dataclass
+from datetime import datetime, time
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List
+
+import numpy as np
+import pandas as pd
+
+from ..utils.config_helper import ConfigAccessor
+from ..utils.time_utils import apply_buffer_to_time, ensure_tz_aware, IST
+from .position_manager import PositionManager
+
+logger = logging.getLogger(__name__)
+
+_SL_EXIT_REASONS = ("Trailing Stop", "Base SL")
+
+# Config sections that determine the stateless entry stream (risk is replayed per variant)
+SIGNAL_STREAM_SECTIONS = ('strategy', 'session', 'instrument', 'instrument_mappings')
+
+
+# ============================================================================
+# STATELESS ARRAYS
+# ============================================================================
+
+def _ema_array(values: np.ndarray, period: int) -> np.ndarray:
+    """EMA with the exact recurrence of IncrementalEMA (seeded with first value)."""
+    alpha = 2 / (period + 1)
+    out = np.empty(len(values), dtype=np.float64)
+    ema = None
+    for i, price in enumerate(values.tolist()):
+        ema = price if ema is None else (price - ema) * alpha + ema
+        out[i] = ema
+    return out
+
+
+def _time_of_day_us(index: pd.DatetimeIndex) -> np.ndarray:
+    """Microseconds since midnight in each timestamp's own timezone."""
+    return (((index.hour.values.astype(np.int64) * 60 + index.minute.values) * 60
+             + index.second.values) * 1_000_000 + index.microsecond.values)
+
+
+def _us(t: time) -> int:
+    return ((t.hour * 60 + t.minute) * 60 + t.second) * 1_000_000 + t.microsecond
+
+
+def extract_price_volume(df: pd.DataFrame) -> tuple:
+    """Return (close, volume) arrays using the same column precedence as process_tick_or_bar."""
+    price_col = 'close' if 'close' in df.columns else 'price'
+    if price_col not in df.columns:
+        raise KeyError("Data must contain a 'close' or 'price' column")
+    close = df[price_col].to_numpy(dtype=np.float64)
+    if 'volume' in df.columns:
+        volume = df['volume'].fillna(0).to_numpy().astype(np.int64)
+    else:
+        volume = np.zeros(len(df), dtype=np.int64)
+    return close, volume
+
+
+def extract_timestamps(df: pd.DataFrame) -> pd.DatetimeIndex:
+    """Tz-aware timestamps from a 'timestamp' column or the index (naive -> IST)."""
+    raw = df['timestamp'] if 'timestamp' in df.columns else df.index
+    index = pd.DatetimeIndex(pd.to_datetime(raw))
+    if index.tz is None:
+        index = index.tz_localize(IST)
+    return index
+
+
+def compute_indicator_arrays(close: np.ndarray, volume: np.ndarray,
+                             config: MappingProxyType) -> Dict[str, np.ndarray]:
+    """
+    Compute enabled indicator series matching liveStrategy.process_tick_or_bar.
+
+    Returns:
+        Dict with 'fast_ema', 'slow_ema', 'macd', 'macd_signal', 'macd_histogram',
+        'vwap', 'htf_ema' (only keys for enabled indicators)
+    """
+    accessor = ConfigAccessor(config)
+    arrays: Dict[str, np.ndarray] = {}
+
+    if accessor.get_strategy_param('use_ema_crossover'):
+        arrays['fast_ema'] = _ema_array(close, accessor.get_strategy_param('fast_ema'))
+        arrays['slow_ema'] = _ema_array(close, accessor.get_strategy_param('slow_ema'))
+
+    if accessor.get_strategy_param('use_macd'):
+        macd_fast = _ema_array(close, accessor.get_strategy_param('macd_fast'))
+        macd_slow = _ema_array(close, accessor.get_strategy_param('macd_slow'))
+        macd = macd_fast - macd_slow
+        signal = _ema_array(macd, accessor.get_strategy_param('macd_signal'))
+        arrays['macd'] = macd
+        arrays['macd_signal'] = signal
+        arrays['macd_histogram'] = macd - signal
+
+    if accessor.get_strategy_param('use_vwap'):
+        # IncrementalVWAP skips non-positive volume; sequential cumsum matches its running sums
+        vol = np.where(volume > 0, volume, 0).astype(np.float64)
+        vol_sum = np.cumsum(vol)
+        pv_sum = np.cumsum(close * vol)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            arrays['vwap'] = np.where(vol_sum > 0, pv_sum / vol_sum, np.nan)
+
+    if accessor.get_strategy_param('use_htf_trend'):
+        arrays['htf_ema'] = _ema_array(close, accessor.get_strategy_param('htf_period'))
+
+    return arrays
+
+
+def compute_entry_signal_array(df: pd.DataFrame, config: MappingProxyType,
+                               indicators: Optional[Dict[str, np.ndarray]] = None) -> np.ndarray:
+    """
+    Boolean array of the stateless entry condition (all enabled indicator checks).
+
+    Equivalent to liveStrategy.entry_signal() evaluated on every row, without the
+    per-call checks_performed / failed_checks bookkeeping.
+    """
+    accessor = ConfigAccessor(config)
+    close, volume = extract_price_volume(df)
+    if indicators is None:
+        indicators = compute_indicator_arrays(close, volume, config)
+
+    signal = np.ones(len(close), dtype=bool)
+    with np.errstate(invalid='ignore'):
+        if accessor.get_strategy_param('use_ema_crossover'):
+            signal &= indicators['fast_ema'] > indicators['slow_ema']
+        if accessor.get_strategy_param('use_vwap'):
+            signal &= close > indicators['vwap']
+        if accessor.get_strategy_param('use_macd'):
+            signal &= indicators['macd'] > indicators['macd_signal']
+            signal &= indicators['macd_histogram'] > 0
+        if accessor.get_strategy_param('use_htf_trend'):
+            signal &= close > indicators['htf_ema']
+        if accessor.get_strategy_param('use_rsi_filter'):
+            if 'rsi' in df.columns:
+                rsi = df['rsi'].to_numpy(dtype=np.float64)
+                oversold = accessor.get_strategy_param('rsi_oversold')
+                overbought = accessor.get_strategy_param('rsi_overbought')
+                signal &= (rsi > oversold) & (rsi < overbought)
+            else:
+                signal[:] = False
+        if accessor.get_strategy_param('use_bollinger_bands'):
+            if 'bb_lower' in df.columns and 'bb_upper' in df.columns:
+                signal &= (df['bb_lower'].to_numpy(dtype=np.float64) < close)
+                signal &= (close < df['bb_upper'].to_numpy(dtype=np.float64))
+            else:
+                signal[:] = False
+    return signal
+
+
+def compute_green_tick_counts(close: np.ndarray, config: MappingProxyType) -> np.ndarray:
+    """
+    Consecutive green tick count after each tick (liveStrategy._update_green_tick_count).
+
+    Up-moves increment the streak, down-moves reset it; with the noise filter
+    enabled, moves inside the noise band leave it unchanged.
+    """
+    accessor = ConfigAccessor(config)
+    n = len(close)
+    if n == 0:
+        return np.zeros(0, dtype=np.int64)
+    prev = close[:-1]
+    cur = close[1:]
+    if bool(accessor.get_strategy_param('noise_filter_enabled')):
+        tick_size = float(accessor.get_current_instrument_param('tick_size'))
+        min_ticks = float(accessor.get_strategy_param('noise_filter_min_ticks'))
+        pct = float(accessor.get_strategy_param('noise_filter_percentage'))
+        min_move = np.maximum(tick_size * min_ticks, prev * pct)
+        up = cur > prev + min_move
+        down = cur < prev - min_move
+    else:
+        up = cur > prev
+        down = ~up
+    up_full = np.concatenate(([False], up))
+    down_full = np.concatenate(([True], down))  # First tick starts the streak at 0
+    ups = np.cumsum(up_full)
+    last_reset = np.maximum.accumulate(np.where(down_full, np.arange(n), 0))
+    return ups - ups[last_reset]
+
+
+def compute_session_arrays(timestamps: pd.DatetimeIndex, config: MappingProxyType) -> Dict[str, np.ndarray]:
+    """
+    Time-only gates used by liveStrategy.can_enter_new_position and should_exit_for_session.
+
+    Returns:
+        Dict with 'entry_allowed' (trade blocks, session, buffers, no-trade periods)
+        and 'session_exit' (outside session or at/after the end buffer)
+    """
+    accessor = ConfigAccessor(config)
+    session_start = time(accessor.get_session_param('start_hour'), accessor.get_session_param('start_min'))
+    session_end = time(accessor.get_session_param('end_hour'), accessor.get_session_param('end_min'))
+    buffer_start = apply_buffer_to_time(session_start, accessor.get_session_param('start_buffer_minutes'), is_start=True)
+    buffer_end = apply_buffer_to_time(session_end, accessor.get_session_param('end_buffer_minutes'), is_start=False)
+    no_trade_start = accessor.get_session_param('no_trade_start_minutes')
+    no_trade_end = accessor.get_session_param('no_trade_end_minutes')
+
+    tod = _time_of_day_us(timestamps)
+    start_us, end_us = _us(session_start), _us(session_end)
+    if start_us <= end_us:
+        in_session = (tod >= start_us) & (tod <= end_us)
+    else:
+        in_session = (tod >= start_us) | (tod <= end_us)
+
+    allowed = in_session.copy()
+    allowed &= tod >= _us(buffer_start)
+    allowed &= tod <= _us(buffer_end)
+    allowed &= tod >= start_us + no_trade_start * 60_000_000
+    allowed &= tod <= end_us - no_trade_end * 60_000_000
+
+    if accessor.get_session_param('trade_block_enabled'):
+        minutes = timestamps.hour.values * 60 + timestamps.minute.values
+        for block in accessor.get_session_param('trade_blocks'):
+            block_start = block['start_hour'] * 60 + block['start_min']
+            block_end = block['end_hour'] * 60 + block['end_min']
+            allowed &= ~((minutes >= block_start) & (minutes <= block_end))
+
+    session_exit = ~in_session | (tod >= _us(buffer_end))
+    return {'entry_allowed': allowed, 'session_exit': session_exit}
+
+
+# ============================================================================
+# STATEFUL STATE MACHINE
+# ============================================================================
+
+class EntryStateMachine:
+    """
+    Stateful part of liveStrategy entry gating, without per-tick string building.
+
+    State transitions mirror liveStrategy:
+    - allows(): SL regression timer check, daily cap, green tick threshold,
+      Price-Above-Exit filter (evaluated only while not in position)
+    - on_signal(): Control Base SL threshold reset when a BUY signal is produced
+    - on_entry(): in-position flag + daily trade count
+    - on_position_exit(): PositionManager callback (filter, regression, control SL)
+    """
+
+    def __init__(self, config: MappingProxyType):
+        accessor = ConfigAccessor(config)
+        self.max_positions_per_day = accessor.get_risk_param('max_positions_per_day')
+        self.filter_enabled = accessor.get_risk_param('price_above_exit_filter_enabled')
+        self.price_buffer_points = accessor.get_risk_param('price_buffer_points')
+        self.filter_duration_seconds = accessor.get_risk_param('filter_duration_seconds')
+        self.sl_regression_enabled = accessor.get_risk_param('sl_regression_enabled')
+        self.max_base_sl = accessor.get_risk_param('max_base_sl')
+        self.min_base_sl = accessor.get_risk_param('min_base_sl')
+        self.sl_regression_step = accessor.get_risk_param('sl_regression_step')
+        self.sl_regression_window_minutes = accessor.get_risk_param('sl_regression_window_minutes')
+        self.consecutive_green_bars_required = accessor.get_strategy_param('consecutive_green_bars')
+        self.control_base_sl_enabled = accessor.get_strategy_param('Enable_control_base_sl_green_ticks')
+        self.base_sl_green_ticks = accessor.get_strategy_param('control_base_sl_green_ticks')
+
+        self.in_position = False
+        self.position_id: Optional[str] = None
+        self.trades_today = 0
+        self.current_base_sl = self.max_base_sl
+        self.last_sl_exit_time: Optional[datetime] = None
+        self.last_exit_reason: Optional[str] = None
+        self.last_exit_price: Optional[float] = None
+        self.last_exit_time: Optional[datetime] = None
+        self.last_exit_was_base_sl = False
+
+    @property
+    def green_tick_threshold(self) -> int:
+        if self.control_base_sl_enabled and self.last_exit_was_base_sl:
+            return self.base_sl_green_ticks
+        return self.consecutive_green_bars_required
+
+    def allows(self, now: datetime, price: float, green_count: int) -> bool:
+        """Stateful gates of can_enter_new_position (time gates are precomputed)."""
+        if self.sl_regression_enabled and self.last_sl_exit_time is not None:
+            elapsed_minutes = (now - self.last_sl_exit_time).total_seconds() / 60
+            if elapsed_minutes >= self.sl_regression_window_minutes:
+                self.current_base_sl = self.max_base_sl
+                self.last_sl_exit_time = None
+
+        if self.trades_today >= self.max_positions_per_day:
+            return False
+        if green_count < self.green_tick_threshold:
+            return False
+        if (self.filter_enabled and self.last_exit_reason in _SL_EXIT_REASONS
+                and self.last_exit_time is not None):
+            elapsed = (now - self.last_exit_time).total_seconds()
+            if elapsed <= self.filter_duration_seconds and price < self.last_exit_price + self.price_buffer_points:
+                return False
+        return True
+
+    def on_signal(self):
+        """BUY signal produced (liveStrategy resets Control Base SL even if no order follows)."""
+        if self.control_base_sl_enabled:
+            self.last_exit_was_base_sl = False
+
+    def on_entry(self, position_id: str):
+        self.in_position = True
+        self.position_id = position_id
+        self.trades_today += 1
+
+    def base_sl_override(self) -> Optional[float]:
+        return self.current_base_sl if self.sl_regression_enabled else None
+
+    def on_position_exit(self, exit_info: Dict[str, Any]):
+        """PositionManager strategy_callback - same transitions as liveStrategy.on_position_exit."""
+        if self.position_id == exit_info.get('position_id'):
+            self.in_position = False
+            self.position_id = None
+
+        exit_reason = exit_info.get('exit_reason', '')
+        exit_time = exit_info.get('timestamp')
+
+        if exit_reason in _SL_EXIT_REASONS:
+            if self.filter_enabled:
+                self.last_exit_reason = exit_reason
+                self.last_exit_price = exit_info.get('exit_price')
+                self.last_exit_time = exit_time
+            if self.sl_regression_enabled:
+                old_sl = self.current_base_sl
+                self.current_base_sl = max(self.current_base_sl - self.sl_regression_step, self.min_base_sl)
+                if self.current_base_sl < old_sl:
+                    self.last_sl_exit_time = exit_time
+
+        if not self.control_base_sl_enabled:
+            return
+        if 'Base SL' in exit_reason:
+            self.last_exit_was_base_sl = True
+        elif exit_reason in ('Take Profit', 'Trailing Stop'):
+            self.last_exit_was_base_sl = False
+
+    def on_position_closed(self, position_id: str):
+        """Trader notification after risk-management close (liveStrategy.on_position_closed)."""
+        if self.position_id == position_id:
+            self.in_position = False
+            self.position_id = None
+
+
+# ============================================================================
+# SIGNAL STREAM
+# ============================================================================
+
+@dataclass
+class SignalStream:
+    """Stateless per-tick inputs of the entry loop for one dataset and signal config."""
+    close: List[float]
+    timestamps: List[datetime]
+    green: List[int]
+    candidate: np.ndarray      # Indicator signal & time gates & warm-up
+    session_exit: np.ndarray
+    warmup: int
+
+
+def signal_stream_key(config: MappingProxyType) -> str:
+    """Configs with equal keys produce identical SignalStreams on the same data."""
+    return json.dumps({section: config[section] for section in SIGNAL_STREAM_SECTIONS},
+                      sort_keys=True, default=str)
+
+
+def compute_signal_stream(df: pd.DataFrame, config: MappingProxyType,
+                          timestamps: Optional[List[datetime]] = None) -> SignalStream:
+    """
+    Compute indicators, entry candidates and green tick counts once.
+
+    Args:
+        df: Tick data (see run_array_backtest)
+        config: Configuration; only SIGNAL_STREAM_SECTIONS are read
+        timestamps: Tz-aware datetimes for df's rows, when the caller already has them
+    """
+    accessor = ConfigAccessor(config)
+    warmup = accessor.get_strategy_param('min_warmup_ticks')
+
+    close, _ = extract_price_volume(df)
+    index = extract_timestamps(df)
+    if timestamps is None:
+        timestamps = [ensure_tz_aware(ts) for ts in index.to_pydatetime()]
+    signal = compute_entry_signal_array(df, config)
+    green = compute_green_tick_counts(close, config)
+    session = compute_session_arrays(index, config)
+    # Warm-up and time gates are stateless: fold them into one candidate mask
+    candidate = signal & session['entry_allowed']
+    candidate[:max(0, warmup - 1)] = False
+
+    return SignalStream(close=close.tolist(), timestamps=timestamps, green=green.tolist(),
+                        candidate=candidate, session_exit=session['session_exit'], warmup=warmup)
+
+
+# ============================================================================
+# DRIVER
+# ============================================================================
+
+def run_array_backtest(df: pd.DataFrame, frozen_config: MappingProxyType,
+                       symbol: Optional[str] = None) -> PositionManager:
+    """
+    Run a forward-test equivalent backtest using precomputed arrays.
+
+    Follows LiveTrader._run_polling_loop ordering: session-end check (close and
+    stop), entry evaluation, order placement, then PositionManager exits on the
+    same tick. The session-end close uses the tick timestamp instead of
+    wall-clock time.
+
+    Args:
+        df: Tick data with 'close' (or 'price'), optional 'volume', and a
+            'timestamp' column or DatetimeIndex
+        frozen_config: Frozen configuration (MappingProxyType)
+        symbol: Trading symbol (default: instrument.symbol)
+
+    Returns:
+        PositionManager holding completed_trades
+    """
+    if not isinstance(frozen_config, MappingProxyType):
+        raise TypeError("run_array_backtest requires a frozen MappingProxyType config")
+    return replay_positions(compute_signal_stream(df, frozen_config), frozen_config, symbol)
+
+
+def replay_positions(stream: SignalStream, frozen_config: MappingProxyType,
+                     symbol: Optional[str] = None) -> PositionManager:
+    """
+    Run the stateful entry/exit loop of run_array_backtest over a precomputed stream.
+
+    The stream may come from any config with the same signal_stream_key; risk
+    parameters (SL/TP, trailing, commission, filters, SL regression) are taken
+    from frozen_config.
+    """
+    if not isinstance(frozen_config, MappingProxyType):
+        raise TypeError("replay_positions requires a frozen MappingProxyType config")
+    accessor = ConfigAccessor(frozen_config)
+    symbol = symbol or accessor.get_instrument_param('symbol')
+    warmup = stream.warmup
+
+    state = EntryStateMachine(frozen_config)
+    pm = PositionManager(frozen_config, strategy_callback=state.on_position_exit)
+    active_position_id: Optional[str] = None
+    timestamps = stream.timestamps
+    candidate = stream.candidate
+    session_exit = stream.session_exit
+    close_list = stream.close
+    green_list = stream.green
+
+    for i in range(len(close_list)):
+        now = timestamps[i]
+        price = close_list[i]
+
+        if session_exit[i]:
+            if active_position_id and active_position_id in pm.positions:
+                pm.close_position_full(active_position_id, price, now, "Session End")
+                state.on_position_closed(active_position_id)
+            break
+
+        if not state.in_position and i >= warmup - 1:
+            if state.allows(now, price, green_list[i]) and candidate[i]:
+                state.on_signal()
+                if not active_position_id:
+                    position_id = pm.open_position(symbol, price, now,
+                                                   base_sl_points_override=state.base_sl_override())
+                    if position_id:
+                        state.on_entry(position_id)
+                        active_position_id = position_id
+
+        if active_position_id:
+            pm.process_positions({'close': price}, now)
+            if active_position_id not in pm.positions:
+                state.on_position_closed(active_position_id)
+                active_position_id = None
+
+    return pm
@@ -39,7 +39,7 @@ from typing import Dict, Any
 
 from ..utils.config_helper import create_config_from_defaults, validate_config, freeze_config, ConfigAccessor
 from ..backtest.backtest_runner import BacktestRunner
-from ..utils.cache_manager import refresh_symbol_cache, load_symbol_cache
+from ..utils.cache_manager import refresh_symbol_cache, get_symbol_index
 from ..live.trader import LiveTrader
 from ..live.forward_test_results import ForwardTestResults
 
@@ -57,6 +57,9 @@ frozen_cfg = freeze_config(base_cfg)
 setup_from_config(frozen_cfg)
 logger = logging.getLogger(__name__)
 
+# Monitor tab: Latency view refresh interval while a forward test runs
+LATENCY_REFRESH_MS = 2000
+
 
 class GuiLogHandler(logging.Handler):
     """Custom log handler to display logs in GUI text widget"""
@@ -255,6 +258,13 @@ class UnifiedTradingGUI(tk.Tk):
         # Data / misc placeholders
         self.bt_data_file = tk.StringVar(value="")
 
+        # Checkpoint/resume for long runs (from defaults.py)
+        checkpoint_config = DEFAULT_CONFIG['checkpoint']
+        self.bt_checkpoint_enabled = tk.BooleanVar(value=checkpoint_config['enabled'])
+        self.bt_checkpoint_resume = tk.BooleanVar(value=checkpoint_config['resume'])
+        self.bt_diagnostics_mode = tk.StringVar(value=DEFAULT_CONFIG['backtest']['diagnostics_mode'])
+        self.bt_use_result_cache = tk.BooleanVar(value=DEFAULT_CONFIG['result_cache']['enabled'])
+
         # Logger UI placeholders
         self.logger_levels = {}
         for logger_name in ["core.indicators", "core.researchStrategy", "backtest.backtest_runner", "utils.simple_loader"]:
@@ -342,9 +352,12 @@ class UnifiedTradingGUI(tk.Tk):
         # Forward Test Data Simulation (Optional)
         self.ft_use_file_simulation = tk.BooleanVar(value=False)  # Disabled by default - live trading is primary
         self.ft_data_file_path = tk.StringVar(value="")  # No file selected by default
+        self.ft_checkpoint_enabled = tk.BooleanVar(value=DEFAULT_CONFIG['checkpoint']['enabled'])
+        self.ft_checkpoint_resume = tk.BooleanVar(value=DEFAULT_CONFIG['checkpoint']['resume'])
 
         # Forward Test Performance Settings (Consumption Mode)
         self.ft_use_direct_callbacks = tk.BooleanVar(value=True)  # Default to callback mode (Wind-style, faster)
+        self.ft_use_asyncio = tk.BooleanVar(value=False)  # Asyncio event-loop mode (overrides callback/polling)
 
         # Forward Test Capital management (from defaults.py)
         self.ft_initial_capital = tk.StringVar(value=str(capital_config['initial_capital']))
@@ -644,6 +657,12 @@ class UnifiedTradingGUI(tk.Tk):
         # Set the data file path for the backtest runner
         config['backtest']['data_path'] = self.bt_data_file.get()
 
+        # Checkpoint/resume settings
+        config['checkpoint']['enabled'] = self.bt_checkpoint_enabled.get()
+        config['checkpoint']['resume'] = self.bt_checkpoint_resume.get()
+        config['backtest']['diagnostics_mode'] = self.bt_diagnostics_mode.get()
+        config['result_cache']['enabled'] = self.bt_use_result_cache.get()
+
         # --- Ensure logging config is propagated to backtest config ---
         # Include logging defaults from DEFAULT_CONFIG
         config['logging'] = DEFAULT_CONFIG['logging'].copy()
@@ -1176,6 +1195,8 @@ class UnifiedTradingGUI(tk.Tk):
         help_label = ttk.Label(data_sim_frame, text="💡 User-controlled only: When enabled, uses ONLY selected CSV file data. No fallback data if WebSocket fails. Live trading completely preserved.", 
                               font=('TkDefaultFont', 8), foreground='gray')
         help_label.grid(row=1, column=0, columnspan=4, sticky="w", padx=5, pady=(0,5))
+        ttk.Checkbutton(data_sim_frame, text="Save checkpoints", variable=self.ft_checkpoint_enabled).grid(row=2, column=0, sticky="w", padx=5, pady=2)
+        ttk.Checkbutton(data_sim_frame, text="Resume from checkpoint", variable=self.ft_checkpoint_resume).grid(row=2, column=1, columnspan=2, sticky="w", padx=5, pady=2)
         row += 1
 
         # Add separator
@@ -1192,23 +1213,29 @@ class UnifiedTradingGUI(tk.Tk):
 
         ttk.Label(perf_frame, text="Consumption Mode:").grid(row=0, column=0, sticky="e", padx=5, pady=5)
         mode_combo = ttk.Combobox(perf_frame, 
-                                 values=["⚡ Callback Mode (Fast - Default)", "📊 Polling Mode (Safe)"], 
+                                 values=["⚡ Callback Mode (Fast - Default)", "📊 Polling Mode (Safe)",
+                                         "🔄 Asyncio Mode (Event Loop)"], 
                                  state="readonly", width=30)
         mode_combo.grid(row=0, column=1, padx=5, pady=5, sticky="w")
         
-        # Set initial value based on ft_use_direct_callbacks
-        mode_combo.set("⚡ Callback Mode (Fast - Default)" if self.ft_use_direct_callbacks.get() else "📊 Polling Mode (Safe)")
+        # Set initial value based on ft_use_asyncio / ft_use_direct_callbacks
+        if self.ft_use_asyncio.get():
+            mode_combo.set("🔄 Asyncio Mode (Event Loop)")
+        else:
+            mode_combo.set("⚡ Callback Mode (Fast - Default)" if self.ft_use_direct_callbacks.get() else "📊 Polling Mode (Safe)")
         
-        # Bind combo change to update the boolean variable
+        # Bind combo change to update the boolean variables
         def on_mode_change(event):
             selected = mode_combo.get()
             self.ft_use_direct_callbacks.set("Callback" in selected)
+            self.ft_use_asyncio.set("Asyncio" in selected)
         mode_combo.bind("<<ComboboxSelected>>", on_mode_change)
 
         # Help text explaining the modes
         perf_help = ttk.Label(perf_frame, 
                              text="⚡ Callback Mode: Wind-style direct processing (~50ms latency, 29% faster)\n"
-                                  "📊 Polling Mode: Queue-based processing (~70ms latency, proven stable)", 
+                                  "📊 Polling Mode: Queue-based processing (~70ms latency, proven stable)\n"
+                                  "🔄 Asyncio Mode: Ticks awaited on an event loop (no polling delay)", 
                              font=('TkDefaultFont', 8), foreground='gray', justify='left')
         perf_help.grid(row=1, column=0, columnspan=2, sticky="w", padx=5, pady=(0,5))
         row += 1
@@ -1521,6 +1548,16 @@ class UnifiedTradingGUI(tk.Tk):
         ttk.Entry(file_frame, textvariable=self.bt_data_file).grid(row=0, column=0, sticky='ew', padx=(0,5))
         ttk.Button(file_frame, text="Browse", command=self._bt_browse_csv).grid(row=0, column=1)
         
+        # Checkpoint/resume row
+        checkpoint_frame = ttk.Frame(content)
+        checkpoint_frame.grid(row=1, column=1, sticky='w', padx=(0,5), pady=(0,5))
+        ttk.Checkbutton(checkpoint_frame, text="Save checkpoints", variable=self.bt_checkpoint_enabled).grid(row=0, column=0, sticky='w')
+        ttk.Checkbutton(checkpoint_frame, text="Resume from checkpoint", variable=self.bt_checkpoint_resume).grid(row=0, column=1, sticky='w', padx=(10,0))
+        ttk.Label(checkpoint_frame, text="Diagnostics:").grid(row=0, column=2, sticky='e', padx=(20,5))
+        ttk.Combobox(checkpoint_frame, textvariable=self.bt_diagnostics_mode, values=["off", "summary", "full"],
+                     state="readonly", width=9).grid(row=0, column=3, sticky='w')
+        ttk.Checkbutton(checkpoint_frame, text="Reuse cached results", variable=self.bt_use_result_cache).grid(row=0, column=4, sticky='w', padx=(20,0))
+        
         section.pack(fill='x', pady=(0,10))
 
     def _build_strategy_section(self, parent):
@@ -2398,6 +2435,18 @@ class UnifiedTradingGUI(tk.Tk):
         self.ft_performance_box.grid(row=0, column=0, sticky='nsew', padx=(0,2))
         perf_scroll.grid(row=0, column=1, sticky='ns')
 
+        # Latency Tab (end-to-end tick latency histograms of the running trader)
+        latency_frame = ttk.Frame(monitor_notebook)
+        monitor_notebook.add(latency_frame, text="⏱️ Latency")
+        
+        latency_frame.columnconfigure(0, weight=1)
+        latency_frame.rowconfigure(1, weight=1)
+        
+        ttk.Button(latency_frame, text="Refresh", command=self._refresh_latency_monitor).grid(row=0, column=0, sticky="w", pady=(5,5))
+        self.ft_latency_box = tk.Text(latency_frame, height=25, state='disabled', wrap='none', font=('Consolas', 14))
+        self.ft_latency_box.grid(row=1, column=0, columnspan=2, sticky='nsew')
+        self.after(LATENCY_REFRESH_MS, self._schedule_latency_refresh)
+
         # Status Details Tab
         status_frame = ttk.Frame(monitor_notebook)
         monitor_notebook.add(status_frame, text="📋 Status Details")
@@ -2437,6 +2486,29 @@ class UnifiedTradingGUI(tk.Tk):
         ttk.Label(status_detail_frame, text="Ticks Processed:").grid(row=8, column=0, sticky="w", padx=10)
         ttk.Label(status_detail_frame, textvariable=self.ft_tick_count).grid(row=8, column=1, sticky="w", padx=10)
 
+    def _schedule_latency_refresh(self):
+        """Refresh the Latency tab periodically while a forward test is running"""
+        if getattr(self, 'active_trader', None) is not None:
+            self._refresh_latency_monitor()
+        self.after(LATENCY_REFRESH_MS, self._schedule_latency_refresh)
+
+    def _refresh_latency_monitor(self):
+        """Show the running trader's receive -> decision latency histograms (live/tick_latency.py)"""
+        trader = getattr(self, 'active_trader', None)
+        tick_latency = getattr(trader, 'tick_latency', None)
+        if tick_latency is None:
+            text = "No forward test running"
+        else:
+            text = "\n".join([f"Tick latency - {tick_latency.count:,} ticks (receive -> stage)", ""]
+                             + tick_latency.format_report())
+        try:
+            self.ft_latency_box.config(state="normal")
+            self.ft_latency_box.delete(1.0, tk.END)
+            self.ft_latency_box.insert(1.0, text)
+            self.ft_latency_box.config(state="disabled")
+        except Exception as e:
+            logger.warning(f"Failed to update latency monitor: {e}")
+
     def _build_log_tab(self):
         """Build the logging tab"""
         frame = self.log_tab
@@ -2548,22 +2620,22 @@ class UnifiedTradingGUI(tk.Tk):
                 messagebox.showwarning("Input Required", "Please enter a symbol filter")
                 return
                 
-            # Load symbol cache
-            cache = load_symbol_cache()
-            if not cache:
+            # Symbol index (parsed once per process, rebuilt when the cache file changes)
+            index = get_symbol_index(persist=True)
+            if not len(index):
                 messagebox.showerror("Cache Error", "Symbol cache not loaded. Please refresh cache first.")
                 return
                 
             # Filter symbols
-            matching_symbols = [symbol for symbol in cache.keys() if symbol_filter in symbol]
+            matching_symbols, match_count = index.search(symbol_filter, limit=100)  # Limit to 100 results
             
             # Clear and populate listbox
             self.ft_symbols_listbox.delete(0, tk.END)
-            for symbol in sorted(matching_symbols)[:100]:  # Limit to 100 results
+            for symbol in matching_symbols:
                 self.ft_symbols_listbox.insert(tk.END, symbol)
                 
-            self.ft_cache_status.set(f"Found {len(matching_symbols)} matches for '{symbol_filter}'")
-            logger.info(f"Loaded {len(matching_symbols)} symbols matching '{symbol_filter}'")
+            self.ft_cache_status.set(f"Found {match_count} matches for '{symbol_filter}'")
+            logger.info(f"Loaded {match_count} symbols matching '{symbol_filter}'")
             
         except Exception as e:
             self.ft_cache_status.set(f"Symbol loading failed: {e}")
@@ -2583,10 +2655,8 @@ class UnifiedTradingGUI(tk.Tk):
             self.ft_token.set("")
             
             # Load token information
-            cache = load_symbol_cache()
-            if cache and selected_symbol in cache:
-                # cache[selected_symbol] is the token string directly (simple mapping)
-                token = cache[selected_symbol]
+            token = get_symbol_index(persist=True).token(selected_symbol)
+            if token:
                 self.ft_token.set(str(token))
                 logger.info(f"Selected symbol: {selected_symbol}, Token: {token}")
             else:
@@ -2811,6 +2881,8 @@ class UnifiedTradingGUI(tk.Tk):
             'enabled': self.ft_use_file_simulation.get(),
             'file_path': self.ft_data_file_path.get() if self.ft_use_file_simulation.get() else ""
         }
+        config_dict['checkpoint']['enabled'] = self.ft_checkpoint_enabled.get()
+        config_dict['checkpoint']['resume'] = self.ft_checkpoint_resume.get()
         
         # Log data source for user confirmation
         if config_dict['data_simulation']['enabled']:
@@ -2976,7 +3048,11 @@ class UnifiedTradingGUI(tk.Tk):
                 trader = LiveTrader(frozen_config=ft_frozen_config, dialog_text=config_text)
                 # Set consumption mode from GUI toggle
                 trader.use_direct_callbacks = self.ft_use_direct_callbacks.get()
-                logger.info(f"🎯 Consumption mode set: {'⚡ Callback (Fast)' if trader.use_direct_callbacks else '📊 Polling (Safe)'}")
+                trader.use_asyncio = self.ft_use_asyncio.get()
+                if trader.use_asyncio:
+                    logger.info("🎯 Consumption mode set: 🔄 Asyncio (Event Loop)")
+                else:
+                    logger.info(f"🎯 Consumption mode set: {'⚡ Callback (Fast)' if trader.use_direct_callbacks else '📊 Polling (Safe)'}")
             except Exception as e:
                 logger.error(f"Failed to create LiveTrader: {e}")
                 messagebox.showerror("LiveTrader Error", f"Could not create LiveTrader: {e}")
@@ -2996,6 +3072,7 @@ class UnifiedTradingGUI(tk.Tk):
                     logger.info("🔬 Performance testing mode detected - FORCING WebSocket callback mode")
                     # CRITICAL: Force WebSocket callback mode for performance testing
                     trader.use_direct_callbacks = True
+                    trader.use_asyncio = False
                     logger.info("⚡ Callback mode FORCED ON - WebSocket direct callbacks (no polling)")
                     perf_hook.inject_into_trader(trader)
             except ImportError:
@@ -3688,8 +3765,12 @@ class UnifiedTradingGUI(tk.Tk):
         lines.append("")
         
         # Consumption Mode (Performance Setting)
-        consumption_mode = "⚡ Callback Mode (Fast)" if self.ft_use_direct_callbacks.get() else "📊 Polling Mode (Safe)"
-        consumption_latency = "~50ms latency, Wind-style" if self.ft_use_direct_callbacks.get() else "~70ms latency, Queue-based"
+        if self.ft_use_asyncio.get():
+            consumption_mode = "🔄 Asyncio Mode (Event Loop)"
+            consumption_latency = "No polling delay, event-loop hand-off"
+        else:
+            consumption_mode = "⚡ Callback Mode (Fast)" if self.ft_use_direct_callbacks.get() else "📊 Polling Mode (Safe)"
+            consumption_latency = "~50ms latency, Wind-style" if self.ft_use_direct_callbacks.get() else "~70ms latency, Queue-based"
         lines.append(f"CONSUMPTION MODE: {consumption_mode}")
         lines.append(f"Expected Performance: {consumption_latency}")
         lines.append("")
@@ -25,7 +25,6 @@ import time
 import logging
 import pandas as pd
 import threading
-import queue
 import os
 import csv
 from pathlib import Path
@@ -34,12 +33,14 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Callable
 
 from ..utils.time_utils import now_ist, normalize_datetime_to_ist, IST
+from .run_profile import RunProfile, get_run_profile
+from .tick_ring_buffer import TickRingBuffer
+from .gap_fill import GapFiller
 
 from types import MappingProxyType
 
-# Set tick log directory to user's Desktop BotResults folder
+# Set tick log directory to user's Desktop BotResults folder (created when live tick logging starts)
 TICK_LOG_DIR = Path(r"C:\Users\user\Desktop\BotResults\LiveTickPrice")
-TICK_LOG_DIR.mkdir(parents=True, exist_ok=True)
 
 logger = logging.getLogger(__name__)
 
@@ -53,11 +54,12 @@ def set_pre_convergence_instrumentor(instrumentor):
     logger.info(f"🔬 [BROKER_ADAPTER] Instrumentor SET: {instrumentor is not None}, Type: {type(instrumentor).__name__ if instrumentor else 'None'}")
 
 class BrokerAdapter:
-    def __init__(self, config: MappingProxyType = None):
+    def __init__(self, config: MappingProxyType = None, profile: RunProfile = None):
         """Initialize BrokerAdapter with frozen config from upstream
         
         Args:
             config: Frozen MappingProxyType config from LiveTrader
+            profile: LiveTrader run profile (default: interactive)
         """
         if config is None:
             raise ValueError("BrokerAdapter requires frozen config from upstream (LiveTrader)")
@@ -66,6 +68,7 @@ class BrokerAdapter:
             raise TypeError(f"BrokerAdapter requires frozen MappingProxyType, got {type(config)}")
             
         self.params = config
+        self.profile = profile or get_run_profile('interactive')
         
         # Use strict config access - fail immediately if sections missing
         from ..utils.config_helper import ConfigAccessor
@@ -90,7 +93,7 @@ class BrokerAdapter:
         self.paper_trading = self.live_params["paper_trading"]
 
         # Data streaming components
-        self.tick_buffer = queue.Queue(maxsize=1000)  # Thread-safe queue (no lock needed)
+        self.tick_buffer = TickRingBuffer.from_config(config)  # SPSC ring: WebSocket thread -> polling loop
         self.df_tick = pd.DataFrame(columns=["timestamp", "price", "volume"])
         self.last_price: float = 0.0
         self.connection = None
@@ -99,6 +102,10 @@ class BrokerAdapter:
         
         # WebSocket streaming components
         self.ws_streamer = None
+        self.gap_filler: Optional[GapFiller] = None  # Set with the WebSocket when gap_fill.enabled
+        self._gap_fill_lock = threading.Lock()
+        self._held_ticks: Optional[List] = None  # Live ticks waiting behind a backfill replay (None = no replay)
+        self._gap_fill_thread: Optional[threading.Thread] = None
         self.streaming_mode = False  # True = WebSocket, False = Polling
         self.last_tick_time = None
         self.heartbeat_threshold = 30  # seconds - switch to polling if no ticks
@@ -107,6 +114,10 @@ class BrokerAdapter:
         # Direct callback support (Wind-style, optional)
         self.on_tick_callback: Optional[Callable] = None
         
+        # Multi-symbol: every instrument streamed over the one WebSocket
+        # ([{"symbol", "token", "exchange"}]; None = config['instrument'] only)
+        self.subscriptions: Optional[List[Dict[str, Any]]] = None
+        
         # Auto-recovery settings
         self.reconnect_attempts = 0
         self.max_reconnect_attempts = 3
@@ -126,8 +137,11 @@ class BrokerAdapter:
             file_path = config.get('data_simulation', {}).get('file_path', '')
             if file_path:
                 from .data_simulator import DataSimulator
-                # DataSimulator only takes file_path parameter
-                self.file_simulator = DataSimulator(file_path)
+                # Optional max_ticks replays only a prefix (matrix successive halving)
+                max_ticks = config.get('data_simulation', {}).get('max_ticks')
+                self.file_simulator = DataSimulator(file_path, max_ticks=max_ticks)
+                if not self.profile.pacing:
+                    self.file_simulator.tick_delay = 0.0
                 logger.info(f"File simulation enabled with: {file_path}")
 
         # Dynamic imports for SmartAPI
@@ -156,6 +170,12 @@ class BrokerAdapter:
                 self.tick_writer = None
                 logger.info("📁 File simulation mode: tick logging disabled (source file already exists)")
                 return
+            if not self.profile.tick_recording:
+                self.tick_logging_enabled = False
+                self.tick_file = None
+                self.tick_writer = None
+                logger.info(f"Run profile '{self.profile.name}': live tick logging disabled")
+                return
             
             # Generate session-based filename with symbol and session end time
             date = datetime.now().strftime("%Y%m%d")
@@ -164,6 +184,7 @@ class BrokerAdapter:
             fname = f"livePrice_{symbol_clean}_{date}_{eh:02d}{em:02d}.csv"
             
             # Open file with buffered I/O for performance
+            TICK_LOG_DIR.mkdir(parents=True, exist_ok=True)
             tick_log_path = TICK_LOG_DIR / fname
             self.tick_file = tick_log_path.open("w", newline="", encoding="utf-8", buffering=8192)
             self.tick_writer = csv.writer(self.tick_file)
@@ -269,19 +290,19 @@ class BrokerAdapter:
                         logger.debug("[BrokerAdapter] Failed to log file simulator tick diagnostic")
 
                 self._buffer_tick(tick)
+                tick['received_ns'] = time.perf_counter_ns()  # Simulated feed: received when read
             return tick
         
         # Priority 1: WebSocket streaming (real-time) - ONLY mode when WebSocket is active
         if self.streaming_mode:
             try:
-                try:
-                    # Non-blocking get from thread-safe queue (no lock needed)
-                    tick = self.tick_buffer.get_nowait()
-                    self.last_price = tick['price']
-                    return tick
-                except queue.Empty:
+                # Non-blocking read from the SPSC ring (no lock needed; conflates a backlog if enabled)
+                tick = self.tick_buffer.pop_conflated()
+                if tick is None:
                     # WebSocket is active but buffer is empty - return None (don't poll)
                     return None
+                self.last_price = tick['price']
+                return tick
             except Exception as e:
                 logger.error(f"Error processing WebSocket tick buffer: {e}")
                 return None
@@ -305,23 +326,16 @@ class BrokerAdapter:
             self.df_tick = pd.concat([self.df_tick, pd.DataFrame([tick])], ignore_index=True)
         if len(self.df_tick) > 2500:
             self.df_tick = self.df_tick.tail(2000)  # Keep last 2000 for memory management
-        
-        # Add to queue for get_next_tick() compatibility
-        try:
-            self.tick_buffer.put_nowait(tick)
-        except queue.Full:
-            # Queue full, drop oldest and retry
-            try:
-                self.tick_buffer.get_nowait()
-                self.tick_buffer.put_nowait(tick)
-            except:
-                pass
 
     def place_order(self, side: str, price: float, quantity: int, order_type: str = "MARKET") -> str:
         """Simulate all orders by default. Never sends real order in paper/forward test."""
         logger.info(f"Simulated order: {side} {quantity} @ {price} ({order_type})")
         return f"PAPER_{side}_{int(time.time())}"
 
+    def get_tick_buffer_stats(self) -> Dict[str, Any]:
+        """Backpressure counters of the WebSocket tick buffer (see TickRingBuffer.stats)."""
+        return self.tick_buffer.stats()
+
     def get_last_price(self) -> float:
         """Return last known tick price (latest or simulated)."""
         return self.last_price or 0.0
@@ -331,6 +345,23 @@ class BrokerAdapter:
         # Close tick logging file
         self._close_tick_logging()
         
+        stats = self.tick_buffer.stats()
+        if stats['produced']:
+            logger.info(
+                f"Tick buffer: {stats['produced']} received, {stats['consumed']} consumed, "
+                f"{stats['dropped']} dropped ({stats['overflow_policy']}), high-water {stats['high_water_mark']}/"
+                f"{stats['capacity']}, latency mean {stats['latency_mean_us']:.0f}us max {stats['latency_max_us']:.0f}us"
+            )
+            if stats['conflation_events']:
+                logger.info(f"Tick conflation: {stats['conflation_events']} backlogs merged "
+                            f"({stats['conflated_ticks']} ticks, threshold {stats['conflation_threshold']})")
+        if not self.wait_for_gap_fill(timeout=5.0):
+            logger.warning("Backfill replay still running at disconnect")
+        if self.gap_filler is not None and self.gap_filler.gaps_detected:
+            gaps = self.gap_filler.stats()
+            logger.info(f"Feed gaps: {gaps['gaps_detected']} detected, {gaps['backfilled_ticks']} ticks backfilled, "
+                        f"{gaps['backfill_failures']} backfill failures")
+        
         # Clean up WebSocket connection first
         if self.ws_streamer:
             try:
@@ -345,6 +376,8 @@ class BrokerAdapter:
                 # Logout from SmartAPI session
                 self.connection.terminateSession(self.live_params["client_code"])
                 self.connection = None
+                from .login import clear_session_validation_cache
+                clear_session_validation_cache()  # The JWT is no longer valid
             except Exception as e:
                 logger.warning(f"Error during SmartAPI logout: {e}")
                 
@@ -356,8 +389,11 @@ class BrokerAdapter:
     def _connect_with_retry(self):
         """Establish SmartAPI connection with retry logic for live data streaming"""
         from .login import SmartAPISessionManager
+        from ..utils.http_client import get_http_client
         
         live = self.live_params
+        get_http_client(self.params)  # Pool/timeouts/retries from this run's 'http' section
+        validation_ttl = self.params['http']['session_validation_ttl_seconds']
         logger.info("🔌 Establishing SmartAPI connection for live data streaming...")
         
         # Validate minimum required credentials
@@ -372,7 +408,8 @@ class BrokerAdapter:
                     api_key=live['api_key'],
                     client_code=live['client_code'], 
                     pin=live['pin'],
-                    totp_secret=live['totp_secret']
+                    totp_secret=live['totp_secret'],
+                    validation_ttl=validation_ttl
                 )
                 session_info = session_manager.login()
                 logger.info("✅ Direct SmartAPI authentication successful")
@@ -383,7 +420,8 @@ class BrokerAdapter:
                     api_key=live['api_key'],
                     client_code=live['client_code'],
                     pin="", 
-                    totp_secret=""
+                    totp_secret="",
+                    validation_ttl=validation_ttl
                 )
                 session_info = session_manager.load_session()
                 if not session_info:
@@ -407,7 +445,7 @@ class BrokerAdapter:
                 raise RuntimeError("WebSocket streaming required but not available - no polling fallback allowed")
             
             # FAIL-FIRST: Token is MANDATORY for WebSocket streaming
-            if not self.instrument.get("token"):
+            if not self.subscriptions and not self.instrument.get("token"):
                 error_msg = (
                     f"🚨 CRITICAL ERROR: Instrument token is MANDATORY for WebSocket streaming!\n"
                     f"💡 SOLUTION: Add 'token' field to instrument config for {self.instrument.get('symbol', 'UNKNOWN')}\n"
@@ -436,19 +474,24 @@ class BrokerAdapter:
             session_info: Session information from login
             on_tick_callback: Optional direct callback for Wind-style performance (bypasses queue)
         """
+        self.gap_filler = GapFiller.from_config(self.params, self.connection)  # Misconfiguration raises
         try:
             # Store callback for hybrid tick processing (only if provided, don't overwrite existing)
             if on_tick_callback is not None:
                 self.on_tick_callback = on_tick_callback
             
             live = self.live_params
-            symbol_tokens = [{
-                "symbol": self.instrument.get("symbol", ""),
-                "token": self.instrument["token"],
-                "exchange": self.exchange
-            }]
+            if self.subscriptions:
+                symbol_tokens = [dict(s) for s in self.subscriptions]
+            else:
+                symbol_tokens = [{
+                    "symbol": self.instrument.get("symbol", ""),
+                    "token": self.instrument["token"],
+                    "exchange": self.exchange
+                }]
             
-            logger.info(f"📡 Initializing WebSocket for {symbol_tokens[0]['symbol']} (Token: {symbol_tokens[0]['token']})")
+            logger.info(f"📡 Initializing WebSocket for {', '.join(s['symbol'] for s in symbol_tokens)} "
+                        f"(Tokens: {', '.join(str(s['token']) for s in symbol_tokens)})")
             if on_tick_callback:
                 logger.info("⚡ Direct callback mode enabled (Wind-style performance)")
             
@@ -544,32 +587,20 @@ class BrokerAdapter:
                 # Log raw tick to CSV (buffered, minimal performance impact)
                 self._log_tick_to_csv(tick, symbol)
             
+            # Ticks missed during an outage are replayed ahead of this one (by the gap fill worker)
+            if self.gap_filler is not None and self._hold_for_backfill(tick, symbol):
+                if _pre_convergence_instrumentor:
+                    _pre_convergence_instrumentor.end_broker_tick()
+                return
+            
             # Phase 1.5: Measure queue operations
-            if _pre_convergence_instrumentor:
-                with _pre_convergence_instrumentor.measure_broker('queue_ops'):
-                    # Option 2: Queue for polling (backwards compatible)
-                    # Always queue tick for backwards compatibility with trader.py
-                    try:
-                        self.tick_buffer.put_nowait(tick)
-                    except queue.Full:
-                        # Queue full, drop oldest tick and retry
-                        try:
-                            self.tick_buffer.get_nowait()  # Drop oldest
-                            self.tick_buffer.put_nowait(tick)  # Add new
-                        except:
-                            pass  # Drop tick if queue operations fail
-            else:
-                # Option 2: Queue for polling (backwards compatible)
-                # Always queue tick for backwards compatibility with trader.py
-                try:
-                    self.tick_buffer.put_nowait(tick)
-                except queue.Full:
-                    # Queue full, drop oldest tick and retry
-                    try:
-                        self.tick_buffer.get_nowait()  # Drop oldest
-                        self.tick_buffer.put_nowait(tick)  # Add new
-                    except:
-                        pass  # Drop tick if queue operations fail
+            # Option 2: Ring buffer for the polling loop (only read when no callback consumes ticks)
+            if self.on_tick_callback is None:
+                if _pre_convergence_instrumentor:
+                    with _pre_convergence_instrumentor.measure_broker('queue_ops'):
+                        self.tick_buffer.push(tick)
+                else:
+                    self.tick_buffer.push(tick)
             
             # Phase 1.5: Measure callback check and invocation
             if _pre_convergence_instrumentor:
@@ -618,6 +649,71 @@ class BrokerAdapter:
             if _pre_convergence_instrumentor:
                 _pre_convergence_instrumentor.end_broker_tick()
 
+    def _hold_for_backfill(self, tick, symbol) -> bool:
+        """
+        Feed thread: True if this live tick must wait behind a backfill replay.
+
+        Detection is an in-memory comparison; the fetch and the replay run on
+        a worker thread so the WebSocket keeps reading. While a replay is in
+        progress every live tick is held, in arrival order, and handed on by
+        the worker after the backfilled ticks (the worker is the only producer
+        meanwhile, so the ring buffer stays single-producer).
+        """
+        token = str(tick.get('token') or self.instrument.get('token', ''))
+        epoch = self.ws_streamer.connection_epoch if self.ws_streamer is not None else 0
+        with self._gap_fill_lock:
+            gap = self.gap_filler.detect(token or symbol, tick['timestamp'], epoch)
+            if self._held_ticks is not None:
+                self._held_ticks.append((tick, symbol))
+                return True
+            if gap is None:
+                return False
+            self._held_ticks = [(tick, symbol)]
+        instrument = {'symbol': symbol, 'token': token, 'exchange': tick.get('exchange') or self.exchange}
+        self._gap_fill_thread = threading.Thread(target=self._replay_gap, args=(instrument, gap),
+                                                 name="gap-fill", daemon=True)
+        self._gap_fill_thread.start()
+        return True
+
+    def _replay_gap(self, instrument, gap):
+        """Gap fill worker: fetch and replay the gap, then release the held live ticks."""
+        symbol = instrument['symbol']
+        try:
+            for backfilled in self.gap_filler.backfill(instrument, *gap):
+                self._deliver_tick(backfilled, symbol, replay=True)
+        finally:
+            while True:
+                with self._gap_fill_lock:
+                    held = self._held_ticks
+                    if not held:
+                        self._held_ticks = None  # Feed thread delivers directly again
+                        return
+                    self._held_ticks = []
+                for tick, tick_symbol in held:
+                    self._deliver_tick(tick, tick_symbol)
+
+    def _deliver_tick(self, tick, symbol, replay=False):
+        """Hand a replayed or held tick to the consumer (ring buffer or callback)."""
+        if self.on_tick_callback is None:
+            self.tick_buffer.push(tick, wait_for_space=replay)  # Replay must not be overwritten
+            return
+        try:
+            self.on_tick_callback(tick, symbol)
+        except Exception as e:
+            logger.error(f"🔥 [BROKER] Error in tick callback: {type(e).__name__}: {e}", exc_info=True)
+
+    def wait_for_gap_fill(self, timeout: Optional[float] = None) -> bool:
+        """Wait for an in-progress backfill replay; False if it is still running after `timeout`."""
+        thread = self._gap_fill_thread
+        if thread is not None:
+            thread.join(timeout)
+            return not thread.is_alive()
+        return True
+
+    def get_gap_fill_stats(self) -> Dict[str, Any]:
+        """Feed gaps detected and backfilled (see GapFiller.stats); empty when gap fill is off."""
+        return self.gap_filler.stats() if self.gap_filler is not None else {}
+
     def _log_tick_to_csv(self, tick, symbol):
         """Log tick to CSV with minimal performance impact (buffered I/O)"""
         if self.tick_logging_enabled and self.tick_writer:
@@ -17,23 +17,193 @@ USAGE:
 - If file is invalid/missing: clear error, no trading
 """
 
+import numpy as np
 import pandas as pd
 import os
 import time
 import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple, Union
 
 from ..utils.time_utils import now_ist, ensure_tz_aware, IST
 
 logger = logging.getLogger(__name__)
 
+# Timestamp column names recognised by DataSimulator, in lookup order
+TIMESTAMP_COLUMNS = ('timestamp', 'Timestamp', 'datetime')
+
+# Parsed simulation files kept per process (LRU, keyed by absolute path)
+DATASET_CACHE_SIZE = 4
+
+
+@dataclass(frozen=True)
+class SimulationDataset:
+    """
+    A simulation file parsed once and shared read-only by every DataSimulator.
+
+    Attributes:
+        data: Standardized DataFrame (price/volume columns); must not be mutated
+        prices: Read-only float64 prices
+        volumes: Read-only volumes (None if the frame has no volume column)
+        timestamps: DatetimeIndex, or a read-only object array of per-row parses
+            (None for rows that fail) when the column has no single datetime dtype;
+            None if the file has no timestamp column
+        signature: (mtime_ns, size) of the file when parsed (None for preloaded data)
+    """
+    data: pd.DataFrame
+    prices: np.ndarray
+    volumes: Optional[np.ndarray]
+    timestamps: Optional[Union[pd.DatetimeIndex, np.ndarray]]
+    signature: Optional[Tuple[int, int]] = None
+
+    @classmethod
+    def from_frame(cls, data: pd.DataFrame, signature: Optional[Tuple[int, int]] = None) -> 'SimulationDataset':
+        """Extract tick arrays from a frame standardized by read_simulation_file."""
+        prices = np.asarray(data['price'], dtype=np.float64)
+        prices.setflags(write=False)
+        volumes = None
+        if 'volume' in data.columns:
+            volumes = data['volume'].to_numpy()
+            volumes.setflags(write=False)
+        timestamp_column = next((c for c in TIMESTAMP_COLUMNS if c in data.columns), None)
+        timestamps = _parse_timestamps(data[timestamp_column]) if timestamp_column is not None else None
+        return cls(data, prices, volumes, timestamps, signature)
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    def head(self, n: int) -> 'SimulationDataset':
+        """The first n ticks (views, no copies)."""
+        return SimulationDataset(
+            self.data.iloc[:n],
+            self.prices[:n],
+            self.volumes[:n] if self.volumes is not None else None,
+            self.timestamps[:n] if self.timestamps is not None else None,
+            self.signature,
+        )
+
+    def timestamp(self, index: int) -> Optional[datetime]:
+        """Python datetime of a tick as in the file (naive if the file is), None if unavailable."""
+        if self.timestamps is None:
+            return None
+        value = self.timestamps[index]
+        if value is None:
+            return None
+        return value.to_pydatetime() if hasattr(value, 'to_pydatetime') else value
+
+
+def _parse_timestamps(column: pd.Series) -> Union[pd.DatetimeIndex, np.ndarray]:
+    """Parse a timestamp column once; rows are parsed one by one if it has no single datetime dtype."""
+    try:
+        parsed = pd.to_datetime(column)
+        if pd.api.types.is_datetime64_any_dtype(parsed):
+            return pd.DatetimeIndex(parsed)
+    except (ValueError, TypeError):
+        pass
+
+    values = np.empty(len(column), dtype=object)
+    failed = 0
+    for i, raw in enumerate(column):
+        try:
+            values[i] = pd.to_datetime(raw)
+        except (ValueError, TypeError):
+            values[i] = None
+            failed += 1
+    if failed:
+        logger.error(f"[DataSimulator] {failed} timestamps could not be parsed - those ticks use current time")
+    values.setflags(write=False)
+    return values
+
+
+# Datasets already in memory (e.g. attached from shared memory by matrix workers), keyed by absolute path
+_preloaded_data: Dict[str, SimulationDataset] = {}
+_dataset_cache: 'OrderedDict[str, SimulationDataset]' = OrderedDict()
+_dataset_lock = threading.Lock()
+
+
+def register_preloaded_data(file_path: str, data: Optional[pd.DataFrame]):
+    """Serve `data` to DataSimulator instances for `file_path` instead of re-reading the file (None unregisters)."""
+    path = os.path.abspath(file_path)
+    if data is None:
+        _preloaded_data.pop(path, None)
+    else:
+        _preloaded_data[path] = SimulationDataset.from_frame(data)
+
+
+def load_simulation_dataset(file_path: str) -> SimulationDataset:
+    """
+    Parsed ticks of a simulation file, shared across the process.
+
+    Registered preloaded data wins; otherwise the file is parsed once and
+    re-parsed only when its mtime or size changes.
+    """
+    path = os.path.abspath(file_path)
+    preloaded = _preloaded_data.get(path)
+    if preloaded is not None:
+        return preloaded
+
+    stat = os.stat(path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    with _dataset_lock:
+        dataset = _dataset_cache.get(path)
+        if dataset is not None and dataset.signature == signature:
+            _dataset_cache.move_to_end(path)
+            return dataset
+        logger.info(f"Loading simulation data from: {file_path}")
+        dataset = SimulationDataset.from_frame(read_simulation_file(path), signature)
+        _dataset_cache[path] = dataset
+        _dataset_cache.move_to_end(path)
+        while len(_dataset_cache) > DATASET_CACHE_SIZE:
+            _dataset_cache.popitem(last=False)
+    return dataset
+
+
+def clear_dataset_cache():
+    """Drop parsed files (preloaded registrations are kept)."""
+    with _dataset_lock:
+        _dataset_cache.clear()
+
+
+def read_simulation_file(file_path: str) -> pd.DataFrame:
+    """Read a simulation CSV and standardize it to have 'price' and 'volume' columns."""
+    data = pd.read_csv(file_path)
+    
+    # Standardize columns
+    if 'close' in data.columns:
+        data['price'] = data['close']
+    elif 'Close' in data.columns:
+        data['price'] = data['Close']
+    elif 'ltp' in data.columns:
+        data['price'] = data['ltp']
+    elif 'LTP' in data.columns:
+        data['price'] = data['LTP']
+    
+    # Ensure we have a price column
+    if 'price' not in data.columns:
+        # Use first numeric column as price
+        numeric_cols = data.select_dtypes(include=['number']).columns
+        if len(numeric_cols) > 0:
+            data['price'] = data[numeric_cols[0]]
+        else:
+            raise ValueError("No numeric price column found")
+    
+    # Add default volume if not present
+    if 'volume' not in data.columns:
+        data['volume'] = 1000
+    return data
+
+
 class DataSimulator:
     """Optional file-based data simulator. Does not affect live trading."""
     
-    def __init__(self, file_path: str = None):
+    def __init__(self, file_path: str = None, max_ticks: Optional[int] = None):
         self.file_path = file_path
+        self.max_ticks = max_ticks  # Replay only a prefix of the file (None = whole file)
         self.data = None
+        self.dataset: Optional[SimulationDataset] = None
         self.index = 0
         # Fixed delay for consistent simulation speed
         self.tick_delay = 0.0005  # 100 tps - good balance of speed and visibility
@@ -41,45 +211,24 @@ class DataSimulator:
         self.completed = False  # Flag to prevent repeated completion messages
         
     def load_data(self) -> bool:
-        """Load data from file. Returns True if successful."""
-        if not self.file_path or not os.path.exists(self.file_path):
+        """Load data from the process-wide dataset cache (parsed on first use). Returns True if successful."""
+        preloaded = _preloaded_data.get(os.path.abspath(self.file_path)) if self.file_path else None
+        if preloaded is None and (not self.file_path or not os.path.exists(self.file_path)):
             logger.warning(f"Data file not found: {self.file_path}")
             return False
             
         try:
-            logger.info(f"Loading simulation data from: {self.file_path}")
-            
-            # Read CSV file
-            self.data = pd.read_csv(self.file_path)
-            
-            # Standardize columns
-            if 'close' in self.data.columns:
-                self.data['price'] = self.data['close']
-            elif 'Close' in self.data.columns:
-                self.data['price'] = self.data['Close']
-            elif 'ltp' in self.data.columns:
-                self.data['price'] = self.data['ltp']
-            elif 'LTP' in self.data.columns:
-                self.data['price'] = self.data['LTP']
-            
-            # Ensure we have a price column
-            if 'price' not in self.data.columns:
-                # Use first numeric column as price
-                numeric_cols = self.data.select_dtypes(include=['number']).columns
-                if len(numeric_cols) > 0:
-                    self.data['price'] = self.data[numeric_cols[0]]
-                else:
-                    raise ValueError("No numeric price column found")
-            
-            # Add default volume if not present
-            if 'volume' not in self.data.columns:
-                self.data['volume'] = 1000
+            dataset = load_simulation_dataset(self.file_path)
+            if self.max_ticks is not None:
+                dataset = dataset.head(self.max_ticks)
+            self.dataset = dataset
+            self.data = dataset.data
                 
             self.index = 0
             self.loaded = True
             
             # Provide user with time estimates
-            total_ticks = len(self.data)
+            total_ticks = len(dataset)
             estimated_time = total_ticks * self.tick_delay
             
             if estimated_time < 60:
@@ -100,60 +249,40 @@ class DataSimulator:
     
     def get_next_tick(self) -> Optional[Dict]:
         """Get next tick from file data. Returns None if no data or end reached."""
-        if not self.loaded or self.data is None:
+        if not self.loaded or self.dataset is None:
             return None
             
+        dataset = self.dataset
+        total = len(dataset)
         # Check if we've reached end
-        if self.index >= len(self.data):
+        if self.index >= total:
             if not self.completed:
                 self.completed = True
                 logger.info("📋 Simulation completed successfully - all data processed")
             return None  # Signal completion, don't restart
             
         # Progress reporting (every 10% for user feedback, less frequent to avoid GUI overload)
-        if self.index % max(1, len(self.data) // 10) == 0:
-            progress = (self.index / len(self.data)) * 100
-            logger.info(f"📊 Simulation progress: {progress:.0f}% ({self.index}/{len(self.data)})")
+        if self.index % max(1, total // 10) == 0:
+            progress = (self.index / total) * 100
+            logger.info(f"📊 Simulation progress: {progress:.0f}% ({self.index}/{total})")
             
-        # Get current data point
-        row = self.data.iloc[self.index]
+        # Get current data point (timestamps were parsed once when the dataset was loaded)
+        position = self.index
         self.index += 1
         
-        # Extract timestamp from CSV (if available), otherwise use current time
-        try:
-            if 'timestamp' in self.data.columns:
-                # CSV has timestamp column - use it (data simulation mode)
-                csv_timestamp = pd.to_datetime(row['timestamp'])
-                tick_timestamp = csv_timestamp
-                logger.debug(f"Using CSV timestamp: {csv_timestamp}")
-            elif 'Timestamp' in self.data.columns:
-                # Handle capitalized column name
-                csv_timestamp = pd.to_datetime(row['Timestamp'])
-                tick_timestamp = csv_timestamp
-                logger.debug(f"Using CSV timestamp: {csv_timestamp}")
-            elif 'datetime' in self.data.columns:
-                # Alternative timestamp column name
-                csv_timestamp = pd.to_datetime(row['datetime'])
-                tick_timestamp = csv_timestamp
-                logger.debug(f"Using CSV datetime: {csv_timestamp}")
-            else:
-                # No timestamp in CSV - fall back to current time
-                tick_timestamp = now_ist()
-                if self.index == 1:  # Log warning only once
-                    logger.warning("CSV file has no timestamp column - using current time for trade times")
-            # Normalize pandas.Timestamp to native python datetime and ensure tz-aware
+        # Timestamp from CSV (if available), otherwise use current time
+        if dataset.timestamps is None:
+            tick_timestamp = now_ist()
+            if self.index == 1:  # Log warning only once
+                logger.warning("CSV file has no timestamp column - using current time for trade times")
+        else:
             try:
-                if hasattr(tick_timestamp, 'to_pydatetime'):
-                    tick_timestamp = tick_timestamp.to_pydatetime()
-                # Ensure timezone-aware (assume IST if naive)
-                tick_timestamp = ensure_tz_aware(tick_timestamp, default_tz=IST)
-            except Exception:
-                # If normalization fails, fallback to now_ist()
+                tick_timestamp = dataset.timestamp(position)
+                # Ensure timezone-aware (assume IST if naive); unparseable rows use current time
+                tick_timestamp = ensure_tz_aware(tick_timestamp, default_tz=IST) if tick_timestamp is not None else now_ist()
+            except Exception as e:
+                logger.error(f"[DataSimulator] ERROR converting CSV timestamp at row {self.index}: {e}")
                 tick_timestamp = now_ist()
-        except Exception as e:
-            logger.error(f"[DataSimulator] ERROR parsing CSV timestamp at row {self.index}: {e}")
-            # Fall back to current time but record error
-            tick_timestamp = now_ist()
 
         # DIAGNOSTIC LOGGING (first few ticks)
         try:
@@ -172,8 +301,8 @@ class DataSimulator:
         # Create tick with normalized, timezone-aware timestamp from CSV
         tick = {
             "timestamp": tick_timestamp,
-            "price": float(row['price']),
-            "volume": int(row.get('volume', 1000))
+            "price": float(dataset.prices[position]),
+            "volume": int(dataset.volumes[position]) if dataset.volumes is not None else 1000
         }
 
         # DIAGNOSTIC LOGGING - confirm tick dict contains timestamp
@@ -196,7 +325,7 @@ class DataSimulator:
         if not self.loaded or self.tick_delay == 0:
             return "Unknown"
         
-        remaining_ticks = len(self.data) - self.index
+        remaining_ticks = len(self.dataset) - self.index
         remaining_seconds = remaining_ticks * self.tick_delay
         
         if remaining_seconds < 60:
@@ -0,0 +1,222 @@
+"""
+live/gap_fill.py
+
+Feed gap detection and backfill for the WebSocket stream.
+
+CRITICAL PRINCIPLES:
+- Gaps are detected per instrument on the first live tick after them: the
+  stream reconnected since the instrument's previous tick (the streamer's
+  connection epoch changed), or the two ticks are more than
+  max_tick_gap_seconds apart
+- The missing interval (previous tick, this tick) is fetched from a pluggable
+  historical source and replayed, flagged 'backfill', ahead of the live tick,
+  so indicators and SL/TP/trailing checks fast-forward through it; the trader
+  opens no new positions on backfilled ticks
+- A silence on a connected stream may just be a quiet instrument, so it is
+  only backfilled from sources holding real ticks; synthetic candle ticks are
+  replayed only after a reconnect, and only for candles lying entirely inside
+  the gap (prices already delivered live are never replayed twice)
+- Detection runs on the feed thread (an in-memory comparison); the fetch and
+  the replay run on a worker (BrokerAdapter._replay_gap) so a slow
+  getCandleData never stalls the WebSocket. Live ticks arriving meanwhile are
+  held and delivered after the backfilled ones
+- Backfill failures are logged and counted, never raised into the feed thread
+
+SOURCES (anything with fetch(instrument, start, end) -> ticks):
+    RecorderFileSource  Broker tick log CSV (timestamp, price, volume, symbol) - offline runs/tests
+    CandleApiSource     SmartConnect.getCandleData; each candle replays as open, the two extremes
+                        (low first for an up candle, high first for a down candle), close
+    Optional real_ticks attribute (default True): False for synthetic ticks
+
+CONFIG (defaults.py 'gap_fill'):
+    enabled, source ("candles" | "recorder"), recorder_path, candle_interval,
+    max_tick_gap_seconds, max_backfill_minutes
+"""
+
+import csv
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..utils.time_utils import ensure_tz_aware
+
+logger = logging.getLogger(__name__)
+
+GAP_FILL_SOURCES = ('candles', 'recorder')
+
+# SmartAPI getCandleData intervals
+CANDLE_INTERVAL_SECONDS = {
+    'ONE_MINUTE': 60, 'THREE_MINUTE': 180, 'FIVE_MINUTE': 300, 'TEN_MINUTE': 600,
+    'FIFTEEN_MINUTE': 900, 'THIRTY_MINUTE': 1800, 'ONE_HOUR': 3600,
+}
+_CANDLE_API_TIME_FORMAT = '%Y-%m-%d %H:%M'
+
+
+def _parse_timestamp(value) -> datetime:
+    if not isinstance(value, datetime):
+        value = datetime.fromisoformat(str(value))
+    return ensure_tz_aware(value)
+
+
+class RecorderFileSource:
+    """Ticks from a broker tick log (livePrice_*.csv: timestamp, price, volume, symbol)."""
+
+    real_ticks = True
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def fetch(self, instrument: Dict[str, Any], start: datetime, end: datetime) -> List[Dict[str, Any]]:
+        symbol = instrument['symbol']
+        ticks = []
+        with open(self.path, 'r', newline='', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                if row['symbol'] != symbol:
+                    continue
+                timestamp = _parse_timestamp(row['timestamp'])
+                if start < timestamp < end:
+                    ticks.append({'timestamp': timestamp, 'price': float(row['price']),
+                                  'volume': int(float(row['volume'] or 0)), 'symbol': symbol})
+        return ticks
+
+
+def candle_ticks(candle, interval_seconds: int, symbol: str = '') -> List[Dict[str, Any]]:
+    """
+    Four ticks standing in for one [timestamp, open, high, low, close, volume]
+    candle, spread over its interval; volume goes on the close.
+    """
+    timestamp, open_, high, low, close, volume = candle[:6]
+    start = _parse_timestamp(timestamp)
+    path = (open_, low, high, close) if close >= open_ else (open_, high, low, close)
+    step = (interval_seconds - 1) / 3.0
+    return [{'timestamp': start + timedelta(seconds=step * i), 'price': float(price),
+             'volume': int(volume) if i == 3 else 0, 'symbol': symbol}
+            for i, price in enumerate(path)]
+
+
+class CandleApiSource:
+    """Ticks synthesised from SmartAPI historical candles (whole candles inside the gap only)."""
+
+    real_ticks = False
+
+    def __init__(self, connection, interval: str = 'ONE_MINUTE'):
+        if interval not in CANDLE_INTERVAL_SECONDS:
+            raise ValueError(f"Unknown candle interval {interval!r} (expected one of {list(CANDLE_INTERVAL_SECONDS)})")
+        self.connection = connection
+        self.interval = interval
+        self.interval_seconds = CANDLE_INTERVAL_SECONDS[interval]
+
+    def fetch(self, instrument: Dict[str, Any], start: datetime, end: datetime) -> List[Dict[str, Any]]:
+        params = {
+            'exchange': instrument['exchange'],
+            'symboltoken': str(instrument['token']),
+            'interval': self.interval,
+            'fromdate': start.strftime(_CANDLE_API_TIME_FORMAT),
+            'todate': end.strftime(_CANDLE_API_TIME_FORMAT),
+        }
+        response = self.connection.getCandleData(params)
+        if not response or not response.get('status'):
+            raise RuntimeError(f"getCandleData failed: {(response or {}).get('message', 'no response')}")
+        interval = timedelta(seconds=self.interval_seconds)
+        ticks = []
+        for candle in response.get('data') or []:
+            candle_start = _parse_timestamp(candle[0])
+            if start < candle_start and candle_start + interval <= end:
+                ticks.extend(candle_ticks(candle, self.interval_seconds, instrument['symbol']))
+        return ticks
+
+
+class GapFiller:
+    """Detects feed gaps per instrument and returns backfilled ticks for them."""
+
+    def __init__(self, source, max_tick_gap_seconds: float, max_backfill_seconds: float):
+        if max_tick_gap_seconds <= 0:
+            raise ValueError(f"max_tick_gap_seconds must be positive, got {max_tick_gap_seconds}")
+        if max_backfill_seconds <= 0:
+            raise ValueError(f"Backfill window must be positive, got {max_backfill_seconds}s")
+        self.source = source
+        self.max_tick_gap_seconds = max_tick_gap_seconds
+        self.max_backfill = timedelta(seconds=max_backfill_seconds)
+        self._last_seen: Dict[str, Tuple[datetime, int]] = {}  # instrument key -> (last tick time, epoch)
+        self.gaps_detected = 0
+        self.backfilled_ticks = 0
+        self.backfill_failures = 0
+        self.last_gap: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def from_config(cls, config, connection=None) -> Optional['GapFiller']:
+        """Gap filler for config['gap_fill'], or None when disabled."""
+        params = config['gap_fill']
+        if not params['enabled']:
+            return None
+        if params['source'] == 'recorder':
+            if not params['recorder_path']:
+                raise ValueError("gap_fill source 'recorder' requires gap_fill.recorder_path")
+            source = RecorderFileSource(params['recorder_path'])
+        elif params['source'] == 'candles':
+            if connection is None:
+                raise ValueError("gap_fill source 'candles' requires a SmartAPI connection")
+            source = CandleApiSource(connection, params['candle_interval'])
+        else:
+            raise ValueError(f"Unknown gap_fill source {params['source']!r} (expected one of {GAP_FILL_SOURCES})")
+        return cls(source, params['max_tick_gap_seconds'], params['max_backfill_minutes'] * 60)
+
+    def detect(self, key: str, timestamp: datetime, epoch: int = 0) -> Optional[Tuple[datetime, datetime, str]]:
+        """
+        Record a live tick of instrument `key`; returns (start, end, reason) if
+        ticks are missing before it, else None.
+        """
+        previous = self._last_seen.get(key)
+        self._last_seen[key] = (timestamp, epoch)
+        if previous is None:
+            return None
+        last_timestamp, last_epoch = previous
+        seconds = (timestamp - last_timestamp).total_seconds()
+        if seconds <= 0:
+            return None
+        if last_epoch != epoch:
+            return last_timestamp, timestamp, 'reconnect'
+        if seconds > self.max_tick_gap_seconds:
+            return last_timestamp, timestamp, 'silence'
+        return None
+
+    def backfill(self, instrument: Dict[str, Any], start: datetime, end: datetime, reason: str) -> List[Dict[str, Any]]:
+        """
+        Ticks strictly inside (start, end) from the source, oldest first, flagged
+        'backfill'. A 'silence' gap is only backfilled from a real-tick source.
+        """
+        self.gaps_detected += 1
+        symbol = instrument['symbol']
+        gap_seconds = (end - start).total_seconds()
+        if reason == 'silence' and not getattr(self.source, 'real_ticks', True):
+            self.last_gap = {'symbol': symbol, 'start': start, 'end': end, 'reason': reason, 'ticks': 0}
+            logger.info(f"No ticks for {symbol} for {gap_seconds:.1f}s on a live connection - "
+                        f"not replaying synthetic candle ticks")
+            return []
+        if end - start > self.max_backfill:
+            logger.warning(f"Feed gap for {symbol} ({gap_seconds:.0f}s) exceeds the backfill window - "
+                           f"replaying only the last {self.max_backfill.total_seconds():.0f}s")
+            start = end - self.max_backfill
+        try:
+            fetched = self.source.fetch(instrument, start, end)
+        except Exception as e:
+            self.backfill_failures += 1
+            logger.error(f"Backfill of {symbol} gap {start} -> {end} failed: {e}")
+            return []
+        ticks = sorted((t for t in fetched if start < t['timestamp'] < end), key=lambda t: t['timestamp'])
+        for tick in ticks:
+            tick['backfill'] = True
+            tick.setdefault('symbol', symbol)
+            tick.setdefault('token', instrument['token'])
+        self.backfilled_ticks += len(ticks)
+        self.last_gap = {'symbol': symbol, 'start': start, 'end': end, 'reason': reason, 'ticks': len(ticks)}
+        logger.warning(f"Feed gap for {symbol}: {gap_seconds:.1f}s ({reason}) - replaying {len(ticks)} backfilled ticks")
+        return ticks
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'gaps_detected': self.gaps_detected,
+            'backfilled_ticks': self.backfilled_ticks,
+            'backfill_failures': self.backfill_failures,
+            'last_gap': self.last_gap,
+        }
@@ -7,13 +7,21 @@ SmartAPI login and session management for the unified trading system.
 - Provides method for authenticated SmartConnect client (for streaming/tick data).
 - Designed for GUI- or CLI-driven login with explicit user control and safety.
 - Saves and loads session tokens from disk to avoid repeated logins.
+- Session checks go through the pooled HTTP client (utils/http_client.py);
+  a successful check is trusted for http.session_validation_ttl_seconds, so
+  repeated GUI actions don't each pay a round trip and TLS handshake.
 """
 
 import os
 import json
 import logging
+import threading
+import time
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional
+
+from ..config.defaults import DEFAULT_CONFIG
+from ..utils.http_client import get_http_client
 
 try:
     from SmartApi import SmartConnect
@@ -28,15 +36,55 @@ except ImportError:
     logging.warning("pyotp not installed. Install with `pip install pyotp` for dynamic TOTP generation.")
 
 SESSION_FILE = r"C:\Users\user\projects\angelalgo\auth_token.json"
+PROFILE_URL = "https://apiconnect.angelone.in/rest/secure/angelbroking/user/v1/getProfile"
+
+# JWT -> time.monotonic() until which its last successful check is trusted (process-wide)
+_validated_tokens: Dict[str, float] = {}
+_validated_tokens_lock = threading.Lock()
+
+
+def _remember_valid_token(jwt_token: str, ttl_seconds: float):
+    if ttl_seconds > 0:
+        with _validated_tokens_lock:
+            _validated_tokens[jwt_token] = time.monotonic() + ttl_seconds
+
+
+def check_session_token(jwt_token: str, ttl_seconds: float) -> bool:
+    """Profile-endpoint check of a JWT; a success is cached for ttl_seconds."""
+    with _validated_tokens_lock:
+        if _validated_tokens.get(jwt_token, 0.0) > time.monotonic():
+            return True
+    try:
+        headers = {"Authorization": f"Bearer {jwt_token}"}
+        valid = get_http_client().get(PROFILE_URL, headers=headers).status_code == 200
+    except Exception as e:
+        logging.warning(f"SmartAPI session check failed: {e}")
+        valid = False
+    if valid:
+        _remember_valid_token(jwt_token, ttl_seconds)
+    else:
+        with _validated_tokens_lock:
+            _validated_tokens.pop(jwt_token, None)
+    return valid
+
+
+def clear_session_validation_cache():
+    """Forget cached session checks (e.g. after a logout)."""
+    with _validated_tokens_lock:
+        _validated_tokens.clear()
+
 
 class SmartAPISessionManager:
-    def __init__(self, api_key: str, client_code: str, pin: str, totp_secret: str):
+    def __init__(self, api_key: str, client_code: str, pin: str, totp_secret: str,
+                 validation_ttl: Optional[float] = None):
         self.api_key = api_key
         self.client_code = client_code
         self.pin = pin
         self.totp_secret = totp_secret  # Store TOTP secret for dynamic generation
         self.session = None
         self.session_info = {}
+        self.validation_ttl = (DEFAULT_CONFIG['http']['session_validation_ttl_seconds']
+                               if validation_ttl is None else validation_ttl)
         if SmartConnect is None:
             raise ImportError("SmartAPI client is not installed.")
         if pyotp is None:
@@ -68,6 +116,7 @@ class SmartAPISessionManager:
             with open(SESSION_FILE, "w", encoding="utf-8") as f:
                 json.dump({"data": {"auth_token": jwt_token, "client_id": self.client_code}}, f)
             logging.info(f"SmartAPI login successful for {self.client_code}. Session token saved.")
+            _remember_valid_token(jwt_token, self.validation_ttl)
             self.session = smartapi
             return self.session_info
         except Exception as e:
@@ -96,18 +145,10 @@ class SmartAPISessionManager:
         return self.session_info
 
     def is_session_valid(self) -> bool:
-        """Simple Wind-style token validation with API test."""
+        """Simple Wind-style token validation with API test (cached for validation_ttl)."""
         if not self.session_info or not self.session_info.get("jwt_token"):
             return False
-            
-        try:
-            import requests
-            test_url = "https://apiconnect.angelone.in/rest/secure/angelbroking/user/v1/getProfile"
-            headers = {"Authorization": f"Bearer {self.session_info['jwt_token']}"}
-            response = requests.get(test_url, headers=headers)
-            return response.status_code == 200
-        except Exception:
-            return False
+        return check_session_token(self.session_info["jwt_token"], self.validation_ttl)
     
     def load_session(self) -> Optional[dict]:
         """
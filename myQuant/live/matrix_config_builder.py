@@ -22,6 +22,7 @@ import logging
 from typing import Dict, Any, Tuple
 from copy import deepcopy
 
+from ..config.defaults import DEFAULT_CONFIG
 from ..utils.config_helper import create_config_from_defaults
 
 logger = logging.getLogger(__name__)
@@ -101,6 +102,81 @@ def _inject_parameter(config: Dict, param_name: str, value: Any):
     )
 
 
+# ============================================================================
+# EQUIVALENCE CLASSES
+# ============================================================================
+
+# Feature flag -> parameters that cannot affect trading while the flag is False.
+# Combinations that differ only in inert parameters produce identical results.
+# Every name must exist in defaults.py (checked at import).
+INERT_WHEN_DISABLED = {
+    'use_ema_crossover': ('fast_ema', 'slow_ema'),
+    'use_macd': ('macd_fast', 'macd_slow', 'macd_signal'),
+    'use_rsi_filter': ('rsi_length', 'rsi_overbought', 'rsi_oversold'),
+    'use_htf_trend': ('htf_period',),
+    'use_atr': ('atr_len',),
+    'noise_filter_enabled': ('noise_filter_percentage', 'noise_filter_min_ticks'),
+    'Enable_control_base_sl_green_ticks': ('control_base_sl_green_ticks',),
+    'use_trail_stop': ('trail_activation_points', 'trail_distance_points'),
+    'price_above_exit_filter_enabled': ('price_buffer_points', 'filter_duration_seconds'),
+    'sl_regression_enabled': ('max_base_sl', 'min_base_sl', 'sl_regression_step', 'sl_regression_window_minutes'),
+}
+
+
+def _default_parameter(param_name: str) -> Any:
+    """Look up a parameter's defaults.py value (same sections as _inject_parameter)."""
+    for section in ['strategy', 'risk', 'capital', 'instrument', 'session']:
+        if param_name in DEFAULT_CONFIG.get(section, {}):
+            return DEFAULT_CONFIG[section][param_name]
+    raise KeyError(
+        f"Parameter '{param_name}' not found in config. "
+        f"Valid parameters must be defined in defaults.py SSOT."
+    )
+
+
+for _flag, _dependents in INERT_WHEN_DISABLED.items():
+    for _name in (_flag,) + _dependents:
+        _default_parameter(_name)
+
+
+def canonical_parameters(
+    param_values: Dict[str, Any],
+    fixed_params: Dict[str, Any] = None
+) -> Dict[str, Any]:
+    """
+    Drop parameters that are inert under the combination's feature flags.
+    
+    Flags are resolved from param_values, then fixed_params, then defaults.py.
+    Two combinations with equal canonical parameters are behaviourally identical.
+    
+    Example:
+        >>> canonical_parameters({'use_macd': False, 'macd_fast': 8, 'fast_ema': 9})
+        {'use_macd': False, 'fast_ema': 9}
+    """
+    fixed_params = fixed_params or {}
+    inert = set()
+    for flag, dependents in INERT_WHEN_DISABLED.items():
+        if flag in param_values:
+            enabled = param_values[flag]
+        elif flag in fixed_params:
+            enabled = fixed_params[flag]
+        else:
+            enabled = _default_parameter(flag)
+        if not enabled:
+            inert.update(dependents)
+    return {name: value for name, value in param_values.items() if name not in inert}
+
+
+def signal_parameters(param_values: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Parameters that can change indicators or entry candidates (everything outside risk).
+    
+    Combinations with equal signal parameters share one signal stream and differ
+    only in position/exit handling (see core/signal_arrays.replay_positions).
+    """
+    return {name: value for name, value in param_values.items() if name not in DEFAULT_CONFIG['risk']}
+
+
 # ============================================================================
 # PARAMETER VALIDATION
 # ============================================================================
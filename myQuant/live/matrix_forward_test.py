@@ -20,25 +20,53 @@ USAGE:
     runner.add_parameter_grid('slow_ema', [21, 26, 42])
     results_df = runner.run(phase_name='Phase 1: EMA Crossover')
     
+    # Sampled ranges (fixed budget of 200 runs instead of the full product)
+    runner.add_parameter_range('base_sl_points', 5, 40, step=0.5)
+    runner.add_parameter_range('fast_ema', 5, 21, integer=True)
+    runner.set_sampling('lhs', 200)
+    
+    # Parallel (one process per core; ticks loaded once into shared memory)
+    results_df = runner.run(phase_name='Phase 1: EMA Crossover', workers=16)
+    
     # CLI
     python -m live.matrix_forward_test --csv nifty.csv --phase "Phase 1" --fast-ema 9,12,18 --slow-ema 21,26,42
 """
 
+import json
 import logging
 logger = logging.getLogger(__name__)
 import sys
+import math
 import time
+import random
 import argparse
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
-from itertools import product
+from typing import Dict, List, Any, Iterable, Iterator, Optional, Tuple
+from itertools import chain, product
 from datetime import datetime
 
+import numpy as np
 import pandas as pd
-from .matrix_config_builder import build_config_from_parameters, generate_test_tag, validate_parameter_combination
+from .matrix_config_builder import (
+    build_config_from_parameters, canonical_parameters, generate_test_tag, signal_parameters,
+    validate_parameter_combination
+)
 from .matrix_results_exporter import export_matrix_results
+from .matrix_job_queue import MatrixJobQueue
+from .matrix_results_store import MatrixResultsStore
+from .matrix_worker import run_worker
+from .matrix_sampling import ParameterRange, SAMPLING_METHODS, iter_samples
+from ..config.defaults import DEFAULT_CONFIG
 from ..utils.config_helper import freeze_config, validate_config
-from .data_simulator import DataSimulator
+from ..utils.checkpoint import make_run_key
+from ..utils.result_cache import ResultCache, make_cache_key
+from ..utils.time_utils import ensure_tz_aware, IST
+from ..core.signal_arrays import SignalStream, compute_signal_stream, replay_positions, signal_stream_key
+from .data_simulator import register_preloaded_data, load_simulation_dataset
+from .shared_tick_data import SharedTickData
 from .broker_adapter import BrokerAdapter
 from .trader import LiveTrader
 
@@ -47,6 +75,44 @@ from .trader import LiveTrader
 # MATRIX TEST RUNNER
 # ============================================================================
 
+# Search modes for MatrixTestRunner.run()
+SEARCH_MODES = ('grid', 'halving')
+
+# Result columns where lower is better when ranking halving rungs
+MINIMIZE_METRICS = frozenset({'max_drawdown'})
+
+# Signal streams kept per process when reuse_signals is on (tests run grouped by stream)
+SIGNAL_STREAM_CACHE_SIZE = 4
+
+
+def halving_schedule(num_tests: int, eta: int, budget: float, max_rungs: int = 10) -> List[float]:
+    """
+    Data fractions for successive halving rungs, e.g. [1/27, 1/9, 1/3, 1.0].
+    
+    Rung k runs ceil(num_tests / eta**k) combinations on eta**(k - K) of the data.
+    Returns the schedule with the fewest rungs whose total cost, relative to
+    running every combination on the full data, is within `budget`.
+    
+    Raises:
+        ValueError: If eta < 2, budget is not in (0, 1], or no schedule fits the budget
+    """
+    if eta < 2:
+        raise ValueError(f"halving eta must be >= 2, got {eta}")
+    if not 0 < budget <= 1:
+        raise ValueError(f"halving budget must be in (0, 1], got {budget}")
+    
+    for last_rung in range(1, max_rungs + 1):
+        fractions = [float(eta) ** (rung - last_rung) for rung in range(last_rung + 1)]
+        counts = [max(1, math.ceil(num_tests / eta ** rung)) for rung in range(last_rung + 1)]
+        cost = sum(count * fraction for count, fraction in zip(counts, fractions)) / num_tests
+        if cost <= budget:
+            return fractions
+    raise ValueError(
+        f"No successive halving schedule with eta={eta} fits budget {budget} "
+        f"for {num_tests} combinations; increase the budget or eta"
+    )
+
+
 class MatrixTestRunner:
     """
     Main orchestration class for matrix parameter testing.
@@ -55,9 +121,9 @@ class MatrixTestRunner:
     1. Define parameter grids and fixed parameters
     2. Generate all combinations
     3. Validate each combination
-    4. Run forward tests sequentially
-    5. Collect results
-    6. Export to Excel
+    4. Run forward tests sequentially, or across a process pool (workers > 1)
+    5. Append each result to the on-disk results store as it completes
+    6. Export the store to Excel
     
     Example:
         >>> runner = MatrixTestRunner('C:\\Data\\nifty.csv')
@@ -86,14 +152,29 @@ class MatrixTestRunner:
         self.output_dir = Path(output_dir) if output_dir else Path('results')
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
-        # Parameter grids (parameters to test)
-        self.parameter_grids: Dict[str, List[Any]] = {}
+        # Parameter grids (parameters to test): value lists or sampled ranges
+        self.parameter_grids: Dict[str, Any] = {}
+        
+        # (method, budget) when combinations are sampled instead of the full product
+        self.sampling: Optional[Tuple[str, int]] = None
         
         # Fixed parameters (held constant)
         self.fixed_parameters: Dict[str, Any] = {}
         
-        # Results storage
-        self.results: List[Dict[str, Any]] = []
+        # Results storage: append-only store on disk, opened by run()
+        self.results_store: Optional[MatrixResultsStore] = None
+        
+        # Reuse metrics of previously run identical tests (see utils/result_cache.py)
+        self.use_cache = True
+        
+        # Replay risk variants over shared signal streams instead of running LiveTrader
+        self.reuse_signals = False
+        self._signal_streams: "OrderedDict[Tuple[str, Optional[int]], SignalStream]" = OrderedDict()
+        self._replay_ticks: Optional[Tuple[pd.DataFrame, List[datetime]]] = None
+        
+        # Shared job queue when tests run on queue workers (see run(queue_path=...))
+        self.job_queue: Optional[MatrixJobQueue] = None
+        self._queue_batch = 0
         
         logger.info(f"Matrix Test Runner initialized with CSV: {self.csv_path}")
     
@@ -101,24 +182,66 @@ class MatrixTestRunner:
     # CONFIGURATION
     # ========================================================================
     
-    def add_parameter_grid(self, param_name: str, values: List[Any]):
+    def add_parameter_grid(self, param_name: str, values: Any):
         """
-        Add parameter to test with list of values.
+        Add parameter to test with list of values (or a ParameterRange to sample).
         
         Args:
             param_name: Parameter name (must exist in defaults.py)
-            values: List of values to test
+            values: List of values to test, or ParameterRange (requires set_sampling)
             
         Example:
             >>> runner.add_parameter_grid('fast_ema', [9, 12, 18, 21])
             >>> runner.add_parameter_grid('base_sl_points', [10, 15, 20])
         """
-        if not isinstance(values, list):
+        if not isinstance(values, (list, ParameterRange)):
             values = [values]
         
         self.parameter_grids[param_name] = values
         logger.debug(f"Added parameter grid: {param_name} = {values}")
     
+    def add_parameter_range(
+        self,
+        param_name: str,
+        low: float,
+        high: float,
+        integer: bool = False,
+        step: float = None
+    ):
+        """
+        Add parameter to sample from an inclusive range (see set_sampling).
+        
+        Args:
+            param_name: Parameter name (must exist in defaults.py)
+            low: Lower bound
+            high: Upper bound
+            integer: Sample integers only
+            step: Quantize float samples to low + k * step
+            
+        Example:
+            >>> runner.add_parameter_range('trail_distance_points', 2.0, 20.0, step=0.5)
+            >>> runner.add_parameter_range('slow_ema', 18, 60, integer=True)
+        """
+        self.add_parameter_grid(param_name, ParameterRange(low, high, integer, step))
+    
+    def set_sampling(self, method: str, budget: int):
+        """
+        Sample a fixed number of combinations instead of running the full product.
+        
+        Args:
+            method: 'random', 'lhs' (Latin hypercube) or 'sobol' (requires scipy)
+            budget: Number of combinations to run
+            
+        Example:
+            >>> runner.set_sampling('lhs', 200)
+        """
+        if method not in SAMPLING_METHODS:
+            raise ValueError(f"Sampling method must be one of {SAMPLING_METHODS}, got '{method}'")
+        if budget < 1:
+            raise ValueError(f"Sampling budget must be >= 1, got {budget}")
+        self.sampling = (method, budget)
+        logger.debug(f"Sampling {budget} combinations with {method}")
+    
     def set_fixed_parameter(self, param_name: str, value: Any):
         """
         Set parameter to fixed value (not tested, held constant).
@@ -139,7 +262,7 @@ class MatrixTestRunner:
         Calculate total number of tests that will be run.
         
         Returns:
-            Number of test combinations (Cartesian product of all grids)
+            Number of test combinations (sampling budget, or Cartesian product of all grids)
             
         Example:
             >>> runner.add_parameter_grid('fast_ema', [9, 12, 18])
@@ -149,6 +272,10 @@ class MatrixTestRunner:
         """
         if not self.parameter_grids:
             return 0
+        if self.sampling is not None:
+            return self.sampling[1]
+        if any(isinstance(values, ParameterRange) for values in self.parameter_grids.values()):
+            raise ValueError("Parameter ranges have no fixed count; call set_sampling() to set a budget")
         
         count = 1
         for values in self.parameter_grids.values():
@@ -165,7 +292,19 @@ class MatrixTestRunner:
         phase_name: str = "Matrix Test",
         description: str = "",
         skip_validation: bool = False,
-        output_filename: str = None
+        output_filename: str = None,
+        resume: bool = False,
+        workers: int = 1,
+        seed: int = 0,
+        use_cache: bool = True,
+        search: str = "grid",
+        search_metric: str = "total_pnl",
+        halving_eta: int = 3,
+        halving_budget: float = 0.25,
+        deduplicate: bool = True,
+        reuse_signals: bool = False,
+        queue_path: Optional[str] = None,
+        local_workers: int = 0
     ) -> pd.DataFrame:
         """
         Run all test combinations and export results.
@@ -175,73 +314,139 @@ class MatrixTestRunner:
             description: Optional description of test purpose
             skip_validation: If True, skip parameter validation (NOT RECOMMENDED)
             output_filename: Custom filename for Excel export (default: auto-generated)
+            resume: If True, keep the results already in this run's store
+                (same CSV, grids, fixed parameters and search settings) and
+                skip the combinations they cover
+            workers: Number of worker processes. With workers > 1 the CSV ticks are
+                loaded once into shared memory and tests complete in any order
+            seed: Base seed; each test seeds random/numpy with seed + test_number,
+                so results do not depend on which worker runs a test. Also seeds
+                the combination sampler (see set_sampling)
+            use_cache: If False, ignore and do not update the persistent result cache
+            search: "grid" runs every combination on the full data; "halving" runs
+                successive halving (see _run_successive_halving)
+            search_metric: Result column used to rank combinations in halving mode
+            halving_eta: Keep the top 1/eta combinations at each halving rung
+            halving_budget: Target halving cost as a fraction of the full-grid cost
+            deduplicate: Run each equivalence class once (combinations that differ
+                only in parameters inert under their feature flags, see
+                canonical_parameters) and copy its result to the other members
+            reuse_signals: Compute indicators and entry candidates once per group of
+                tests sharing strategy/session parameters and replay only the
+                position/exit logic per risk variant (core/signal_arrays.py)
+                instead of running LiveTrader for every test
+            queue_path: Run tests through this SQLite job queue instead of in this
+                process. Any number of workers (python -m myQuant.live.matrix_worker
+                --queue PATH, on any machine sharing the filesystem) claim tests;
+                this process collects their results and re-queues the jobs of
+                workers that stop heartbeating
+            local_workers: Worker processes to start on this machine for queue_path
             
         Returns:
             DataFrame with all test results
             
         Raises:
-            ValueError: If no parameter grids defined
+            ValueError: If no parameter grids defined or search settings are invalid
             RuntimeError: If test execution fails
         """
         if not self.parameter_grids:
             raise ValueError("No parameter grids defined. Use add_parameter_grid() first.")
+        if workers < 1:
+            raise ValueError(f"workers must be >= 1, got {workers}")
+        if search not in SEARCH_MODES:
+            raise ValueError(f"search must be one of {SEARCH_MODES}, got '{search}'")
+        if queue_path is None and local_workers:
+            raise ValueError("local_workers requires queue_path")
+        if queue_path is not None and workers > 1:
+            raise ValueError("Use local_workers (queue workers) instead of workers with queue_path")
+        self.use_cache = use_cache
+        self.reuse_signals = reuse_signals
+        self._signal_streams.clear()
+        self._replay_ticks = None
         
         logger.info(f"========================================")
         logger.info(f"Starting Matrix Test: {phase_name}")
         logger.info(f"========================================")
         
-        # Generate all parameter combinations
-        combinations = self._generate_combinations()
-        total_tests = len(combinations)
+        # Parameter combinations (generated lazily)
+        combinations = self._generate_combinations(seed)
+        total_tests = self.calculate_test_count()
         
-        logger.info(f"Generated {total_tests} test combinations")
+        if self.sampling is not None:
+            logger.info(f"Sampling {total_tests} test combinations ({self.sampling[0]})")
+        else:
+            logger.info(f"Generated {total_tests} test combinations")
         logger.info(f"Fixed parameters: {self.fixed_parameters}")
         logger.info(f"CSV data file: {self.csv_path}")
         
+        # Every result is appended to the store as it completes so a crash loses nothing
+        search_settings = {'search': search, 'sampling': self.sampling, 'seed': seed}
+        if search == 'halving':
+            search_settings.update(metric=search_metric, eta=halving_eta, budget=halving_budget)
+        self.results_store = self._create_results_store(skip_validation, search_settings)
+        stored = self.results_store.open({
+            'phase_name': phase_name,
+            'description': description,
+            'csv_path': str(self.csv_path),
+            'parameter_grids': self.parameter_grids,
+            'fixed_parameters': self.fixed_parameters,
+            'skip_validation': skip_validation,
+            'search_settings': search_settings,
+            'total_tests': total_tests,
+        }, resume=resume)
+        if stored:
+            logger.info(f"Resuming: {stored} results already in {self.results_store.results_path}")
+        
         # Run tests
-        self.results = []
         start_time = time.time()
-        
-        for i, param_values in enumerate(combinations, 1):
-            test_start = time.time()
-            
-            # Generate test tag
-            test_tag = generate_test_tag(param_values)
-            
-            logger.info(f"\n[Test {i}/{total_tests}] {test_tag}")
-            logger.info(f"Parameters: {param_values}")
-            
-            # Validate parameter combination
-            if not skip_validation:
-                is_valid, error_msg = validate_parameter_combination(param_values)
-                if not is_valid:
-                    logger.warning(f"❌ Validation failed: {error_msg}")
-                    self._record_failed_test(i, test_tag, param_values, error_msg)
-                    continue
+        local_processes = []
+        if queue_path is not None:
+            self.job_queue = MatrixJobQueue(queue_path)
+            self._queue_batch = 0
+            self.job_queue.open_run({
+                'csv_path': str(self.csv_path.resolve()),
+                'output_dir': str(self.output_dir.resolve()),
+                'fixed_parameters': self.fixed_parameters,
+                'use_cache': self.use_cache,
+                'reuse_signals': self.reuse_signals,
+                'seed': seed,
+                'queue': dict(DEFAULT_CONFIG['matrix_queue']),
+            })
+            logger.info(f"Job queue: {self.job_queue.path} "
+                        f"(start workers with: python -m myQuant.live.matrix_worker --queue {self.job_queue.path})")
+            for _ in range(local_workers):
+                process = multiprocessing.Process(target=run_worker, args=(str(self.job_queue.path),))
+                process.start()
+                local_processes.append(process)
+        try:
+            pending = self._iter_validated_tests(combinations, total_tests, skip_validation)
+            equivalents: Dict[int, List[Tuple[int, str, Dict[str, Any]]]] = {}
+            if deduplicate:
+                pending = self._iter_class_representatives(pending, equivalents)
             
-            # Run single test
-            try:
-                result = self._run_single_test(i, test_tag, param_values)
-                self.results.append(result)
-                
-                test_elapsed = time.time() - test_start
-                total_elapsed = time.time() - start_time
-                avg_time_per_test = total_elapsed / i
-                remaining_tests = total_tests - i
-                eta_seconds = avg_time_per_test * remaining_tests
-                
-                logger.info(
-                    f"✅ Test complete: PnL={result.get('total_pnl', 0):.2f}, "
-                    f"Trades={result.get('total_trades', 0)}, "
-                    f"Time={test_elapsed:.1f}s, ETA={eta_seconds:.0f}s"
+            if search == 'halving':
+                self._run_successive_halving(
+                    list(pending), workers, seed, total_tests,
+                    search_metric, halving_eta, halving_budget
                 )
-                
-            except Exception as e:
-                logger.error(f"❌ Test failed with exception: {e}", exc_info=True)
-                self._record_failed_test(i, test_tag, param_values, str(e))
+            else:
+                completed_tests = {test_number for test_number, _ in self.results_store.completed_keys()}
+                self._execute_tests(
+                    (test for test in pending if test[0] not in completed_tests),
+                    workers, seed, total_tests
+                )
+            self._fan_out_equivalents(equivalents)
+        finally:
+            self.results_store.close()
+            if self.job_queue is not None:
+                self.job_queue.close_run()
+                for process in local_processes:
+                    process.join()
+                self.job_queue = None
+        self.results_store.finish(runtime_seconds=round(time.time() - start_time, 1))
         
-        # Convert results to DataFrame
-        results_df = pd.DataFrame(self.results)
+        # Export is post-processing of the store (test order, independent of completion order)
+        results_df = self.results_store.load_dataframe()
         
         # Export to Excel
         if output_filename is None:
@@ -269,31 +474,356 @@ class MatrixTestRunner:
         logger.info(f"Failed: {total_tests - len(results_df)}")
         logger.info(f"Total runtime: {total_elapsed:.1f}s ({total_elapsed / 60:.1f}m)")
         logger.info(f"Results exported to: {output_path}")
+        logger.info(f"Results store: {self.results_store.results_path}")
         
         return results_df
     
-    def _generate_combinations(self) -> List[Dict[str, Any]]:
+    def _iter_validated_tests(
+        self,
+        combinations: Iterable[Dict[str, Any]],
+        total_tests: int,
+        skip_validation: bool
+    ) -> Iterator[Tuple[int, str, Dict[str, Any]]]:
+        """Yield (test_number, test_tag, param_values), recording validation failures on the way."""
+        failed_tests = {r['test_number'] for r in self.results_store.iter_results() if not r['validation_passed']}
+        for i, param_values in enumerate(combinations, 1):
+            test_tag = generate_test_tag(param_values)
+            
+            # Validate parameter combination
+            if not skip_validation:
+                is_valid, error_msg = validate_parameter_combination(param_values)
+                if not is_valid:
+                    if i not in failed_tests:
+                        logger.warning(f"❌ [Test {i}/{total_tests}] {test_tag} validation failed: {error_msg}")
+                        self._record_failed_test(i, test_tag, param_values, error_msg)
+                    continue
+            
+            yield i, test_tag, param_values
+    
+    def _iter_class_representatives(
+        self,
+        tests: Iterable[Tuple[int, str, Dict[str, Any]]],
+        equivalents: Dict[int, List[Tuple[int, str, Dict[str, Any]]]]
+    ) -> Iterator[Tuple[int, str, Dict[str, Any]]]:
+        """
+        Yield the first test of each equivalence class.
+        
+        Later members are collected in equivalents (representative test_number ->
+        member tests) for _fan_out_equivalents.
+        """
+        representatives: Dict[str, int] = {}
+        for test in tests:
+            key = json.dumps(canonical_parameters(test[2], self.fixed_parameters), sort_keys=True, default=str)
+            representative = representatives.setdefault(key, test[0])
+            if representative == test[0]:
+                yield test
+            else:
+                logger.debug(f"[Test {test[0]}] {test[1]} is equivalent to test {representative}")
+                equivalents.setdefault(representative, []).append(test)
+    
+    def _fan_out_equivalents(self, equivalents: Dict[int, List[Tuple[int, str, Dict[str, Any]]]]):
+        """Copy every stored representative result (all halving rungs) to its class members."""
+        if not equivalents:
+            return
+        completed = self.results_store.completed_keys()
+        copied = 0
+        # Copies are appended while streaming; they belong to members, never representatives
+        for result in self.results_store.iter_results():
+            for test_number, test_tag, param_values in equivalents.get(result['test_number'], ()):
+                if (test_number, result.get('halving_rung')) in completed:
+                    continue
+                member = dict(result, **param_values)
+                member.update(test_number=test_number, test_tag=test_tag, equivalent_to=result['test_number'])
+                self.results_store.append(member)
+                copied += 1
+        logger.info(f"Equivalent combinations: {sum(map(len, equivalents.values()))} "
+                    f"share results with {len(equivalents)} representatives ({copied} rows copied)")
+    
+    def _execute_tests(
+        self,
+        tests: Iterable[Tuple[int, str, Dict[str, Any]]],
+        workers: int,
+        seed: int,
+        total_tests: int,
+        max_ticks: Optional[int] = None,
+        extra_fields: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Run validated tests sequentially or on a process pool, appending to the results store.
+        
+        Args:
+            tests: (test_number, test_tag, param_values) tuples; may be a lazy iterator
+            max_ticks: Simulate only the first max_ticks ticks (None = whole file)
+            extra_fields: Columns added to every result (e.g. halving rung)
+        """
+        expected_tests = len(tests) if isinstance(tests, list) else total_tests
+        if self.reuse_signals:
+            # Consecutive tests of one signal group hit the stream cache
+            tests = sorted(tests, key=lambda test: json.dumps(signal_parameters(test[2]), sort_keys=True, default=str))
+        if self.job_queue is not None:
+            self._run_on_queue(tests, max_ticks, extra_fields)
+            return
+        if workers > 1:
+            self._run_parallel(tests, workers, seed, expected_tests, total_tests, max_ticks, extra_fields)
+            return
+        
+        start_time = time.time()
+        for done, (test_number, test_tag, param_values) in enumerate(tests, 1):
+            test_start = time.time()
+            
+            logger.info(f"\n[Test {test_number}/{total_tests}] {test_tag}")
+            logger.info(f"Parameters: {param_values}")
+            
+            # Run single test
+            try:
+                _seed_test(seed, test_number)
+                result = self._run_single_test(test_number, test_tag, param_values, max_ticks)
+                result.update(extra_fields or {})
+                self.results_store.append(result)
+                
+                test_elapsed = time.time() - test_start
+                total_elapsed = time.time() - start_time
+                avg_time_per_test = total_elapsed / done
+                remaining_tests = max(expected_tests - done, 0)
+                eta_seconds = avg_time_per_test * remaining_tests
+                
+                logger.info(
+                    f"✅ Test complete: PnL={result.get('total_pnl', 0):.2f}, "
+                    f"Trades={result.get('total_trades', 0)}, "
+                    f"Time={test_elapsed:.1f}s, ETA={eta_seconds:.0f}s"
+                )
+                
+            except Exception as e:
+                logger.error(f"❌ Test failed with exception: {e}", exc_info=True)
+                self._record_failed_test(test_number, test_tag, param_values, str(e), extra_fields)
+    
+    def _run_parallel(
+        self,
+        tests: Iterable[Tuple[int, str, Dict[str, Any]]],
+        workers: int,
+        seed: int,
+        expected_tests: int,
+        total_tests: int,
+        max_ticks: Optional[int] = None,
+        extra_fields: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Run validated tests on a process pool, collecting results as they complete.
+        
+        The CSV is parsed once here into shared memory; each worker attaches to it
+        in its initializer and serves it to DataSimulator via register_preloaded_data.
+        At most 2 * workers tests are in flight, so lazy test iterators stay lazy.
+        """
+        tests = iter(tests)
+        first_test = next(tests, None)
+        if first_test is None:
+            return
+        tests = chain([first_test], tests)
+        
+        shared = SharedTickData.from_csv(str(self.csv_path))
+        logger.info(f"Running up to {expected_tests} tests on {workers} worker processes")
+        
+        start_time = time.time()
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_matrix_worker,
+                initargs=(str(self.csv_path), str(self.output_dir), self.fixed_parameters,
+                          self.use_cache, self.reuse_signals, shared.descriptor())
+            ) as pool:
+                in_flight = {}
+                
+                def submit_next() -> bool:
+                    test = next(tests, None)
+                    if test is None:
+                        return False
+                    test_number, test_tag, param_values = test
+                    future = pool.submit(_run_test_in_worker, test_number, test_tag, param_values, seed, max_ticks)
+                    in_flight[future] = test
+                    return True
+                
+                for _ in range(2 * workers):
+                    if not submit_next():
+                        break
+                
+                done = 0
+                while in_flight:
+                    finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        test_number, test_tag, param_values = in_flight.pop(future)
+                        done += 1
+                        try:
+                            result = future.result()
+                            result.update(extra_fields or {})
+                            self.results_store.append(result)
+                            
+                            eta_seconds = (time.time() - start_time) / done * max(expected_tests - done, 0)
+                            logger.info(
+                                f"✅ [Test {test_number}/{total_tests}] {test_tag}: "
+                                f"PnL={result.get('total_pnl', 0):.2f}, "
+                                f"Trades={result.get('total_trades', 0)}, "
+                                f"Done={done}/{expected_tests}, ETA={eta_seconds:.0f}s"
+                            )
+                        except Exception as e:
+                            logger.error(f"❌ [Test {test_number}/{total_tests}] {test_tag} failed in worker: {e}")
+                            self._record_failed_test(test_number, test_tag, param_values, str(e), extra_fields)
+                        
+                        submit_next()
+        finally:
+            shared.close()
+            shared.unlink()
+    
+    def _run_on_queue(
+        self,
+        tests: Iterable[Tuple[int, str, Dict[str, Any]]],
+        max_ticks: Optional[int] = None,
+        extra_fields: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Submit tests as one queue batch and collect results as workers complete them.
+        
+        Jobs held by workers whose heartbeat stops are re-queued; a job that has
+        lost max_attempts workers is recorded as failed.
+        """
+        queue_settings = DEFAULT_CONFIG['matrix_queue']
+        self._queue_batch += 1
+        batch = self._queue_batch
+        submitted = self.job_queue.submit(batch, tests, max_ticks)
+        if not submitted:
+            return
+        logger.info(f"Queued {submitted} tests (batch {batch})")
+        
+        collected = 0
+        last_idle_warning = time.time()
+        while collected < submitted:
+            self.job_queue.requeue_dead_workers(queue_settings['dead_worker_seconds'], queue_settings['max_attempts'])
+            for job in self.job_queue.take_results(batch):
+                payload = job['payload']
+                if 'error' in payload:
+                    self._record_failed_test(job['test_number'], job['test_tag'], job['param_values'],
+                                             payload['error'], extra_fields)
+                else:
+                    result = payload['result']
+                    result.update(extra_fields or {})
+                    self.results_store.append(result)
+                collected += 1
+                logger.info(f"✅ [{collected}/{submitted}] Test {job['test_number']} {job['test_tag']} collected")
+            if collected < submitted:
+                if (self.job_queue.live_workers(queue_settings['dead_worker_seconds']) == 0
+                        and time.time() - last_idle_warning > 60):
+                    logger.warning(f"No live workers on {self.job_queue.path}; "
+                                   f"{submitted - collected} tests waiting")
+                    last_idle_warning = time.time()
+                time.sleep(queue_settings['poll_seconds'])
+    
+    def _run_successive_halving(
+        self,
+        tests: List[Tuple[int, str, Dict[str, Any]]],
+        workers: int,
+        seed: int,
+        total_tests: int,
+        metric: str,
+        eta: int,
+        budget: float
+    ):
+        """
+        Successive halving: evaluate every combination on a short prefix of the
+        data, keep the best 1/eta by `metric`, and re-evaluate the survivors on
+        eta times more data until the last rung runs on the whole file.
+        
+        Every rung's results are appended to the store (tagged halving_rung /
+        data_fraction) so an interrupted search resumes rung by rung.
+        """
+        if not tests:
+            return
+        fractions = halving_schedule(len(tests), eta, budget)
+        total_ticks = len(load_simulation_dataset(str(self.csv_path)))
+        minimize = metric in MINIMIZE_METRICS
+        logger.info(
+            f"Successive halving over {len(tests)} combinations: eta={eta}, metric={metric}, "
+            f"data fractions={[round(f, 4) for f in fractions]}"
+        )
+        
+        survivors = tests
+        for rung, fraction in enumerate(fractions):
+            max_ticks = None if fraction >= 1 else max(1, int(total_ticks * fraction))
+            rung_fields = {'halving_rung': rung, 'data_fraction': fraction}
+            logger.info(
+                f"\n[Rung {rung + 1}/{len(fractions)}] {len(survivors)} combinations on "
+                f"{max_ticks or total_ticks:,} ticks ({fraction:.1%} of data)"
+            )
+            
+            completed = {test_number for test_number, done_rung in self.results_store.completed_keys()
+                         if done_rung == rung}
+            self._execute_tests(
+                [test for test in survivors if test[0] not in completed],
+                workers, seed, total_tests, max_ticks, rung_fields
+            )
+            if rung == len(fractions) - 1:
+                break
+            
+            # Only this rung's scores are held in memory
+            rung_scores = {}
+            for result in self.results_store.iter_results():
+                if result.get('halving_rung') == rung:
+                    value = result.get(metric)
+                    if not result['validation_passed'] or value is None or pd.isna(value):
+                        rung_scores[result['test_number']] = (False, 0.0)
+                    else:
+                        rung_scores[result['test_number']] = (True, -value if minimize else value)
+            
+            def score(test):
+                return rung_scores[test[0]]
+            
+            keep = max(1, math.ceil(len(survivors) / eta))
+            survivors = sorted(survivors, key=score, reverse=True)[:keep]
+            logger.info(f"Rung {rung + 1} survivors: {[test[1] for test in survivors]}")
+    
+    def _create_results_store(
+        self,
+        skip_validation: bool,
+        search_settings: Optional[Dict[str, Any]] = None
+    ) -> MatrixResultsStore:
+        """Results store keyed by CSV identity, grids, fixed parameters and search mode."""
+        run_key = make_run_key('matrix', str(self.csv_path), extra={
+            'parameter_grids': self.parameter_grids,
+            'fixed_parameters': self.fixed_parameters,
+            'skip_validation': skip_validation,
+            'search': search_settings or {'search': 'grid'},
+        })
+        return MatrixResultsStore(self.output_dir / 'matrix_store', run_key)
+    
+    def _generate_combinations(self, seed: int = 0) -> Iterator[Dict[str, Any]]:
         """
-        Generate all parameter combinations (Cartesian product).
+        Lazily generate parameter combinations.
         
+        Cartesian product of all grids, or `budget` samples when set_sampling()
+        was called (value lists are then sampled as categorical values).
+        
+        Args:
+            seed: Sampler seed (ignored for the Cartesian product)
+            
         Returns:
-            List of parameter dictionaries
+            Iterator of parameter dictionaries
         """
-        param_names = list(self.parameter_grids.keys())
-        param_value_lists = [self.parameter_grids[name] for name in param_names]
+        if self.sampling is not None:
+            method, budget = self.sampling
+            return iter_samples(self.parameter_grids, method, budget, seed)
         
-        combinations = []
-        for values in product(*param_value_lists):
-            combination = dict(zip(param_names, values))
-            combinations.append(combination)
+        ranges = [name for name, values in self.parameter_grids.items() if isinstance(values, ParameterRange)]
+        if ranges:
+            raise ValueError(f"Parameters {ranges} are ranges; call set_sampling() to choose a sampling method")
         
-        return combinations
+        param_names = list(self.parameter_grids.keys())
+        param_value_lists = [self.parameter_grids[name] for name in param_names]
+        return (dict(zip(param_names, values)) for values in product(*param_value_lists))
     
     def _run_single_test(
         self,
         test_number: int,
         test_tag: str,
-        param_values: Dict[str, Any]
+        param_values: Dict[str, Any],
+        max_ticks: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Run single forward test with given parameters.
@@ -302,6 +832,7 @@ class MatrixTestRunner:
             test_number: Test sequence number
             test_tag: Unique test identifier
             param_values: Parameters for this test
+            max_ticks: Simulate only the first max_ticks ticks (None = whole file)
             
         Returns:
             Dictionary with test results and metrics
@@ -314,6 +845,8 @@ class MatrixTestRunner:
             config['data_simulation'] = {}
         config['data_simulation']['enabled'] = True
         config['data_simulation']['file_path'] = str(self.csv_path)
+        if max_ticks is not None:
+            config['data_simulation']['max_ticks'] = max_ticks
         
         # Validate configuration
         validation = validate_config(config)
@@ -323,15 +856,38 @@ class MatrixTestRunner:
         # Freeze configuration
         frozen_config = freeze_config(config)
         
-        # Initialize LiveTrader (it will automatically set up file simulation)
-        trader = LiveTrader(frozen_config=frozen_config)
+        result = {
+            'test_number': test_number,
+            'test_tag': test_tag,
+            'validation_passed': True,
+            'validation_error': '',
+        }
+        result.update(param_values)
         
-        # Run simulation using LiveTrader's start method
-        logger.debug(f"Starting simulation...")
-        trader.start(run_once=False)  # run_once=False to process entire file
+        # Identical config on identical data: reuse stored metrics
+        cache = ResultCache.from_config(frozen_config) if self.use_cache else None
+        if cache is not None:
+            cache_kind = 'matrix_replay' if self.reuse_signals else 'matrix'
+            cache_key = make_cache_key(cache_kind, frozen_config, str(self.csv_path))
+            cached_metrics = cache.get(cache_key)
+            if cached_metrics is not None:
+                logger.info(f"Result cache hit for {test_tag}")
+                result.update(cached_metrics)
+                return result
         
-        # Collect results from trader's position manager
-        pm = trader.position_manager
+        if self.reuse_signals:
+            pm = replay_positions(self._get_signal_stream(frozen_config, max_ticks), frozen_config)
+        else:
+            # Initialize LiveTrader (it will automatically set up file simulation).
+            # Batch profile: no per-test Excel export, heartbeat logs or tick pacing
+            trader = LiveTrader(frozen_config=frozen_config, profile='batch')
+            
+            # Run simulation using LiveTrader's start method
+            logger.debug(f"Starting simulation...")
+            trader.start(run_once=False)  # run_once=False to process entire file
+            
+            # Collect results from trader's position manager
+            pm = trader.position_manager
         
         # Calculate metrics from completed trades
         trades = pm.completed_trades
@@ -364,41 +920,73 @@ class MatrixTestRunner:
             avg_loss = 0
             max_dd = 0
         
-        # Calculate metrics
-        result = {
-            'test_number': test_number,
-            'test_tag': test_tag,
-            'validation_passed': True,
-            'validation_error': '',
+        # Performance metrics
+        metrics = {
+            'total_trades': total_trades,
+            'total_pnl': total_pnl,
+            'win_rate': win_rate,
+            'avg_win': avg_win,
+            'avg_loss': avg_loss,
+            'max_drawdown': max_dd,
         }
         
-        # Add parameter values
-        result.update(param_values)
-        
-        # Add performance metrics
-        result['total_trades'] = total_trades
-        result['total_pnl'] = total_pnl
-        result['win_rate'] = win_rate
-        result['avg_win'] = avg_win
-        result['avg_loss'] = avg_loss
-        result['max_drawdown'] = max_dd
-        
         # Optional metrics (if available)
         if hasattr(pm, 'longest_win_streak'):
-            result['longest_win_streak'] = pm.longest_win_streak
+            metrics['longest_win_streak'] = pm.longest_win_streak
         if hasattr(pm, 'longest_loss_streak'):
-            result['longest_loss_streak'] = pm.longest_loss_streak
+            metrics['longest_loss_streak'] = pm.longest_loss_streak
         if hasattr(pm, 'profit_factor'):
-            result['profit_factor'] = pm.profit_factor
+            metrics['profit_factor'] = pm.profit_factor
+        
+        if cache is not None:
+            cache.put(cache_key, metrics)
         
+        result.update(metrics)
         return result
     
+    def _get_signal_stream(self, frozen_config, max_ticks: Optional[int] = None) -> SignalStream:
+        """Signal stream for this config's strategy/session sections (LRU of SIGNAL_STREAM_CACHE_SIZE)."""
+        key = (signal_stream_key(frozen_config), max_ticks)
+        stream = self._signal_streams.get(key)
+        if stream is not None:
+            self._signal_streams.move_to_end(key)
+            return stream
+        
+        data, timestamps = self._load_replay_ticks()
+        if max_ticks is not None:
+            data, timestamps = data.iloc[:max_ticks], timestamps[:max_ticks]
+        stream = compute_signal_stream(data, frozen_config, timestamps)
+        self._signal_streams[key] = stream
+        if len(self._signal_streams) > SIGNAL_STREAM_CACHE_SIZE:
+            self._signal_streams.popitem(last=False)
+        logger.debug(f"Computed signal stream {len(self._signal_streams)} ({len(timestamps)} ticks)")
+        return stream
+    
+    def _load_replay_ticks(self) -> Tuple[pd.DataFrame, List[datetime]]:
+        """The ticks DataSimulator would replay, as price/volume/timestamp columns plus datetimes."""
+        if self._replay_ticks is None:
+            dataset = load_simulation_dataset(str(self.csv_path))
+            if dataset.timestamps is None:
+                raise ValueError("reuse_signals requires a timestamp column in the CSV data")
+            if not isinstance(dataset.timestamps, pd.DatetimeIndex):
+                raise ValueError("reuse_signals requires timestamps that parse to a single datetime dtype")
+            index = dataset.timestamps
+            timestamps = [ensure_tz_aware(ts, default_tz=IST) for ts in index.to_pydatetime()]
+            ticks = pd.DataFrame({
+                'price': dataset.prices,
+                'volume': dataset.volumes,
+                'timestamp': index,
+            })
+            self._replay_ticks = (ticks, timestamps)
+        return self._replay_ticks
+    
     def _record_failed_test(
         self,
         test_number: int,
         test_tag: str,
         param_values: Dict[str, Any],
-        error_msg: str
+        error_msg: str,
+        extra_fields: Optional[Dict[str, Any]] = None
     ):
         """Record test that failed validation or execution."""
         result = {
@@ -414,7 +1002,55 @@ class MatrixTestRunner:
             'max_drawdown': 0,
         }
         result.update(param_values)
-        self.results.append(result)
+        result.update(extra_fields or {})
+        self.results_store.append(result)
+
+
+# ============================================================================
+# PROCESS POOL WORKERS
+# ============================================================================
+
+# Per-process state set up by _init_matrix_worker
+_worker_runner: Optional[MatrixTestRunner] = None
+_worker_shared_ticks: Optional[SharedTickData] = None
+
+
+def _seed_test(seed: int, test_number: int):
+    """Seed random/numpy per test so results are reproducible regardless of scheduling."""
+    test_seed = seed + test_number
+    random.seed(test_seed)
+    np.random.seed(test_seed % (2 ** 32))
+
+
+def _init_matrix_worker(
+    csv_path: str,
+    output_dir: str,
+    fixed_parameters: Dict[str, Any],
+    use_cache: bool,
+    reuse_signals: bool,
+    shared_descriptor: Dict[str, Any]
+):
+    """Pool initializer: attach to the shared ticks and build this worker's runner."""
+    global _worker_runner, _worker_shared_ticks
+    _worker_shared_ticks = SharedTickData.attach(shared_descriptor)
+    register_preloaded_data(csv_path, _worker_shared_ticks.to_dataframe())
+    
+    _worker_runner = MatrixTestRunner(csv_path, output_dir)
+    _worker_runner.fixed_parameters = dict(fixed_parameters)
+    _worker_runner.use_cache = use_cache
+    _worker_runner.reuse_signals = reuse_signals
+
+
+def _run_test_in_worker(
+    test_number: int,
+    test_tag: str,
+    param_values: Dict[str, Any],
+    seed: int,
+    max_ticks: Optional[int] = None
+) -> Dict[str, Any]:
+    """Run one test inside a pool worker."""
+    _seed_test(seed, test_number)
+    return _worker_runner._run_single_test(test_number, test_tag, param_values, max_ticks)
 
 
 # ============================================================================
@@ -427,7 +1063,8 @@ def run_matrix_test(
     fixed_parameters: Dict[str, Any] = None,
     phase_name: str = "Matrix Test",
     description: str = "",
-    output_dir: str = None
+    output_dir: str = None,
+    workers: int = 1
 ) -> pd.DataFrame:
     """
     Convenience function for simple matrix testing.
@@ -439,6 +1076,7 @@ def run_matrix_test(
         phase_name: Name of testing phase
         description: Optional description
         output_dir: Output directory for results
+        workers: Number of worker processes (1 = sequential)
         
     Returns:
         DataFrame with test results
@@ -466,7 +1104,7 @@ def run_matrix_test(
             runner.set_fixed_parameter(param_name, value)
     
     # Run tests
-    return runner.run(phase_name, description)
+    return runner.run(phase_name, description, workers=workers)
 
 
 # ============================================================================
@@ -492,6 +1130,14 @@ Examples:
   # Test price filter
   python -m live.matrix_forward_test --csv data.csv --phase "Phase 3" \\
       --price-buffer 1.0,2.0,3.0,5.0 --filter-duration 120,180,300,600
+  
+  # Latin hypercube over ranges: fixed budget of 200 runs
+  python -m live.matrix_forward_test --csv data.csv --sampling lhs --samples 200 \\
+      --base-sl 5:40:0.5 --trail-distance 2:20:0.5 --fast-ema 5:21 --slow-ema 18:60
+  
+  # Successive halving: screen on data prefixes, full data only for the best
+  python -m live.matrix_forward_test --csv data.csv --search halving --budget 0.2 \\
+      --fast-ema 5,9,12,18,21 --slow-ema 21,26,34,42,55 --base-sl 10,15,20,25
         """
     )
     
@@ -503,8 +1149,31 @@ Examples:
     parser.add_argument('--description', default='', help='Test description')
     parser.add_argument('--output-dir', default='results', help='Output directory')
     parser.add_argument('--skip-validation', action='store_true', help='Skip validation (NOT RECOMMENDED)')
+    parser.add_argument('--resume', action='store_true', help='Resume an interrupted run from its results store')
+    parser.add_argument('--workers', type=int, default=1, help='Worker processes for parallel tests (default: 1)')
+    parser.add_argument('--seed', type=int, default=0, help='Base random seed (each test uses seed + test number)')
+    parser.add_argument('--no-cache', action='store_true', help='Recompute every test instead of reusing cached results')
+    parser.add_argument('--no-dedupe', action='store_true',
+                        help='Run combinations that differ only in inert parameters (e.g. macd_* with use_macd off) separately')
+    parser.add_argument('--queue', default=None,
+                        help='Run tests through this SQLite job queue (workers: python -m myQuant.live.matrix_worker --queue PATH)')
+    parser.add_argument('--local-workers', type=int, default=0,
+                        help='Queue worker processes to start on this machine (with --queue)')
+    parser.add_argument('--reuse-signals', action='store_true',
+                        help='Compute signals once per strategy-parameter group and replay only exits per risk variant')
+    parser.add_argument('--search', choices=SEARCH_MODES, default='grid',
+                        help='grid = every combination on all data; halving = successive halving on growing data prefixes')
+    parser.add_argument('--metric', default='total_pnl', help='Ranking metric for halving search (default: total_pnl)')
+    parser.add_argument('--eta', type=int, default=3, help='Halving search keeps the top 1/eta per rung (default: 3)')
+    parser.add_argument('--budget', type=float, default=0.25,
+                        help='Halving search cost as a fraction of the full grid (default: 0.25)')
+    parser.add_argument('--sampling', choices=SAMPLING_METHODS,
+                        help='Sample combinations (random, lhs, sobol) instead of the full product; '
+                             'parameter values may then be ranges low:high[:step]')
+    parser.add_argument('--samples', type=int, default=100, help='Number of sampled combinations (default: 100)')
     
     # Parameter grids (most common parameters)
+    # Each accepts comma-separated values, or low:high[:step] ranges with --sampling
     parser.add_argument('--fast-ema', help='Fast EMA values (comma-separated)')
     parser.add_argument('--slow-ema', help='Slow EMA values (comma-separated)')
     parser.add_argument('--macd-fast', help='MACD fast values (comma-separated)')
@@ -558,9 +1227,16 @@ def main():
     
     for param_name, cli_value in param_mapping.items():
         if cli_value:
-            # Parse comma-separated values
-            values = [_parse_value(v.strip()) for v in cli_value.split(',')]
-            runner.add_parameter_grid(param_name, values)
+            if ':' in cli_value:
+                # Parse low:high[:step] range (sampled)
+                runner.add_parameter_grid(param_name, _parse_range(cli_value))
+            else:
+                # Parse comma-separated values
+                values = [_parse_value(v.strip()) for v in cli_value.split(',')]
+                runner.add_parameter_grid(param_name, values)
+    
+    if args.sampling:
+        runner.set_sampling(args.sampling, args.samples)
     
     # Add fixed parameters
     if args.fixed:
@@ -576,13 +1252,35 @@ def main():
         runner.run(
             phase_name=args.phase,
             description=args.description,
-            skip_validation=args.skip_validation
+            skip_validation=args.skip_validation,
+            resume=args.resume,
+            workers=args.workers,
+            seed=args.seed,
+            use_cache=not args.no_cache,
+            deduplicate=not args.no_dedupe,
+            reuse_signals=args.reuse_signals,
+            queue_path=args.queue,
+            local_workers=args.local_workers,
+            search=args.search,
+            search_metric=args.metric,
+            halving_eta=args.eta,
+            halving_budget=args.budget
         )
     except Exception as e:
         logger.error(f"Matrix test failed: {e}", exc_info=True)
         sys.exit(1)
 
 
+def _parse_range(range_str: str) -> ParameterRange:
+    """Parse 'low:high[:step]'; all-integer bounds (and step) give an integer range."""
+    parts = [_parse_value(p.strip()) for p in range_str.split(':')]
+    if len(parts) not in (2, 3) or not all(isinstance(p, (int, float)) and not isinstance(p, bool) for p in parts):
+        raise ValueError(f"Invalid range '{range_str}'; expected low:high or low:high:step")
+    step = parts[2] if len(parts) == 3 else None
+    integer = all(isinstance(p, int) for p in parts)
+    return ParameterRange(parts[0], parts[1], integer=integer, step=step)
+
+
 def _parse_value(value_str: str) -> Any:
     """Parse string value to appropriate type."""
     # Try boolean
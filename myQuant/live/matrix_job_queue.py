@@ -0,0 +1,284 @@
+"""
+live/matrix_job_queue.py
+
+SQLite job queue for spreading one matrix run over several worker processes
+or machines that share a filesystem.
+
+CRITICAL PRINCIPLES:
+- No broker: the queue is a single SQLite file next to the results
+- Claims are atomic (BEGIN IMMEDIATE): a job is held by one worker at a time
+- Workers heartbeat while they run; jobs held by a worker whose heartbeat
+  stops are re-queued by the coordinator (requeue_dead_workers)
+- A job that kills its worker max_attempts times is completed as failed
+- Every operation opens its own short-lived connection, so queue objects are
+  safe to use from any thread or forked process
+
+NOTE: SQLite locking needs a filesystem with working POSIX/SMB file locks
+(local disks, SMB shares, NFSv4). Do not put the queue on NFSv3 without lockd.
+
+ROLES:
+    coordinator: MatrixTestRunner.run(queue_path=...) opens the run, submits each
+                 batch of tests and collects results into its results store
+    worker:      python -m myQuant.live.matrix_worker --queue PATH  (any host)
+"""
+
+import json
+import logging
+import sqlite3
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+QUEUE_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS jobs (
+    batch INTEGER NOT NULL,
+    test_number INTEGER NOT NULL,
+    test_tag TEXT NOT NULL,
+    params TEXT NOT NULL,
+    max_ticks INTEGER,
+    status TEXT NOT NULL DEFAULT 'pending',
+    worker_id TEXT,
+    claimed_at REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    result TEXT,
+    collected INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (batch, test_number)
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, batch, test_number);
+CREATE TABLE IF NOT EXISTS workers (
+    worker_id TEXT PRIMARY KEY,
+    host TEXT,
+    pid INTEGER,
+    started_at REAL NOT NULL,
+    heartbeat_at REAL NOT NULL
+);
+"""
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize numpy scalars natively; anything else by its string form."""
+    if hasattr(value, 'item'):
+        return value.item()
+    return str(value)
+
+
+class MatrixJobQueue:
+    """Jobs, worker heartbeats and run settings of one matrix run in a SQLite file."""
+
+    def __init__(self, path: str, timeout: float = 30.0):
+        self.path = Path(path)
+        self.timeout = timeout
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(str(self.path), timeout=self.timeout, isolation_level=None)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Write transaction taking the database lock up front (no lock upgrades)."""
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    # ------------------------------------------------------------------
+    # Run lifecycle (coordinator)
+    # ------------------------------------------------------------------
+
+    def open_run(self, settings: Dict[str, Any]) -> str:
+        """
+        Start a new run: drop previous jobs and publish the settings workers need.
+
+        Returns:
+            run_id identifying this run (workers rebuild their runner when it changes)
+        """
+        run_id = uuid.uuid4().hex
+        meta = {
+            'queue_version': QUEUE_VERSION,
+            'run_id': run_id,
+            'state': 'open',
+            'settings': settings,
+        }
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM jobs")
+            conn.execute("DELETE FROM meta")
+            conn.executemany("INSERT INTO meta (key, value) VALUES (?, ?)",
+                             [(key, json.dumps(value, default=_json_default)) for key, value in meta.items()])
+        return run_id
+
+    def close_run(self):
+        """Mark the run finished; idle workers started with exit_when_closed stop."""
+        with self._transaction() as conn:
+            conn.execute("UPDATE meta SET value = ? WHERE key = 'state'", (json.dumps('closed'),))
+
+    def read_meta(self) -> Dict[str, Any]:
+        with self._connect() as conn:
+            rows = conn.execute("SELECT key, value FROM meta").fetchall()
+        return {key: json.loads(value) for key, value in rows}
+
+    def submit(self, batch: int, tests: Iterable[Tuple[int, str, Dict[str, Any]]],
+               max_ticks: Optional[int] = None, chunk_size: int = 1000) -> int:
+        """Queue (test_number, test_tag, param_values) tests as one batch. Returns the number queued."""
+        submitted = 0
+        chunk: List[Tuple] = []
+
+        def flush():
+            with self._transaction() as conn:
+                conn.executemany(
+                    "INSERT INTO jobs (batch, test_number, test_tag, params, max_ticks) VALUES (?, ?, ?, ?, ?)",
+                    chunk
+                )
+            chunk.clear()
+
+        for test_number, test_tag, param_values in tests:
+            chunk.append((batch, test_number, test_tag, json.dumps(param_values, default=_json_default), max_ticks))
+            submitted += 1
+            if len(chunk) >= chunk_size:
+                flush()
+        if chunk:
+            flush()
+        return submitted
+
+    def take_results(self, batch: int) -> List[Dict[str, Any]]:
+        """
+        Completed jobs of a batch not returned before; marks them collected.
+
+        Returns:
+            Dicts with test_number, test_tag, param_values and payload
+            ({'result': {...}} or {'error': msg})
+        """
+        with self._transaction() as conn:
+            rows = conn.execute(
+                "SELECT test_number, test_tag, params, result FROM jobs "
+                "WHERE batch = ? AND status = 'done' AND collected = 0 ORDER BY test_number", (batch,)
+            ).fetchall()
+            conn.execute("UPDATE jobs SET collected = 1 WHERE batch = ? AND status = 'done'", (batch,))
+        return [
+            {'test_number': test_number, 'test_tag': test_tag,
+             'param_values': json.loads(params), 'payload': json.loads(result)}
+            for test_number, test_tag, params, result in rows
+        ]
+
+    def batch_counts(self, batch: int) -> Dict[str, int]:
+        """Job counts per status ('pending', 'running', 'done') for a batch."""
+        with self._connect() as conn:
+            rows = conn.execute("SELECT status, COUNT(*) FROM jobs WHERE batch = ? GROUP BY status",
+                                (batch,)).fetchall()
+        counts = {'pending': 0, 'running': 0, 'done': 0}
+        counts.update(dict(rows))
+        return counts
+
+    def requeue_dead_workers(self, dead_after_seconds: float, max_attempts: int) -> int:
+        """
+        Return jobs held by workers without a recent heartbeat to the queue.
+
+        Jobs that already used max_attempts are completed with an error payload
+        instead, so one poisonous combination cannot stall the run.
+
+        Returns:
+            Number of jobs re-queued or failed
+        """
+        cutoff = time.time() - dead_after_seconds
+        with self._transaction() as conn:
+            stale = conn.execute(
+                "SELECT j.batch, j.test_number, j.worker_id, j.attempts FROM jobs j "
+                "LEFT JOIN workers w ON w.worker_id = j.worker_id "
+                "WHERE j.status = 'running' AND (w.heartbeat_at IS NULL OR w.heartbeat_at < ?)",
+                (cutoff,)
+            ).fetchall()
+            for batch, test_number, worker_id, attempts in stale:
+                if attempts >= max_attempts:
+                    error = {'error': f"Worker {worker_id} stopped responding ({attempts} attempts)"}
+                    conn.execute("UPDATE jobs SET status = 'done', result = ? WHERE batch = ? AND test_number = ?",
+                                 (json.dumps(error), batch, test_number))
+                    logger.error(f"Job {batch}/{test_number} failed: {error['error']}")
+                else:
+                    conn.execute("UPDATE jobs SET status = 'pending', worker_id = NULL, claimed_at = NULL "
+                                 "WHERE batch = ? AND test_number = ?", (batch, test_number))
+                    logger.warning(f"Re-queued test {test_number} from unresponsive worker {worker_id}")
+            conn.execute("DELETE FROM workers WHERE heartbeat_at < ?", (cutoff,))
+        return len(stale)
+
+    def live_workers(self, dead_after_seconds: float) -> int:
+        cutoff = time.time() - dead_after_seconds
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM workers WHERE heartbeat_at >= ?", (cutoff,)).fetchone()[0]
+
+    # ------------------------------------------------------------------
+    # Worker side
+    # ------------------------------------------------------------------
+
+    def heartbeat(self, worker_id: str, host: str = '', pid: int = 0):
+        now = time.time()
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT INTO workers (worker_id, host, pid, started_at, heartbeat_at) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(worker_id) DO UPDATE SET heartbeat_at = excluded.heartbeat_at",
+                (worker_id, host, pid, now, now)
+            )
+
+    def claim(self, worker_id: str) -> Optional[Dict[str, Any]]:
+        """Atomically take the lowest pending job, or None when nothing is pending."""
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT batch, test_number, test_tag, params, max_ticks FROM jobs "
+                "WHERE status = 'pending' ORDER BY batch, test_number LIMIT 1"
+            ).fetchone()
+            if row is None:
+                return None
+            batch, test_number, test_tag, params, max_ticks = row
+            conn.execute(
+                "UPDATE jobs SET status = 'running', worker_id = ?, claimed_at = ?, attempts = attempts + 1 "
+                "WHERE batch = ? AND test_number = ?",
+                (worker_id, time.time(), batch, test_number)
+            )
+        return {
+            'batch': batch,
+            'test_number': test_number,
+            'test_tag': test_tag,
+            'param_values': json.loads(params),
+            'max_ticks': max_ticks,
+        }
+
+    def complete(self, worker_id: str, batch: int, test_number: int, payload: Dict[str, Any]) -> bool:
+        """
+        Store a job's result ({'result': {...}} or {'error': msg}).
+
+        A late result from a worker whose job was re-queued is still accepted while
+        the job is pending, but not once another worker has claimed it.
+
+        Returns:
+            True if the result was stored
+        """
+        with self._transaction() as conn:
+            updated = conn.execute(
+                "UPDATE jobs SET status = 'done', result = ? WHERE batch = ? AND test_number = ? "
+                "AND (status = 'pending' OR (status = 'running' AND worker_id = ?))",
+                (json.dumps(payload, default=_json_default), batch, test_number, worker_id)
+            ).rowcount
+        return updated == 1
+
+    def unregister(self, worker_id: str):
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM workers WHERE worker_id = ?", (worker_id,))
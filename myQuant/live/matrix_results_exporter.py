@@ -190,10 +190,14 @@ def _write_top10_sheet(writer, results_df: pd.DataFrame):
     """
     Create Top 10 sheet with best performing configurations.
     
-    Ranked by total_pnl, showing comprehensive metrics.
+    Ranked by total_pnl, showing comprehensive metrics. Successive halving
+    results rank combinations that reached deeper rungs (more data) first.
     """
     # Sort by PnL and take top 10
-    top10_df = results_df.sort_values('total_pnl', ascending=False).head(10).copy()
+    if 'halving_rung' in results_df.columns:
+        top10_df = results_df.sort_values(['halving_rung', 'total_pnl'], ascending=False).head(10).copy()
+    else:
+        top10_df = results_df.sort_values('total_pnl', ascending=False).head(10).copy()
     
     # Select columns for display
     display_cols = [col for col in results_df.columns if col != 'test_number']
@@ -254,7 +258,8 @@ def _write_configuration_sheet(
         'test_number', 'test_tag', 'total_trades', 'total_pnl', 'win_rate',
         'avg_win', 'avg_loss', 'max_drawdown', 'sharpe_ratio', 'profit_factor',
         'longest_win_streak', 'longest_loss_streak', 'validation_passed',
-        'validation_error', 'runtime_seconds'
+        'validation_error', 'runtime_seconds', 'halving_rung', 'data_fraction',
+        'equivalent_to'
     }
     param_cols = [col for col in results_df.columns if col not in metric_cols]
     
@@ -315,7 +320,8 @@ def _write_sensitivity_sheet(writer, results_df: pd.DataFrame):
         'test_number', 'test_tag', 'total_trades', 'total_pnl', 'win_rate',
         'avg_win', 'avg_loss', 'max_drawdown', 'sharpe_ratio', 'profit_factor',
         'longest_win_streak', 'longest_loss_streak', 'validation_passed',
-        'validation_error', 'runtime_seconds'
+        'validation_error', 'runtime_seconds', 'halving_rung', 'data_fraction',
+        'equivalent_to'
     }
     param_cols = [col for col in results_df.columns if col not in metric_cols]
     
@@ -381,7 +387,8 @@ def _write_validation_sheet(writer, results_df: pd.DataFrame):
         'test_number', 'test_tag', 'total_trades', 'total_pnl', 'win_rate',
         'avg_win', 'avg_loss', 'max_drawdown', 'sharpe_ratio', 'profit_factor',
         'longest_win_streak', 'longest_loss_streak', 'validation_passed',
-        'validation_error', 'runtime_seconds'
+        'validation_error', 'runtime_seconds', 'halving_rung', 'data_fraction',
+        'equivalent_to'
     }
     param_cols = [col for col in results_df.columns if col not in metric_cols]
     validation_cols.extend(param_cols)
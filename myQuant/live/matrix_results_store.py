@@ -0,0 +1,160 @@
+"""
+live/matrix_results_store.py
+
+Append-only, crash-safe results store for matrix parameter testing.
+
+CRITICAL PRINCIPLES:
+- Every completed test is appended (and fsync'ed) the moment it finishes
+- One JSON object per line: a crash loses at most the line being written
+- A JSON manifest records what the run is (grids, fixed params, search mode)
+  and whether it completed
+- Results are streamed back from disk; nothing holds the whole grid in memory
+  while tests run
+
+FILES (in <output_dir>/matrix_store/):
+    <run_key>.results.jsonl   one result dict per line
+    <run_key>.manifest.json   run description + status
+
+USAGE:
+    store = MatrixResultsStore(output_dir / 'matrix_store', run_key)
+    store.open(manifest, resume=True)
+    store.append(result)
+    ...
+    store.finish()
+    results_df = store.load_dataframe()
+"""
+
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+STORE_VERSION = 1
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize numpy scalars natively; anything else by its string form."""
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
+
+class MatrixResultsStore:
+    """JSON-lines results file plus manifest for one matrix run."""
+
+    def __init__(self, directory: Path, run_key: str):
+        self.directory = Path(directory)
+        self.run_key = run_key
+        self.results_path = self.directory / f"{run_key}.results.jsonl"
+        self.manifest_path = self.directory / f"{run_key}.manifest.json"
+        self._file = None
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def open(self, manifest: Dict[str, Any], resume: bool = False) -> int:
+        """
+        Start (or resume) the run. Returns the number of results already stored.
+
+        Without resume any previous results for this run key are discarded.
+        With resume a partially written last line (crash mid-append) is removed.
+        """
+        if resume and self.results_path.exists():
+            self._truncate_partial_line()
+        else:
+            self.results_path.write_bytes(b'')
+
+        previous = self.read_manifest() if resume else None
+        self._write_manifest({
+            **manifest,
+            'store_version': STORE_VERSION,
+            'run_key': self.run_key,
+            'results_file': self.results_path.name,
+            'status': 'running',
+            'started_at': previous['started_at'] if previous else datetime.now().isoformat(),
+            'updated_at': datetime.now().isoformat(),
+        })
+        self._file = open(self.results_path, 'a', encoding='utf-8')
+        return sum(1 for _ in self.iter_results())
+
+    def append(self, result: Dict[str, Any]):
+        """Durably append one result."""
+        if self._file is None:
+            raise RuntimeError("MatrixResultsStore.append() called before open()")
+        self._file.write(json.dumps(result, default=_json_default) + '\n')
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def finish(self, **summary):
+        """Close the results file and mark the run complete in the manifest."""
+        self.close()
+        manifest = self.read_manifest() or {}
+        manifest.update(summary, status='complete', updated_at=datetime.now().isoformat())
+        self._write_manifest(manifest)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _write_manifest(self, manifest: Dict[str, Any]):
+        tmp_path = self.manifest_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, default=_json_default)
+        os.replace(tmp_path, self.manifest_path)
+
+    def _truncate_partial_line(self):
+        with open(self.results_path, 'rb+') as f:
+            data = f.read()
+            end = data.rfind(b'\n') + 1
+            if end != len(data):
+                logger.warning(f"Discarding partially written result at end of {self.results_path}")
+                f.truncate(end)
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def read_manifest(self) -> Optional[Dict[str, Any]]:
+        if not self.manifest_path.exists():
+            return None
+        with open(self.manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def iter_results(self) -> Iterator[Dict[str, Any]]:
+        """Stream stored results in append order."""
+        if not self.results_path.exists():
+            return
+        with open(self.results_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.endswith('\n'):
+                    break  # Partial line from an interrupted append
+                yield json.loads(line)
+
+    def completed_keys(self) -> Set[Tuple[int, Optional[int]]]:
+        """(test_number, halving_rung) of every stored result (rung is None for grid runs)."""
+        return {(r['test_number'], r.get('halving_rung')) for r in self.iter_results()}
+
+    def load_dataframe(self) -> pd.DataFrame:
+        """
+        Results as a DataFrame in test order, one row per combination.
+
+        Successive halving runs keep the row from the deepest rung each
+        combination reached.
+        """
+        results_df = pd.DataFrame(self.iter_results())
+        if results_df.empty:
+            return results_df
+        if 'halving_rung' in results_df.columns:
+            results_df = results_df.sort_values(['test_number', 'halving_rung'], kind='stable')
+            results_df = results_df.drop_duplicates('test_number', keep='last')
+        return results_df.sort_values('test_number', kind='stable').reset_index(drop=True)
@@ -0,0 +1,154 @@
+"""
+live/matrix_sampling.py
+
+Parameter ranges and sampling strategies for matrix parameter testing.
+
+CRITICAL PRINCIPLES:
+- Fixed evaluation budget: exactly `budget` combinations, whatever the ranges
+- Lazy: combinations are yielded one at a time, never materialized as dicts
+- Deterministic: the same seed always yields the same combinations (resume-safe)
+- Explicit value lists mix freely with ranges (sampled as categorical values)
+
+METHODS:
+- random: independent uniform draws
+- lhs:    Latin hypercube - each dimension's range is split into `budget`
+          strata and every stratum is used exactly once
+- sobol:  scrambled Sobol low-discrepancy sequence (requires scipy)
+
+USAGE:
+    from .matrix_sampling import ParameterRange, iter_samples
+
+    dimensions = {
+        'base_sl_points': ParameterRange(5, 40, step=0.5),
+        'fast_ema': ParameterRange(5, 21, integer=True),
+        'use_trail_stop': [True, False],
+    }
+    for param_values in iter_samples(dimensions, 'lhs', budget=200, seed=0):
+        ...
+"""
+
+import logging
+import math
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Optional dependency: scipy provides the Sobol sequence
+try:
+    from scipy.stats import qmc
+    SCIPY_AVAILABLE = True
+except ImportError:
+    qmc = None
+    SCIPY_AVAILABLE = False
+
+SAMPLING_METHODS = ('random', 'lhs', 'sobol')
+
+# Float samples without a step are rounded to this many decimals (readable test tags)
+FLOAT_DECIMALS = 4
+
+
+@dataclass(frozen=True)
+class ParameterRange:
+    """
+    Inclusive [low, high] range for one parameter.
+
+    Attributes:
+        low: Lower bound
+        high: Upper bound
+        integer: Sample integers (both bounds inclusive)
+        step: Quantize samples to low + k * step (e.g. 0.05 price tick)
+    """
+    low: float
+    high: float
+    integer: bool = False
+    step: Optional[float] = None
+
+    def __post_init__(self):
+        if self.high < self.low:
+            raise ValueError(f"ParameterRange high ({self.high}) must be >= low ({self.low})")
+        if self.step is not None and self.step <= 0:
+            raise ValueError(f"ParameterRange step must be > 0, got {self.step}")
+        if self.integer and self.step is not None and self.step != int(self.step):
+            raise ValueError(f"ParameterRange step must be a whole number for integer ranges, got {self.step}")
+
+    def value_at(self, u: float) -> Union[int, float]:
+        """Map a unit-interval sample u in [0, 1) onto the range."""
+        if self.integer:
+            step = int(self.step or 1)
+            steps = (int(self.high) - int(self.low)) // step + 1
+            return int(self.low) + min(int(u * steps), steps - 1) * step
+        if self.step is not None:
+            steps = int(math.floor((self.high - self.low) / self.step + 1e-9)) + 1
+            k = min(int(u * steps), steps - 1)
+            return round(self.low + k * self.step, 10)
+        return round(self.low + u * (self.high - self.low), FLOAT_DECIMALS)
+
+
+Dimension = Union[ParameterRange, List[Any]]
+
+
+def _value_at(dimension: Dimension, u: float) -> Any:
+    if isinstance(dimension, ParameterRange):
+        return dimension.value_at(u)
+    return dimension[min(int(u * len(dimension)), len(dimension) - 1)]
+
+
+def _unit_samples(method: str, dims: int, budget: int, seed: int) -> Iterator[np.ndarray]:
+    """Yield `budget` points of the unit hypercube [0, 1)^dims."""
+    rng = np.random.default_rng(seed)
+    if method == 'random':
+        for _ in range(budget):
+            yield rng.random(dims)
+    elif method == 'lhs':
+        # One random permutation of the strata per dimension: O(budget * dims) floats
+        strata = np.stack([rng.permutation(budget) for _ in range(dims)], axis=1)
+        design = (strata + rng.random((budget, dims))) / budget
+        yield from design
+    elif method == 'sobol':
+        sampler = qmc.Sobol(d=dims, scramble=True, seed=seed)
+        remaining = budget
+        while remaining > 0:
+            batch = min(remaining, 1024)
+            yield from sampler.random(batch)
+            remaining -= batch
+    else:
+        raise ValueError(f"Unknown sampling method '{method}'. Use one of {SAMPLING_METHODS}")
+
+
+def iter_samples(
+    dimensions: Dict[str, Dimension],
+    method: str,
+    budget: int,
+    seed: int = 0
+) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily yield `budget` parameter combinations sampled from `dimensions`.
+
+    Arguments are validated immediately; combinations are produced on iteration.
+
+    Args:
+        dimensions: Parameter name -> ParameterRange or explicit value list
+        method: One of SAMPLING_METHODS
+        budget: Number of combinations to yield
+        seed: Seed for the sampler (same seed -> same combinations)
+
+    Raises:
+        ValueError: If method is unknown, budget < 1, or a value list is empty
+        ImportError: If method is 'sobol' and scipy is not installed
+    """
+    if method not in SAMPLING_METHODS:
+        raise ValueError(f"Unknown sampling method '{method}'. Use one of {SAMPLING_METHODS}")
+    if method == 'sobol' and not SCIPY_AVAILABLE:
+        raise ImportError("Sobol sampling requires scipy (pip install scipy); use 'lhs' or 'random' instead")
+    if budget < 1:
+        raise ValueError(f"Sampling budget must be >= 1, got {budget}")
+    for name, dimension in dimensions.items():
+        if not isinstance(dimension, ParameterRange) and not dimension:
+            raise ValueError(f"Parameter '{name}' has no values to sample")
+
+    names = list(dimensions.keys())
+    points = _unit_samples(method, len(names), budget, seed)
+    return ({name: _value_at(dimensions[name], float(u)) for name, u in zip(names, point)} for point in points)
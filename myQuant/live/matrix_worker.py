@@ -0,0 +1,153 @@
+"""
+live/matrix_worker.py
+
+Worker entry point for queue-based matrix runs (see matrix_job_queue.py).
+
+A worker claims one combination at a time from the shared queue, runs it with
+the coordinator's settings (CSV, fixed parameters, cache, signal reuse, seed),
+writes the result back and heartbeats in a background thread meanwhile. Start
+as many as you like, on any machine that sees the queue file and the CSV:
+
+USAGE:
+    python -m myQuant.live.matrix_worker --queue results/matrix_queue.db
+    python -m myQuant.live.matrix_worker --queue Z:/sweeps/matrix_queue.db --keep-running
+"""
+
+import argparse
+import logging
+import os
+import socket
+import sys
+import threading
+import time
+import uuid
+from typing import Any, Dict, Optional
+
+from .matrix_job_queue import MatrixJobQueue
+
+logger = logging.getLogger(__name__)
+
+
+class _Heartbeat:
+    """Background thread refreshing this worker's heartbeat until stopped."""
+
+    def __init__(self, queue: MatrixJobQueue, worker_id: str, interval: float):
+        self.queue = queue
+        self.worker_id = worker_id
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"heartbeat-{worker_id}", daemon=True)
+
+    def start(self):
+        self.queue.heartbeat(self.worker_id, socket.gethostname(), os.getpid())
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.queue.heartbeat(self.worker_id, socket.gethostname(), os.getpid())
+            except Exception as e:
+                logger.warning(f"Heartbeat failed for {self.worker_id}: {e}")
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+
+def _build_runner(settings: Dict[str, Any]):
+    """MatrixTestRunner configured like the coordinator's (no results store; results go to the queue)."""
+    from .matrix_forward_test import MatrixTestRunner
+    runner = MatrixTestRunner(settings['csv_path'], settings['output_dir'])
+    runner.fixed_parameters = dict(settings['fixed_parameters'])
+    runner.use_cache = settings['use_cache']
+    runner.reuse_signals = settings['reuse_signals']
+    return runner
+
+
+def run_worker(
+    queue_path: str,
+    worker_id: Optional[str] = None,
+    exit_when_closed: bool = True,
+    max_jobs: Optional[int] = None
+) -> int:
+    """
+    Claim and run jobs until the run is closed (or forever with exit_when_closed=False).
+
+    Args:
+        queue_path: SQLite queue file shared with the coordinator
+        worker_id: Unique worker name (default: host-pid-random)
+        exit_when_closed: Stop when no job is pending and the coordinator closed the run
+        max_jobs: Stop after this many jobs (None = no limit)
+
+    Returns:
+        Number of jobs completed by this worker
+    """
+    from .matrix_forward_test import _seed_test
+
+    queue = MatrixJobQueue(queue_path)
+    worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+    meta = queue.read_meta()
+    if not meta:
+        raise RuntimeError(f"No matrix run has been opened in queue {queue_path}")
+    queue_settings = meta['settings']['queue']
+
+    heartbeat = _Heartbeat(queue, worker_id, queue_settings['heartbeat_seconds'])
+    heartbeat.start()
+    logger.info(f"Matrix worker {worker_id} attached to {queue_path}")
+
+    runner = None
+    run_id = None
+    completed = 0
+    try:
+        while max_jobs is None or completed < max_jobs:
+            job = queue.claim(worker_id)
+            if job is None:
+                meta = queue.read_meta()
+                if exit_when_closed and meta.get('state') == 'closed':
+                    break
+                time.sleep(queue_settings['poll_seconds'])
+                continue
+
+            meta = queue.read_meta()
+            if meta['run_id'] != run_id:
+                runner = _build_runner(meta['settings'])
+                run_id = meta['run_id']
+
+            test_number = job['test_number']
+            logger.info(f"[{worker_id}] Test {test_number}: {job['test_tag']}")
+            try:
+                _seed_test(meta['settings']['seed'], test_number)
+                result = runner._run_single_test(test_number, job['test_tag'], job['param_values'], job['max_ticks'])
+                payload = {'result': result}
+            except Exception as e:
+                logger.error(f"[{worker_id}] Test {test_number} failed: {e}", exc_info=True)
+                payload = {'error': str(e)}
+            if not queue.complete(worker_id, job['batch'], test_number, payload):
+                logger.warning(f"[{worker_id}] Test {test_number} was re-queued to another worker; result dropped")
+            completed += 1
+    finally:
+        heartbeat.stop()
+        queue.unregister(worker_id)
+    logger.info(f"Matrix worker {worker_id} finished after {completed} jobs")
+    return completed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run matrix test jobs from a shared queue')
+    parser.add_argument('--queue', required=True, help='SQLite queue file written by the coordinator')
+    parser.add_argument('--worker-id', default=None, help='Unique worker name (default: host-pid-random)')
+    parser.add_argument('--keep-running', action='store_true',
+                        help='Keep polling after the current run is closed (serve later runs)')
+    parser.add_argument('--max-jobs', type=int, default=None, help='Exit after this many jobs')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    try:
+        run_worker(args.queue, args.worker_id, exit_when_closed=not args.keep_running, max_jobs=args.max_jobs)
+    except KeyboardInterrupt:
+        logger.info("Worker interrupted")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
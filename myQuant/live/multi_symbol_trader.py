@@ -0,0 +1,265 @@
+"""
+live/multi_symbol_trader.py
+
+Several instruments (e.g. a CE and a PE strike) traded in one process over a
+single WebSocket subscription.
+
+CRITICAL PRINCIPLES:
+- One login, one BrokerAdapter, one WebSocket subscribed to every token
+- Each instrument has its own strategy and PositionManager (SymbolSession),
+  built from the shared config with that leg merged over config['instrument']
+- Ticks are routed by token with a dict lookup, so per-symbol work does not
+  grow with the number of symbols
+- Optional shared capital: legs draw on one pool instead of each getting
+  initial_capital (ticks are processed one at a time, so the pool is simply
+  lent to the session handling the current tick)
+- Each leg runs LiveTrader's per-tick pipeline (trader.process_tick); shutdown
+  closes legs under the dispatch lock, never alongside an in-flight tick
+
+CONFIG (defaults.py 'multi_symbol'):
+    "instruments": [{"symbol": "NIFTY25NOV24000CE", "token": "43657", "exchange": "NFO",
+                     "instrument_type": "NIFTY"}, ...]   # instrument_type: key into instrument_mappings
+    "shared_capital": False
+
+USAGE:
+    trader = MultiSymbolTrader(frozen_config=frozen_config)
+    trader.start()          # Blocks until stop() or session end
+"""
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Optional
+
+from ..core.position_manager import PositionManager
+from ..utils.config_helper import freeze_config, unfreeze_config
+from ..utils.time_utils import now_ist
+from .broker_adapter import BrokerAdapter
+from .forward_test_results import ForwardTestResults
+from .run_profile import get_run_profile
+from .tick_latency import TickLatency
+from .trader import get_strategy, process_tick
+
+logger = logging.getLogger(__name__)
+
+
+class CapitalPool:
+    """Capital shared by all legs; lent to one PositionManager at a time."""
+
+    def __init__(self, initial_capital: float):
+        self.initial_capital = initial_capital
+        self.available = initial_capital
+
+    @contextmanager
+    def lend_to(self, position_manager: PositionManager) -> Iterator[None]:
+        position_manager.current_capital = self.available
+        try:
+            yield
+        finally:
+            self.available = position_manager.current_capital
+
+
+class SymbolSession:
+    """One traded instrument: its strategy, position manager and open position."""
+
+    def __init__(self, config: MappingProxyType, capital_pool: Optional[CapitalPool] = None,
+                 tick_latency: Optional[TickLatency] = None):
+        self.config = config
+        self.symbol = config['instrument']['symbol']
+        self.token = str(config['instrument']['token'])
+        self.exchange = config['instrument']['exchange']
+        self.strategy = get_strategy(config)
+        self.position_manager = PositionManager(config, strategy_callback=self.strategy.on_position_exit)
+        self.capital_pool = capital_pool
+        self.tick_latency = tick_latency  # Receive -> stage histograms, shared by all legs
+        self.active_position_id = None
+        self.last_price = 0.0
+        self._tick_time = None  # Timestamp of the tick being processed (closes inside a tick use it)
+        self.session_ended = False
+        self.nan_streak = 0
+        self.consecutive_valid_ticks = 0
+        self.nan_threshold = config['strategy']['nan_streak_threshold']
+
+        # Per-symbol processing time (tick routed -> strategy/positions done)
+        self.tick_count = 0
+        self.latency_total_ns = 0
+        self.latency_max_ns = 0
+
+    def on_tick(self, tick: Dict[str, Any]):
+        """Process one tick for this instrument (LiveTrader's per-tick pipeline, trader.process_tick)."""
+        if self.session_ended:
+            return
+        started = time.perf_counter_ns()
+        if self.capital_pool is not None:
+            with self.capital_pool.lend_to(self.position_manager):
+                self._process(tick, started)
+        else:
+            self._process(tick, started)
+        elapsed = time.perf_counter_ns() - started
+        self.tick_count += 1
+        self.latency_total_ns += elapsed
+        if elapsed > self.latency_max_ns:
+            self.latency_max_ns = elapsed
+
+    def _process(self, tick: Dict[str, Any], dequeued_ns: int):
+        now = tick.get('timestamp') or now_ist()
+        self._tick_time = now
+        try:
+            stop_reason = process_tick(self, tick, now, dequeued_ns, self.symbol)
+        finally:
+            self._tick_time = None
+        if stop_reason is not None:
+            self.session_ended = True
+            logger.info(f"🛑 [{self.symbol}] Stopped trading this symbol: {stop_reason}")
+
+    def close_position(self, reason: str, now=None):
+        """Close the open position at the last price (at the current tick's time while processing one)."""
+        if self.active_position_id and self.active_position_id in self.position_manager.positions:
+            now = now or self._tick_time or now_ist()
+            self.position_manager.close_position_full(self.active_position_id, self.last_price, now, reason)
+            logger.info(f"[SIM] [{self.symbol}] Position closed at {self.last_price} for reason: {reason}")
+            self.strategy.on_position_closed(self.active_position_id, reason)
+        self.active_position_id = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'symbol': self.symbol,
+            'token': self.token,
+            'ticks': self.tick_count,
+            'trades': len(self.position_manager.completed_trades),
+            'latency_mean_us': self.latency_total_ns / self.tick_count / 1e3 if self.tick_count else 0.0,
+            'latency_max_us': self.latency_max_ns / 1e3,
+        }
+
+
+def leg_configs(frozen_config: MappingProxyType) -> List[MappingProxyType]:
+    """One frozen config per configured instrument (leg merged over config['instrument'])."""
+    instruments = frozen_config['multi_symbol']['instruments']
+    if not instruments:
+        raise ValueError("multi_symbol.instruments is empty - configure at least one {symbol, token, exchange}")
+    base = unfreeze_config(frozen_config)
+    configs = []
+    tokens = set()
+    for leg in instruments:
+        if not leg.get('token'):
+            raise ValueError(f"Instrument {leg.get('symbol', '?')} has no token - WebSocket routing requires one")
+        if str(leg['token']) in tokens:
+            raise ValueError(f"Duplicate token {leg['token']} in multi_symbol.instruments")
+        tokens.add(str(leg['token']))
+        config = dict(base)
+        config['instrument'] = {**base['instrument'], **unfreeze_config(leg)}
+        configs.append(freeze_config(config))
+    return configs
+
+
+class MultiSymbolTrader:
+    """Runs one SymbolSession per configured instrument off a single broker connection."""
+
+    def __init__(self, frozen_config: MappingProxyType, profile: str = 'interactive'):
+        if not isinstance(frozen_config, MappingProxyType):
+            raise TypeError(f"frozen_config must be MappingProxyType, got {type(frozen_config)}")
+        self.config = frozen_config
+        self.profile = get_run_profile(profile)
+
+        configs = leg_configs(frozen_config)
+        self.capital_pool = None
+        if frozen_config['multi_symbol']['shared_capital']:
+            self.capital_pool = CapitalPool(frozen_config['capital']['initial_capital'])
+        self.tick_latency = TickLatency()
+        self.sessions = [SymbolSession(config, self.capital_pool, self.tick_latency) for config in configs]
+        self._sessions_by_token = {session.token: session for session in self.sessions}
+        self.unrouted_ticks = 0
+        self._ended_tokens = set()
+        # dispatch() runs on the WebSocket thread; _shutdown() takes the lock to wait out an in-flight tick
+        self._dispatch_lock = threading.Lock()
+        self._closed = False
+
+        # One broker for all legs, subscribed to every token
+        self.broker = BrokerAdapter(configs[0], profile=self.profile)
+        self.broker.subscriptions = [
+            {'symbol': s.symbol, 'token': s.token, 'exchange': s.exchange} for s in self.sessions
+        ]
+        self.is_running = False
+        self.start_time = None
+        logger.info(f"MultiSymbolTrader: {len(self.sessions)} instruments "
+                    f"({', '.join(s.symbol for s in self.sessions)}), "
+                    f"capital {'shared' if self.capital_pool else 'per instrument'}")
+
+    def dispatch(self, tick: Dict[str, Any], symbol: str = None):
+        """Route a tick to its instrument's session (WebSocket thread callback)."""
+        session = self._sessions_by_token.get(str(tick.get('token', '')))
+        if session is None:
+            self.unrouted_ticks += 1
+            if self.unrouted_ticks == 1 or self.unrouted_ticks % 1000 == 0:
+                logger.warning(f"{self.unrouted_ticks} ticks for unsubscribed tokens ignored (last: {tick.get('token')})")
+            return
+        with self._dispatch_lock:
+            if self._closed:
+                return
+            session.on_tick(tick)
+        if session.session_ended and session.token not in self._ended_tokens:
+            self._ended_tokens.add(session.token)
+            if len(self._ended_tokens) == len(self.sessions):
+                self.is_running = False
+
+    def start(self):
+        """Connect once and process ticks until stop(), session end or all legs finished."""
+        self.is_running = True
+        self.start_time = now_ist()
+        self.broker.on_tick_callback = self.dispatch
+        self.broker.connect()
+        logger.info("🟢 Multi-symbol session started")
+        cycles = 0
+        try:
+            while self.is_running:
+                time.sleep(0.1)  # Ticks arrive via dispatch(); this loop only supervises
+                cycles += 1
+                if self.profile.heartbeat_logging and cycles % 100 == 0:
+                    logger.info(f"[HEARTBEAT] Multi-symbol - {sum(s.tick_count for s in self.sessions)} ticks, "
+                                f"open positions: {sum(1 for s in self.sessions if s.active_position_id)}")
+                should_exit, exit_reason = self.sessions[0].strategy.should_exit_for_session(now_ist())
+                if should_exit:
+                    logger.info(f"🛑 Session ended - stopping trading: {exit_reason}")
+                    break
+        except KeyboardInterrupt:
+            logger.info("Multi-symbol session interrupted by user")
+        finally:
+            self._shutdown("Session End")
+        return {session.symbol: session.position_manager.completed_trades for session in self.sessions}
+
+    def stop(self):
+        """Stop the session gracefully (open positions are closed)."""
+        logger.info("🛑 Stop requested - ending multi-symbol session")
+        self.is_running = False
+
+    def _shutdown(self, reason: str):
+        self.broker.on_tick_callback = None
+        with self._dispatch_lock:  # No tick is mid-way through a leg (or the capital pool) while legs close
+            self._closed = True
+            for session in self.sessions:
+                if session.capital_pool is not None:
+                    with session.capital_pool.lend_to(session.position_manager):
+                        session.close_position(reason)
+                else:
+                    session.close_position(reason)
+        self.broker.disconnect()
+        for stats in self.stats():
+            logger.info(f"[{stats['symbol']}] {stats['ticks']} ticks, {stats['trades']} trades, "
+                        f"processing mean {stats['latency_mean_us']:.0f}us max {stats['latency_max_us']:.0f}us")
+        if self.profile.heartbeat_logging or self.profile.report_throughput:
+            self.tick_latency.log_summary()
+        if self.profile.export_results:
+            for session in self.sessions:
+                exporter = ForwardTestResults(session.config, session.position_manager, self.start_time)
+                exporter.finalize()
+                try:
+                    filename = exporter.export_to_excel()
+                    logger.info(f"[{session.symbol}] Forward test results exported to: {filename}")
+                except Exception as e:
+                    logger.error(f"[{session.symbol}] Failed to export results: {e}")
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Per-symbol tick counts, trades and processing latency."""
+        return [session.stats() for session in self.sessions]
@@ -0,0 +1,58 @@
+"""
+live/run_profile.py
+
+Run profiles for LiveTrader: which session side effects are active.
+
+PROFILES:
+- interactive: GUI forward tests and live sessions (all side effects on)
+- batch:       MatrixTestRunner and scripts - no exports, GUI hooks, heartbeat
+               logging, tick recording or simulation pacing; results stay in
+               memory (LiveTrader.start() returns the completed trades)
+- benchmark:   batch plus a throughput summary (LiveTrader.run_stats)
+
+USAGE:
+    trader = LiveTrader(frozen_config=frozen_config, profile="batch")
+    trades = trader.start()
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class RunProfile:
+    """
+    Session side effects switched on or off as a unit.
+
+    Attributes:
+        name: Profile name
+        export_results: Build ForwardTestResults and export Excel when the session ends
+        gui_updates: Honour result_box / performance_callback passed to start()
+        heartbeat_logging: Periodic [HEARTBEAT] / progress / per-100-tick info lines
+        tick_recording: BrokerAdapter live tick CSV recorder (live data only)
+        pacing: Simulated tick delay and GUI yield sleeps in file simulation
+        report_throughput: Record ticks/sec of the session in LiveTrader.run_stats
+    """
+    name: str
+    export_results: bool
+    gui_updates: bool
+    heartbeat_logging: bool
+    tick_recording: bool
+    pacing: bool
+    report_throughput: bool
+
+
+RUN_PROFILES = {
+    'interactive': RunProfile('interactive', export_results=True, gui_updates=True, heartbeat_logging=True,
+                              tick_recording=True, pacing=True, report_throughput=False),
+    'batch': RunProfile('batch', export_results=False, gui_updates=False, heartbeat_logging=False,
+                        tick_recording=False, pacing=False, report_throughput=False),
+    'benchmark': RunProfile('benchmark', export_results=False, gui_updates=False, heartbeat_logging=False,
+                            tick_recording=False, pacing=False, report_throughput=True),
+}
+
+
+def get_run_profile(name: str) -> RunProfile:
+    """Look up a profile by name (fail-fast on unknown names)."""
+    if name not in RUN_PROFILES:
+        raise ValueError(f"Unknown run profile '{name}'. Use one of {tuple(RUN_PROFILES)}")
+    return RUN_PROFILES[name]
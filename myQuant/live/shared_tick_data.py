@@ -0,0 +1,116 @@
+"""
+live/shared_tick_data.py
+
+Tick arrays held in one shared-memory block so that matrix test worker
+processes can attach to a dataset loaded once by the parent, without each
+worker re-reading (and holding its own copy of) the CSV.
+
+Layout (n = number of ticks, all 8-byte columns):
+    [0, n)    timestamp  int64 nanoseconds (UTC when tz-aware)
+    [n, 2n)   price      float64
+    [2n, 3n)  volume     int64
+
+USAGE:
+    # Parent
+    shared = SharedTickData.from_csv('nifty.csv')
+    descriptor = shared.descriptor()        # picklable, pass to workers
+    ...
+    shared.close(); shared.unlink()
+
+    # Worker
+    shared = SharedTickData.attach(descriptor)
+    register_preloaded_data('nifty.csv', shared.to_dataframe())
+"""
+
+import logging
+from multiprocessing import shared_memory
+from typing import Any, Dict
+
+import numpy as np
+import pandas as pd
+
+from .data_simulator import load_simulation_dataset
+
+logger = logging.getLogger(__name__)
+
+
+class SharedTickData:
+    """Timestamp/price/volume arrays backed by a named shared-memory block."""
+
+    def __init__(self, shm: shared_memory.SharedMemory, length: int, has_timestamp: bool, tz: Any = None):
+        self.shm = shm
+        self.length = length
+        self.has_timestamp = has_timestamp
+        self.tz = tz
+        buffer = np.ndarray((3, length), dtype=np.int64, buffer=shm.buf)
+        self.timestamps = buffer[0]
+        self.prices = buffer[1].view(np.float64)
+        self.volumes = buffer[2]
+
+    @classmethod
+    def from_csv(cls, file_path: str) -> 'SharedTickData':
+        """Copy the tick columns of a simulation CSV (parsed once per process) into a new shared block."""
+        dataset = load_simulation_dataset(file_path)
+        length = len(dataset)
+        if length == 0:
+            raise ValueError(f"No ticks in simulation file: {file_path}")
+
+        timestamps = dataset.timestamps
+        tz = None
+        if timestamps is not None:
+            if not isinstance(timestamps, pd.DatetimeIndex):
+                raise ValueError(
+                    f"Timestamps in {file_path} do not parse to a single datetime dtype (mixed timezones?)"
+                )
+            tz = timestamps.tz
+            if tz is not None:
+                timestamps = timestamps.tz_convert('UTC').tz_localize(None)
+
+        shm = shared_memory.SharedMemory(create=True, size=3 * length * 8)
+        shared = cls(shm, length, timestamps is not None, tz)
+        if timestamps is not None:
+            shared.timestamps[:] = timestamps.to_numpy(dtype='datetime64[ns]').view(np.int64)
+        shared.prices[:] = dataset.prices
+        shared.volumes[:] = dataset.volumes.astype(np.int64)
+
+        logger.info(f"Shared {length:,} ticks from {file_path} in block {shm.name} ({shm.size / 1e6:.1f} MB)")
+        return shared
+
+    @classmethod
+    def attach(cls, descriptor: Dict[str, Any]) -> 'SharedTickData':
+        """Attach to a block created by `from_csv` in another process."""
+        # Pool workers share the parent's resource tracker, so attaching does not
+        # schedule the block for unlink when the worker exits
+        shm = shared_memory.SharedMemory(name=descriptor['name'])
+        return cls(shm, descriptor['length'], descriptor['has_timestamp'], descriptor['tz'])
+
+    def descriptor(self) -> Dict[str, Any]:
+        """Picklable handle for `attach`."""
+        return {
+            'name': self.shm.name,
+            'length': self.length,
+            'has_timestamp': self.has_timestamp,
+            'tz': self.tz,
+        }
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """DataFrame in DataSimulator's standardized shape; price/volume are views on shared memory."""
+        columns = {}
+        if self.has_timestamp:
+            timestamps = pd.DatetimeIndex(self.timestamps.view('datetime64[ns]'))
+            if self.tz is not None:
+                timestamps = timestamps.tz_localize('UTC').tz_convert(self.tz)
+            columns['timestamp'] = timestamps
+        columns['price'] = self.prices
+        columns['volume'] = self.volumes
+        return pd.DataFrame(columns, copy=False)
+
+    def close(self):
+        """Release this process's mapping (views created from it must no longer be used)."""
+        self.timestamps = self.prices = self.volumes = None
+        self.shm.close()
+
+    def unlink(self):
+        """Destroy the block. Call once, from the creating process."""
+        self.shm.unlink()
+
@@ -0,0 +1,124 @@
+"""
+live/smartapi_frames.py
+
+Decoder for SmartAPI WebSocket 2.0 binary market-data frames.
+
+CRITICAL PRINCIPLES:
+- Fixed layouts unpacked with precompiled struct.Struct objects (one call for
+  the header, one for the Quote extension) - no per-field slicing
+- Token -> (symbol, exchange) resolved from the subscription with a dict
+  lookup on the raw token bytes; no string decoding on the hot path
+- The tick record carries only what the trading loop uses (no raw payload copy)
+
+FRAME LAYOUT (little-endian; offsets in bytes; prices in paise):
+    0    int8    subscription mode (1=LTP, 2=Quote, 3=SnapQuote)
+    1    int8    exchange type
+    2    25s     token (NUL padded)
+    27   int64   sequence number
+    35   int64   exchange timestamp (epoch ms)
+    43   int64   last traded price                                  LTP ends at 51
+    51   int64   last traded quantity
+    59   int64   average traded price
+    67   int64   volume traded for the day
+    75   double  total buy quantity
+    83   double  total sell quantity
+    91   int64   open, high, low, close of the day (4 x int64)      Quote ends at 123
+    123  int64   last traded timestamp
+    131  int64   open interest
+    139  int64   open interest change %
+    147  200s    best 5 buy/sell (10 x <int16 flag, int64 qty, int64 price, int16 orders>)
+    347  int64   upper circuit, lower circuit, 52-week high, 52-week low  SnapQuote ends at 379
+"""
+
+import struct
+from typing import Any, Dict, Iterable, Optional
+
+LTP_MODE, QUOTE_MODE, SNAP_QUOTE_MODE = 1, 2, 3
+LTP_FRAME_SIZE = 51
+QUOTE_FRAME_SIZE = 123
+SNAP_QUOTE_FRAME_SIZE = 379
+TOKEN_FIELD_SIZE = 25
+
+_HEADER = struct.Struct('<bb25sqqq')        # mode, exchange type, token, sequence, exchange ts, LTP
+_QUOTE = struct.Struct('<qqqddqqqq')        # offset 51
+_SNAP_QUOTE = struct.Struct('<qqq')         # offset 123
+_DEPTH_ENTRY = struct.Struct('<hqqh')       # offset 147, 10 entries
+_SNAP_LIMITS = struct.Struct('<qqqq')       # offset 347
+_LAST_TRADED_QUANTITY = struct.Struct('<q')
+
+_QUOTE_FIELDS = ('last_traded_quantity', 'average_traded_price', 'volume_trade_for_the_day',
+                 'total_buy_quantity', 'total_sell_quantity', 'open_price_of_the_day',
+                 'high_price_of_the_day', 'low_price_of_the_day', 'closed_price')
+_SNAP_LIMIT_FIELDS = ('upper_circuit_limit', 'lower_circuit_limit', '52_week_high_price', '52_week_low_price')
+
+
+def parse_frame(frame: bytes) -> Dict[str, Any]:
+    """
+    Every field of an LTP/Quote/SnapQuote frame, named as SmartWebSocketV2
+    names them (diagnostics and tests; the trading path uses FrameDecoder).
+    """
+    if len(frame) < LTP_FRAME_SIZE:
+        raise ValueError(f"SmartAPI frame too short: {len(frame)} bytes (LTP frames are {LTP_FRAME_SIZE})")
+    mode, exchange_type, raw_token, sequence, exchange_ts, ltp = _HEADER.unpack_from(frame)
+    data = {
+        'subscription_mode': mode,
+        'exchange_type': exchange_type,
+        'token': raw_token.split(b'\0', 1)[0].decode('ascii'),
+        'sequence_number': sequence,
+        'exchange_timestamp': exchange_ts,
+        'last_traded_price': ltp,
+    }
+    if mode >= QUOTE_MODE:
+        data.update(zip(_QUOTE_FIELDS, _QUOTE.unpack_from(frame, LTP_FRAME_SIZE)))
+    if mode == SNAP_QUOTE_MODE:
+        data['last_traded_timestamp'], data['open_interest'], data['open_interest_change_percentage'] = \
+            _SNAP_QUOTE.unpack_from(frame, QUOTE_FRAME_SIZE)
+        depth = [_DEPTH_ENTRY.unpack_from(frame, 147 + 20 * i) for i in range(10)]
+        data['best_5_buy_data'] = [
+            {'flag': f, 'quantity': q, 'price': p, 'no of orders': n} for f, q, p, n in depth if f == 1]
+        data['best_5_sell_data'] = [
+            {'flag': f, 'quantity': q, 'price': p, 'no of orders': n} for f, q, p, n in depth if f != 1]
+        data.update(zip(_SNAP_LIMIT_FIELDS, _SNAP_LIMITS.unpack_from(frame, 347)))
+    return data
+
+
+class FrameDecoder:
+    """Binary frame -> tick dict for the subscribed instruments."""
+
+    def __init__(self, symbol_tokens: Iterable[Dict[str, Any]]):
+        self._by_raw_token = {}   # NUL-padded token bytes -> (token, symbol, exchange)
+        self._by_token = {}
+        for s in symbol_tokens:
+            token = str(s['token'])
+            instrument = (token, s.get('symbol', ''), s.get('exchange', ''))
+            self._by_raw_token[token.encode('ascii').ljust(TOKEN_FIELD_SIZE, b'\0')] = instrument
+            self._by_token[token] = instrument
+        self.decoded = 0
+        self.rejected = 0
+
+    def decode(self, frame: bytes, timestamp) -> Optional[Dict[str, Any]]:
+        """
+        Tick {timestamp, price (rupees), volume (last traded quantity; 0 for
+        LTP frames), symbol, token, exchange}, or None for a short frame.
+        """
+        size = len(frame)
+        if size < LTP_FRAME_SIZE:
+            self.rejected += 1
+            return None
+        mode, _, raw_token, _, _, ltp = _HEADER.unpack_from(frame)
+        instrument = self._by_raw_token.get(raw_token)
+        if instrument is None:
+            token = raw_token.split(b'\0', 1)[0].decode('ascii')
+            instrument = self._by_token.get(token, (token, '', ''))
+        volume = 0
+        if mode >= QUOTE_MODE and size >= QUOTE_FRAME_SIZE:
+            volume = _LAST_TRADED_QUANTITY.unpack_from(frame, LTP_FRAME_SIZE)[0]
+        self.decoded += 1
+        return {
+            'timestamp': timestamp,
+            'price': ltp / 100.0,  # SmartAPI prices are in paise
+            'volume': volume,
+            'symbol': instrument[1],
+            'token': instrument[0],
+            'exchange': instrument[2],
+        }
@@ -0,0 +1,163 @@
+"""
+live/tick_latency.py
+
+Always-on end-to-end tick latency: receive time to trading decision.
+
+CRITICAL PRINCIPLES:
+- The WebSocket thread stamps each tick with a monotonic receive time
+  ('received_ns', time.perf_counter_ns()) before decoding it; the stamp
+  survives the tick ring buffer and conflation (a merged tick keeps the
+  oldest receive time of its burst)
+- The trading loop records receive -> stage latency at four stages: dequeue,
+  indicators updated, signal evaluated, positions processed (decision done)
+- Log-bucketed histograms (16 linear sub-buckets per power of two, <= 6.25%
+  bucket width): recording is a few integer operations and memory is fixed,
+  so accounting never needs switching off
+- Ticks without a receive stamp (backfilled gap ticks) are not counted
+
+Unlike PerformanceInstrumentor / PreConvergenceInstrumentor (per-component
+timing for profiling sessions), this only measures elapsed time since receipt.
+"""
+
+import logging
+import math
+from typing import Any, Dict, List
+
+logger = logging.getLogger(__name__)
+
+# (stage key, label) in pipeline order
+LATENCY_STAGES = (
+    ('dequeue', 'receive -> dequeue'),
+    ('indicators', 'receive -> indicators'),
+    ('signal', 'receive -> signal'),
+    ('positions', 'receive -> decision'),
+)
+
+PERCENTILES = (('p50', 0.50), ('p99', 0.99), ('p99_9', 0.999))
+
+_SUB_BUCKET_BITS = 4                      # 16 sub-buckets per power of two
+_SUB_BUCKETS = 1 << _SUB_BUCKET_BITS
+_MAX_TRACKED_BITS = 40                    # ~18 minutes in ns; larger values share the top bucket
+_BUCKET_COUNT = (_MAX_TRACKED_BITS - _SUB_BUCKET_BITS + 1) * _SUB_BUCKETS
+
+
+def _bucket_index(value: int) -> int:
+    shift = value.bit_length() - _SUB_BUCKET_BITS - 1
+    if shift <= 0:
+        return value
+    return (shift << _SUB_BUCKET_BITS) + (value >> shift)
+
+
+def _bucket_upper_bound(index: int) -> int:
+    """Largest value that falls into bucket `index`."""
+    if index < 2 * _SUB_BUCKETS:
+        return index
+    shift = (index >> _SUB_BUCKET_BITS) - 1
+    mantissa = index - (shift << _SUB_BUCKET_BITS)
+    return ((mantissa + 1) << shift) - 1
+
+
+class LatencyHistogram:
+    """Fixed-size log-linear histogram of nanosecond latencies."""
+
+    def __init__(self):
+        self._counts = [0] * _BUCKET_COUNT
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    def record(self, value_ns: int):
+        if value_ns < 0:
+            value_ns = 0
+        index = _bucket_index(value_ns)
+        if index >= _BUCKET_COUNT:
+            index = _BUCKET_COUNT - 1
+        self._counts[index] += 1
+        self.count += 1
+        self.total_ns += value_ns
+        if value_ns > self.max_ns:
+            self.max_ns = value_ns
+
+    def percentile(self, fraction: float) -> int:
+        """Value (ns) at or below which `fraction` of the recordings fall (bucket upper bound)."""
+        return self._percentiles(list(self._counts), (fraction,))[0]
+
+    def _percentiles(self, counts: List[int], fractions) -> List[int]:
+        total = sum(counts)
+        if total == 0:
+            return [0] * len(fractions)
+        results = []
+        index, seen = 0, counts[0]
+        for fraction in fractions:  # Ascending
+            rank = max(1, math.ceil(fraction * total - 1e-9))
+            while seen < rank:
+                index += 1
+                seen += counts[index]
+            results.append(min(_bucket_upper_bound(index), self.max_ns))
+        return results
+
+    def snapshot(self) -> Dict[str, float]:
+        """count, mean/p50/p99/p99.9/max in microseconds (safe to call from another thread)."""
+        counts = list(self._counts)
+        values = self._percentiles(counts, [fraction for _, fraction in PERCENTILES])
+        count = sum(counts)
+        summary = {'count': count, 'mean_us': self.total_ns / count / 1e3 if count else 0.0}
+        for (name, _), value in zip(PERCENTILES, values):
+            summary[f'{name}_us'] = value / 1e3
+        summary['max_us'] = self.max_ns / 1e3
+        return summary
+
+
+class TickLatency:
+    """Receive -> stage histograms for one trading loop (see LATENCY_STAGES)."""
+
+    def __init__(self):
+        self.histograms = {stage: LatencyHistogram() for stage, _ in LATENCY_STAGES}
+        self._dequeue = self.histograms['dequeue']
+        self._indicators = self.histograms['indicators']
+        self._signal = self.histograms['signal']
+        self._positions = self.histograms['positions']
+
+    def record(self, received_ns: int, dequeued_ns: int, indicators_ns: int, signal_ns: int, done_ns: int):
+        """Stage times are perf_counter_ns() values; 0 means the stage was not reached."""
+        self._dequeue.record(dequeued_ns - received_ns)
+        if indicators_ns:
+            self._indicators.record(indicators_ns - received_ns)
+        if signal_ns:
+            self._signal.record(signal_ns - received_ns)
+        if done_ns:
+            self._positions.record(done_ns - received_ns)
+
+    @property
+    def count(self) -> int:
+        return self._dequeue.count
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Per-stage histogram summaries (LatencyHistogram.snapshot), in pipeline order."""
+        return {stage: self.histograms[stage].snapshot() for stage, _ in LATENCY_STAGES}
+
+    def format_report(self) -> List[str]:
+        """One line per stage: count, p50, p99, p99.9, max."""
+        snapshot = self.snapshot()
+        lines = []
+        for stage, label in LATENCY_STAGES:
+            s = snapshot[stage]
+            lines.append(f"{label:<24} n={s['count']:<9,} p50 {_format_us(s['p50_us']):>8}  "
+                         f"p99 {_format_us(s['p99_us']):>8}  p99.9 {_format_us(s['p99_9_us']):>8}  "
+                         f"max {_format_us(s['max_us']):>8}")
+        return lines
+
+    def log_summary(self, prefix: str = ""):
+        """Dump the histograms to the log (session end)."""
+        if not self.count:
+            logger.info(f"{prefix}Tick latency: no stamped ticks recorded")
+            return
+        logger.info(f"{prefix}Tick latency ({self.count:,} ticks, receive -> stage):")
+        for line in self.format_report():
+            logger.info(f"{prefix}  {line}")
+
+
+def _format_us(us: float) -> str:
+    if us >= 1000.0:
+        return f"{us / 1000.0:.2f}ms"
+    return f"{us:.0f}us"
@@ -0,0 +1,275 @@
+"""
+live/tick_ring_buffer.py
+
+Single-producer/single-consumer tick ring between the WebSocket thread
+(producer) and the trading loop (consumer).
+
+CRITICAL PRINCIPLES:
+- Preallocated slots per tick field; no per-tick allocation in the producer
+- No locks: the producer owns the write sequence, the consumer owns the read
+  sequence, and each only reads the other's (GIL-atomic integer stores)
+- Overflow is never silent: every dropped tick is counted
+- drop_oldest lets the producer overwrite unread slots; the consumer detects
+  the overrun (claim sequence moved more than `capacity` past the slot it read)
+  and skips the overwritten ticks
+- Backfilled ticks (live/gap_fill.py) keep their 'backfill' flag and can
+  wait for space instead of being dropped (push(..., wait_for_space=True));
+  during a replay the gap fill worker is the producer (live ticks are held)
+- The WebSocket receive stamp ('received_ns', live/tick_latency.py) is
+  carried through; a conflated tick keeps the oldest stamp of its burst
+- Optional conflation (pop_conflated): when the trading loop falls behind,
+  the backlog is merged into one synthetic tick at the latest price; the
+  burst's high/low travel with it (in order) so SL/TP still see them
+
+OVERFLOW POLICIES:
+    drop_oldest  Keep the newest ticks (previous queue.Queue behaviour)
+    drop_newest  Keep the queued ticks, discard arrivals while full
+    block        Producer waits for space, up to block_timeout_seconds, then drops
+"""
+
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+OVERFLOW_POLICIES = ('drop_oldest', 'drop_newest', 'block')
+
+# Producer back-off while waiting for space under the block policy
+_BLOCK_POLL_SECONDS = 0.0001
+
+
+class TickConflator:
+    """Merges a tick backlog into one synthetic tick and counts how often it did."""
+
+    def __init__(self, threshold: int):
+        if threshold < 1:
+            raise ValueError(f"Conflation threshold must be positive, got {threshold}")
+        self.threshold = threshold
+        self.conflation_events = 0
+        self.conflated_ticks = 0
+
+    @classmethod
+    def from_config(cls, config) -> Optional['TickConflator']:
+        """Conflator for config['tick_buffer'], or None when conflation is off."""
+        params = config['tick_buffer']
+        return cls(params['conflation_threshold']) if params['conflate'] else None
+
+    def merge(self, ticks: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        One tick standing in for `ticks` (oldest first): latest timestamp and
+        price, summed volume, plus 'open'/'high'/'low', 'extremes' (the high
+        and low in the order they traded) and 'conflated' (ticks merged); the
+        receive stamp is the oldest tick's.
+        """
+        prices = [t['price'] for t in ticks]
+        high, low = max(prices), min(prices)
+        merged = dict(ticks[-1])
+        merged['volume'] = sum(t.get('volume', 0) for t in ticks)
+        merged['open'] = prices[0]
+        merged['high'] = high
+        merged['low'] = low
+        merged['extremes'] = (high, low) if prices.index(high) < prices.index(low) else (low, high)
+        merged['conflated'] = len(ticks)
+        if 'received_ns' in ticks[0]:
+            merged['received_ns'] = ticks[0]['received_ns']
+
+        self.conflation_events += 1
+        self.conflated_ticks += len(ticks)
+        if self.conflation_events == 1 or self.conflation_events % 1000 == 0:
+            logger.warning(f"Trading loop behind the feed: {self.conflation_events} backlogs conflated "
+                           f"({self.conflated_ticks} ticks, threshold {self.threshold})")
+        return merged
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'conflation_threshold': self.threshold,
+            'conflation_events': self.conflation_events,
+            'conflated_ticks': self.conflated_ticks,
+        }
+
+
+class TickRingBuffer:
+    """Bounded SPSC ring of ticks with backpressure counters (see stats())."""
+
+    def __init__(self, capacity: int, overflow_policy: str = 'drop_oldest', block_timeout_seconds: float = 0.5,
+                 conflator: Optional[TickConflator] = None):
+        if capacity < 1:
+            raise ValueError(f"Tick buffer capacity must be positive, got {capacity}")
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy '{overflow_policy}'. Use one of {OVERFLOW_POLICIES}")
+        self.capacity = capacity
+        self.overflow_policy = overflow_policy
+        self.block_timeout_seconds = block_timeout_seconds
+        self.conflator = conflator
+
+        # Preallocated slots (slot = sequence % capacity)
+        self._timestamps = [None] * capacity
+        self._prices = [0.0] * capacity
+        self._volumes = [0] * capacity
+        self._symbols = [''] * capacity
+        self._backfill = [False] * capacity
+        self._received_ns = [0] * capacity
+        self._enqueued_ns = [0] * capacity
+
+        # Producer-owned
+        self._claim = 0        # Sequences whose slot write has started
+        self._tail = 0         # Sequences fully written (published)
+        self.produced = 0
+        self.dropped_newest = 0
+        self.high_water_mark = 0
+
+        # Consumer-owned
+        self._head = 0         # Next sequence to read
+        self.consumed = 0
+        self.dropped_oldest = 0
+        self.latency_count = 0
+        self.latency_total_ns = 0
+        self.latency_max_ns = 0
+
+    @classmethod
+    def from_config(cls, config) -> 'TickRingBuffer':
+        params = config['tick_buffer']
+        return cls(params['capacity'], params['overflow_policy'], params['block_timeout_seconds'],
+                   TickConflator.from_config(config))
+
+    # ------------------------------------------------------------------
+    # Producer (WebSocket thread)
+    # ------------------------------------------------------------------
+
+    def push(self, tick: Dict[str, Any], wait_for_space: bool = False) -> bool:
+        """
+        Store a tick. Returns False if it was dropped (drop_newest, or block
+        timeout). wait_for_space applies the block policy to this tick whatever
+        the configured policy.
+        """
+        seq = self._tail
+        if seq - self._head >= self.capacity:
+            if wait_for_space:
+                if not self._wait_for_space(seq):
+                    self._count_newest_drop()
+                    return False
+            elif self.overflow_policy == 'drop_newest':
+                self._count_newest_drop()
+                return False
+            if self.overflow_policy == 'block' and not self._wait_for_space(seq):
+                self._count_newest_drop()
+                return False
+
+        slot = seq % self.capacity
+        self._claim = seq + 1  # Announce the overwrite before touching the slot
+        self._timestamps[slot] = tick.get('timestamp')
+        self._prices[slot] = tick['price']
+        self._volumes[slot] = tick.get('volume', 0)
+        self._symbols[slot] = tick.get('symbol', '')
+        self._backfill[slot] = tick.get('backfill', False)
+        self._received_ns[slot] = tick.get('received_ns', 0)
+        self._enqueued_ns[slot] = time.perf_counter_ns()
+        self._tail = seq + 1
+        self.produced += 1
+
+        depth = seq + 1 - self._head
+        if depth > self.high_water_mark:
+            self.high_water_mark = min(depth, self.capacity)
+        return True
+
+    def _wait_for_space(self, seq: int) -> bool:
+        deadline = time.perf_counter() + self.block_timeout_seconds
+        while seq - self._head >= self.capacity:
+            if time.perf_counter() >= deadline:
+                return False
+            time.sleep(_BLOCK_POLL_SECONDS)
+        return True
+
+    def _count_newest_drop(self):
+        self.dropped_newest += 1
+        if self.dropped_newest == 1 or self.dropped_newest % 1000 == 0:
+            logger.warning(f"Tick buffer full ({self.capacity}): {self.dropped_newest} incoming ticks dropped "
+                           f"({self.overflow_policy})")
+
+    # ------------------------------------------------------------------
+    # Consumer (trading loop)
+    # ------------------------------------------------------------------
+
+    def pop(self) -> Optional[Dict[str, Any]]:
+        """Oldest unread tick, or None when empty."""
+        while True:
+            head = self._head
+            if head >= self._tail:
+                return None
+            oldest = self._claim - self.capacity
+            if head < oldest:
+                self._skip_overrun(oldest - head)
+                continue
+            slot = head % self.capacity
+            tick = {
+                'timestamp': self._timestamps[slot],
+                'price': self._prices[slot],
+                'volume': self._volumes[slot],
+                'symbol': self._symbols[slot],
+            }
+            if self._backfill[slot]:
+                tick['backfill'] = True
+            if self._received_ns[slot]:
+                tick['received_ns'] = self._received_ns[slot]
+            enqueued_ns = self._enqueued_ns[slot]
+            if self._claim - self.capacity > head:
+                continue  # Slot was overwritten while being read; skip it on the next pass
+            self._head = head + 1
+            self.consumed += 1
+            latency = time.perf_counter_ns() - enqueued_ns
+            self.latency_count += 1
+            self.latency_total_ns += latency
+            if latency > self.latency_max_ns:
+                self.latency_max_ns = latency
+            return tick
+
+    def pop_conflated(self) -> Optional[Dict[str, Any]]:
+        """
+        Like pop(), but when conflation is enabled and the backlog exceeds the
+        threshold, every queued tick is merged into one (TickConflator.merge).
+        """
+        if self.conflator is None or self._tail - self._head <= self.conflator.threshold:
+            return self.pop()
+        end = self._tail
+        backlog = []
+        while self._head < end and (tick := self.pop()) is not None:
+            backlog.append(tick)
+        if len(backlog) < 2:
+            return backlog[0] if backlog else None
+        return self.conflator.merge(backlog)
+
+    def _skip_overrun(self, count: int):
+        self._head += count
+        previous = self.dropped_oldest
+        self.dropped_oldest += count
+        if previous == 0 or previous // 1000 != self.dropped_oldest // 1000:
+            logger.warning(f"Tick buffer overrun ({self.capacity}): {self.dropped_oldest} oldest ticks dropped")
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return min(self._tail - self._head, self.capacity)
+
+    def stats(self) -> Dict[str, Any]:
+        """Backpressure counters: depth, high-water mark, drops, conflation and producer-to-consumer latency."""
+        unread_overrun = max(0, self._tail - self._head - self.capacity)  # Overwritten, not yet skipped
+        dropped_oldest = self.dropped_oldest + unread_overrun
+        conflation = self.conflator.stats() if self.conflator else {
+            'conflation_threshold': None, 'conflation_events': 0, 'conflated_ticks': 0}
+        return {
+            'capacity': self.capacity,
+            'overflow_policy': self.overflow_policy,
+            'depth': len(self),
+            'high_water_mark': self.high_water_mark,
+            'produced': self.produced,
+            'consumed': self.consumed,
+            'dropped_oldest': dropped_oldest,
+            'dropped_newest': self.dropped_newest,
+            'dropped': dropped_oldest + self.dropped_newest,
+            'latency_mean_us': self.latency_total_ns / self.latency_count / 1e3 if self.latency_count else 0.0,
+            'latency_max_us': self.latency_max_ns / 1e3,
+            **conflation,
+        }
@@ -9,19 +9,32 @@ Unified forward-test/live simulation runner.
 """
 
 import time
+import asyncio
 import logging
 import importlib
 import pandas as pd
+from contextlib import nullcontext
 from types import MappingProxyType
+from typing import Optional
 from ..core.position_manager import PositionManager
 from .broker_adapter import BrokerAdapter
 from .forward_test_results import ForwardTestResults
+from .run_profile import get_run_profile
+from .tick_ring_buffer import TickConflator
+from .tick_latency import TickLatency
 from ..utils.time_utils import now_ist
-from ..utils.config_helper import validate_config, freeze_config, create_config_from_defaults
+from ..utils.logger import get_tracer
+from ..utils.config_helper import ConfigAccessor, validate_config, freeze_config, create_config_from_defaults
+from ..utils.checkpoint import CheckpointManager, make_run_key
 
 # Module-level logger
 logger = logging.getLogger(__name__)
 
+# Asyncio mode: schedule of the session's background tasks (seconds)
+ASYNC_HEARTBEAT_SECONDS = 10.0      # [HEARTBEAT] log
+ASYNC_GUI_UPDATE_SECONDS = 5.0      # performance_callback refresh
+ASYNC_SESSION_CHECK_SECONDS = 1.0   # session-end check between ticks (live stream only)
+
 # Phase 1.5: Pre-convergence instrumentation
 _pre_convergence_instrumentor = None
 
@@ -41,8 +54,127 @@ def get_strategy(config):
     ind_mod = importlib.import_module('.indicators', package='myQuant.core')
     return strat_module.ModularIntradayStrategy(config, ind_mod)
 
+_UNMEASURED = nullcontext()
+
+
+def _unmeasured(component: str):
+    return _UNMEASURED
+
+
+def process_tick(leg, tick: dict, now, dequeued_ns: int, label: str, notify=None,
+                 instrumentor=None) -> Optional[str]:
+    """
+    Run one tick through the trading pipeline of `leg` (LiveTrader or SymbolSession):
+    session end check -> strategy.on_tick() -> entry/exit on the signal ->
+    TP/SL/trailing (conflated extremes first) -> tick latency record.
+
+    `leg` provides strategy, position_manager, active_position_id, last_price,
+    nan_streak, consecutive_valid_ticks, nan_threshold, tick_latency and
+    close_position(reason). `label` tags the log lines ([TICK], [DIRECT], [<symbol>])
+    and the result box messages passed to notify(message). A Phase 1.5
+    instrumentor, when given, times each stage.
+
+    Returns None to keep trading, or the reason trading stopped ("Session End",
+    "NaN Threshold Exceeded") after the open position has been closed.
+    """
+    measure = instrumentor.measure_trader if instrumentor is not None else _unmeasured
+    tag = f"[{label.upper()}]"
+    price = tick.get('price', tick.get('ltp', 0))
+    leg.last_price = price
+
+    # Session end enforcement (before processing)
+    with measure('session_check'):
+        should_exit, exit_reason = leg.strategy.should_exit_for_session(now)
+    if should_exit:
+        leg.close_position("Session End")
+        logger.info(f"🛑 {tag} Session ended - stopping trading: {exit_reason}")
+        return "Session End"
+
+    # TRUE TICK-BY-TICK PROCESSING - Use on_tick() directly
+    try:
+        with measure('strategy_call'):
+            signal = leg.strategy.on_tick(tick)
+        # Reset NaN streak on successful processing
+        leg.nan_streak = 0
+        leg.consecutive_valid_ticks += 1
+    except Exception as e:
+        # NaN threshold implementation
+        leg.nan_streak += 1
+        leg.consecutive_valid_ticks = 0
+        logger.warning(f"{tag} Tick processing failed (streak: {leg.nan_streak}/{leg.nan_threshold}): {e}")
+        if leg.nan_streak >= leg.nan_threshold:
+            logger.error(f"{tag} NaN streak threshold ({leg.nan_threshold}) exceeded. Stopping trading.")
+            leg.close_position("NaN Threshold Exceeded")
+            return "NaN Threshold Exceeded"
+        return None
+    signal_ns = time.perf_counter_ns()
+
+    # Process signal immediately if generated (backfilled ticks never open positions)
+    with measure('signal_handling'):
+        if signal:
+            if signal.action == 'BUY' and not leg.active_position_id and not tick.get('backfill'):
+                tick_row = create_tick_row(tick, signal.price, now)
+                leg.active_position_id = leg.strategy.open_long(tick_row, now, leg.position_manager)
+                if leg.active_position_id:
+                    qty = leg.position_manager.positions[leg.active_position_id].current_quantity
+                    logger.info(f"{tag} ENTERED LONG at ₹{signal.price:.2f} ({qty} contracts) - {signal.reason}")
+                    if notify:
+                        notify(f"{label} BUY: {qty} @ {signal.price:.2f} ({signal.reason})")
+            elif signal.action == 'CLOSE' and leg.active_position_id:
+                leg.close_position(f"Strategy Signal: {signal.reason}")
+                if notify:
+                    notify(f"{label} CLOSE: @ {signal.price:.2f} ({signal.reason})")
+
+    # Position manager processes TP/SL/trail exits (if position exists)
+    with measure('position_mgmt'):
+        if leg.active_position_id:
+            try:
+                process_positions(leg, tick, create_tick_row(tick, price, now), now)
+            except Exception as e:
+                logger.exception(f"{tag} Error in position_manager.process_positions: {e}")
+
+            # Check if position was closed by risk management
+            if leg.active_position_id not in leg.position_manager.positions:
+                logger.info(f"{tag} Position closed by risk management (TP/SL/trailing)")
+                if notify:
+                    notify(f"Risk CLOSE: @ {price:.2f}")
+                # CRITICAL FIX: Notify strategy of position closure to reset state
+                try:
+                    leg.strategy.on_position_closed(leg.active_position_id, "Risk Management")
+                except Exception as e:
+                    logger.warning(f"{tag} Strategy notification failed: {e}")
+                leg.active_position_id = None
+
+    received_ns = tick.get('received_ns')
+    if received_ns and leg.tick_latency is not None:
+        leg.tick_latency.record(received_ns, dequeued_ns, tick.get('indicators_ns', 0), signal_ns,
+                                time.perf_counter_ns())
+    return None
+
+
+def process_positions(leg, tick: dict, tick_row: pd.Series, now):
+    """TP/SL/trailing checks; a conflated tick first replays its intra-burst high/low in traded order."""
+    for price in tick.get('extremes', ()):
+        leg.position_manager.process_positions(create_tick_row(tick, price, now), now)
+        if leg.active_position_id not in leg.position_manager.positions:
+            return
+    leg.position_manager.process_positions(tick_row, now)
+
+
+def create_tick_row(tick: dict, price: float, timestamp) -> pd.Series:
+    """Create standardized tick row for position manager compatibility."""
+    return pd.Series({
+        'close': price,
+        'high': price,
+        'low': price,
+        'open': price,
+        'volume': tick.get('volume', 1000),
+        'timestamp': timestamp
+    })
+
 class LiveTrader:
-    def __init__(self, config_path: str = None, config_dict: dict = None, frozen_config: MappingProxyType = None, dialog_text: str = None):
+    def __init__(self, config_path: str = None, config_dict: dict = None, frozen_config: MappingProxyType = None,
+                 dialog_text: str = None, profile: str = 'interactive'):
         """Initialize LiveTrader with frozen config validation
         
         Args:
@@ -50,7 +182,10 @@ class LiveTrader:
             config_dict: Raw dict config (legacy) 
             frozen_config: MappingProxyType from GUI workflow (preferred)
             dialog_text: Configuration dialog text from GUI (REQUIRED for results export)
+            profile: Run profile - 'interactive' (GUI), 'batch' or 'benchmark' (see run_profile.py)
         """
+        self.profile = get_run_profile(profile)
+        
         # Accept frozen config directly from GUI (preferred path)
         if frozen_config is not None:
             if not isinstance(frozen_config, MappingProxyType):
@@ -85,30 +220,41 @@ class LiveTrader:
         
         # Pass frozen config directly to PositionManager with strategy callback
         self.position_manager = PositionManager(config, strategy_callback=self.strategy.on_position_exit)
-        self.broker = BrokerAdapter(config)  # Pass frozen config downstream
+        self.broker = BrokerAdapter(config, profile=self.profile)  # Pass frozen config downstream
         
-        # 🔍 DEBUG: Log dialog_text before passing to ForwardTestResults
-        logger.info(f"🔍 LiveTrader creating ForwardTestResults - dialog_text type: {type(dialog_text)}, length: {len(dialog_text) if dialog_text else 0}")
-        if dialog_text:
-            logger.info(f"✅ Passing dialog_text to ForwardTestResults - first 100 chars: {dialog_text[:100]}")
+        if self.profile.export_results:
+            # 🔍 DEBUG: Log dialog_text before passing to ForwardTestResults
+            logger.info(f"🔍 LiveTrader creating ForwardTestResults - dialog_text type: {type(dialog_text)}, length: {len(dialog_text) if dialog_text else 0}")
+            if dialog_text:
+                logger.info(f"✅ Passing dialog_text to ForwardTestResults - first 100 chars: {dialog_text[:100]}")
+            else:
+                logger.warning(f"⚠️ dialog_text is empty or None before passing: {repr(dialog_text)}")
+            
+            self.results_exporter = ForwardTestResults(config, self.position_manager, now_ist(), dialog_text=dialog_text)
         else:
-            logger.warning(f"⚠️ dialog_text is empty or None before passing: {repr(dialog_text)}")
-        
-        self.results_exporter = ForwardTestResults(config, self.position_manager, now_ist(), dialog_text=dialog_text)
+            self.results_exporter = None  # Batch/benchmark: results stay in position_manager
         self.is_running = False
         self.active_position_id = None
         
         # Hybrid mode: Support both polling and direct callbacks (Wind-style)
         self.use_direct_callbacks = False  # Toggle for Wind-style performance
+        self.use_asyncio = False  # Toggle for asyncio event-loop mode (takes precedence over callbacks)
+        self._event_loop = None  # Asyncio mode: session event loop and its tick queue
+        self._async_ticks = None
+        self._async_conflator = TickConflator.from_config(self.config)  # None unless tick_buffer.conflate
         self.tick_count = 0
         self.last_price = None  # Track last seen price for heartbeat logging
         self._last_no_tick_log = None
+        self.checkpoint_manager = None  # File simulation only (see _init_checkpointing)
+        self.run_stats = {}  # Benchmark profile: ticks, elapsed_seconds, ticks_per_second
+        self.tick_latency = TickLatency()  # Receive -> dequeue/indicators/signal/decision histograms (always on)
 
     def stop(self):
         """Stop the forward test session gracefully"""
         logger = logging.getLogger(__name__)
         logger.info("🛑 Stop requested - ending forward test session")
         self.is_running = False
+        self._wake_async_loop()
         
         # Close any open positions
         if self.active_position_id:
@@ -121,24 +267,51 @@ class LiveTrader:
             logger.warning(f"Error disconnecting broker: {e}")
         
         # Finalize and export results automatically
+        get_tracer().flush()  # Deliver buffered trace events to the attached sinks
+        self._export_results()
+        
+        logger.info("✅ Forward test session stopped successfully")
+
+    def _export_results(self):
+        """Finalize and export the session results (interactive profile only)"""
+        if self.results_exporter is None:
+            return
         self.results_exporter.finalize()
         try:
             filename = self.results_exporter.export_to_excel()
             logger.info(f"Forward test results automatically exported to: {filename}")
         except Exception as e:
             logger.error(f"Failed to export results: {e}")
-        
-        logger.info("✅ Forward test session stopped successfully")
+
+    def _record_run_stats(self, started: float):
+        """Benchmark profile: store session throughput in self.run_stats"""
+        if not self.profile.report_throughput:
+            return
+        elapsed = time.perf_counter() - started
+        self.run_stats = {
+            'ticks': self.tick_count,
+            'elapsed_seconds': elapsed,
+            'ticks_per_second': self.tick_count / elapsed if elapsed > 0 else 0.0,
+        }
+        logger.info(f"Benchmark: {self.tick_count} ticks in {elapsed:.3f}s "
+                    f"({self.run_stats['ticks_per_second']:.0f} ticks/sec)")
 
     def start(self, run_once=False, result_box=None, performance_callback=None):
         """Start trading session with hybrid mode support
         
-        Supports two modes:
+        Supports three modes:
         1. Polling Mode (default): Queue-based tick polling (~70ms latency)
         2. Callback Mode (Wind-style): Direct callbacks (~50ms latency)
+        3. Asyncio Mode: WebSocket thread hands ticks to an event loop (no polling)
+        
+        Toggle with self.use_direct_callbacks = True or self.use_asyncio = True
         
-        Toggle with self.use_direct_callbacks = True
+        Returns:
+            Completed trades of the session (position_manager.completed_trades)
         """
+        if not self.profile.gui_updates:
+            result_box = None
+            performance_callback = None
         self.is_running = True
         self.performance_callback = performance_callback
         logger = logging.getLogger(__name__)
@@ -151,8 +324,14 @@ class LiveTrader:
         self.result_box = result_box
         self.run_once = run_once
         
-        # Register callback if Wind-style mode enabled
-        if self.use_direct_callbacks:
+        # Register callback if asyncio or Wind-style mode enabled
+        if self.use_asyncio:
+            # Created before connect() so ticks arriving during connection are queued, not lost
+            self._event_loop = asyncio.new_event_loop()
+            self._async_ticks = asyncio.Queue()
+            self.broker.on_tick_callback = self._hand_off_tick
+            logger.info("🔄 Asyncio mode enabled (event-loop tick hand-off, no polling)")
+        elif self.use_direct_callbacks:
             self.broker.on_tick_callback = self._on_tick_direct
             logger.info("⚡ Direct callback mode enabled (Wind-style, ~50ms latency)")
         else:
@@ -160,22 +339,29 @@ class LiveTrader:
         
         # Connect broker (WebSocket initialization happens here)
         self.broker.connect()
+        self._init_checkpointing()
         logger.info("🟢 Forward testing session started - TRUE TICK-BY-TICK PROCESSING")
         
         # Choose execution path based on mode
-        if self.use_direct_callbacks:
+        started = time.perf_counter()
+        if self.use_asyncio:
+            self._run_async_loop()
+        elif self.use_direct_callbacks:
             self._run_callback_loop()
         else:
             self._run_polling_loop(run_once, result_box, performance_callback)
+        self._record_run_stats(started)
+        if self.profile.heartbeat_logging or self.profile.report_throughput:  # Not per run of a batch/matrix
+            self.tick_latency.log_summary()
+        return self.position_manager.completed_trades
     
     def _run_polling_loop(self, run_once, result_box, performance_callback):
         """Original polling-based trading loop (backwards compatible)"""
         logger = logging.getLogger(__name__)
-        nan_streak = 0
-        nan_threshold = self.nan_threshold
-        nan_recovery_threshold = self.nan_recovery_threshold
-        consecutive_valid_ticks = 0
-        tick_count = 0
+        tick_count = self.tick_count  # Non-zero when resumed from a checkpoint
+        pacing = self.profile.pacing
+        heartbeat_logging = self.profile.heartbeat_logging
+        notify = (lambda message: self._update_result_box(result_box, message)) if result_box else None
         
         try:
             while self.is_running:
@@ -186,6 +372,7 @@ class LiveTrader:
                     if hasattr(self.broker, 'file_simulator') and self.broker.file_simulator:
                         if hasattr(self.broker.file_simulator, 'completed') and self.broker.file_simulator.completed:
                             logger.info("File simulation completed - ending trading session")
+                            self._clear_checkpoints()
                             break
                     
                     # Intelligent sleep based on data source
@@ -206,18 +393,24 @@ class LiveTrader:
                         # Polling mode: longer sleep to respect rate limits
                         time.sleep(1.0)   # 1 second for polling
                     continue
+                dequeued_ns = time.perf_counter_ns()
                 
                 # Check stop condition more frequently during processing
                 if not self.is_running:
                     logger.info("Stop requested during tick processing")
                     break
                 
+                # Checkpoint state as of the previous tick (this tick is not yet processed)
+                self._maybe_checkpoint(tick_count)
+
                 # GUI responsiveness: Brief yield every 100 ticks to keep GUI responsive
                 tick_count += 1
                 if tick_count % 100 == 0:
-                    time.sleep(0.001)  # Minimal yield to allow GUI updates
+                    if pacing:
+                        time.sleep(0.001)  # Minimal yield to allow GUI updates
                     # Heartbeat logging every 100 ticks
-                    logger.info(f"[HEARTBEAT] Trading loop active - tick count: {tick_count}, position: {self.active_position_id is not None}")
+                    if heartbeat_logging:
+                        logger.info(f"[HEARTBEAT] Trading loop active - tick count: {tick_count}, position: {self.active_position_id is not None}")
                     # Check stop condition during GUI yield
                     if not self.is_running:
                         logger.info("Stop requested during GUI yield - exiting immediately")
@@ -226,86 +419,17 @@ class LiveTrader:
                 
                 now = tick['timestamp'] if 'timestamp' in tick else now_ist()
                 
-                # STEP 2: Session end enforcement (before processing)
-                if hasattr(self.strategy, "should_exit_for_session"):
-                    should_exit, exit_reason = self.strategy.should_exit_for_session(now)
-                    if should_exit:
-                        self.close_position("Session End")
-                        logger.info(f"🛑 Session ended - stopping trading: {exit_reason}")
-                        logger.info("All positions flattened (if any).")
-                        break
-                
-                # STEP 3: TRUE TICK-BY-TICK PROCESSING - Use on_tick() directly
-                try:
-                    signal = self.strategy.on_tick(tick)
-                    
-                    # Reset NaN streak on successful processing
-                    nan_streak = 0
-                    consecutive_valid_ticks += 1
-                    
-                except Exception as e:
-                    # NaN threshold implementation
-                    nan_streak += 1
-                    consecutive_valid_ticks = 0
-                    logger.warning(f"Tick processing failed (streak: {nan_streak}/{nan_threshold}): {e}")
-                    
-                    if nan_streak >= nan_threshold:
-                        logger.error(f"NaN streak threshold ({nan_threshold}) exceeded. Stopping trading.")
-                        self.close_position("NaN Threshold Exceeded")
-                        break
-                    continue
-                
-                # STEP 4: Process signal immediately if generated
-                if signal:
-                    current_price = tick.get('price', tick.get('ltp', 0))
-                    
-                    if signal.action == 'BUY' and not self.active_position_id:
-                        # Trust the strategy's entry validation - signal was already generated with proper checks
-                        # Create optimized tick row for position manager
-                        tick_row = self._create_tick_row(tick, signal.price, now)
-                        
-                        self.active_position_id = self.strategy.open_long(tick_row, now, self.position_manager)
-                        if self.active_position_id:
-                            qty = self.position_manager.positions[self.active_position_id].current_quantity
-                            logger.info(f"[TICK] ENTERED LONG at ₹{signal.price:.2f} ({qty} contracts) - {signal.reason}")
-                            self._update_result_box(result_box, f"Tick BUY: {qty} @ {signal.price:.2f} ({signal.reason})")
-                    
-                    elif signal.action == 'CLOSE' and self.active_position_id:
-                        self.close_position(f"Strategy Signal: {signal.reason}")
-                        self._update_result_box(result_box, f"Tick CLOSE: @ {signal.price:.2f} ({signal.reason})")
+                # Debug logging every 100 ticks when in position
+                if heartbeat_logging and self.active_position_id and tick_count % 100 == 0:
+                    logger.info(f"[DEBUG] Position active: {self.active_position_id} | Tick count: {tick_count} | Price: ₹{tick.get('price', 0):.2f}")
                 
-                # Check stop condition before position processing
-                if not self.is_running:
-                    logger.info("Stop requested before position processing - exiting")
+                # STEPS 2-5: Session end check, strategy, signal handling, TP/SL/trailing (shared with SymbolSession)
+                stop_reason = process_tick(self, tick, now, dequeued_ns, "Tick", notify)
+                if stop_reason is not None:
+                    if stop_reason == "Session End":
+                        self._clear_checkpoints()
                     break
                 
-                # STEP 5: Position manager processes TP/SL/trail exits (if position exists)
-                if self.active_position_id:
-                    # Debug logging every 100 ticks when in position
-                    if tick_count % 100 == 0:
-                        logger.info(f"[DEBUG] Position active: {self.active_position_id} | Tick count: {tick_count} | Price: ₹{tick.get('price', 0):.2f}")
-                    
-                    current_price = tick.get('price', tick.get('ltp', 0))
-                    current_tick_row = self._create_tick_row(tick, current_price, now)
-                    
-                    try:
-                        self.position_manager.process_positions(current_tick_row, now)
-                    except Exception as e:
-                        logger.error(f"Error in position_manager.process_positions: {e}")
-                        logger.exception("Position processing exception details:")
-                    
-                    # Check if position was closed by risk management
-                    if self.active_position_id not in self.position_manager.positions:
-                        logger.info("Position closed by risk management (TP/SL/trailing).")
-                        self._update_result_box(result_box, f"Risk CLOSE: @ {current_price:.2f}")
-                        # CRITICAL FIX: Notify strategy of position closure to reset state
-                        try:
-                            self.strategy.on_position_closed(self.active_position_id, "Risk Management")
-                        except Exception as e:
-                            # Log notification failed, but continue trading
-                            logger.warning(f"Strategy notification failed: {e}")
-                        self.active_position_id = None
-                
                 # STEP 6: Check for single-run mode
                 if run_once:
                     self.is_running = False
@@ -316,16 +440,13 @@ class LiveTrader:
             logger.exception(f"Error in trading loop: {e}")
             self.close_position("Error Occurred")
         finally:
+            self.tick_count = tick_count
             self.broker.disconnect()
             logger.info("Session ended, data connection closed.")
             
             # Finalize and export results automatically
-            self.results_exporter.finalize()
-            try:
-                filename = self.results_exporter.export_to_excel()
-                logger.info(f"Forward test results automatically exported to: {filename}")
-            except Exception as e:
-                logger.error(f"Failed to export results: {e}")
+            get_tracer().flush()  # Deliver buffered trace events to the attached sinks
+            self._export_results()
     
     def _run_callback_loop(self):
         """Wind-style callback-driven trading loop (high performance)
@@ -362,7 +483,7 @@ class LiveTrader:
                 
                 # Heartbeat logging
                 self.tick_count += 1
-                if self.tick_count % 100 == 0:
+                if self.profile.heartbeat_logging and self.tick_count % 100 == 0:
                     last_price = self.broker.get_last_price()
                     price_str = f"₹{last_price:.2f}" if last_price > 0 else "N/A"
                     logger.info(f"[HEARTBEAT] Callback mode - {self.tick_count} cycles, position: {self.active_position_id is not None}, price: {price_str}")
@@ -402,12 +523,148 @@ class LiveTrader:
             logger.info("Callback mode session ended, data connection closed.")
             
             # Finalize and export results
-            self.results_exporter.finalize()
+            get_tracer().flush()  # Deliver buffered trace events to the attached sinks
+            self._export_results()
+    
+    def _run_async_loop(self):
+        """Asyncio trading loop: ticks are awaited, housekeeping runs as scheduled tasks
+        
+        LIVE WEBSTREAM: the WebSocket thread hands each tick over with
+        loop.call_soon_threadsafe (see _hand_off_tick); the loop wakes on arrival
+        instead of polling, so queueing adds microseconds rather than up to 50ms.
+        FILE SIMULATION: ticks are read from the simulator inside the loop.
+        
+        Heartbeat logging, GUI performance updates and the session-end check are
+        tasks on the same loop, so they never run concurrently with tick processing.
+        """
+        logger = logging.getLogger(__name__)
+        loop = self._event_loop
+        try:
+            loop.run_until_complete(self._async_session())
+        except KeyboardInterrupt:
+            logger.info("Asyncio mode interrupted by user")
+            self.close_position("Keyboard Interrupt")
+        except Exception as e:
+            logger.exception(f"Error in asyncio loop: {e}")
+            self.close_position("Error Occurred")
+        finally:
+            self.broker.on_tick_callback = None
+            self._event_loop = None
+            loop.close()
+            self.broker.disconnect()
+            logger.info("Asyncio mode session ended, data connection closed.")
+            
+            # Finalize and export results
+            get_tracer().flush()  # Deliver buffered trace events to the attached sinks
+            self._export_results()
+    
+    async def _async_session(self):
+        """Run the tick consumer until the session ends, with its housekeeping tasks alongside"""
+        file_simulation = bool(getattr(self.broker, 'file_simulator', None))
+        tasks = [asyncio.ensure_future(self._async_heartbeat())]
+        if self.performance_callback:
+            tasks.append(asyncio.ensure_future(self._async_gui_updates()))
+        if not file_simulation and hasattr(self.strategy, "should_exit_for_session"):
+            tasks.append(asyncio.ensure_future(self._async_session_timer()))
+        try:
+            if file_simulation:
+                await self._async_file_ticks()
+            else:
+                await self._async_stream_ticks()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+    
+    async def _async_stream_ticks(self):
+        """Process WebSocket ticks as they are handed over (None wakes the loop to stop; backlogs conflate if enabled)"""
+        ticks = self._async_ticks
+        symbol = self.config['instrument']['symbol']
+        logger.info("🔥 Asyncio mode active - awaiting WebSocket ticks")
+        while self.is_running:
+            tick = await ticks.get()
+            if tick is None or not self.is_running:
+                break
+            stopping = False
+            if self._async_conflator is not None and ticks.qsize() >= self._async_conflator.threshold:
+                backlog = [tick]
+                while not ticks.empty():
+                    queued = ticks.get_nowait()
+                    if queued is None:
+                        stopping = True
+                        break
+                    backlog.append(queued)
+                tick = self._async_conflator.merge(backlog) if len(backlog) > 1 else tick
+            self._on_tick_direct(tick, symbol)
+            if stopping:
+                break
+            self.tick_count += 1
+            if self.run_once and self.tick_count > 100:
+                logger.info("Single-run mode - exiting after initial processing")
+                self.is_running = False
+    
+    async def _async_file_ticks(self):
+        """File simulation inside the event loop, yielding to scheduled tasks between ticks"""
+        logger.info("📁 File simulation asyncio mode - testing asyncio logic with file data")
+        while self.is_running:
+            tick = self.broker.get_next_tick()
+            if not tick:
+                logger.info("📋 File simulation completed - all data processed")
+                self._clear_checkpoints()
+                break
+            self._maybe_checkpoint(self.tick_count)
+            self._on_tick_direct(tick, "FILE_SIM")
+            self.tick_count += 1
+            if self.profile.heartbeat_logging and self.tick_count % 1000 == 0:
+                logger.info(f"[FILE SIM] Processed {self.tick_count} ticks, position: {self.active_position_id is not None}")
+            if self.run_once and self.tick_count > 100:
+                logger.info("Single-run mode - exiting after initial processing")
+                self.is_running = False
+                break
+            if self.profile.pacing or self.tick_count % 100 == 0:
+                await asyncio.sleep(0)
+    
+    async def _async_heartbeat(self):
+        while self.is_running:
+            await asyncio.sleep(ASYNC_HEARTBEAT_SECONDS)
+            if self.profile.heartbeat_logging:
+                last_price = self.broker.get_last_price()
+                price_str = f"₹{last_price:.2f}" if last_price > 0 else "N/A"
+                logger.info(f"[HEARTBEAT] Asyncio mode - {self.tick_count} ticks, position: {self.active_position_id is not None}, price: {price_str}")
+    
+    async def _async_gui_updates(self):
+        while self.is_running:
+            await asyncio.sleep(ASYNC_GUI_UPDATE_SECONDS)
             try:
-                filename = self.results_exporter.export_to_excel()
-                logger.info(f"Forward test results automatically exported to: {filename}")
+                self.performance_callback(self)
             except Exception as e:
-                logger.error(f"Failed to export results: {e}")
+                logger.warning(f"Performance callback error: {e}")
+    
+    async def _async_session_timer(self):
+        """End the session on time even when no ticks arrive"""
+        while self.is_running:
+            await asyncio.sleep(ASYNC_SESSION_CHECK_SECONDS)
+            should_exit, exit_reason = self.strategy.should_exit_for_session(now_ist())
+            if should_exit:
+                self.close_position("Session End")
+                logger.info(f"🛑 Session ended - stopping trading: {exit_reason}")
+                logger.info("All positions flattened (if any).")
+                self.is_running = False
+                self._async_ticks.put_nowait(None)
+    
+    def _hand_off_tick(self, tick, symbol):
+        """Asyncio mode: called on the WebSocket thread, queues the tick on the session loop"""
+        loop = self._event_loop
+        if loop is not None:
+            try:
+                loop.call_soon_threadsafe(self._async_ticks.put_nowait, tick)
+            except RuntimeError:
+                pass  # Loop already closed - session is over
+    
+    def _wake_async_loop(self):
+        """Asyncio mode: unblock a consumer waiting for ticks (e.g. on stop())"""
+        if self._event_loop is not None:
+            self._hand_off_tick(None, None)
     
     def _run_file_simulation_callback_mode(self):
         """Dedicated file simulation loop for callback mode testing
@@ -425,11 +682,12 @@ class LiveTrader:
                 
                 if tick:
                     # Process tick through callback handler (testing callback logic)
+                    self._maybe_checkpoint(self.tick_count)
                     self._on_tick_direct(tick, "FILE_SIM")
                     self.tick_count += 1
                     
                     # Periodic progress logging
-                    if self.tick_count % 1000 == 0:
+                    if self.profile.heartbeat_logging and self.tick_count % 1000 == 0:
                         logger.info(f"[FILE SIM] Processed {self.tick_count} ticks, position: {self.active_position_id is not None}")
                     
                     # Update GUI performance display
@@ -441,10 +699,12 @@ class LiveTrader:
                     
                     # CRITICAL: Yield to GUI thread to prevent freezing
                     # Small sleep simulates realistic tick timing and allows GUI updates
-                    time.sleep(0.001)  # 1ms delay = ~1000 ticks/sec max
+                    if self.profile.pacing:
+                        time.sleep(0.001)  # 1ms delay = ~1000 ticks/sec max
                 else:
                     # Simulation complete
                     logger.info("📋 File simulation completed - all data processed")
+                    self._clear_checkpoints()
                     break
                 
                 # Check for single-run mode
@@ -464,12 +724,8 @@ class LiveTrader:
             logger.info("File simulation session ended")
             
             # Finalize and export results
-            self.results_exporter.finalize()
-            try:
-                filename = self.results_exporter.export_to_excel()
-                logger.info(f"File simulation results exported to: {filename}")
-            except Exception as e:
-                logger.error(f"Failed to export results: {e}")
+            get_tracer().flush()  # Deliver buffered trace events to the attached sinks
+            self._export_results()
     
     def _on_tick_direct(self, tick, symbol):
         """Direct callback handler for Wind-style tick processing
@@ -482,6 +738,7 @@ class LiveTrader:
             symbol: Symbol identifier
         """
         logger = logging.getLogger(__name__)
+        dequeued_ns = time.perf_counter_ns()
         
         try:
             # Phase 1.5: Start trader measurement
@@ -495,9 +752,10 @@ class LiveTrader:
                 logger.info("🔧 [CALLBACK] Initialized _callback_tick_count counter")
             
             self._callback_tick_count += 1
+            callback_logging = self.profile.heartbeat_logging
             
             # Log FIRST tick and every 100 ticks to verify callback is receiving ticks
-            if self._callback_tick_count == 1 or self._callback_tick_count % 100 == 0:
+            if callback_logging and (self._callback_tick_count == 1 or self._callback_tick_count % 100 == 0):
                 logger.info(f"🔍 [CALLBACK] Processing tick #{self._callback_tick_count}, price: ₹{tick.get('price', 'N/A')}, keys: {list(tick.keys())}")
             # Add timestamp if not present
             if 'timestamp' not in tick:
@@ -505,174 +763,20 @@ class LiveTrader:
             
             now = tick['timestamp']
             
-            # Update last price for heartbeat logging
-            self.last_price = tick.get('price', tick.get('ltp', None))
-            
-            # Phase 1.5: Measure session checks
-            if _pre_convergence_instrumentor:
-                with _pre_convergence_instrumentor.measure_trader('session_check'):
-                    # Session end check
-                    if hasattr(self.strategy, "should_exit_for_session"):
-                        should_exit, exit_reason = self.strategy.should_exit_for_session(now)
-                        if should_exit:
-                            self.close_position("Session End")
-                            logger.info(f"🛑 Session ended - stopping trading: {exit_reason}")
-                            logger.info("All positions flattened (if any).")
-                            self.is_running = False  # Stop processing further ticks
-                            _pre_convergence_instrumentor.end_trader_tick()
-                            return
-            else:
-                # Session end check
-                if hasattr(self.strategy, "should_exit_for_session"):
-                    should_exit, exit_reason = self.strategy.should_exit_for_session(now)
-                    if should_exit:
-                        self.close_position("Session End")
-                        logger.info(f"🛑 Session ended - stopping trading: {exit_reason}")
-                        logger.info("All positions flattened (if any).")
-                        self.is_running = False  # Stop processing further ticks
-                        return
+            # Log strategy call
+            if callback_logging and (self._callback_tick_count == 1 or self._callback_tick_count % 300 == 0):
+                logger.info(f"📊 [CALLBACK] Calling strategy.on_tick() for tick #{self._callback_tick_count}")
+            # Debug log every 100 ticks when in position
+            if callback_logging and self.active_position_id and self._callback_tick_count % 100 == 0:
+                logger.info(f"[DEBUG] Position active: {self.active_position_id} | Tick count: {self._callback_tick_count} | Price: ₹{tick.get('price', 0):.2f}")
             
-            # Phase 1.5: Measure signal handling preparation
-            if _pre_convergence_instrumentor:
-                with _pre_convergence_instrumentor.measure_trader('signal_prep'):
-                    # Log strategy call
-                    if self._callback_tick_count == 1 or self._callback_tick_count % 300 == 0:
-                        logger.info(f"📊 [CALLBACK] Calling strategy.on_tick() for tick #{self._callback_tick_count}")
-            else:
-                # Log strategy call
-                if self._callback_tick_count == 1 or self._callback_tick_count % 300 == 0:
-                    logger.info(f"📊 [CALLBACK] Calling strategy.on_tick() for tick #{self._callback_tick_count}")
-            
-            # Process tick through strategy (KEEP MEASURING - this is part of pre-convergence)
-            try:
-                # Phase 1.5: Measure strategy call overhead (NOT strategy internals)
-                if _pre_convergence_instrumentor:
-                    with _pre_convergence_instrumentor.measure_trader('strategy_call'):
-                        signal = self.strategy.on_tick(tick)
-                else:
-                    signal = self.strategy.on_tick(tick)
-                
-                # Log signal result for FIRST tick and occasionally
-                if self._callback_tick_count == 1 or self._callback_tick_count % 300 == 0:
-                    if signal:
-                        logger.info(f"✅ [CALLBACK] Strategy returned signal: {signal.action} @ ₹{signal.price}")
-                    else:
-                        logger.info(f"⏸️ [CALLBACK] Strategy returned None (no entry signal)")
-                
-                # Reset NaN streak on success
-                self.nan_streak = 0
-                self.consecutive_valid_ticks += 1
-                
-            except Exception as e:
-                # NaN threshold implementation
-                self.nan_streak += 1
-                self.consecutive_valid_ticks = 0
-                logger.warning(f"Tick processing failed (streak: {self.nan_streak}/{self.nan_threshold}): {e}")
-                
-                if self.nan_streak >= self.nan_threshold:
-                    logger.error(f"NaN streak threshold ({self.nan_threshold}) exceeded. Stopping trading.")
-                    self.close_position("NaN Threshold Exceeded")
-                    self.is_running = False
-                
-                # Phase 1.5: End trader measurement on error
-                if _pre_convergence_instrumentor:
-                    _pre_convergence_instrumentor.end_trader_tick()
-                return
-            
-            # Phase 1.5: Measure signal processing
-            if _pre_convergence_instrumentor:
-                with _pre_convergence_instrumentor.measure_trader('signal_handling'):
-                    # Handle signal immediately
-                    if signal:
-                        current_price = tick.get('price', tick.get('ltp', 0))
-                        self.last_price = current_price
-                        
-                        if signal.action == 'BUY' and not self.active_position_id:
-                            tick_row = self._create_tick_row(tick, signal.price, now)
-                            self.active_position_id = self.strategy.open_long(tick_row, now, self.position_manager)
-                            
-                            if self.active_position_id:
-                                qty = self.position_manager.positions[self.active_position_id].current_quantity
-                                logger.info(f"[DIRECT] ENTERED LONG at ₹{signal.price:.2f} ({qty} contracts) - {signal.reason}")
-                                self._update_result_box(self.result_box, f"Direct BUY: {qty} @ {signal.price:.2f} ({signal.reason})")
-                        
-                        elif signal.action == 'CLOSE' and self.active_position_id:
-                            self.close_position(f"Strategy Signal: {signal.reason}")
-                            self._update_result_box(self.result_box, f"Direct CLOSE: @ {signal.price:.2f} ({signal.reason})")
-            else:
-                # Handle signal immediately (no instrumentation)
-                if signal:
-                    current_price = tick.get('price', tick.get('ltp', 0))
-                    self.last_price = current_price
-                    
-                    if signal.action == 'BUY' and not self.active_position_id:
-                        tick_row = self._create_tick_row(tick, signal.price, now)
-                        self.active_position_id = self.strategy.open_long(tick_row, now, self.position_manager)
-                        
-                        if self.active_position_id:
-                            qty = self.position_manager.positions[self.active_position_id].current_quantity
-                            logger.info(f"[DIRECT] ENTERED LONG at ₹{signal.price:.2f} ({qty} contracts) - {signal.reason}")
-                            self._update_result_box(self.result_box, f"Direct BUY: {qty} @ {signal.price:.2f} ({signal.reason})")
-                    
-                    elif signal.action == 'CLOSE' and self.active_position_id:
-                        self.close_position(f"Strategy Signal: {signal.reason}")
-                        self._update_result_box(self.result_box, f"Direct CLOSE: @ {signal.price:.2f} ({signal.reason})")
-            
-            # Phase 1.5: Measure position management
-            if _pre_convergence_instrumentor:
-                with _pre_convergence_instrumentor.measure_trader('position_mgmt'):
-                    # Position management (TP/SL/trailing)
-                    if self.active_position_id:
-                        current_price = tick.get('price', tick.get('ltp', 0))
-                        self.last_price = current_price
-                        current_tick_row = self._create_tick_row(tick, current_price, now)
-                        
-                        try:
-                            self.position_manager.process_positions(current_tick_row, now)
-                        except Exception as e:
-                            logger.error(f"Error in position_manager.process_positions: {e}")
-                        
-                        # Check if position was closed by risk management
-                        if self.active_position_id not in self.position_manager.positions:
-                            logger.info("Position closed by risk management (TP/SL/trailing) [Direct Callback]")
-                            self._update_result_box(self.result_box, f"Risk CLOSE: @ {current_price:.2f}")
-                            
-                            # Notify strategy
-                            try:
-                                self.strategy.on_position_closed(self.active_position_id, "Risk Management")
-                            except Exception as e:
-                                logger.warning(f"Strategy notification failed: {e}")
-                            
-                            self.active_position_id = None
-            else:
-                # Position management (TP/SL/trailing) - no instrumentation
-                if self.active_position_id:
-                    current_price = tick.get('price', tick.get('ltp', 0))
-                    self.last_price = current_price
-                    current_tick_row = self._create_tick_row(tick, current_price, now)
-                    
-                    # Debug log every 100 ticks when in position
-                    if self._callback_tick_count % 100 == 0:
-                        logger.info(f"[DEBUG] Position active: {self.active_position_id} | Tick count: {self._callback_tick_count} | Price: ₹{current_price:.2f}")
-                    
-                    try:
-                        self.position_manager.process_positions(current_tick_row, now)
-                    except Exception as e:
-                        logger.error(f"Error in position_manager.process_positions: {e}")
-                        logger.exception("Position processing exception details:")
-                    
-                    # Check if position was closed by risk management
-                    if self.active_position_id not in self.position_manager.positions:
-                        logger.info("Position closed by risk management (TP/SL/trailing) [Direct Callback]")
-                        self._update_result_box(self.result_box, f"Risk CLOSE: @ {current_price:.2f}")
-                        
-                        # Notify strategy
-                        try:
-                            self.strategy.on_position_closed(self.active_position_id, "Risk Management")
-                        except Exception as e:
-                            logger.warning(f"Strategy notification failed: {e}")
-                        
-                        self.active_position_id = None
+            # Session end check, strategy, signal handling, TP/SL/trailing (shared with SymbolSession)
+            stop_reason = process_tick(self, tick, now, dequeued_ns, "Direct", self._notify_result_box,
+                                       _pre_convergence_instrumentor)
+            if stop_reason is not None:
+                self.is_running = False  # Stop processing further ticks
+                if stop_reason == "Session End":
+                    self._clear_checkpoints()
             
             # Phase 1.5: End trader measurement (normal completion)
             if _pre_convergence_instrumentor:
@@ -704,17 +808,58 @@ class LiveTrader:
                 except Exception as e:
                     logger.warning(f"Failed to update performance callback: {e}")
 
-    def _create_tick_row(self, tick: dict, price: float, timestamp) -> pd.Series:
-        """Create standardized tick row for position manager compatibility."""
-        return pd.Series({
-            'close': price,
-            'high': price,
-            'low': price,
-            'open': price,
-            'volume': tick.get('volume', 1000),
-            'timestamp': timestamp
+    def _init_checkpointing(self):
+        """Set up checkpoint/resume for file simulation runs (live WebSocket sessions are not resumable)."""
+        get_checkpoint_param = ConfigAccessor(self.config).get_checkpoint_param
+        simulator = getattr(self.broker, 'file_simulator', None)
+        self.checkpoint_enabled = get_checkpoint_param('enabled')
+        resume = get_checkpoint_param('resume')
+        if not simulator or not (self.checkpoint_enabled or resume):
+            return
+        run_key = make_run_key('forward_test', simulator.file_path, self.config)
+        self.checkpoint_manager = CheckpointManager.from_config(self.config, run_key)
+        self.checkpoint_interval = get_checkpoint_param('interval_ticks')
+        self._last_checkpoint_tick = 0
+        saved = self.checkpoint_manager.load_latest() if resume else None
+        if saved:
+            simulator.index = saved['simulator_index']
+            self.tick_count = saved['tick_count']
+            self.active_position_id = saved['active_position_id']
+            self._last_checkpoint_tick = self.tick_count
+            self.strategy.restore_checkpoint_state(saved['strategy'])
+            self.position_manager.restore_checkpoint_state(saved['position_manager'])
+            logger.info(f"Resuming file simulation at tick {simulator.index:,} "
+                        f"(position: {self.active_position_id is not None})")
+
+    def _maybe_checkpoint(self, tick_count: int):
+        """
+        Save a checkpoint every interval_ticks processed ticks.
+
+        Called after a tick has been fetched but before it is processed, so the
+        simulator cursor is rewound by one to replay that tick on resume.
+        """
+        if (self.checkpoint_manager is None or not self.checkpoint_enabled
+                or tick_count % self.checkpoint_interval != 0 or tick_count == self._last_checkpoint_tick):
+            return
+        self._last_checkpoint_tick = tick_count
+        self.checkpoint_manager.save({
+            'simulator_index': self.broker.file_simulator.index - 1,
+            'tick_count': tick_count,
+            'active_position_id': self.active_position_id,
+            'strategy': self.strategy.get_checkpoint_state(),
+            'position_manager': self.position_manager.get_checkpoint_state(),
         })
-    
+
+    def _clear_checkpoints(self):
+        """Drop checkpoints once the simulated session has run to completion."""
+        if self.checkpoint_manager is not None:
+            self.checkpoint_manager.clear()
+
+    def _notify_result_box(self, message: str):
+        """Result box messages of the callback/asyncio modes (see process_tick)."""
+        if self.result_box:
+            self._update_result_box(self.result_box, message)
+
     def _update_result_box(self, result_box, message: str):
         """Update result box with thread-safe GUI operations."""
         if result_box:
@@ -4,8 +4,10 @@ live/websocket_stream.py
 SmartAPI WebSocket streaming module for unified trading system.
 
 Features:
-- Multiple instrument streams (up to 3 per SmartAPI account)
+- Multiple instruments over one connection (up to 1000 tokens; SmartAPI allows 3 connections per account)
 - User-selectable feed type: LTP, Quote, SnapQuote
+- Binary frames decoded directly with precompiled struct layouts (live/smartapi_frames.py)
+- Each tick stamped with its monotonic receive time (received_ns) for end-to-end latency
 - Event-driven tick delivery to tick buffer and OHLC aggregator
 - Robust reconnect and error handling
 - Integration with GUI controls and manual refresh
@@ -18,12 +20,13 @@ Usage:
 
 import logging
 import threading
+import time
 import json
 import pytz
 from datetime import datetime
 
 # Import timezone from SSOT
-from ..utils.time_utils import IST
+from ..utils.time_utils import IST, now_ist_fast
 
 try:
     from SmartApi.smartWebSocketV2 import SmartWebSocketV2  # Capital 'A' - correct package name
@@ -32,9 +35,16 @@ except ImportError:
 
 # Import Angel One exchange type mapper
 from ..utils.exchange_mapper import map_to_angel_exchange_type
+from .smartapi_frames import FrameDecoder, LTP_FRAME_SIZE
 
 logger = logging.getLogger(__name__)
 
+# SmartAPI WebSocket 2.0 subscription limit per connection
+MAX_TOKENS_PER_CONNECTION = 1000
+
+# websocket-client opcode of binary frames (SmartAPI market data)
+BINARY_OPCODE = 2
+
 # Suppress known SmartAPI WebSocket callback signature mismatch
 class SmartAPIWebSocketFilter(logging.Filter):
     """Filter out known SmartAPI library bugs that don't affect functionality."""
@@ -76,38 +86,47 @@ class WebSocketTickStreamer:
         self.auth_token = auth_token
         self.client_code = client_code
         self.feed_token = feed_token
-        self.symbol_tokens = symbol_tokens[:3]  # SmartAPI allows max 3
+        if len(symbol_tokens) > MAX_TOKENS_PER_CONNECTION:
+            raise ValueError(f"{len(symbol_tokens)} tokens requested; one connection streams at most {MAX_TOKENS_PER_CONNECTION}")
+        self.symbol_tokens = list(symbol_tokens)
         self.feed_type = feed_type
         self.on_tick = on_tick or (lambda tick, symbol: None)
+        self.decoder = FrameDecoder(self.symbol_tokens)
+        self._library_on_frame = None
         self.ws = None
         self.running = False
         self.thread = None
+        self.connection_epoch = 0  # Incremented on every (re)connect; ticks after a change may follow a gap
         # Robustness priority: Always allow auto-reconnection
         # User must explicitly confirm stop via GUI dialog
 
     def _on_open(self, ws):
-        logger.info("WebSocket connection OPEN")
+        self.connection_epoch += 1
+        if self.connection_epoch > 1:
+            logger.warning(f"WebSocket connection RE-OPENED (connection #{self.connection_epoch}) - ticks during the outage may be missing")
+        else:
+            logger.info("WebSocket connection OPEN")
         
         # SmartWebSocketV2.subscribe() expects: subscribe(mode, token_list)
         # mode: 1=LTP, 2=Quote, 3=SnapQuote
         mode_map = {"LTP": 1, "Quote": 2, "SnapQuote": 3}
         mode = mode_map.get(self.feed_type, 1)  # Default to LTP
         
-        # Build token list with exchange type mapping
-        token_list = []
+        # Build token list with exchange type mapping (one entry per exchange type)
+        tokens_by_exchange = {}
         for s in self.symbol_tokens:
             try:
                 # Convert exchange code to Angel One exchange_type integer
                 angel_exchange_type = map_to_angel_exchange_type(s['exchange'])
-                token_entry = {
-                    "exchangeType": angel_exchange_type,  # Use Angel One integer format
-                    "tokens": [s['token']]
-                }
-                token_list.append(token_entry)
+                tokens_by_exchange.setdefault(angel_exchange_type, []).append(s['token'])
                 logger.info(f"Mapped {s['exchange']} -> exchange_type={angel_exchange_type} for {s['symbol']}")
             except ValueError as e:
                 logger.error(f"Exchange mapping failed for {s['symbol']}: {e}")
                 continue
+        token_list = [
+            {"exchangeType": exchange_type, "tokens": tokens}  # Use Angel One integer format
+            for exchange_type, tokens in tokens_by_exchange.items()
+        ]
         
         if token_list:
             try:
@@ -115,7 +134,7 @@ class WebSocketTickStreamer:
                 # Try different subscription patterns based on SmartAPI version
                 correlation_id = "myQuant_stream"
                 self.ws.subscribe(correlation_id, mode, token_list)
-                logger.info(f"Subscribed to {len(token_list)} stream(s): {[s['symbol'] for s in self.symbol_tokens]} [mode={mode}, feed_type={self.feed_type}]")
+                logger.info(f"Subscribed to {len(self.symbol_tokens)} token(s): {[s['symbol'] for s in self.symbol_tokens]} [mode={mode}, feed_type={self.feed_type}]")
             except TypeError as e:
                 logger.error(f"WebSocket subscription failed with signature error: {e}")
                 # Fallback: Try without correlation_id
@@ -130,6 +149,7 @@ class WebSocketTickStreamer:
     def _on_data(self, ws, message):
         # Robustness priority: Process all ticks, always allow reconnection
         # Stop only when user explicitly confirms via GUI dialog
+        received_ns = time.perf_counter_ns()  # Start of end-to-end latency (live/tick_latency.py)
         try:
             # Phase 1.5: Start pre-convergence measurement
             global _pre_convergence_instrumentor
@@ -188,15 +208,11 @@ class WebSocketTickStreamer:
                 "price": actual_price,  # Use converted price in rupees
                 "volume": int(data.get("volume", 0)),
                 "symbol": data.get("tradingsymbol", data.get("symbol", "")),
+                "token": str(data.get("token", "")),
                 "exchange": data.get("exchange", ""),
-                "raw": data
+                "received_ns": received_ns
             }
-            
-            # Validate reasonable price range for options  
-            if tick['price'] > 5000:  # Still log if something seems wrong
-                logger.warning(f"🚨 Unusually high option price: {tick['symbol']} @ ₹{tick['price']} - Raw data: {data}")
-            elif tick['price'] < 0.01:  # Also log extremely low prices
-                logger.warning(f"🚨 Unusually low option price: {tick['symbol']} @ ₹{tick['price']} - Raw data: {data}")
+            self._check_price_range(tick)
             
             if self.on_tick:
                 # Phase 1.5: End websocket measurement before callback
@@ -215,6 +231,38 @@ class WebSocketTickStreamer:
             if _pre_convergence_instrumentor:
                 _pre_convergence_instrumentor.end_websocket_tick()
 
+    def _on_frame(self, wsapp, data, data_type, continue_flag):
+        """
+        Raw frame hook installed in place of SmartWebSocketV2._on_data: binary
+        market data is decoded directly (FrameDecoder); anything else (text,
+        control frames) goes through the library as before.
+        """
+        if data_type != BINARY_OPCODE or len(data) < LTP_FRAME_SIZE:
+            self._library_on_frame(wsapp, data, data_type, continue_flag)
+            return
+        received_ns = time.perf_counter_ns()
+        try:
+            if _pre_convergence_instrumentor:
+                _pre_convergence_instrumentor.start_websocket_tick()
+            tick = self.decoder.decode(data, now_ist_fast())
+            tick['received_ns'] = received_ns
+            self._check_price_range(tick)
+            if _pre_convergence_instrumentor:
+                _pre_convergence_instrumentor.end_websocket_tick()
+            self.on_tick(tick, tick['symbol'])
+        except Exception as e:
+            logger.error(f"Error in streamed tick: {e}")
+            if _pre_convergence_instrumentor:
+                _pre_convergence_instrumentor.end_websocket_tick()
+
+    @staticmethod
+    def _check_price_range(tick):
+        # Validate reasonable price range for options
+        if tick['price'] > 5000:  # Still log if something seems wrong
+            logger.warning(f"🚨 Unusually high option price: {tick['symbol']} (token {tick['token']}) @ ₹{tick['price']}")
+        elif tick['price'] < 0.01:  # Also log extremely low prices
+            logger.warning(f"🚨 Unusually low option price: {tick['symbol']} (token {tick['token']}) @ ₹{tick['price']}")
+
     def _on_error(self, ws, error):
         logger.error(f"WebSocket error: {error}")
 
@@ -245,6 +293,12 @@ class WebSocketTickStreamer:
         self.ws.on_data = self._on_data
         self.ws.on_error = self._on_error
         self.ws.on_close = self._on_close
+        # Binary market data bypasses the library's per-field parse (see _on_frame)
+        if hasattr(self.ws, '_on_data'):
+            self._library_on_frame = self.ws._on_data
+            self.ws._on_data = self._on_frame
+        else:
+            logger.warning("SmartWebSocketV2 has no _on_data frame hook - using the library's dict decoding")
         self.thread = threading.Thread(target=self.ws.connect)
         self.thread.daemon = True
         self.thread.start()
@@ -5,12 +5,26 @@ Simple symbol/token cache manager replicating angelalgo windsurf approach
 - Simple symbol:token mapping for fast lookup
 - Direct fetch from Angel One API
 - Compatible with GUI autocomplete
+- Streaming scrip master refresh (see iter_scrip_master): entries are decoded
+  one at a time into compact per-instrument columns, never as a full list
+- Process-wide SymbolIndex (see get_symbol_index): O(1) symbol -> token,
+  sorted prefix search, and secondary indexes by underlying/expiry/strike/
+  option type, invalidated by the cache file's mtime/size
 """
 
 import os
+import re
+import sys
 import json
-import requests
-from datetime import datetime
+import codecs
+import struct
+import bisect
+import threading
+from array import array
+from datetime import datetime, date
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .http_client import get_http_client
 
 # Default cache file path - exactly like angelalgo windsurf
 DEFAULT_CACHE_PATH = os.path.join("smartapi", "symbol_cache.json")
@@ -23,10 +37,17 @@ def load_symbol_cache(path: str = DEFAULT_CACHE_PATH) -> dict:
     Returns:
         symbol_token_map (dict): { 'NIFTY': '99926000', 'BANKNIFTY': '99926009', ... }
     """
+    return load_instrument_cache(path)[0]
+
+def load_instrument_cache(path: str = DEFAULT_CACHE_PATH) -> Tuple[dict, Optional[dict]]:
+    """
+    Symbol-token mapping plus, for caches written by a streaming refresh, the
+    instrument columns (INSTRUMENT_FIELDS, aligned with the mapping's order).
+    """
     if not os.path.exists(path):
         # Try to fetch from online if cache doesn't exist
         print(f"Cache file not found at {path}, fetching from API...")
-        return fetch_and_cache_symbols(path)
+        return _fetch_into_mapping(path)
     
     try:
         with open(path, "r", encoding="utf-8") as f:
@@ -35,49 +56,59 @@ def load_symbol_cache(path: str = DEFAULT_CACHE_PATH) -> dict:
         # Expect angelalgo windsurf format: {"timestamp": "...", "symbols": {"symbol": "token", ...}}
         if "symbols" in cache_data:
             symbols = cache_data["symbols"]
+            if not isinstance(symbols, dict):
+                return {}, None
+            columns = cache_data.get("instruments")
+            if not isinstance(columns, dict) or any(len(columns.get(f, ())) != len(symbols) for f in INSTRUMENT_FIELDS):
+                columns = None
             # Return the simple symbol:token mapping
-            return symbols if isinstance(symbols, dict) else {}
+            return symbols, columns
         else:
             # If old format, return empty and force refresh
             print("Old cache format detected, forcing refresh...")
-            return fetch_and_cache_symbols(path)
+            return _fetch_into_mapping(path)
             
     except Exception as e:
         print(f"Error loading cache: {e}")
-        return fetch_and_cache_symbols(path)
+        return _fetch_into_mapping(path)
+
+def _fetch_into_mapping(path: str) -> Tuple[dict, Optional[dict]]:
+    try:
+        index = fetch_instrument_index(path)
+    except Exception as e:
+        print(f"âŒ Error fetching symbols: {e}")
+        return {}, None
+    return index.tokens, index.columns
 
 def fetch_and_cache_symbols(path: str = DEFAULT_CACHE_PATH, url: str = DEFAULT_MASTER_URL) -> dict:
     """
     Fetch symbols from Angel One API and cache them using exact angelalgo windsurf format.
+    url may also be a local scrip master file (offline refresh).
     
     Returns:
         symbol_token_map (dict): { 'NIFTY': '99926000', ... }
     """
     try:
-        print("Fetching symbols from Angel One API...")
-        response = requests.get(url, timeout=60)
-        response.raise_for_status()
-        data = response.json()
-        
-        # Create simple symbol:token mapping exactly like angelalgo windsurf
-        symbol_token_map = {}
-        for entry in data:
-            symbol = entry.get("symbol")
-            token = entry.get("token")
-            if symbol and token:
-                symbol_token_map[symbol] = str(token)  # Ensure token is string
-        
-        # Save to cache in angelalgo windsurf format
-        save_cache(symbol_token_map, path)
-        
-        print(f"âœ… Cached {len(symbol_token_map)} symbols to {path}")
-        return symbol_token_map
-        
+        return fetch_instrument_index(path, url).tokens
     except Exception as e:
         print(f"âŒ Error fetching symbols: {e}")
         return {}
 
-def save_cache(symbol_token_map: dict, path: str = DEFAULT_CACHE_PATH):
+def fetch_instrument_index(path: str = DEFAULT_CACHE_PATH, url: str = DEFAULT_MASTER_URL) -> 'SymbolIndex':
+    """
+    Stream the scrip master (URL or local file) into a SymbolIndex and save it
+    as the cache. Raises on download/parse errors.
+    """
+    print(f"Fetching symbols from {'Angel One API' if _is_url(url) else url}...")
+    index = build_instrument_index(iter_scrip_master(_master_chunks(url)))
+    
+    # Save to cache in angelalgo windsurf format (plus instrument columns)
+    save_cache(index.tokens, path, columns=index.columns)
+    
+    print(f"âœ… Cached {len(index)} symbols to {path}")
+    return index
+
+def save_cache(symbol_token_map: dict, path: str = DEFAULT_CACHE_PATH, columns: Optional[dict] = None):
     """Save symbol-token mapping to cache file in exact angelalgo windsurf format."""
     try:
         # Ensure directory exists
@@ -90,38 +121,408 @@ def save_cache(symbol_token_map: dict, path: str = DEFAULT_CACHE_PATH):
             "timestamp": datetime.now().isoformat(),
             "symbols": symbol_token_map
         }
+        if columns is not None:
+            # Per-instrument fields, one list per field aligned with "symbols"
+            cache_data["instruments"] = {field: list(columns[field]) for field in INSTRUMENT_FIELDS}
         
         with open(path, "w", encoding="utf-8") as f:
-            json.dump(cache_data, f, indent=2)
+            json.dump(cache_data, f, indent=2 if columns is None else None)
             
         print(f"âœ… Symbol cache saved to {path}")
         
     except Exception as e:
         print(f"âŒ Error saving cache: {e}")
 
-def refresh_symbol_cache(path: str = DEFAULT_CACHE_PATH) -> int:
+def refresh_symbol_cache(path: str = DEFAULT_CACHE_PATH, url: str = DEFAULT_MASTER_URL) -> int:
     """
     Manually refresh the symbol cache.
     
     Returns:
         count (int): number of symbols cached
     """
-    symbol_token_map = fetch_and_cache_symbols(path)
+    symbol_token_map = fetch_and_cache_symbols(path, url)
     return len(symbol_token_map)
 
+# ============================================================================
+# Streaming scrip master parse
+# ============================================================================
+
+# Per-instrument fields kept from the scrip master, besides symbol and token
+INSTRUMENT_FIELDS = ("exchange", "lot_size", "tick_size", "expiry", "strike")
+MASTER_CHUNK_SIZE = 1 << 16
+_JSON_SEPARATORS = " \t\r\n,"
+
+def _is_url(source: str) -> bool:
+    return source.startswith(("http://", "https://"))
+
+def _master_chunks(source: str, chunk_size: int = MASTER_CHUNK_SIZE) -> Iterator[str]:
+    """Text chunks of a scrip master from a URL (streamed download) or a local file."""
+    if not _is_url(source):
+        with open(source, "r", encoding="utf-8") as f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+    with get_http_client().get(source, stream=True) as response:
+        response.raise_for_status()
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        for raw in response.iter_content(chunk_size):
+            yield decoder.decode(raw)
+        yield decoder.decode(b"", final=True)
+
+def iter_scrip_master(chunks: Iterable[str]) -> Iterator[dict]:
+    """
+    Entries of a scrip master JSON array, decoded one object at a time from
+    text chunks; only the current chunk and a partial object are held.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    pos = 0
+    opened = False
+    for chunk in chunks:
+        buffer = buffer[pos:] + chunk
+        pos = 0
+        end = len(buffer)
+        while True:
+            while pos < end and buffer[pos] in _JSON_SEPARATORS:
+                pos += 1
+            if pos >= end:
+                break
+            if not opened:
+                if buffer[pos] != "[":
+                    raise ValueError("Scrip master is not a JSON array")
+                opened = True
+                pos += 1
+                continue
+            if buffer[pos] == "]":
+                return
+            try:
+                entry, pos = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                break  # Object continues in the next chunk
+            yield entry
+    if buffer[pos:].strip():
+        raise ValueError("Scrip master ended inside an entry")
+    if not opened:
+        raise ValueError("Scrip master is empty")
+    raise ValueError("Scrip master array is not closed")
+
+def _number(value) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+def build_instrument_index(entries: Iterable[dict]) -> 'SymbolIndex':
+    """
+    Compact SymbolIndex from scrip master entries (later duplicates of a
+    symbol win, as in the symbol map). Prices in the master are in paise.
+    """
+    intern = sys.intern
+    rows = {}
+    tokens = []
+    exchanges = []
+    lot_sizes = array("i")
+    tick_sizes = array("d")
+    expiries = []
+    strikes = array("d")
+    columns = (tokens, exchanges, lot_sizes, tick_sizes, expiries, strikes)
+    for entry in entries:
+        symbol = entry.get("symbol")
+        token = entry.get("token")
+        if not symbol or not token:
+            continue
+        strike = _number(entry.get("strike")) / 100.0
+        values = (str(token), intern(entry.get("exch_seg") or ""), int(_number(entry.get("lotsize"))),
+                  _number(entry.get("tick_size")) / 100.0, intern(entry.get("expiry") or ""),
+                  strike if strike > 0 else 0.0)
+        row = rows.get(symbol)
+        if row is None:
+            rows[symbol] = len(tokens)
+            for column, value in zip(columns, values):
+                column.append(value)
+        else:
+            for column, value in zip(columns, values):
+                column[row] = value
+    symbols = sorted(rows)
+    order = [rows[s] for s in symbols]
+    del rows
+    return SymbolIndex(symbols, [tokens[i] for i in order], columns={
+        "exchange": [exchanges[i] for i in order],
+        "lot_size": array("i", (lot_sizes[i] for i in order)),
+        "tick_size": array("d", (tick_sizes[i] for i in order)),
+        "expiry": [expiries[i] for i in order],
+        "strike": array("d", (strikes[i] for i in order)),
+    })
+
+# ============================================================================
+# In-memory symbol index
+# ============================================================================
+
+# Angel One derivative symbols: NIFTY28NOV2424000CE (option), NIFTY28NOV24FUT (future)
+_DERIVATIVE_SYMBOL = re.compile(
+    r'^(?P<underlying>.+?)(?P<expiry>\d{2}[A-Z]{3}\d{2})(?:(?P<strike>\d+(?:\.\d+)?)(?P<kind>CE|PE)|(?P<future>FUT))$')
+
+# Compact sidecar next to the JSON cache: header, NUL-joined symbols/tokens/
+# exchanges/expiries, then the raw lot size, tick size and strike arrays
+INDEX_FILE_SUFFIX = ".idx"
+_INDEX_MAGIC = b"MQSYMIX2"
+# magic, source mtime_ns, source size, symbol count, has columns, byte lengths of the four text blocks
+_INDEX_HEADER = struct.Struct("<8sqqq?qqqq")
+
+
+class SymbolIndex:
+    """
+    Read-only index over a symbol -> token cache.
+
+    symbols is sorted, so prefix queries are two bisects. Secondary indexes
+    (by underlying, expiry, strike, option type) are built on first use.
+    columns (INSTRUMENT_FIELDS, aligned with symbols) is present when the
+    cache came from a streaming refresh.
+    """
+
+    def __init__(self, symbols: List[str], tokens: List[str], signature: Tuple[int, int] = (0, 0),
+                 columns: Optional[dict] = None):
+        self.symbols = symbols                      # Sorted
+        self.tokens = dict(zip(symbols, tokens))
+        self.signature = signature                  # (mtime_ns, size) of the source file
+        self.columns = columns
+        self._secondary = None
+        self._secondary_lock = threading.Lock()
+
+    @classmethod
+    def from_mapping(cls, symbol_token_map: Dict[str, str], signature: Tuple[int, int] = (0, 0),
+                     columns: Optional[dict] = None) -> 'SymbolIndex':
+        """columns, if given, is aligned with the mapping's iteration order."""
+        symbols = list(symbol_token_map)
+        order = sorted(range(len(symbols)), key=symbols.__getitem__)
+        sorted_columns = None
+        if columns is not None:
+            sorted_columns = {
+                "exchange": [columns["exchange"][i] for i in order],
+                "lot_size": array("i", (int(columns["lot_size"][i]) for i in order)),
+                "tick_size": array("d", (columns["tick_size"][i] for i in order)),
+                "expiry": [columns["expiry"][i] for i in order],
+                "strike": array("d", (columns["strike"][i] for i in order)),
+            }
+        symbols = [symbols[i] for i in order]
+        return cls(symbols, [str(symbol_token_map[s]) for s in symbols], signature, sorted_columns)
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self.tokens
+
+    def token(self, symbol: str) -> str:
+        """Token for symbol, or "" if unknown."""
+        return self.tokens.get(symbol, "")
+
+    def details(self, symbol: str) -> Optional[dict]:
+        """
+        Scrip master fields of symbol: exchange, lot_size, tick_size (rupees),
+        expiry ('28NOV2024', None if not a derivative) and strike (rupees, None
+        if not an option). None if unknown or the cache has no columns.
+        """
+        if self.columns is None or symbol not in self.tokens:
+            return None
+        i = bisect.bisect_left(self.symbols, symbol)
+        columns = self.columns
+        return {
+            "exchange": columns["exchange"][i],
+            "lot_size": columns["lot_size"][i],
+            "tick_size": columns["tick_size"][i],
+            "expiry": columns["expiry"][i] or None,
+            "strike": columns["strike"][i] or None,
+        }
+
+    def prefix(self, prefix: str, limit: Optional[int] = None) -> List[str]:
+        """Sorted symbols starting with prefix (autocomplete)."""
+        start = bisect.bisect_left(self.symbols, prefix)
+        end = bisect.bisect_left(self.symbols, prefix + "\uffff", lo=start)
+        if limit is not None:
+            end = min(end, start + limit)
+        return self.symbols[start:end]
+
+    def search(self, text: str, limit: Optional[int] = None) -> Tuple[List[str], int]:
+        """Sorted symbols containing text (at most limit) and the total number of matches."""
+        matches = [s for s in self.symbols if text in s]
+        return (matches if limit is None else matches[:limit]), len(matches)
+
+    def derivatives(self, underlying: str = None, expiry: date = None, strike: float = None,
+                    option_type: str = None) -> List[str]:
+        """Sorted symbols matching every given field; option_type is 'CE', 'PE' or 'FUT'."""
+        by_underlying, by_expiry, by_strike, by_type = self._secondary_indexes()
+        candidates = None
+        for index, key in ((by_underlying, underlying), (by_expiry, expiry), (by_strike, strike),
+                           (by_type, option_type)):
+            if key is None:
+                continue
+            matches = index.get(key, ())
+            candidates = set(matches) if candidates is None else candidates.intersection(matches)
+            if not candidates:
+                return []
+        if candidates is None:
+            return [s for s in self.symbols if _DERIVATIVE_SYMBOL.match(s)]
+        return sorted(candidates)
+
+    def expiries(self, underlying: str) -> List[date]:
+        """Sorted expiry dates listed for an underlying."""
+        by_underlying, _, _, _ = self._secondary_indexes()
+        return sorted({parse_derivative_symbol(s)['expiry'] for s in by_underlying.get(underlying, ())})
+
+    def _secondary_indexes(self):
+        if self._secondary is None:
+            with self._secondary_lock:
+                if self._secondary is None:
+                    indexes = ({}, {}, {}, {})
+                    for symbol in self.symbols:
+                        fields = parse_derivative_symbol(symbol)
+                        if fields is None:
+                            continue
+                        for index, key in zip(indexes, (fields['underlying'], fields['expiry'],
+                                                        fields['strike'], fields['option_type'])):
+                            if key is not None:
+                                index.setdefault(key, []).append(symbol)
+                    self._secondary = indexes
+        return self._secondary
+
+
+def parse_derivative_symbol(symbol: str) -> Optional[dict]:
+    """
+    Fields of an Angel One option/future symbol, or None for other instruments.
+    {'underlying': 'NIFTY', 'expiry': date(2024, 11, 28), 'strike': 24000.0, 'option_type': 'CE'}
+    (strike is None and option_type 'FUT' for futures)
+    """
+    match = _DERIVATIVE_SYMBOL.match(symbol)
+    if match is None:
+        return None
+    try:
+        expiry = datetime.strptime(match.group('expiry'), "%d%b%y").date()
+    except ValueError:
+        return None
+    if match.group('future'):
+        return {'underlying': match.group('underlying'), 'expiry': expiry, 'strike': None, 'option_type': 'FUT'}
+    return {'underlying': match.group('underlying'), 'expiry': expiry,
+            'strike': float(match.group('strike')), 'option_type': match.group('kind')}
+
+
+def _file_signature(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def save_symbol_index(index: SymbolIndex, index_path: str):
+    """Write the compact binary form of an index (read back by load_symbol_index_file)."""
+    columns = index.columns
+    blocks = [
+        "\0".join(index.symbols).encode("utf-8"),
+        "\0".join(index.tokens[s] for s in index.symbols).encode("utf-8"),
+        "\0".join(columns["exchange"]).encode("utf-8") if columns else b"",
+        "\0".join(columns["expiry"]).encode("utf-8") if columns else b"",
+    ]
+    header = _INDEX_HEADER.pack(_INDEX_MAGIC, index.signature[0], index.signature[1], len(index.symbols),
+                                columns is not None, *(len(block) for block in blocks))
+    tmp_path = index_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        for block in blocks:
+            f.write(block)
+        if columns is not None:
+            for field, typecode in (("lot_size", "i"), ("tick_size", "d"), ("strike", "d")):
+                f.write(array(typecode, columns[field]).tobytes())
+    os.replace(tmp_path, index_path)
+
+
+def load_symbol_index_file(index_path: str, signature: Tuple[int, int]) -> Optional[SymbolIndex]:
+    """Index persisted for a source file with this signature, or None if missing/stale/corrupt."""
+    try:
+        with open(index_path, "rb") as f:
+            blob = f.read()
+        magic, mtime_ns, size, count, has_columns, *lengths = _INDEX_HEADER.unpack_from(blob)
+        if magic != _INDEX_MAGIC or (mtime_ns, size) != tuple(signature):
+            return None
+        offset = _INDEX_HEADER.size
+        texts = []
+        for length in lengths:
+            texts.append(blob[offset:offset + length].decode("utf-8").split("\0") if count else [])
+            offset += length
+        symbols, tokens, exchanges, expiries = texts
+        columns = None
+        if has_columns:
+            columns = {"exchange": exchanges, "expiry": expiries}
+            for field, typecode in (("lot_size", "i"), ("tick_size", "d"), ("strike", "d")):
+                values = array(typecode)
+                values.frombytes(blob[offset:offset + values.itemsize * count])
+                offset += values.itemsize * count
+                columns[field] = values
+    except (OSError, struct.error, UnicodeDecodeError, ValueError):
+        return None
+    if len(symbols) != count or len(tokens) != count:
+        return None
+    if columns is not None and any(len(columns[field]) != count for field in INSTRUMENT_FIELDS):
+        return None
+    return SymbolIndex(symbols, tokens, tuple(signature), columns)
+
+
+_symbol_indexes: Dict[str, SymbolIndex] = {}
+_symbol_index_lock = threading.Lock()
+
+
+def get_symbol_index(path: str = DEFAULT_CACHE_PATH, persist: bool = False) -> SymbolIndex:
+    """
+    Process-wide index of a symbol cache file.
+
+    Rebuilt only when the file's (mtime_ns, size) changes. With persist=True
+    the index is also kept in a binary sidecar (path + ".idx") so a new
+    process skips the JSON parse and sort.
+    """
+    abs_path = os.path.abspath(path)
+    signature = _file_signature(abs_path)
+    with _symbol_index_lock:
+        index = _symbol_indexes.get(abs_path)
+        if index is not None and index.signature == signature:
+            return index
+        if signature is not None and persist:
+            index = load_symbol_index_file(abs_path + INDEX_FILE_SUFFIX, signature)
+        else:
+            index = None
+        if index is None:
+            symbol_token_map, columns = load_instrument_cache(path)  # Fetches the master if the file is missing
+            signature = _file_signature(abs_path)
+            index = SymbolIndex.from_mapping(symbol_token_map, signature or (0, 0), columns)
+            if signature is None:
+                return index  # Nothing on disk to validate against; don't cache
+            if persist:
+                try:
+                    save_symbol_index(index, abs_path + INDEX_FILE_SUFFIX)
+                except OSError as e:
+                    print(f"Could not persist symbol index: {e}")
+        _symbol_indexes[abs_path] = index
+    return index
+
+
+def clear_symbol_index():
+    """Drop all in-memory symbol indexes (sidecar files are left in place)."""
+    with _symbol_index_lock:
+        _symbol_indexes.clear()
+
+
 def get_token_for_symbol(symbol: str, path: str = DEFAULT_CACHE_PATH) -> str:
     """Get token for a specific symbol."""
     try:
-        symbols = load_symbol_cache(path)
-        return symbols.get(symbol, "")
+        return get_symbol_index(path).token(symbol)
     except:
         return ""
 
 def get_symbols_list(path: str = DEFAULT_CACHE_PATH) -> list:
     """Get sorted list of all symbols."""
     try:
-        symbols = load_symbol_cache(path)
-        return sorted(symbols.keys())
+        return list(get_symbol_index(path).symbols)
     except:
         return []
 
@@ -158,13 +559,14 @@ if __name__ == "__main__":
 def get_symbol_details(symbol: str, path: str = DEFAULT_CACHE_PATH) -> dict:
     """
     Retrieve a single symbol's details from cache (angelalgo windsurf style).
-    Returns simple format: {"token": "99926000", "symbol": "NIFTY"}
+    Returns simple format: {"token": "99926000", "symbol": "NIFTY"}, plus
+    exchange/lot_size/tick_size/expiry/strike when the cache has them.
     """
-    symbols = load_symbol_cache(path)
-    token = symbols.get(symbol, "")
+    index = get_symbol_index(path)
+    token = index.token(symbol)
     
     if token:
-        return {"token": token, "symbol": symbol}
+        return {"token": token, "symbol": symbol, **(index.details(symbol) or {})}
     else:
         return {}
 
@@ -173,10 +575,9 @@ def is_simple_format(path: str = DEFAULT_CACHE_PATH) -> bool:
     Check if the cache uses simple format (symbol -> token) - angelalgo windsurf style.
     """
     try:
-        symbols = load_symbol_cache(path)
-        if symbols:
-            first_value = next(iter(symbols.values()))
-            return isinstance(first_value, str)
+        index = get_symbol_index(path)
+        if index.symbols:
+            return isinstance(index.tokens[index.symbols[0]], str)
         return True  # Default to simple format
     except:
         return True
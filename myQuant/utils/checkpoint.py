@@ -0,0 +1,155 @@
+"""
+utils/checkpoint.py - Checkpoint/resume support for long-running jobs
+
+Used by:
+- BacktestRunner._run_backtest_logic (data cursor + strategy + PositionManager)
+- LiveTrader file simulation loops (simulator cursor + strategy + PositionManager)
+- MatrixTestRunner (completed-result set)
+
+Design:
+- One checkpoint file per save: <run_key>_<seq>.ckpt (pickle, written atomically)
+- run_key = hash of (job kind, data file identity, config) so a checkpoint is
+  never resumed against different data or parameters
+- Only the newest `keep_last` checkpoints are retained
+- Engine objects expose get_checkpoint_state()/restore_checkpoint_state();
+  capture_state()/restore_state() snapshot plain attributes and skip
+  config-bound members (frozen config, accessors, loggers, modules)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+from pathlib import Path
+from types import MappingProxyType, ModuleType
+from typing import Any, Dict, Iterable, Optional
+
+from .config_helper import ConfigAccessor, unfreeze_config
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_VERSION = 1
+
+# Attributes that are rebuilt from the frozen config on construction and must not be pickled
+_NON_STATE_ATTRIBUTES = frozenset({
+    'config', 'config_accessor', 'perf_logger', 'error_handler', 'indicators',
+    'instrumentor', 'strategy_callback', 'tracer',
+})
+
+
+def make_run_key(kind: str, data_path: Optional[str], config: Any = None,
+                 extra: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Build a stable key identifying a resumable job.
+
+    The 'checkpoint' config section is excluded so that toggling resume does
+    not orphan existing checkpoints.
+    """
+    payload: Dict[str, Any] = {'kind': kind, 'version': CHECKPOINT_VERSION}
+    if data_path:
+        path = Path(data_path)
+        payload['data_path'] = str(path.resolve())
+        if path.exists():
+            stat = path.stat()
+            payload['data_size'] = stat.st_size
+            payload['data_mtime'] = int(stat.st_mtime)
+    if config is not None:
+        payload['config'] = {k: v for k, v in unfreeze_config(config).items() if k != 'checkpoint'}
+    if extra:
+        payload['extra'] = unfreeze_config(extra)
+    digest = hashlib.sha1(json.dumps(payload, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+    return f"{kind}_{digest[:16]}"
+
+
+def capture_state(obj: Any, exclude: Iterable[str] = ()) -> Dict[str, Any]:
+    """Snapshot instance attributes, skipping config-bound members and modules."""
+    skip = _NON_STATE_ATTRIBUTES.union(exclude)
+    state = {}
+    for name, value in vars(obj).items():
+        if name in skip or isinstance(value, (MappingProxyType, ModuleType)) or callable(value):
+            continue
+        state[name] = value
+    return state
+
+
+def restore_state(obj: Any, state: Dict[str, Any]):
+    """Restore attributes captured by capture_state()."""
+    for name, value in state.items():
+        setattr(obj, name, value)
+
+
+class CheckpointManager:
+    """
+    Atomic, rotating checkpoint files for one job.
+
+    Example:
+        >>> manager = CheckpointManager('checkpoints', make_run_key('backtest', path, config))
+        >>> manager.save({'cursor': 1000, 'strategy': strategy.get_checkpoint_state()})
+        >>> state = manager.load_latest()
+    """
+
+    def __init__(self, directory: str, run_key: str, keep_last: int = 2):
+        if keep_last < 1:
+            raise ValueError(f"keep_last must be >= 1, got {keep_last}")
+        self.directory = Path(directory)
+        self.run_key = run_key
+        self.keep_last = keep_last
+        self.directory.mkdir(parents=True, exist_ok=True)
+        existing = self._existing()
+        self._seq = self._seq_of(existing[-1]) if existing else 0
+
+    @classmethod
+    def from_config(cls, config: MappingProxyType, run_key: str) -> "CheckpointManager":
+        """Build from the 'checkpoint' section of a frozen config."""
+        accessor = ConfigAccessor(config)
+        return cls(accessor.get_checkpoint_param('directory'), run_key,
+                   accessor.get_checkpoint_param('keep_last'))
+
+    def _existing(self):
+        return sorted(self.directory.glob(f"{self.run_key}_*.ckpt"), key=self._seq_of)
+
+    @staticmethod
+    def _seq_of(path: Path) -> int:
+        return int(path.stem.rsplit('_', 1)[1])
+
+    @property
+    def latest_path(self) -> Optional[Path]:
+        existing = self._existing()
+        return existing[-1] if existing else None
+
+    def save(self, state: Dict[str, Any]) -> Path:
+        """Write a new checkpoint atomically and prune old ones."""
+        self._seq += 1
+        path = self.directory / f"{self.run_key}_{self._seq:06d}.ckpt"
+        tmp_path = path.with_suffix('.tmp')
+        payload = {'version': CHECKPOINT_VERSION, 'run_key': self.run_key, 'state': state}
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+        for old in self._existing()[:-self.keep_last]:
+            try:
+                old.unlink()
+            except OSError as e:
+                logger.warning(f"Could not remove old checkpoint {old}: {e}")
+        logger.debug(f"Checkpoint saved: {path}")
+        return path
+
+    def load_latest(self) -> Optional[Dict[str, Any]]:
+        """Return the newest checkpoint state, or None if there is none."""
+        path = self.latest_path
+        if path is None:
+            return None
+        with open(path, 'rb') as f:
+            payload = pickle.load(f)
+        if payload.get('version') != CHECKPOINT_VERSION or payload.get('run_key') != self.run_key:
+            raise ValueError(f"Checkpoint {path} is incompatible with this run (key/version mismatch)")
+        logger.info(f"Resuming from checkpoint: {path}")
+        return payload['state']
+
+    def clear(self):
+        """Remove all checkpoints for this job (called after successful completion)."""
+        for path in self._existing():
+            path.unlink()
@@ -70,6 +70,14 @@ def freeze_config(cfg: Dict[str, Any]) -> MappingProxyType:
         pass
     return MappingProxyType(deepcopy(cfg))
 
+def unfreeze_config(cfg: Any) -> Any:
+    """Plain dict/list copy of a frozen config (MappingProxyType trees), e.g. to merge or hash it."""
+    if isinstance(cfg, (MappingProxyType, dict)):
+        return {k: unfreeze_config(v) for k, v in cfg.items()}
+    if isinstance(cfg, (list, tuple)):
+        return [unfreeze_config(v) for v in cfg]
+    return cfg
+
 class ConfigAccessor:
     """Strict accessor to read from frozen MappingProxyType; raises on missing keys."""
     def __init__(self, frozen_cfg: MappingProxyType):
@@ -123,6 +131,10 @@ class ConfigAccessor:
         """Get value from the 'backtest' section (convenience for backtest callers)."""
         return self._section_get("backtest", param, default)
 
+    def get_checkpoint_param(self, param: str, default=MISSING):
+        """Get value from the 'checkpoint' section (checkpoint/resume for long runs)."""
+        return self._section_get("checkpoint", param, default)
+
     def get_current_instrument_param(self, param_name: str, default=MISSING):
         """
         Get instrument parameter for currently selected instrument from instrument_mappings (SSOT).
@@ -0,0 +1,98 @@
+"""
+utils/http_client.py
+
+Process-wide pooled HTTP client for SmartAPI REST calls and the scrip master
+download.
+
+CRITICAL PRINCIPLES:
+- One requests.Session per process: keep-alive connections are reused, so
+  repeated calls skip the TCP/TLS handshake
+- Every request has a (connect, read) timeout unless the caller passes one
+- Idempotent requests (GET/HEAD) are retried on connection errors and
+  429/5xx with exponential backoff; the last response is returned, not raised
+
+CONFIG (defaults.py 'http'):
+    connect_timeout_seconds, read_timeout_seconds, retries, backoff_factor,
+    pool_maxsize
+"""
+
+import logging
+import threading
+from typing import Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from ..config.defaults import DEFAULT_CONFIG
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+RETRY_METHODS = frozenset({"GET", "HEAD"})
+
+
+class HttpClient:
+    """requests.Session with a keep-alive pool, default timeouts and retry/backoff."""
+
+    def __init__(self, connect_timeout: float, read_timeout: float, retries: int, backoff_factor: float,
+                 pool_maxsize: int):
+        if connect_timeout <= 0 or read_timeout <= 0:
+            raise ValueError(f"HTTP timeouts must be positive, got ({connect_timeout}, {read_timeout})")
+        if retries < 0:
+            raise ValueError(f"HTTP retries must be >= 0, got {retries}")
+        if pool_maxsize < 1:
+            raise ValueError(f"HTTP pool size must be positive, got {pool_maxsize}")
+        self.params = (connect_timeout, read_timeout, retries, backoff_factor, pool_maxsize)
+        self.timeout = (connect_timeout, read_timeout)
+        retry = Retry(total=retries, connect=retries, read=retries, status=retries, backoff_factor=backoff_factor,
+                      status_forcelist=RETRY_STATUSES, allowed_methods=RETRY_METHODS, raise_on_status=False)
+        adapter = HTTPAdapter(pool_maxsize=pool_maxsize, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    @classmethod
+    def from_config(cls, config) -> 'HttpClient':
+        return cls(*_config_params(config))
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        kwargs.setdefault("timeout", self.timeout)
+        return self.session.get(url, **kwargs)
+
+    def close(self):
+        self.session.close()
+
+
+def _config_params(config) -> Tuple[float, float, int, float, int]:
+    params = config['http']
+    return (params['connect_timeout_seconds'], params['read_timeout_seconds'], params['retries'],
+            params['backoff_factor'], params['pool_maxsize'])
+
+
+_client: Optional[HttpClient] = None
+_client_lock = threading.Lock()
+
+
+def get_http_client(config=None) -> HttpClient:
+    """
+    The shared client, created from config['http'] (DEFAULT_CONFIG if None).
+    Passing a config whose 'http' section differs replaces the client.
+    """
+    global _client
+    with _client_lock:
+        if _client is None or (config is not None and _config_params(config) != _client.params):
+            if _client is not None:
+                logger.info("HTTP client settings changed, reopening connection pool")
+                _client.close()
+            _client = HttpClient.from_config(config if config is not None else DEFAULT_CONFIG)
+        return _client
+
+
+def close_http_client():
+    """Close pooled connections; the next get_http_client() starts a new pool."""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
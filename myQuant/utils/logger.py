@@ -42,14 +42,17 @@ utils/logger.py - Single high-performanc        # File handler - STRICT CONFIG A
 - Hot-loop helpers: increment_tick_counter, get_tick_counter, should_log_tick
 - HighPerfLogger: lazy formatting + rate-limited tick_debug, guaranteed INFO for signals/trades
 - Optional JSON event stream for reproducible backtest analysis
+- TraceBuffer: typed per-tick trace events in a preallocated ring buffer,
+  formatted only when flushed to a sink; disabled sites cost one attribute check
 """
 from types import MappingProxyType
+from array import array
 import logging
 import logging.handlers
 import os
 import json
 import threading
-from typing import Optional, Any, Mapping
+from typing import Optional, Any, Mapping, Callable, Iterator, List, Tuple
 
 _config_lock = threading.RLock()
 _setup_done = False
@@ -113,6 +116,10 @@ def setup_from_config(frozen_cfg: MappingProxyType) -> logging.Logger:
             eh.setLevel(logging.INFO)
             root.addHandler(eh)
 
+        # Structured tracing - STRICT CONFIG ACCESS
+        configure_tracer(bool(log_cfg['trace_enabled']), int(log_cfg['trace_buffer_size']),
+                         bool(log_cfg['trace_to_log']))
+
         # per-component overrides
         for name, lvl in (log_cfg.get('log_level_overrides') or {}).items():
             try:
@@ -179,17 +186,18 @@ class HighPerfLogger:
             # defensive: never raise from hot-loop logging
             pass
 
-    def entry_blocked(self, reason: str, summary_every: int = 300):
+    def entry_blocked(self, reason, summary_every: int = 300):
         """
         Log when entry is blocked (rate-limited to avoid spam).
         Default: log every 300 blocks (~30 seconds at 10 ticks/sec).
+        `reason` may be a zero-arg callable; it is only evaluated when a message is emitted.
         """
         self._entry_block_count += 1
         # Log first block, then every 300 blocks
         if self._entry_block_count == 1 or (self._entry_block_count % summary_every) == 0:
-            self.logger.info(f"🚫 ENTRY BLOCKED (#{self._entry_block_count}): {reason}")
+            self.logger.info(f"🚫 ENTRY BLOCKED (#{self._entry_block_count}): {reason() if callable(reason) else reason}")
         elif self.logger.isEnabledFor(logging.DEBUG):
-            self.logger.debug(f"Entry blocked #{self._entry_block_count}: {reason}")
+            self.logger.debug(f"Entry blocked #{self._entry_block_count}: {reason() if callable(reason) else reason}")
 
     def signal_generated(self, signal_type: str, price: float, reason: str = "", run_id: Optional[str] = None):
         self.logger.info(f"SIGNAL {signal_type} @ {price:.2f}: {reason}")
@@ -209,8 +217,10 @@ class HighPerfLogger:
             except Exception:
                 pass
 
-    def session_start(self, session_info: str):
-        self.logger.info(f"SESSION START: {session_info}")
+    def session_start(self, session_info):
+        """`session_info` may be a zero-arg callable; it is only evaluated when INFO is enabled."""
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"SESSION START: {session_info() if callable(session_info) else session_info}")
 
     def session_end(self, session_summary: str):
         self.logger.info(f"SESSION END: {session_summary}")
@@ -220,3 +230,169 @@ def format_tick_message(tick_num: int, price: float, volume: Optional[int] = Non
     if volume is not None:
         return f"Tick {tick_num}: {price:.2f} vol={volume}"
     return f"Tick {tick_num}: {price:.2f}"
+
+# ---------------------------------------------------------------------------
+# Structured tracing
+# ---------------------------------------------------------------------------
+# Hot loops record typed events (event code + up to 4 numeric fields) instead of
+# formatting strings. Call sites guard on the enabled flag so a disabled site is
+# a single attribute check:
+#
+#     tracer = get_tracer()
+#     if tracer.enabled:
+#         tracer.record(TRACE_GREEN_TICK, prev_price, price, min_movement, count)
+#
+# Messages are formatted only when events are flushed to an attached sink.
+
+TRACE_TICK = 1              # tick_num, price, volume
+TRACE_FIRST_TICK = 2        # price
+TRACE_GREEN_TICK = 3        # prev_price, price, min_movement, green_count
+TRACE_RED_TICK = 4          # prev_price, price, min_movement
+TRACE_NOISE_TICK = 5        # prev_price, price, min_movement, green_count
+TRACE_ENTRY_BLOCKED = 6     # price, blocking_reasons, green_count
+TRACE_ENTRY_REJECTED = 7    # price, failed_checks, enabled_checks
+TRACE_SIGNAL_CHECK = 8      # price, conditions_passed, conditions_total, can_enter
+TRACE_SESSION_EXIT = 9      # reason (1 = outside session, 2 = after buffer end)
+TRACE_SIGNAL = 10           # price
+TRACE_TRADE = 11            # price, quantity
+TRACE_STRATEGY_EXIT = 12    # price
+TRACE_MISSING_PRICE = 13    # (no fields)
+
+TRACE_FORMATS = {
+    TRACE_TICK: ("tick", "Tick {0:.0f}: {1:.2f} vol={2:.0f}"),
+    TRACE_FIRST_TICK: ("first_tick", "First tick: price={0:.2f}, green_count=0"),
+    TRACE_GREEN_TICK: ("green_tick", "Green tick: {0:.2f} -> {1:.2f} (min move {2:.2f}), count={3:.0f}"),
+    TRACE_RED_TICK: ("red_tick", "Red tick: {0:.2f} -> {1:.2f} (min move {2:.2f}), count reset to 0"),
+    TRACE_NOISE_TICK: ("noise_tick", "Noise range tick: {0:.2f} -> {1:.2f} (min move {2:.2f}), count remains {3:.0f}"),
+    TRACE_ENTRY_BLOCKED: ("entry_blocked", "Entry blocked @ {0:.2f}: {1:.0f} gating reasons, green={2:.0f}"),
+    TRACE_ENTRY_REJECTED: ("entry_rejected", "Entry rejected @ {0:.2f}: {1:.0f}/{2:.0f} checks failed"),
+    TRACE_SIGNAL_CHECK: ("signal_check", "Signal check @ {0:.2f}: {1:.0f}/{2:.0f} conditions, can_enter={3:.0f}"),
+    TRACE_SESSION_EXIT: ("session_exit", "Should exit: reason={0:.0f} (1=outside session, 2=after buffer end)"),
+    TRACE_SIGNAL: ("signal", "Signal detected: price={0:.2f}"),
+    TRACE_TRADE: ("trade", "Trade executed: {1:.0f} @ {0:.2f}"),
+    TRACE_STRATEGY_EXIT: ("strategy_exit", "Strategy exit @ {0:.2f}"),
+    TRACE_MISSING_PRICE: ("missing_price", "Row without close price"),
+}
+
+_TRACE_FIELDS = 4
+
+TraceSink = Callable[[int, Tuple[float, ...], str], None]
+
+
+def format_trace_event(code: int, fields: Tuple[float, ...]) -> str:
+    """Format one trace event using TRACE_FORMATS."""
+    name, template = TRACE_FORMATS.get(code, (f"event_{code}", "fields={0}, {1}, {2}, {3}"))
+    return f"[{name}] {template.format(*fields)}"
+
+
+class TraceBuffer:
+    """
+    Preallocated ring buffer of typed trace events (single writer).
+
+    Storage is two flat arrays (event codes + 4 float fields per slot), so
+    recording allocates nothing. When the buffer wraps with sinks attached,
+    pending events are flushed first; without sinks the oldest are overwritten.
+    """
+
+    def __init__(self, capacity: int = 65536):
+        self.enabled = False
+        self._sinks: List[TraceSink] = []
+        self.resize(capacity)
+
+    def resize(self, capacity: int):
+        """Reallocate storage (discards recorded events)."""
+        if capacity < 1:
+            raise ValueError(f"Trace buffer capacity must be >= 1, got {capacity}")
+        self.capacity = capacity
+        self._codes = array('H', bytes(2 * capacity))
+        self._fields = array('d', bytes(8 * capacity * _TRACE_FIELDS))
+        self._count = 0      # Total events recorded
+        self._flushed = 0    # Total events delivered to sinks (or skipped)
+
+    def record(self, code: int, f0: float = 0.0, f1: float = 0.0, f2: float = 0.0, f3: float = 0.0):
+        """Store one event. Callers must check `enabled` first."""
+        slot = self._count % self.capacity
+        self._codes[slot] = code
+        base = slot * _TRACE_FIELDS
+        fields = self._fields
+        fields[base] = f0
+        fields[base + 1] = f1
+        fields[base + 2] = f2
+        fields[base + 3] = f3
+        self._count += 1
+        if self._sinks and self._count - self._flushed >= self.capacity:
+            self.flush()
+
+    def attach_sink(self, sink: TraceSink):
+        """Register sink(code, fields, message); it receives events on flush()."""
+        self._sinks.append(sink)
+
+    def detach_sinks(self):
+        self._sinks = []
+
+    @property
+    def recorded(self) -> int:
+        return self._count
+
+    @property
+    def dropped(self) -> int:
+        """Events overwritten before they could be flushed."""
+        return max(0, self._count - self.capacity - self._flushed)
+
+    def events(self) -> Iterator[Tuple[int, Tuple[float, ...]]]:
+        """Iterate retained events (oldest first) as (code, fields)."""
+        start = max(0, self._count - self.capacity)
+        for seq in range(start, self._count):
+            yield self._event_at(seq)
+
+    def _event_at(self, seq: int) -> Tuple[int, Tuple[float, ...]]:
+        slot = seq % self.capacity
+        base = slot * _TRACE_FIELDS
+        return self._codes[slot], tuple(self._fields[base:base + _TRACE_FIELDS])
+
+    def flush(self) -> int:
+        """Format pending events and deliver them to all sinks. Returns events delivered."""
+        start = max(self._flushed, self._count - self.capacity)
+        end = self._count
+        self._flushed = end
+        if not self._sinks:
+            return 0
+        for seq in range(start, end):
+            code, fields = self._event_at(seq)
+            message = format_trace_event(code, fields)
+            for sink in self._sinks:
+                try:
+                    sink(code, fields, message)
+                except Exception:
+                    pass  # Never raise from tracing
+        return end - start
+
+    def clear(self):
+        self._count = 0
+        self._flushed = 0
+
+
+_tracer = TraceBuffer()
+
+
+def get_tracer() -> TraceBuffer:
+    """Process-wide trace buffer used by strategies and runners."""
+    return _tracer
+
+
+def log_trace_sink(logger: logging.Logger, level: int = logging.DEBUG) -> TraceSink:
+    """Sink that writes formatted trace events to a stdlib logger."""
+    def _sink(code: int, fields: Tuple[float, ...], message: str):
+        logger.log(level, message)
+    return _sink
+
+
+def configure_tracer(enabled: bool, capacity: Optional[int] = None, log_to_logger: bool = False) -> TraceBuffer:
+    """Enable/disable the process-wide tracer, optionally resizing and attaching a log sink."""
+    if capacity is not None and capacity != _tracer.capacity:
+        _tracer.resize(capacity)
+    _tracer.detach_sinks()
+    if log_to_logger:
+        _tracer.attach_sink(log_trace_sink(logging.getLogger("myQuant.trace")))
+    _tracer.enabled = bool(enabled)
+    return _tracer
@@ -0,0 +1,175 @@
+"""
+utils/result_cache.py - Persistent, content-addressed cache of run results
+
+Used by:
+- MatrixTestRunner._run_single_test (per-combination metrics)
+- BacktestRunner.run (trade list, from which BacktestResults is rebuilt)
+
+Design:
+- key = sha256 of (run kind, canonical config, dataset content hash, ENGINE_VERSION)
+- Sections that cannot change results (logging, debug, checkpoint, result_cache)
+  and the data file path (replaced by its content hash) are excluded, so the same
+  parameters on the same data always hit, wherever the file lives
+- One pickle file per entry: <directory>/<key>.pkl, written atomically
+- Hits refresh the file mtime; when the directory exceeds max_size_mb the least
+  recently used entries are evicted
+- Bump ENGINE_VERSION whenever strategy, indicator or position logic changes
+  results, which invalidates every existing entry
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from .config_helper import unfreeze_config
+
+logger = logging.getLogger(__name__)
+
+ENGINE_VERSION = 1
+
+# Config sections that only affect logging/persistence, never results
+_NON_RESULT_SECTIONS = frozenset({'logging', 'debug', 'debug_production', 'checkpoint', 'result_cache',
+                                  'matrix_queue', 'tick_buffer', 'multi_symbol', 'http',
+                                  'gap_fill'})
+
+# Data file locations; the dataset is identified by content instead
+_DATA_PATH_KEYS = (('data_simulation', 'file_path'), ('backtest', 'data_path'))
+
+# (absolute path, size, mtime_ns) -> content hash, so each file is hashed once per process
+_fingerprints: Dict[Tuple[str, int, int], str] = {}
+
+
+def dataset_fingerprint(data_path: str) -> str:
+    """Content hash of a data file (memoized on path/size/mtime)."""
+    path = os.path.abspath(data_path)
+    stat = os.stat(path)
+    memo_key = (path, stat.st_size, stat.st_mtime_ns)
+    fingerprint = _fingerprints.get(memo_key)
+    if fingerprint is None:
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        fingerprint = digest.hexdigest()
+        _fingerprints[memo_key] = fingerprint
+    return fingerprint
+
+
+def make_cache_key(kind: str, config: Any, data_path: str) -> str:
+    """Stable key for a run of `kind` with `config` over the contents of `data_path`."""
+    plain = {k: v for k, v in unfreeze_config(config).items() if k not in _NON_RESULT_SECTIONS}
+    for section, key in _DATA_PATH_KEYS:
+        if isinstance(plain.get(section), dict):
+            plain[section].pop(key, None)
+    payload = {
+        'kind': kind,
+        'engine_version': ENGINE_VERSION,
+        'dataset': dataset_fingerprint(data_path),
+        'config': plain,
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+class ResultCache:
+    """
+    Directory of pickled results addressed by make_cache_key().
+
+    Example:
+        >>> cache = ResultCache.from_config(frozen_config)
+        >>> key = make_cache_key('backtest', frozen_config, data_path)
+        >>> result = cache.get(key)
+        >>> if result is None:
+        ...     result = run()
+        ...     cache.put(key, result)
+    """
+
+    def __init__(self, directory: str, max_size_mb: float):
+        if max_size_mb <= 0:
+            raise ValueError(f"max_size_mb must be > 0, got {max_size_mb}")
+        self.directory = Path(directory)
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    @classmethod
+    def from_config(cls, config: Any) -> Optional["ResultCache"]:
+        """Build from the 'result_cache' config section; None when caching is disabled."""
+        section = config['result_cache']
+        if not section['enabled']:
+            return None
+        return cls(section['directory'], section['max_size_mb'])
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.pkl"
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for `key`, or None on a miss."""
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                payload = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, pickle.UnpicklingError, EOFError) as e:
+            logger.warning(f"Discarding unreadable cache entry {path}: {e}")
+            self._remove(path)
+            return None
+        if payload.get('engine_version') != ENGINE_VERSION:
+            self._remove(path)
+            return None
+        try:
+            os.utime(path)  # LRU recency
+        except OSError:
+            pass
+        logger.debug(f"Result cache hit: {key[:16]}")
+        return payload['value']
+
+    def put(self, key: str, value: Any):
+        """Store `value` atomically, then evict least recently used entries over the size limit."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump({'engine_version': ENGINE_VERSION, 'value': value}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self._path(key))
+        self._evict()
+
+    def size_bytes(self) -> int:
+        """Total size of all cache entries."""
+        return sum(entry[1] for entry in self._entries())
+
+    def clear(self):
+        """Remove every cache entry."""
+        for path, _, _ in self._entries():
+            self._remove(path)
+
+    def _entries(self):
+        entries = []
+        for path in self.directory.glob('*.pkl'):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue  # Evicted concurrently by another process
+            entries.append((path, stat.st_size, stat.st_mtime_ns))
+        return entries
+
+    def _evict(self):
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_size_bytes:
+            return
+        for path, size, _ in sorted(entries, key=lambda entry: entry[2]):
+            self._remove(path)
+            total -= size
+            if total <= self.max_size_bytes:
+                break
+        logger.debug(f"Result cache evicted to {total / 1e6:.1f} MB")
+
+    @staticmethod
+    def _remove(path: Path):
+        try:
+            path.unlink()
+        except OSError:
+            pass
@@ -0,0 +1,127 @@
+"""
+SmartAPI Binary Frame Decoding Benchmark
+
+Compares, per Quote frame:
+- Current path: SmartWebSocketV2._parse_binary_data (per-field slicing into a
+  dict) followed by WebSocketTickStreamer._on_data building the tick
+- Direct path: WebSocketTickStreamer._on_frame (FrameDecoder, precompiled structs)
+
+Uses the installed smartapi-python parser when available; otherwise a
+stand-in that unpacks field by field the way the library does.
+
+Usage:
+    python scripts/benchmark_frame_decoder.py [--frames 100000] [--runs 5]
+"""
+
+import sys
+import argparse
+import struct
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from myQuant.live import websocket_stream
+from myQuant.live.smartapi_frames import QUOTE_FRAME_SIZE
+
+SUBSCRIPTION = [{'symbol': 'NIFTY25NOV24000CE', 'token': '43657', 'exchange': 'NFO'},
+                {'symbol': 'NIFTY25NOV24000PE', 'token': '43658', 'exchange': 'NFO'}]
+
+
+def build_quote_frame(token: str, ltp: int, quantity: int) -> bytes:
+    frame = bytearray(QUOTE_FRAME_SIZE)
+    struct.pack_into('<bb', frame, 0, 2, 2)
+    frame[2:2 + len(token)] = token.encode()
+    struct.pack_into('<qqqqqqddqqqq', frame, 27, 1, 1762142400000, ltp, quantity, ltp, 1000,
+                     1500.0, 2500.0, ltp, ltp, ltp, ltp)
+    return bytes(frame)
+
+
+def library_style_parse(data: bytes) -> dict:
+    """Field-by-field unpacking as in SmartWebSocketV2._parse_binary_data (Quote fields)."""
+    def unpack(start, end, fmt='q'):
+        return struct.unpack('<' + fmt, data[start:end])[0]
+
+    token = ''
+    for byte in data[2:27]:
+        if byte == 0:
+            break
+        token += chr(byte)
+    parsed = {
+        'subscription_mode': unpack(0, 1, 'B'),
+        'exchange_type': unpack(1, 2, 'B'),
+        'token': token,
+        'sequence_number': unpack(27, 35),
+        'exchange_timestamp': unpack(35, 43),
+        'last_traded_price': unpack(43, 51),
+        'subscription_mode_val': 'QUOTE',
+    }
+    if parsed['subscription_mode'] in (2, 3):
+        parsed['last_traded_quantity'] = unpack(51, 59)
+        parsed['average_traded_price'] = unpack(59, 67)
+        parsed['volume_trade_for_the_day'] = unpack(67, 75)
+        parsed['total_buy_quantity'] = unpack(75, 83, 'd')
+        parsed['total_sell_quantity'] = unpack(83, 91, 'd')
+        parsed['open_price_of_the_day'] = unpack(91, 99)
+        parsed['high_price_of_the_day'] = unpack(99, 107)
+        parsed['low_price_of_the_day'] = unpack(107, 115)
+        parsed['closed_price'] = unpack(115, 123)
+    return parsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark SmartAPI binary frame decoding")
+    parser.add_argument('--frames', type=int, default=100000)
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    try:
+        from SmartApi.smartWebSocketV2 import SmartWebSocketV2
+        library = SmartWebSocketV2.__new__(SmartWebSocketV2)
+        parse = library._parse_binary_data
+        parser_name = "SmartWebSocketV2._parse_binary_data"
+    except ImportError:
+        parse = library_style_parse
+        parser_name = "library-style stand-in (smartapi-python not installed)"
+
+    class _NoConnection:
+        def __init__(self, **kwargs):
+            pass
+
+    if websocket_stream.SmartWebSocketV2 is None:
+        websocket_stream.SmartWebSocketV2 = _NoConnection  # Constructor check only; nothing connects
+    streamer = websocket_stream.WebSocketTickStreamer('key', 'client', 'feed', SUBSCRIPTION,
+                                                      on_tick=lambda tick, symbol: None)
+    frames = [build_quote_frame(SUBSCRIPTION[i % 2]['token'], 12000 + i % 500, 75) for i in range(args.frames)]
+
+    def current_path():
+        for frame in frames:
+            streamer._on_data(None, parse(frame))
+
+    def direct_path():
+        for frame in frames:
+            streamer._on_frame(None, frame, 2, True)
+
+    results = {}
+    for name, fn in (('current', current_path), ('direct', direct_path)):
+        best = float('inf')
+        for _ in range(args.runs):
+            started = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - started)
+        results[name] = best / args.frames * 1e6
+
+    print("=" * 80)
+    print("SMARTAPI FRAME DECODING BENCHMARK")
+    print("=" * 80)
+    print(f"Frames: {args.frames} Quote frames, best of {args.runs} runs")
+    print(f"Parser: {parser_name}")
+    print(f"Current path (parse + _on_data): {results['current']:8.2f} us/frame")
+    print(f"Direct path (_on_frame):         {results['direct']:8.2f} us/frame")
+    print(f"Speed-up: {results['current'] / results['direct']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+"""
+Test: Checkpoint/Resume
+Verifies CheckpointManager file handling, that an interrupted tick loop
+restored from a checkpoint produces the same trades as an uninterrupted run,
+and that the BacktestRunner row loop checkpoints and resumes.
+"""
+import sys
+import os
+import tempfile
+from datetime import datetime, timedelta
+from copy import deepcopy
+import logging
+
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '.')))
+
+from myQuant.config.defaults import DEFAULT_CONFIG
+from myQuant.utils.config_helper import freeze_config
+from myQuant.utils.time_utils import IST
+from myQuant.utils.checkpoint import CheckpointManager, make_run_key
+from myQuant.core.liveStrategy import ModularIntradayStrategy
+from myQuant.core.position_manager import PositionManager
+from myQuant.backtest.backtest_runner import BacktestRunner
+
+logging.disable(logging.CRITICAL)
+
+print("=" * 80)
+print("CHECKPOINT / RESUME TESTS")
+print("=" * 80)
+
+
+def make_ticks(seed, n=6000, start=datetime(2025, 11, 3, 9, 30, 0)):
+    rng = np.random.default_rng(seed)
+    prices = np.round((120 + np.cumsum(rng.normal(0, 0.35, n))) / 0.05) * 0.05
+    return [{'timestamp': IST.localize(start + timedelta(seconds=3 * i)),
+             'price': float(p), 'volume': int(v)}
+            for i, (p, v) in enumerate(zip(prices, rng.integers(1, 5000, n)))]
+
+
+def new_engine(frozen_config):
+    strategy = ModularIntradayStrategy(frozen_config)
+    pm = PositionManager(frozen_config, strategy_callback=strategy.on_position_exit)
+    return strategy, pm
+
+
+def run_ticks(strategy, pm, ticks, start, stop, active=None):
+    """LiveTrader polling order over ticks[start:stop]; returns active position id."""
+    for tick in ticks[start:stop]:
+        now = tick['timestamp']
+        should_exit, _ = strategy.should_exit_for_session(now)
+        if should_exit:
+            if active and active in pm.positions:
+                pm.close_position_full(active, tick['price'], now, "Session End")
+                strategy.on_position_closed(active, "Session End")
+            return None
+        signal = strategy.on_tick(tick)
+        if signal and signal.action == 'BUY' and not active:
+            active = strategy.open_long(pd.Series({'close': signal.price}), now, pm)
+        if active:
+            pm.process_positions({'close': tick['price']}, now)
+            if active not in pm.positions:
+                strategy.on_position_closed(active, "Risk Management")
+                active = None
+    return active
+
+
+def summarize(trades):
+    return [(t.entry_time, t.exit_time, t.entry_price, t.exit_price, t.quantity, t.exit_reason)
+            for t in trades]
+
+
+# Test 1: CheckpointManager rotation, reload and key isolation
+print("\n" + "=" * 80)
+print("TEST 1: CheckpointManager save/load/prune/clear")
+print("=" * 80)
+
+with tempfile.TemporaryDirectory() as tmp:
+    manager = CheckpointManager(tmp, 'job_a', keep_last=2)
+    assert manager.load_latest() is None, "Empty directory should have no checkpoint"
+    for cursor in (100, 200, 300):
+        manager.save({'cursor': cursor})
+    files = sorted(os.listdir(tmp))
+    assert len(files) == 2, f"Expected 2 retained checkpoints, found {files}"
+    assert CheckpointManager(tmp, 'job_a').load_latest() == {'cursor': 300}, "Latest checkpoint not loaded"
+    assert CheckpointManager(tmp, 'job_b').load_latest() is None, "Checkpoints leaked across run keys"
+    manager.clear()
+    assert not os.listdir(tmp), "clear() should remove all checkpoints"
+
+config_a = freeze_config(deepcopy(DEFAULT_CONFIG))
+changed = deepcopy(DEFAULT_CONFIG)
+changed['risk']['base_sl_points'] += 1
+toggled = deepcopy(DEFAULT_CONFIG)
+toggled['checkpoint']['resume'] = True
+assert make_run_key('backtest', None, config_a) != make_run_key('backtest', None, changed), \
+    "Parameter change must produce a new run key"
+assert make_run_key('backtest', None, config_a) == make_run_key('backtest', None, toggled), \
+    "Checkpoint settings must not affect the run key"
+print("✅ TEST 1 PASSED")
+
+# Test 2: Interrupted + resumed run matches uninterrupted run
+print("\n" + "=" * 80)
+print("TEST 2: Resume equivalence")
+print("=" * 80)
+
+config = deepcopy(DEFAULT_CONFIG)
+config['strategy']['use_macd'] = True
+config['risk']['max_positions_per_day'] = 8
+frozen = freeze_config(config)
+ticks = make_ticks(3)
+
+strategy, pm = new_engine(frozen)
+run_ticks(strategy, pm, ticks, 0, len(ticks))
+expected = summarize(pm.completed_trades)
+
+for cut in (1500, 3333, 5000):
+    with tempfile.TemporaryDirectory() as tmp:
+        strategy, pm = new_engine(frozen)
+        active = run_ticks(strategy, pm, ticks, 0, cut)
+        CheckpointManager(tmp, 'resume_test').save({
+            'cursor': cut,
+            'active_position_id': active,
+            'strategy': strategy.get_checkpoint_state(),
+            'position_manager': pm.get_checkpoint_state(),
+        })
+        del strategy, pm  # Simulate process exit
+
+        saved = CheckpointManager(tmp, 'resume_test').load_latest()
+        strategy, pm = new_engine(frozen)
+        strategy.restore_checkpoint_state(saved['strategy'])
+        pm.restore_checkpoint_state(saved['position_manager'])
+        run_ticks(strategy, pm, ticks, saved['cursor'], len(ticks), saved['active_position_id'])
+        actual = summarize(pm.completed_trades)
+    assert actual == expected, f"Resume at tick {cut} diverged: {len(expected)} vs {len(actual)} trades"
+    print(f"✓ Resumed at tick {cut}: {len(actual)} trades match")
+print("✅ TEST 2 PASSED")
+
+# Test 3: BacktestRunner row loop with checkpointing off and on
+print("\n" + "=" * 80)
+print("TEST 3: BacktestRunner._run_backtest_logic checkpoints and resumes")
+print("=" * 80)
+
+saved_cursors = []
+original_save, original_clear = CheckpointManager.save, CheckpointManager.clear
+
+
+def recording_save(self, state):
+    saved_cursors.append(state['cursor'])
+    return original_save(self, state)
+
+
+def run_backtest(csv_path, checkpoint_dir, **checkpoint):
+    """One backtest over csv_path, instrument settings filled from instrument_mappings as the GUI does."""
+    config = deepcopy(DEFAULT_CONFIG)
+    config['strategy']['use_macd'] = True
+    config['risk']['max_positions_per_day'] = 8
+    mapping = config['instrument_mappings'][config['instrument']['symbol']]
+    config['instrument']['lot_size'] = mapping['lot_size']
+    config['instrument']['tick_size'] = mapping['tick_size']
+    config['checkpoint'].update(interval_ticks=1000, directory=checkpoint_dir, **checkpoint)
+    runner = BacktestRunner(freeze_config(config), csv_path)
+    runner._prepare_data()
+    trades_df, _ = runner._run_backtest_logic()
+    return [tuple(trade) for trade in
+            trades_df[['entry_time', 'exit_time', 'entry_price', 'exit_price', 'exit_reason']].itertuples(index=False)]
+
+
+cwd = os.getcwd()
+CheckpointManager.save = recording_save
+with tempfile.TemporaryDirectory() as tmp:
+    os.chdir(tmp)  # The runner writes backtest_trades.csv to the working directory
+    try:
+        csv_path = os.path.join(tmp, 'ticks.csv')
+        pd.DataFrame([{'timestamp': t['timestamp'].strftime('%Y-%m-%d %H:%M:%S'), 'price': t['price'],
+                       'volume': t['volume']} for t in ticks]).to_csv(csv_path, index=False)
+        checkpoint_dir = os.path.join(tmp, 'checkpoints')
+
+        baseline = run_backtest(csv_path, checkpoint_dir, enabled=False)
+        assert baseline and saved_cursors == [], f"Checkpointing off must not save, saved at {saved_cursors}"
+
+        checkpointed = run_backtest(csv_path, checkpoint_dir, enabled=True)
+        assert checkpointed == baseline, "Checkpointing changed the backtest trades"
+        assert saved_cursors == [1000, 2000, 3000, 4000, 5000], f"Unexpected checkpoint cursors {saved_cursors}"
+        assert not os.listdir(checkpoint_dir), "A completed backtest should clear its checkpoints"
+
+        # Keep the checkpoints of an "interrupted" run, then resume from the latest one
+        CheckpointManager.clear = lambda self: None
+        try:
+            run_backtest(csv_path, checkpoint_dir, enabled=True)
+        finally:
+            CheckpointManager.clear = original_clear
+        saved_cursors.clear()
+        resumed = run_backtest(csv_path, checkpoint_dir, enabled=True, resume=True)
+        assert resumed == baseline, f"Resumed backtest diverged: {len(baseline)} vs {len(resumed)} trades"
+        assert saved_cursors == [], "Resuming at row 5000 should not save again before the end"
+    finally:
+        os.chdir(cwd)
+        CheckpointManager.save = original_save
+print(f"✓ Off: {len(baseline)} trades, no checkpoints; on: same trades, checkpoints at rows 1000-5000")
+print("✓ Resumed from the row 5000 checkpoint with the same trades")
+print("✅ TEST 3 PASSED")
+
+print("\n" + "=" * 80)
+print("ALL CHECKPOINT TESTS PASSED")
+print("=" * 80)
@@ -0,0 +1,117 @@
+"""
+Test: Process-wide Simulation Dataset Cache (live/data_simulator.py)
+Verifies that DataSimulator instances share one parsed, read-only copy of a
+CSV, that editing the file invalidates it, and that preloaded data wins.
+"""
+import sys
+import os
+import shutil
+import tempfile
+from datetime import datetime, timedelta
+import logging
+
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '.')))
+
+from myQuant.live import data_simulator
+from myQuant.live.data_simulator import (
+    DataSimulator, load_simulation_dataset, register_preloaded_data, clear_dataset_cache
+)
+
+logging.disable(logging.CRITICAL)
+
+print("=" * 80)
+print("SIMULATION DATASET CACHE TESTS")
+print("=" * 80)
+
+tmp = tempfile.mkdtemp()
+csv_path = os.path.join(tmp, 'ticks.csv')
+
+
+def write_csv(n, seed):
+    rng = np.random.default_rng(seed)
+    start = datetime(2025, 11, 3, 9, 30, 0)
+    pd.DataFrame({
+        'timestamp': [(start + timedelta(seconds=3 * i)).strftime('%Y-%m-%d %H:%M:%S') for i in range(n)],
+        'close': np.round((120 + np.cumsum(rng.normal(0, 0.35, n))) / 0.05) * 0.05,
+    }).to_csv(csv_path, index=False)
+
+
+parses = []
+real_read = data_simulator.read_simulation_file
+
+
+def counting_read(file_path):
+    parses.append(file_path)
+    return real_read(file_path)
+
+
+data_simulator.read_simulation_file = counting_read
+
+# Test 1: One parse shared by every simulator
+print("\n" + "=" * 80)
+print("TEST 1: Simulators share one parsed dataset")
+print("=" * 80)
+
+write_csv(300, seed=1)
+simulators = []
+for max_ticks in (None, None, 100):
+    simulator = DataSimulator(csv_path, max_ticks=max_ticks)
+    simulator.tick_delay = 0
+    assert simulator.load_data()
+    simulators.append(simulator)
+assert len(parses) == 1, f"CSV parsed {len(parses)} times"
+assert len(simulators[2].data) == 100, "max_ticks should still limit replay to a prefix"
+assert np.shares_memory(simulators[0].dataset.prices, simulators[1].dataset.prices)
+assert not simulators[0].dataset.prices.flags.writeable, "Shared arrays must be read-only"
+
+first = simulators[0].get_next_tick()
+assert first['price'] == float(real_read(csv_path)['price'].iloc[0])
+assert first['timestamp'].tzinfo is not None, "Timestamps stay timezone-aware"
+assert simulators[1].get_next_tick() == first, "Each simulator keeps its own cursor"
+print("✓ 3 simulators, 1 parse, read-only shared arrays")
+print("✅ TEST 1 PASSED")
+
+# Test 2: Editing the file invalidates the cached copy
+print("\n" + "=" * 80)
+print("TEST 2: mtime/size change re-parses")
+print("=" * 80)
+
+write_csv(400, seed=2)
+os.utime(csv_path, ns=(os.stat(csv_path).st_atime_ns, os.stat(csv_path).st_mtime_ns + 10 ** 9))
+assert len(load_simulation_dataset(csv_path)) == 400, "Stale dataset served after the file changed"
+assert len(parses) == 2
+load_simulation_dataset(csv_path)
+assert len(parses) == 2, "Unchanged file should not be re-parsed"
+clear_dataset_cache()
+load_simulation_dataset(csv_path)
+assert len(parses) == 3, "clear_dataset_cache should force a re-parse"
+print("✓ Changed file re-parsed, unchanged file served from cache")
+print("✅ TEST 2 PASSED")
+
+# Test 3: Preloaded data takes precedence
+print("\n" + "=" * 80)
+print("TEST 3: Preloaded data wins over the file")
+print("=" * 80)
+
+frame = pd.DataFrame({'price': [101.0, 102.5], 'volume': [7, 8]})
+register_preloaded_data(csv_path, frame)
+simulator = DataSimulator(csv_path)
+simulator.tick_delay = 0
+simulator.load_data()
+assert [simulator.get_next_tick()['price'] for _ in range(2)] == [101.0, 102.5]
+register_preloaded_data(csv_path, None)
+assert len(load_simulation_dataset(csv_path)) == 400, "Unregistering should fall back to the file"
+assert len(parses) == 3
+print("✓ Registered frame served, file used again after unregistering")
+print("✅ TEST 3 PASSED")
+
+data_simulator.read_simulation_file = real_read
+shutil.rmtree(tmp, ignore_errors=True)
+
+print("\n" + "=" * 80)
+print("ALL SIMULATION DATASET CACHE TESTS PASSED")
+print("=" * 80)
@@ -0,0 +1,192 @@
+"""
+Test: Backtest Diagnostics Modes (backtest/backtest_runner.py)
+Verifies backtest.diagnostics_mode: 'off' computes no statistics, 'summary'
+and 'full' report the same numbers as the original per-run diagnostics, and
+an unknown mode is rejected when the BacktestRunner is constructed.
+"""
+import sys
+import os
+import shutil
+import tempfile
+import logging
+from copy import deepcopy
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '.')))
+
+from myQuant.config.defaults import DEFAULT_CONFIG
+from myQuant.utils.config_helper import freeze_config
+from myQuant.backtest import backtest_runner
+from myQuant.backtest.backtest_runner import (
+    BacktestRunner, DIAGNOSTICS_MODES, load_and_normalize_data,
+    _build_quality_report, _log_data_diagnostics, _log_indicator_diagnostics
+)
+
+logging.disable(logging.CRITICAL)
+
+print("=" * 80)
+print("DIAGNOSTICS MODE TESTS")
+print("=" * 80)
+
+
+class Capture(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+def run_diagnostics(function, *args):
+    """Messages logged by one diagnostics call."""
+    capture = Capture()
+    runner_logger = logging.getLogger(backtest_runner.__name__)
+    runner_logger.addHandler(capture)
+    runner_logger.propagate = False
+    runner_logger.setLevel(logging.INFO)
+    logging.disable(logging.NOTSET)
+    try:
+        result = function(*args)
+    finally:
+        logging.disable(logging.CRITICAL)
+        runner_logger.removeHandler(capture)
+        runner_logger.propagate = True
+    return result, capture.messages
+
+
+def reference_sample_indices(total_rows):
+    """Sample rows as the original loader picked them (5 per 1000-row chunk)."""
+    sample_indices = []
+    for chunk_start in range(0, total_rows, 1000):
+        chunk_end = min(chunk_start + 1000, total_rows)
+        if chunk_end - chunk_start >= 5:
+            step = (chunk_end - chunk_start) // 5
+            sample_indices.extend(chunk_start + i * step for i in range(5))
+        else:
+            sample_indices.extend(range(chunk_start, chunk_end))
+    return sorted(set(idx for idx in sample_indices if idx < total_rows))
+
+
+tmp = tempfile.mkdtemp()
+csv_path = os.path.join(tmp, 'ticks.csv')
+rng = np.random.default_rng(21)
+rows = 2003  # Last chunk (3 rows) shorter than 5
+start = datetime(2025, 11, 3, 9, 15, 0)
+prices = np.round((120 + np.cumsum(rng.normal(0, 0.35, rows))) / 0.05) * 0.05
+prices[[40, 900]] = [0.0, -1.0]
+pd.DataFrame({
+    'timestamp': [(start + timedelta(seconds=5 * i)).strftime('%Y-%m-%d %H:%M:%S') for i in range(rows)],
+    'price': prices,
+    'volume': rng.integers(1, 50, rows),
+}).to_csv(csv_path, index=False)
+
+# Test 1: Invalid mode
+print("\n" + "=" * 80)
+print("TEST 1: Unknown mode rejected by the BacktestRunner constructor")
+print("=" * 80)
+
+for mode in DIAGNOSTICS_MODES:
+    config = deepcopy(DEFAULT_CONFIG)
+    config['backtest']['diagnostics_mode'] = mode
+    assert BacktestRunner(freeze_config(config), csv_path).diagnostics_mode == mode
+
+config = deepcopy(DEFAULT_CONFIG)
+config['backtest']['diagnostics_mode'] = 'verbose'
+try:
+    BacktestRunner(freeze_config(config), csv_path)
+    raise AssertionError("BacktestRunner accepted diagnostics_mode='verbose'")
+except ValueError as e:
+    assert 'verbose' in str(e) and 'summary' in str(e), str(e)
+try:
+    load_and_normalize_data(csv_path, process_as_ticks=True, diagnostics_mode='verbose')
+    raise AssertionError("load_and_normalize_data accepted diagnostics_mode='verbose'")
+except ValueError:
+    pass
+print("✓ 'verbose' raises ValueError at construction; off/summary/full accepted")
+print("✅ TEST 1 PASSED")
+
+# Test 2: Off computes nothing
+print("\n" + "=" * 80)
+print("TEST 2: 'off' skips every statistic")
+print("=" * 80)
+
+(df, report), messages = run_diagnostics(
+    lambda: load_and_normalize_data(csv_path, process_as_ticks=True, diagnostics_mode='off'))
+assert len(df) == rows and report.total_rows == rows and report.sample_indices == []
+assert messages == [f"Loading data from: {csv_path}"], messages
+
+# Statistics are not even touched: an object without any DataFrame API is accepted
+_, messages = run_diagnostics(_log_data_diagnostics, object(), report, 'off')
+_, indicator_messages = run_diagnostics(_log_indicator_diagnostics, object(), [], 'off')
+assert messages == [] and indicator_messages == []
+print("✓ Only the load line is logged; no sample indices, counts or dumps computed")
+print("✅ TEST 2 PASSED")
+
+# Test 3: Summary and full numbers
+print("\n" + "=" * 80)
+print("TEST 3: 'summary' and 'full' report the original numbers")
+print("=" * 80)
+
+df.loc[df.index[[7, 8, 1500]], 'volume'] = np.nan
+missing = df.isnull().sum().sum()
+non_positive = (df['close'] <= 0).sum()
+expected_summary = [
+    f"Dataset contains {missing} missing values",
+    f"Dataset contains {non_positive} negative or zero prices",
+    "=== COMPLETE DATASET ANALYSIS ===",
+    f"Dataset shape: {df.shape}",
+    f"Time range: {df.index.min()} to {df.index.max()}",
+    f"Total duration: {df.index.max() - df.index.min()}",
+]
+assert missing == 3 and non_positive == 2
+
+_, summary = run_diagnostics(_log_data_diagnostics, df, _build_quality_report(df, 'summary'), 'summary')
+assert summary == expected_summary, summary
+
+full_report = _build_quality_report(df, 'full')
+assert full_report.sample_indices == reference_sample_indices(rows)
+_, full = run_diagnostics(_log_data_diagnostics, df, full_report, 'full')
+assert full[:len(expected_summary)] == expected_summary
+hours = [f"  Hour {hour:02d}: {count:,} ticks" for hour, count in df.groupby(df.index.hour).size().items()]
+assert [m for m in full if m.startswith("  Hour")] == hours
+sample_rows = [m for m in full if m.startswith("Norm Row")]
+samples_logged = min(25, len(full_report.sample_indices))
+assert len(sample_rows) == samples_logged and sample_rows[1].startswith(f"Norm Row {full_report.sample_indices[1]:6d} (Sample  2)")
+
+indicators = pd.DataFrame({
+    'close': df['close'].to_numpy(),
+    'fast_ema': df['close'].ewm(span=9).mean().to_numpy(),
+    'slow_ema': df['close'].ewm(span=21).mean().to_numpy(),
+    'vwap': df['close'].expanding().mean().to_numpy(),
+    'macd': rng.normal(0, 1, rows),
+    'macd_signal': rng.normal(0, 1, rows),
+}, index=df.index)
+fast_above_slow = (indicators['fast_ema'] > indicators['slow_ema']).sum()
+above_vwap = (indicators['close'] > indicators['vwap']).sum()
+macd_bullish = (indicators['macd'] > indicators['macd_signal']).sum()
+expected_indicators = [
+    f"EMA DIAGNOSTIC: {fast_above_slow}/{rows} rows have fast > slow ({fast_above_slow/rows*100:.1f}%)",
+    f"VWAP DIAGNOSTIC: {above_vwap}/{rows} rows have price > VWAP ({above_vwap/rows*100:.1f}%)",
+    f"MACD DIAGNOSTIC: {macd_bullish}/{rows} rows have MACD > Signal ({macd_bullish/rows*100:.1f}%)",
+]
+_, summary = run_diagnostics(_log_indicator_diagnostics, indicators, [], 'summary')
+assert summary == expected_indicators, summary
+_, full = run_diagnostics(_log_indicator_diagnostics, indicators, full_report.sample_indices, 'full')
+assert full[:3] == expected_indicators
+assert len([m for m in full if m.startswith("Ind  Row")]) == samples_logged
+print(f"✓ summary: {missing} missing, {non_positive} non-positive, EMA {fast_above_slow}/{rows}, "
+      f"VWAP {above_vwap}/{rows}, MACD {macd_bullish}/{rows}")
+print(f"✓ full: same counts plus {len(hours)} hourly lines and {samples_logged} sample rows per stage "
+      f"from the original {len(full_report.sample_indices)} sample indices")
+print("✅ TEST 3 PASSED")
+
+shutil.rmtree(tmp, ignore_errors=True)
+
+print("\n" + "=" * 80)
+print("ALL DIAGNOSTICS MODE TESTS PASSED")
+print("=" * 80)
@@ -0,0 +1,154 @@
+"""
+Test: Vectorized Exit Oracle vs PositionManager
+Verifies that ExitOracle reproduces PositionManager.process_positions fills
+(index, price, quantity, reason) exactly on randomized tick paths.
+"""
+import sys
+import os
+import time as _time
+from datetime import datetime, timedelta
+from copy import deepcopy
+import logging
+
+import numpy as np
+import pytz
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '.')))
+
+from myQuant.config.defaults import DEFAULT_CONFIG
+from myQuant.utils.config_helper import freeze_config
+from myQuant.core.position_manager import PositionManager
+from myQuant.core.exit_oracle import ExitOracle, ExitParams
+
+logging.disable(logging.CRITICAL)
+
+IST = pytz.timezone('Asia/Kolkata')
+
+print("=" * 80)
+print("EXIT ORACLE EQUIVALENCE TESTS")
+print("=" * 80)
+
+
+def make_config(**risk_overrides):
+    config = deepcopy(DEFAULT_CONFIG)
+    config['risk'].update(risk_overrides)
+    return freeze_config(config)
+
+
+def reference_fills(frozen_config, prices, timestamps, entry_index):
+    """Run PositionManager tick-by-tick and return its fills."""
+    pm = PositionManager(frozen_config)
+    pos_id = pm.open_position('NIFTY', prices[entry_index], timestamps[entry_index])
+    position = pm.positions[pos_id]
+    entry_price, quantity = position.entry_price, position.initial_quantity
+    index_of = {ts: i for i, ts in enumerate(timestamps)}
+    session_end_index = None
+    for i in range(entry_index, len(prices)):
+        if pos_id not in pm.positions:
+            break
+        if session_end_index is None and pm.should_exit_for_session_end(timestamps[i]):
+            session_end_index = i
+        pm.process_positions({'close': prices[i]}, timestamps[i])
+    fills = [(index_of[t.exit_time], t.exit_price, t.quantity, t.exit_reason) for t in pm.completed_trades]
+    remaining = pm.positions[pos_id].current_quantity if pos_id in pm.positions else 0
+    return entry_price, quantity, session_end_index, fills, remaining
+
+
+def session_end_index_for(frozen_config, timestamps):
+    pm = PositionManager(frozen_config)
+    for i, ts in enumerate(timestamps):
+        if pm.should_exit_for_session_end(ts):
+            return i
+    return None
+
+
+def random_path(rng, n, start_price=100.0, vol=0.6):
+    steps = rng.normal(0, vol, n)
+    return np.round((start_price + np.cumsum(steps)) / 0.05) * 0.05
+
+
+def compare(frozen_config, prices, timestamps, entry_index):
+    entry_price, quantity, _, expected, remaining = reference_fills(frozen_config, prices, timestamps, entry_index)
+    oracle = ExitOracle(ExitParams.from_config(frozen_config))
+    result = oracle.simulate(prices, entry_index, entry_price, quantity,
+                             session_end_index=session_end_index_for(frozen_config, timestamps))
+    actual = [(f.index, f.price, f.quantity, f.reason) for f in result.fills]
+    return actual == expected and result.remaining_quantity == remaining, expected, actual
+
+
+# Test 1: Randomized paths with default risk settings
+print("\n" + "=" * 80)
+print("TEST 1: Randomized paths (default risk)")
+print("=" * 80)
+
+rng = np.random.default_rng(42)
+base_time = IST.localize(datetime(2025, 11, 3, 10, 0, 0))
+n_ticks = 400
+timestamps = [base_time + timedelta(seconds=i) for i in range(n_ticks)]
+frozen = make_config()
+mismatches = 0
+for trial in range(200):
+    prices = random_path(rng, n_ticks)
+    ok, expected, actual = compare(frozen, prices, timestamps, int(rng.integers(0, 50)))
+    if not ok:
+        mismatches += 1
+        print(f"✗ Trial {trial}: expected {expected}, got {actual}")
+assert mismatches == 0, f"{mismatches} randomized paths diverged from PositionManager"
+print("✅ TEST 1 PASSED: 200 paths match")
+
+# Test 2: Risk parameter sweep (SL, TP ladder, trailing on/off)
+print("\n" + "=" * 80)
+print("TEST 2: Risk parameter sweep")
+print("=" * 80)
+
+sweep = [
+    dict(base_sl_points=5.0, use_trail_stop=False),
+    dict(base_sl_points=10.0, trail_activation_points=2.0, trail_distance_points=1.0),
+    dict(tp_points=[1.0, 1.5, 2.0, 2.5], trail_activation_points=1.0, trail_distance_points=3.0),
+    dict(tp_points=[2.0, 2.0, 3.0, 3.0]),  # Same-tick multi-TP with stale quantity
+    dict(tp_points=[3.0, 6.0, 9.0, 12.0], tp_percents=[0.9, 0.9, 0.9, 0.1]),
+]
+for overrides in sweep:
+    frozen = make_config(**overrides)
+    for trial in range(60):
+        prices = random_path(rng, n_ticks, vol=1.2)
+        ok, expected, actual = compare(frozen, prices, timestamps, int(rng.integers(0, 50)))
+        assert ok, f"{overrides} trial {trial}: expected {expected}, got {actual}"
+    print(f"✓ {overrides}")
+print("✅ TEST 2 PASSED: all sweeps match")
+
+# Test 3: Session end forced exit
+print("\n" + "=" * 80)
+print("TEST 3: Session end exit")
+print("=" * 80)
+
+late_time = IST.localize(datetime(2025, 11, 3, 14, 49, 0))
+late_timestamps = [late_time + timedelta(seconds=i) for i in range(120)]
+frozen = make_config(base_sl_points=50.0, tp_points=[50.0, 60.0, 70.0, 80.0], use_trail_stop=False)
+prices = random_path(rng, 120, vol=0.1)
+ok, expected, actual = compare(frozen, prices, late_timestamps, 0)
+assert ok, f"expected {expected}, got {actual}"
+assert actual[-1][3] == "Session End", "Position should close at session end"
+print(f"✓ Closed at tick {actual[-1][0]} with reason '{actual[-1][3]}'")
+print("✅ TEST 3 PASSED")
+
+# Test 4: Throughput of risk sweep over a fixed entry set
+print("\n" + "=" * 80)
+print("TEST 4: Oracle throughput")
+print("=" * 80)
+
+prices = random_path(rng, 20000)
+entries = [(i, prices[i], 975) for i in range(0, 19000, 500)]
+configs = [ExitParams(sl, (5.0, 12.0, 15.0, 17.0), (0.4, 0.3, 0.2, 0.1), True, act, dist, 75)
+           for sl in (5.0, 10.0, 15.0, 20.0) for act in (3.0, 5.0, 7.0) for dist in (2.0, 5.0)]
+start = _time.perf_counter()
+for params in configs:
+    ExitOracle(params).simulate_many(prices, entries)
+elapsed = _time.perf_counter() - start
+print(f"✓ {len(configs)} configs x {len(entries)} entries in {elapsed:.3f}s")
+print("✅ TEST 4 PASSED")
+
+print("\n" + "=" * 80)
+print("ALL EXIT ORACLE TESTS PASSED")
+print("=" * 80)
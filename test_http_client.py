@@ -0,0 +1,213 @@
+"""
+Test: Pooled HTTP Client (utils/http_client.py) and cached session checks
+Runs against a local stub HTTP server. Verifies keep-alive connection reuse,
+retry with backoff on 5xx, timeouts, the session validation TTL in
+live/login.py, and the streamed scrip master download over the pool.
+"""
+import sys
+import os
+import json
+import shutil
+import tempfile
+import threading
+import time
+import logging
+from copy import deepcopy
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '.')))
+
+logging.disable(logging.CRITICAL)
+
+import requests
+from myQuant.config.defaults import DEFAULT_CONFIG
+from myQuant.utils.http_client import HttpClient, get_http_client, close_http_client
+from myQuant.utils.cache_manager import fetch_and_cache_symbols
+from myQuant.live import login
+
+print("=" * 80)
+print("HTTP CLIENT TESTS")
+print("=" * 80)
+
+VALID_JWT = 'jwt-valid'
+MASTER = [{'token': str(40000 + i), 'symbol': f'NIFTY28NOV24{20000 + 50 * i}CE', 'exch_seg': 'NFO',
+           'lotsize': '75', 'tick_size': '5.000000', 'expiry': '28NOV2024', 'strike': f'{(20000 + 50 * i) * 100}.0'}
+          for i in range(2000)]
+
+
+class StubState:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.requests = {}
+        self.flaky_failures = 0
+
+    def hit(self, path):
+        with self.lock:
+            self.requests[path] = self.requests.get(path, 0) + 1
+
+
+state = StubState()
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # Keep-alive
+
+    def setup(self):
+        super().setup()
+        with state.lock:
+            state.connections += 1
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status, body=b'{}'):
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        state.hit(self.path)
+        if self.path == '/ping':
+            self._reply(200)
+        elif self.path == '/flaky':
+            with state.lock:
+                fail = state.flaky_failures > 0
+                state.flaky_failures -= 1
+            self._reply(503 if fail else 200)
+        elif self.path == '/slow':
+            time.sleep(1.0)
+            self._reply(200)
+        elif self.path == '/profile':
+            valid = self.headers.get('Authorization') == f'Bearer {VALID_JWT}'
+            self._reply(200 if valid else 401)
+        elif self.path == '/master':
+            self._reply(200, json.dumps(MASTER, indent=4).encode('utf-8'))
+        else:
+            self._reply(404)
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        pass  # Clients that timed out close the socket before /slow replies
+
+
+server = StubServer(('127.0.0.1', 0), StubHandler)
+threading.Thread(target=server.serve_forever, daemon=True).start()
+base_url = f'http://127.0.0.1:{server.server_address[1]}'
+
+config = deepcopy(DEFAULT_CONFIG)
+config['http'].update({'connect_timeout_seconds': 2.0, 'read_timeout_seconds': 2.0, 'retries': 3,
+                       'backoff_factor': 0.05, 'pool_maxsize': 4})
+client = get_http_client(config)
+
+# Test 1: Keep-alive
+print("\n" + "=" * 80)
+print("TEST 1: Requests reuse one pooled connection")
+print("=" * 80)
+
+for _ in range(20):
+    assert client.get(f'{base_url}/ping').status_code == 200
+assert state.requests['/ping'] == 20
+assert state.connections == 1, f"{state.connections} connections for 20 requests"
+assert get_http_client() is client and get_http_client(config) is client
+assert client.timeout == (2.0, 2.0)
+print(f"✓ 20 GETs over {state.connections} connection; shared client reused")
+print("✅ TEST 1 PASSED")
+
+# Test 2: Retry with backoff
+print("\n" + "=" * 80)
+print("TEST 2: 5xx retried with exponential backoff")
+print("=" * 80)
+
+state.flaky_failures = 2
+started = time.perf_counter()
+response = client.get(f'{base_url}/flaky')
+elapsed = time.perf_counter() - started
+assert response.status_code == 200 and state.requests['/flaky'] == 3
+assert elapsed >= 0.1, f"Expected backoff sleep (0.05 * 2), took {elapsed:.3f}s"
+
+state.flaky_failures = 10
+response = client.get(f'{base_url}/flaky')
+assert response.status_code == 503, "Exhausted retries return the last response"
+assert state.requests['/flaky'] == 3 + 4
+print(f"✓ Two 503s then 200 in {elapsed * 1000:.0f}ms; 1 + 3 attempts before giving up")
+print("✅ TEST 2 PASSED")
+
+# Test 3: Timeouts
+print("\n" + "=" * 80)
+print("TEST 3: Default read timeout")
+print("=" * 80)
+
+impatient = HttpClient(connect_timeout=1.0, read_timeout=0.2, retries=0, backoff_factor=0.0, pool_maxsize=1)
+started = time.perf_counter()
+try:
+    impatient.get(f'{base_url}/slow')
+    raise AssertionError("Slow response should time out")
+except requests.exceptions.RequestException:
+    pass
+assert time.perf_counter() - started < 0.9
+impatient.close()
+for bad in ({'connect_timeout': 0}, {'retries': -1}, {'pool_maxsize': 0}):
+    params = dict(connect_timeout=1.0, read_timeout=1.0, retries=0, backoff_factor=0.0, pool_maxsize=1)
+    params.update(bad)
+    try:
+        HttpClient(**params)
+        raise AssertionError(f"Invalid settings accepted: {bad}")
+    except ValueError:
+        pass
+print("✓ Request without an explicit timeout aborted at the configured read timeout")
+print("✅ TEST 3 PASSED")
+
+# Test 4: Session validation TTL
+print("\n" + "=" * 80)
+print("TEST 4: Successful session checks cached for the TTL")
+print("=" * 80)
+
+login.PROFILE_URL = f'{base_url}/profile'
+login.clear_session_validation_cache()
+for _ in range(10):
+    assert login.check_session_token(VALID_JWT, ttl_seconds=0.3)
+assert state.requests['/profile'] == 1, "Repeated checks within the TTL must not hit the API"
+time.sleep(0.35)
+assert login.check_session_token(VALID_JWT, ttl_seconds=0.3)
+assert state.requests['/profile'] == 2, "Expired check must re-validate"
+
+for _ in range(3):
+    assert not login.check_session_token('jwt-expired', ttl_seconds=300)
+assert state.requests['/profile'] == 5, "Failed checks are never cached"
+
+login.clear_session_validation_cache()
+for _ in range(3):
+    assert login.check_session_token(VALID_JWT, ttl_seconds=0)
+assert state.requests['/profile'] == 8, "TTL 0 checks every time"
+login.clear_session_validation_cache()
+assert DEFAULT_CONFIG['http']['session_validation_ttl_seconds'] > 0
+print("✓ 10 checks -> 1 request within the TTL; failures and TTL 0 always re-check")
+print("✅ TEST 4 PASSED")
+
+# Test 5: Scrip master download over the pool
+print("\n" + "=" * 80)
+print("TEST 5: Streamed scrip master download")
+print("=" * 80)
+
+tmp = tempfile.mkdtemp()
+connections_before = state.connections
+symbols = fetch_and_cache_symbols(os.path.join(tmp, 'symbol_cache.json'), url=f'{base_url}/master')
+assert len(symbols) == len(MASTER) and symbols['NIFTY28NOV2420000CE'] == '40000'
+assert state.connections == connections_before, "Download should reuse the pooled connection"
+shutil.rmtree(tmp, ignore_errors=True)
+print(f"✓ {len(symbols)} symbols streamed from the stub over the existing connection")
+print("✅ TEST 5 PASSED")
+
+close_http_client()
+server.shutdown()
+
+print("\n" + "=" * 80)
+print("ALL HTTP CLIENT TESTS PASSED")
+print("=" * 80)
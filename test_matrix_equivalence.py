@@ -0,0 +1,99 @@
+"""
+Test: Equivalence-Class Deduplication (live/matrix_config_builder.canonical_parameters)
+Verifies inert parameters are dropped under their feature flags and that a
+matrix run executes each equivalence class once, copying results to members.
+"""
+import sys
+import os
+import shutil
+import tempfile
+from datetime import datetime, timedelta
+import logging
+
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '.')))
+
+from myQuant.live.matrix_config_builder import canonical_parameters
+import myQuant.live.matrix_forward_test as matrix_module
+from myQuant.live.matrix_forward_test import MatrixTestRunner
+
+logging.disable(logging.CRITICAL)
+
+print("=" * 80)
+print("MATRIX EQUIVALENCE TESTS")
+print("=" * 80)
+
+# Test 1: Canonicalization
+print("\n" + "=" * 80)
+print("TEST 1: Inert parameters are dropped")
+print("=" * 80)
+
+assert canonical_parameters({'macd_fast': 8, 'fast_ema': 9}) == {'fast_ema': 9}, "use_macd defaults to False"
+assert canonical_parameters({'macd_fast': 8}, {'use_macd': True}) == {'macd_fast': 8}, "Fixed flag must be honoured"
+assert canonical_parameters({'use_trail_stop': False, 'trail_distance_points': 3}) == {'use_trail_stop': False}
+assert canonical_parameters({'use_trail_stop': True, 'trail_distance_points': 3}) == \
+    {'use_trail_stop': True, 'trail_distance_points': 3}
+print("✓ macd_* and trail_* dropped only while their flag is off")
+print("✅ TEST 1 PASSED")
+
+# Test 2: Matrix run executes one test per class
+print("\n" + "=" * 80)
+print("TEST 2: Deduplicated matrix run")
+print("=" * 80)
+
+tmp = tempfile.mkdtemp()
+os.chdir(tmp)
+csv_path = os.path.join(tmp, 'ticks.csv')
+rng = np.random.default_rng(17)
+start = datetime(2025, 11, 3, 9, 30, 0)
+pd.DataFrame({
+    'timestamp': [(start + timedelta(seconds=3 * i)).strftime('%Y-%m-%d %H:%M:%S') for i in range(300)],
+    'close': np.round((120 + np.cumsum(rng.normal(0, 0.35, 300))) / 0.05) * 0.05,
+}).to_csv(csv_path, index=False)
+
+runs = []
+real_live_trader = matrix_module.LiveTrader
+
+
+class CountingLiveTrader(real_live_trader):
+    def start(self, *args, **kwargs):
+        runs.append(self.config['risk']['use_trail_stop'])
+        return super().start(*args, **kwargs)
+
+
+matrix_module.LiveTrader = CountingLiveTrader
+try:
+    runner = MatrixTestRunner(csv_path, os.path.join(tmp, 'results'))
+    runner.add_parameter_grid('macd_fast', [8, 10, 12])
+    runner.add_parameter_grid('use_trail_stop', [True, False])
+    runner.add_parameter_grid('trail_distance_points', [3.0, 5.0])
+    results = runner.run(phase_name='dedupe', output_filename='dedupe.xlsx', use_cache=False)
+    assert len(runs) == 3, f"Expected 3 classes (2 trail distances + trail off), ran {len(runs)}"
+    assert len(results) == 12, "Every combination must have a row in the report"
+
+    off = results[~results['use_trail_stop'].astype(bool)]
+    assert off['total_pnl'].nunique() == 1 and off['equivalent_to'].notna().sum() == 5
+    members = results[results['equivalent_to'].notna()]
+    assert set(members['equivalent_to'].astype(int)).issubset(set(results['test_number'])), \
+        "Members must point at a representative"
+
+    runs.clear()
+    full = runner.run(phase_name='full', output_filename='full.xlsx', use_cache=False, deduplicate=False)
+    assert len(runs) == 12, "deduplicate=False must run every combination"
+    columns = ['test_number', 'total_trades', 'total_pnl', 'max_drawdown']
+    assert results[columns].to_dict('records') == full[columns].to_dict('records'), \
+        "Copied results must match running every member"
+finally:
+    matrix_module.LiveTrader = real_live_trader
+print(f"✓ 12 combinations ran as 3 equivalence classes with identical results")
+print("✅ TEST 2 PASSED")
+
+os.chdir(os.path.dirname(os.path.abspath(__file__)))
+shutil.rmtree(tmp, ignore_errors=True)
+
+print("\n" + "=" * 80)
+print("ALL MATRIX EQUIVALENCE TESTS PASSED")
+print("=" * 80)
@@ -0,0 +1,122 @@
+"""
+Test: Parallel Matrix Runs (live/matrix_forward_test.py workers=N)
+Verifies shared-memory tick data round-trips through DataSimulator and that a
+process-pool run produces the same results as a sequential run, with worker
+failures recorded instead of aborting the matrix.
+"""
+import sys
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+import logging
+
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '.')))
+
+from myQuant.live.data_simulator import DataSimulator, register_preloaded_data
+from myQuant.live.shared_tick_data import SharedTickData
+from myQuant.live.matrix_forward_test import MatrixTestRunner
+
+logging.disable(logging.CRITICAL)
+
+
+def write_csv(path, n=600, seed=7, start=datetime(2025, 11, 3, 9, 30, 0)):
+    rng = np.random.default_rng(seed)
+    prices = np.round((120 + np.cumsum(rng.normal(0, 0.35, n))) / 0.05) * 0.05
+    pd.DataFrame({
+        'timestamp': [(start + timedelta(seconds=3 * i)).strftime('%Y-%m-%d %H:%M:%S') for i in range(n)],
+        'close': prices,
+        'volume': rng.integers(1, 5000, n),
+    }).to_csv(path, index=False)
+
+
+def metrics(df):
+    columns = ['test_number', 'test_tag', 'validation_passed', 'total_trades', 'total_pnl', 'max_drawdown']
+    return df[columns].to_dict('records')
+
+
+if __name__ == '__main__':
+    print("=" * 80)
+    print("PARALLEL MATRIX TESTS")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        csv_path = os.path.join(tmp, 'ticks.csv')
+        write_csv(csv_path)
+
+        # Test 1: Shared ticks replay identically to the CSV
+        print("\n" + "=" * 80)
+        print("TEST 1: Shared-memory ticks match file ticks")
+        print("=" * 80)
+
+        from_file = DataSimulator(csv_path)
+        from_file.tick_delay = 0
+        from_file.load_data()
+        expected_ticks = [from_file.get_next_tick() for _ in range(600)]
+
+        shared = SharedTickData.from_csv(csv_path)
+        attached = SharedTickData.attach(shared.descriptor())
+        frame = attached.to_dataframe()
+        assert np.shares_memory(frame['price'].to_numpy(), attached.prices), "Price column must view shared memory"
+        register_preloaded_data(csv_path, frame)
+        from_shared = DataSimulator(csv_path)
+        from_shared.tick_delay = 0
+        from_shared.load_data()
+        actual_ticks = [from_shared.get_next_tick() for _ in range(600)]
+        assert actual_ticks == expected_ticks, "Shared-memory ticks diverged from CSV ticks"
+        register_preloaded_data(csv_path, None)
+        del frame, from_shared
+        attached.close()
+        shared.close()
+        shared.unlink()
+        print(f"✓ {len(actual_ticks)} ticks identical")
+        print("✅ TEST 1 PASSED")
+
+        # Test 2: workers=1 and workers=3 give identical results
+        print("\n" + "=" * 80)
+        print("TEST 2: Sequential vs parallel equivalence")
+        print("=" * 80)
+
+        def make_runner():
+            runner = MatrixTestRunner(csv_path, os.path.join(tmp, 'results'))
+            runner.add_parameter_grid('fast_ema', [5, 9])
+            runner.add_parameter_grid('slow_ema', [13, 21])
+            runner.add_parameter_grid('base_sl_points', [5, 15])
+            return runner
+
+        started = time.time()
+        sequential = make_runner().run(phase_name='seq', output_filename='seq.xlsx', use_cache=False)
+        sequential_elapsed = time.time() - started
+        started = time.time()
+        parallel = make_runner().run(phase_name='par', output_filename='par.xlsx', workers=3, use_cache=False)
+        parallel_elapsed = time.time() - started
+        assert metrics(parallel) == metrics(sequential), "Parallel results differ from sequential"
+        print(f"✓ {len(parallel)} tests identical (sequential {sequential_elapsed:.1f}s, "
+              f"3 workers {parallel_elapsed:.1f}s)")
+        print("✅ TEST 2 PASSED")
+
+        # Test 3: A failing test in a worker is recorded, others still complete
+        print("\n" + "=" * 80)
+        print("TEST 3: Worker failures recorded")
+        print("=" * 80)
+
+        runner = MatrixTestRunner(csv_path, os.path.join(tmp, 'results'))
+        runner.add_parameter_grid('fast_ema', [5, 9])
+        runner.set_fixed_parameter('not_a_real_parameter', 1)
+        results = runner.run(phase_name='fail', output_filename='fail.xlsx', skip_validation=True, workers=2,
+                             use_cache=False)
+        assert len(results) == 2 and not results['validation_passed'].any(), "Failures should be recorded per test"
+        assert all(results['validation_error'].str.len() > 0), "Failure reason should be recorded"
+        print(f"✓ Recorded failures: {results['validation_error'].tolist()}")
+        print("✅ TEST 3 PASSED")
+
+        os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+    print("\n" + "=" * 80)
+    print("ALL PARALLEL MATRIX TESTS PASSED")
+    print("=" * 80)
@@ -0,0 +1,113 @@
+"""
+Test: Matrix Results Store (live/matrix_results_store.py)
+Verifies durable appends, recovery from a partially written last line, and
+that a resumed matrix run only executes the combinations missing from the store.
+"""
+import sys
+import os
+import json
+import shutil
+import tempfile
+from datetime import datetime, timedelta
+import logging
+
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '.')))
+
+from myQuant.live.matrix_results_store import MatrixResultsStore
+import myQuant.live.matrix_forward_test as matrix_module
+from myQuant.live.matrix_forward_test import MatrixTestRunner
+
+logging.disable(logging.CRITICAL)
+
+print("=" * 80)
+print("MATRIX RESULTS STORE TESTS")
+print("=" * 80)
+
+tmp = tempfile.mkdtemp()
+os.chdir(tmp)
+
+# Test 1: Append, crash recovery, manifest
+print("\n" + "=" * 80)
+print("TEST 1: Append and partial-line recovery")
+print("=" * 80)
+
+store = MatrixResultsStore(os.path.join(tmp, 'store'), 'run')
+assert store.open({'phase_name': 'p'}) == 0
+store.append({'test_number': 1, 'total_pnl': np.float64(12.5), 'validation_passed': True})
+store.append({'test_number': 2, 'total_pnl': np.int64(-3), 'validation_passed': True})
+store.close()
+with open(store.results_path, 'a', encoding='utf-8') as f:
+    f.write('{"test_number": 3, "total_')  # Crash mid-append
+
+assert [r['test_number'] for r in store.iter_results()] == [1, 2], "Partial line must be ignored on read"
+resumed = MatrixResultsStore(os.path.join(tmp, 'store'), 'run')
+assert resumed.open({'phase_name': 'p'}, resume=True) == 2, "Resume should keep complete lines"
+resumed.append({'test_number': 3, 'total_pnl': 1.0, 'validation_passed': True})
+resumed.finish(runtime_seconds=1.0)
+assert resumed.completed_keys() == {(1, None), (2, None), (3, None)}
+assert resumed.read_manifest()['status'] == 'complete'
+assert resumed.load_dataframe()['total_pnl'].tolist() == [12.5, -3, 1.0]
+
+fresh = MatrixResultsStore(os.path.join(tmp, 'store'), 'run')
+assert fresh.open({'phase_name': 'p'}) == 0, "A run without resume starts empty"
+fresh.close()
+print("✓ Numpy values serialized, torn last line discarded, manifest marked complete")
+print("✅ TEST 1 PASSED")
+
+# Test 2: Resumed matrix run skips stored combinations
+print("\n" + "=" * 80)
+print("TEST 2: Matrix resume")
+print("=" * 80)
+
+csv_path = os.path.join(tmp, 'ticks.csv')
+rng = np.random.default_rng(13)
+start = datetime(2025, 11, 3, 9, 30, 0)
+pd.DataFrame({
+    'timestamp': [(start + timedelta(seconds=3 * i)).strftime('%Y-%m-%d %H:%M:%S') for i in range(300)],
+    'close': np.round((120 + np.cumsum(rng.normal(0, 0.35, 300))) / 0.05) * 0.05,
+}).to_csv(csv_path, index=False)
+
+runs = []
+real_live_trader = matrix_module.LiveTrader
+
+
+class CountingLiveTrader(real_live_trader):
+    def start(self, *args, **kwargs):
+        runs.append(self.config['strategy']['fast_ema'])
+        return super().start(*args, **kwargs)
+
+
+matrix_module.LiveTrader = CountingLiveTrader
+try:
+    runner = MatrixTestRunner(csv_path, os.path.join(tmp, 'results'))
+    runner.add_parameter_grid('fast_ema', [5, 9, 12])
+    first = runner.run(phase_name='store', output_filename='first.xlsx', use_cache=False)
+    assert sorted(runs) == [5, 9, 12]
+
+    # Simulate a crash after the first test: keep one line plus a torn second line
+    results_path = runner.results_store.results_path
+    lines = results_path.read_text(encoding='utf-8').splitlines(keepends=True)
+    kept = next(line for line in lines if json.loads(line)['test_number'] == 1)
+    results_path.write_text(kept + lines[-1][:20], encoding='utf-8')
+
+    runs.clear()
+    second = runner.run(phase_name='store', output_filename='second.xlsx', use_cache=False, resume=True)
+    assert sorted(runs) == [9, 12], f"Only missing combinations should run, ran {runs}"
+    columns = ['test_number', 'total_trades', 'total_pnl']
+    assert second[columns].to_dict('records') == first[columns].to_dict('records'), \
+        "Resumed run must export the same results"
+finally:
+    matrix_module.LiveTrader = real_live_trader
+print(f"✓ Resume reran {len(runs)} of 3 tests; store at {results_path.name}")
+print("✅ TEST 2 PASSED")
+
+os.chdir(os.path.dirname(os.path.abspath(__file__)))
+shutil.rmtree(tmp, ignore_errors=True)
+
+print("\n" + "=" * 80)
+print("ALL MATRIX RESULTS STORE TESTS PASSED")
+print("=" * 80)
@@ -0,0 +1,109 @@
+"""
+Test: Sampled Matrix Runs (live/matrix_sampling.py)
+Verifies range mapping, Latin hypercube stratification, determinism, lazy
+generation and that a sampled matrix run costs exactly its budget.
+"""
+import sys
+import os
+import shutil
+import tempfile
+import types
+from datetime import datetime, timedelta
+import logging
+
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '.')))
+
+from myQuant.live.matrix_sampling import ParameterRange, iter_samples
+from myQuant.live.matrix_forward_test import MatrixTestRunner, _parse_range
+
+logging.disable(logging.CRITICAL)
+
+print("=" * 80)
+print("MATRIX SAMPLING TESTS")
+print("=" * 80)
+
+# Test 1: Range mapping and CLI parsing
+print("\n" + "=" * 80)
+print("TEST 1: ParameterRange mapping")
+print("=" * 80)
+
+assert ParameterRange(5, 21, integer=True).value_at(0.0) == 5
+assert ParameterRange(5, 21, integer=True).value_at(0.9999) == 21
+assert ParameterRange(10, 30, step=0.5).value_at(0.9999) == 30.0
+assert ParameterRange(5, 21, integer=True, step=4).value_at(0.9999) == 21
+assert _parse_range('5:21') == ParameterRange(5, 21, integer=True)
+assert _parse_range('2:20:0.5') == ParameterRange(2, 20, integer=False, step=0.5)
+assert ParameterRange(1, 5, integer=True, step=2.0).value_at(0.9999) == 5
+for bad in (dict(step=0.5), dict(step=0), dict(high=0)):
+    try:
+        ParameterRange(**{'low': 1, 'high': 5, 'integer': True, **bad})
+        raise AssertionError(f"ParameterRange accepted {bad}")
+    except ValueError:
+        pass
+print("✓ Integer, stepped and CLI-parsed ranges map correctly; fractional integer steps rejected")
+print("✅ TEST 1 PASSED")
+
+# Test 2: LHS stratification, determinism, laziness
+print("\n" + "=" * 80)
+print("TEST 2: Latin hypercube properties")
+print("=" * 80)
+
+dimensions = {
+    'fast_ema': ParameterRange(5, 24, integer=True),
+    'base_sl_points': ParameterRange(5.0, 25.0),
+    'use_trail_stop': [True, False],
+}
+samples = iter_samples(dimensions, 'lhs', budget=20, seed=3)
+assert isinstance(samples, types.GeneratorType), "Samples must be generated lazily"
+samples = list(samples)
+assert len(samples) == 20
+assert sorted(s['fast_ema'] for s in samples) == list(range(5, 25)), "LHS must use every stratum once"
+strata = sorted(int((s['base_sl_points'] - 5.0) / 20.0 * 20) for s in samples)
+assert strata == list(range(20)), f"Continuous LHS strata not covered: {strata}"
+assert sum(s['use_trail_stop'] for s in samples) == 10, "Categorical values should be balanced"
+assert samples == list(iter_samples(dimensions, 'lhs', budget=20, seed=3)), "Same seed must give same samples"
+assert samples != list(iter_samples(dimensions, 'lhs', budget=20, seed=4)), "Seed should change samples"
+print("✓ 20 LHS samples cover every stratum of each dimension")
+print("✅ TEST 2 PASSED")
+
+# Test 3: Sampled run costs exactly the budget
+print("\n" + "=" * 80)
+print("TEST 3: Sampled matrix run")
+print("=" * 80)
+
+tmp = tempfile.mkdtemp()
+os.chdir(tmp)
+csv_path = os.path.join(tmp, 'ticks.csv')
+rng = np.random.default_rng(2)
+start = datetime(2025, 11, 3, 9, 30, 0)
+pd.DataFrame({
+    'timestamp': [(start + timedelta(seconds=3 * i)).strftime('%Y-%m-%d %H:%M:%S') for i in range(300)],
+    'close': np.round((120 + np.cumsum(rng.normal(0, 0.35, 300))) / 0.05) * 0.05,
+}).to_csv(csv_path, index=False)
+
+runner = MatrixTestRunner(csv_path, os.path.join(tmp, 'results'))
+runner.add_parameter_range('base_sl_points', 5, 40, step=0.5)
+runner.add_parameter_range('fast_ema', 5, 12, integer=True)
+try:
+    runner.calculate_test_count()
+    raise AssertionError("Ranges without sampling should raise")
+except ValueError:
+    pass
+runner.set_sampling('random', 3)
+assert runner.calculate_test_count() == 3
+results = runner.run(phase_name='sampled', output_filename='sampled.xlsx', use_cache=False, seed=9)
+assert len(results) == 3 and results['validation_passed'].all(), "Exactly budget tests should run"
+assert set(results['fast_ema']).issubset(range(5, 13))
+print(f"✓ Ran {len(results)} sampled combinations: {results['test_tag'].tolist()}")
+print("✅ TEST 3 PASSED")
+
+os.chdir(os.path.dirname(os.path.abspath(__file__)))
+shutil.rmtree(tmp, ignore_errors=True)
+
+print("\n" + "=" * 80)
+print("ALL MATRIX SAMPLING TESTS PASSED")
+print("=" * 80)
@@ -0,0 +1,263 @@
+"""
+Test: Multi-Symbol Trading over One WebSocket (live/multi_symbol_trader.py)
+Verifies token routing (each leg trades exactly as it would alone), the shared
+capital pool, that per-symbol processing time stays flat as N grows, that a
+leg runs LiveTrader's tick pipeline, and that shutdown waits for an in-flight
+tick.
+"""
+import sys
+import os
+import statistics
+import threading
+import time
+from datetime import datetime, timedelta
+from copy import deepcopy
+import logging
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '.')))
+
+from myQuant.config.defaults import DEFAULT_CONFIG
+from myQuant.utils.config_helper import freeze_config
+from myQuant.utils.time_utils import IST
+from myQuant.live import multi_symbol_trader
+from myQuant.live.multi_symbol_trader import MultiSymbolTrader
+from myQuant.live.tick_ring_buffer import TickConflator
+from myQuant.live.trader import LiveTrader
+
+logging.disable(logging.CRITICAL)
+
+print("=" * 80)
+print("MULTI-SYMBOL TRADER TESTS")
+print("=" * 80)
+
+START = datetime(2025, 11, 3, 9, 30, 0)
+TICKS = 1500
+
+
+def price_series(seed):
+    rng = np.random.default_rng(seed)
+    return np.round((120 + np.cumsum(rng.normal(0, 0.35, TICKS))) / 0.05) * 0.05
+
+
+def legs(n):
+    return [{'symbol': f'NIFTY25NOV{24000 + 50 * i}CE', 'token': str(40000 + i), 'exchange': 'NFO',
+             'instrument_type': 'NIFTY'} for i in range(n)]
+
+
+def make_trader(instruments, shared_capital=False):
+    config = deepcopy(DEFAULT_CONFIG)
+    config['multi_symbol'] = {'instruments': instruments, 'shared_capital': shared_capital}
+    return MultiSymbolTrader(freeze_config(config), profile='batch')
+
+
+def ticks_for(leg, prices, i):
+    return {'timestamp': IST.localize(START + timedelta(seconds=3 * i)), 'price': float(prices[i]),
+            'volume': 10, 'token': leg['token'], 'symbol': leg['symbol']}
+
+
+def summarize(trades):
+    return [(t.entry_time, t.exit_time, t.entry_price, t.exit_price, t.quantity, t.exit_reason) for t in trades]
+
+
+# Test 1: Routing through the shared WebSocket callback
+print("\n" + "=" * 80)
+print("TEST 1: Each leg trades exactly as it would alone")
+print("=" * 80)
+
+instruments = legs(3)
+series = {leg['token']: price_series(seed) for seed, leg in enumerate(instruments, start=11)}
+trader = make_trader(instruments)
+assert [s['token'] for s in trader.broker.subscriptions] == ['40000', '40001', '40002']
+multi_symbol_trader.now_ist = lambda: IST.localize(START)  # Wall-clock session end must not interfere
+
+
+def feed():
+    for i in range(TICKS):
+        for leg in instruments:
+            trader.broker._handle_websocket_tick(ticks_for(leg, series[leg['token']], i), leg['symbol'])
+    trader.broker._handle_websocket_tick({'price': 1.0, 'token': '99999'}, 'UNKNOWN')
+    trader.stop()
+
+
+def fake_connect():
+    trader.broker.streaming_mode = True
+    threading.Thread(target=feed, name='fake-websocket', daemon=True).start()
+
+
+trader.broker.connect = fake_connect
+runner = threading.Thread(target=trader.start)
+runner.start()
+runner.join(60)
+assert not runner.is_alive(), "stop() should end the supervising loop"
+assert trader.unrouted_ticks == 1
+assert trader.broker.get_tick_buffer_stats()['produced'] == 0, "Dispatcher consumes ticks directly"
+
+total_trades = 0
+for session, leg in zip(trader.sessions, instruments):
+    alone = make_trader([leg])
+    for i in range(TICKS):
+        alone.dispatch(ticks_for(leg, series[leg['token']], i))
+    alone.sessions[0].close_position("Session End")
+    expected = summarize(alone.sessions[0].position_manager.completed_trades)
+    actual = summarize(session.position_manager.completed_trades)
+    assert actual == expected, f"{leg['symbol']} trades differ when sharing the stream"
+    assert session.tick_count == TICKS
+    assert all(t.symbol == leg['symbol'] for t in session.position_manager.completed_trades)
+    total_trades += len(actual)
+assert total_trades > 0, "Fixture should trade"
+print(f"✓ 3 legs x {TICKS} ticks routed by token, {total_trades} trades identical to single-leg runs")
+print("✅ TEST 1 PASSED")
+
+# Test 2: Shared capital pool
+print("\n" + "=" * 80)
+print("TEST 2: Legs draw on one capital pool")
+print("=" * 80)
+
+
+def run_identical_legs(shared_capital):
+    pair = legs(2)
+    prices = price_series(11)
+    pair_trader = make_trader(pair, shared_capital=shared_capital)
+    for i in range(TICKS):
+        for leg in pair:
+            pair_trader.dispatch(ticks_for(leg, prices, i))
+    for session in pair_trader.sessions:
+        if pair_trader.capital_pool is not None:
+            with pair_trader.capital_pool.lend_to(session.position_manager):
+                session.close_position("Session End")
+        else:
+            session.close_position("Session End")
+    return pair_trader, [s.position_manager.completed_trades for s in pair_trader.sessions]
+
+
+def overlapping(first, second):
+    return any(a.entry_time < b.exit_time and b.entry_time < a.exit_time for a in first for b in second)
+
+
+separate_trader, separate = run_identical_legs(False)
+shared_trader, shared = run_identical_legs(True)
+assert summarize(separate[0]) == summarize(separate[1]), "Separate capital: identical legs trade identically"
+assert overlapping(*separate)
+assert shared_trader.capital_pool.available == shared_trader.sessions[1].position_manager.current_capital
+assert not overlapping(*shared), "A fully deployed pool must block the other leg's entries"
+assert len(shared[0]) > 0 and len(shared[0]) + len(shared[1]) < len(separate[0]) + len(separate[1])
+print(f"✓ Separate: {len(separate[0])}+{len(separate[1])} trades; "
+      f"shared: {len(shared[0])}+{len(shared[1])} trades, never both deployed")
+print("✅ TEST 2 PASSED")
+
+# Test 3: Per-symbol latency as N grows
+print("\n" + "=" * 80)
+print("TEST 3: Per-symbol processing time stays flat from N=1 to N=24")
+print("=" * 80)
+
+
+def per_symbol_mean_us(n):
+    instruments = legs(n)
+    prices = price_series(11)
+    scale_trader = make_trader(instruments)
+    for i in range(600):
+        for leg in instruments:
+            scale_trader.dispatch(ticks_for(leg, prices, i))
+    return statistics.median(s['latency_mean_us'] for s in scale_trader.stats())
+
+
+per_symbol_mean_us(1)  # Warm-up
+single = per_symbol_mean_us(1)
+many = per_symbol_mean_us(24)
+assert many < single * 3, f"Per-symbol latency grew with N: {single:.1f}us -> {many:.1f}us"
+print(f"✓ Median per-symbol mean: N=1 {single:.1f}us, N=24 {many:.1f}us")
+print("✅ TEST 3 PASSED")
+
+# Test 4: Configuration errors fail fast
+print("\n" + "=" * 80)
+print("TEST 4: Invalid multi_symbol configuration")
+print("=" * 80)
+
+for bad, message in (([], "empty"), ([{'symbol': 'X', 'exchange': 'NFO'}], "no token"),
+                     (legs(1) + legs(1), "Duplicate token")):
+    try:
+        make_trader(bad)
+        raise AssertionError(f"{bad} should be rejected")
+    except ValueError as e:
+        assert message in str(e), e
+print("✓ Empty list, missing token and duplicate token rejected")
+print("✅ TEST 4 PASSED")
+
+# Test 5: Same pipeline as LiveTrader
+print("\n" + "=" * 80)
+print("TEST 5: A leg trades like LiveTrader, including conflated bursts")
+print("=" * 80)
+
+leg = legs(1)[0]
+prices = price_series(12)
+single = LiveTrader(frozen_config=freeze_config(deepcopy(DEFAULT_CONFIG)), profile='batch')
+single.nan_streak, single.consecutive_valid_ticks = 0, 0
+single.nan_threshold = DEFAULT_CONFIG['strategy']['nan_streak_threshold']
+single.result_box = None
+multi = make_trader([leg])
+for i in range(TICKS):
+    single._on_tick_direct(ticks_for(leg, prices, i), leg['symbol'])
+    multi.dispatch(ticks_for(leg, prices, i))
+live_trades = single.position_manager.completed_trades
+assert live_trades and summarize(multi.sessions[0].position_manager.completed_trades) == summarize(live_trades)
+
+session = make_trader([leg]).sessions[0]
+now = IST.localize(START + timedelta(hours=1))
+session.active_position_id = session.position_manager.open_position(leg['symbol'], 100.0, now)
+stop_loss = session.position_manager.positions[session.active_position_id].stop_loss_price
+burst = TickConflator(threshold=2).merge([{'timestamp': now, 'price': price, 'volume': 10, 'token': leg['token']}
+                                          for price in (100.0, stop_loss - 1.0, 100.5)])
+session.on_tick(burst)
+assert session.active_position_id is None, "SL must trigger on the burst low"
+assert session.position_manager.completed_trades[-1].exit_price == stop_loss - 1.0
+print(f"✓ {len(live_trades)} trades identical to LiveTrader; SL hit at a conflated burst's low")
+print("✅ TEST 5 PASSED")
+
+# Test 6: Shutdown vs in-flight dispatch
+print("\n" + "=" * 80)
+print("TEST 6: Shutdown waits for the tick being dispatched")
+print("=" * 80)
+
+pair = legs(2)
+racing = make_trader(pair, shared_capital=True)
+slow_leg = racing.sessions[0]
+now = IST.localize(START + timedelta(hours=1))
+with racing.capital_pool.lend_to(slow_leg.position_manager):
+    slow_leg.active_position_id = slow_leg.position_manager.open_position(pair[0]['symbol'], 100.0, now)
+events = []
+real_on_tick, real_close = slow_leg.strategy.on_tick, slow_leg.close_position
+
+
+def slow_on_tick(tick):
+    events.append('tick started')
+    time.sleep(0.3)
+    events.append('tick done')
+    return real_on_tick(tick)
+
+
+def recorded_close(reason, now=None):
+    events.append('close')
+    real_close(reason, now)
+
+
+slow_leg.strategy.on_tick = slow_on_tick
+slow_leg.close_position = recorded_close
+in_flight = threading.Thread(target=racing.dispatch, args=(ticks_for(pair[0], price_series(11), 0),))
+in_flight.start()
+while not events:
+    time.sleep(0.001)
+racing._shutdown("Session End")
+in_flight.join()
+assert events == ['tick started', 'tick done', 'close'], events
+assert racing.capital_pool.available == slow_leg.position_manager.current_capital
+racing.dispatch(ticks_for(pair[0], price_series(11), 1))
+assert slow_leg.tick_count == 1, "Ticks after shutdown are dropped"
+print("✓ Legs closed only after the in-flight tick finished; later ticks ignored")
+print("✅ TEST 6 PASSED")
+
+print("\n" + "=" * 80)
+print("ALL MULTI-SYMBOL TRADER TESTS PASSED")
+print("=" * 80)
@@ -0,0 +1,129 @@
+"""
+Test: Result Cache (utils/result_cache.py)
+Verifies cache key stability, LRU size eviction, and that a repeated matrix
+run serves known combinations from the cache and only runs new ones.
+"""
+import sys
+import os
+import shutil
+import tempfile
+import time
+from copy import deepcopy
+from datetime import datetime, timedelta
+import logging
+
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '.')))
+
+from myQuant.config.defaults import DEFAULT_CONFIG
+from myQuant.utils.config_helper import freeze_config
+from myQuant.utils.result_cache import ResultCache, make_cache_key
+import myQuant.live.matrix_forward_test as matrix_module
+from myQuant.live.matrix_forward_test import MatrixTestRunner
+
+logging.disable(logging.CRITICAL)
+
+print("=" * 80)
+print("RESULT CACHE TESTS")
+print("=" * 80)
+
+tmp = tempfile.mkdtemp()
+os.chdir(tmp)
+csv_path = os.path.join(tmp, 'ticks.csv')
+rng = np.random.default_rng(11)
+start = datetime(2025, 11, 3, 9, 30, 0)
+pd.DataFrame({
+    'timestamp': [(start + timedelta(seconds=3 * i)).strftime('%Y-%m-%d %H:%M:%S') for i in range(400)],
+    'close': np.round((120 + np.cumsum(rng.normal(0, 0.35, 400))) / 0.05) * 0.05,
+}).to_csv(csv_path, index=False)
+
+# Test 1: Key depends on results-relevant inputs only
+print("\n" + "=" * 80)
+print("TEST 1: Cache key canonicalization")
+print("=" * 80)
+
+base = deepcopy(DEFAULT_CONFIG)
+key = make_cache_key('backtest', freeze_config(base), csv_path)
+
+relogged = deepcopy(DEFAULT_CONFIG)
+relogged['logging']['verbosity'] = 'debug'
+relogged['checkpoint']['enabled'] = True
+relogged['backtest']['data_path'] = '/elsewhere/ticks.csv'
+assert make_cache_key('backtest', relogged, csv_path) == key, "Logging/checkpoint/path changes must not change key"
+
+copied_csv = os.path.join(tmp, 'copy.csv')
+shutil.copyfile(csv_path, copied_csv)
+assert make_cache_key('backtest', base, copied_csv) == key, "Identical data content must give the same key"
+
+changed = deepcopy(DEFAULT_CONFIG)
+changed['strategy']['fast_ema'] += 1
+assert make_cache_key('backtest', changed, csv_path) != key, "Parameter change must change key"
+assert make_cache_key('matrix', base, csv_path) != key, "Run kind must be part of key"
+print("✅ TEST 1 PASSED")
+
+# Test 2: LRU eviction by size
+print("\n" + "=" * 80)
+print("TEST 2: Size-based eviction")
+print("=" * 80)
+
+cache = ResultCache(os.path.join(tmp, 'evict'), max_size_mb=0.07)  # ~73 KB: room for three 20 KB entries
+payload = b'x' * 20_000
+for name in ('a', 'b', 'c'):
+    cache.put(name, payload)
+    time.sleep(0.01)
+assert cache.get('a') == payload, "Entry should be readable"  # 'a' becomes most recently used
+time.sleep(0.01)
+cache.put('d', payload)
+assert cache.get('b') is None, "Least recently used entry should be evicted"
+assert all(cache.get(name) == payload for name in ('a', 'c', 'd')), "Recent entries should survive"
+assert cache.size_bytes() <= cache.max_size_bytes
+print(f"✓ Cache holds {cache.size_bytes()} bytes (limit {cache.max_size_bytes})")
+print("✅ TEST 2 PASSED")
+
+# Test 3: Grid refinement only runs new combinations
+print("\n" + "=" * 80)
+print("TEST 3: Matrix reuse")
+print("=" * 80)
+
+runs = []
+real_live_trader = matrix_module.LiveTrader
+
+
+class CountingLiveTrader(real_live_trader):
+    def start(self, *args, **kwargs):
+        runs.append(self.config['strategy']['fast_ema'])
+        return super().start(*args, **kwargs)
+
+
+matrix_module.LiveTrader = CountingLiveTrader
+try:
+    runner = MatrixTestRunner(csv_path, os.path.join(tmp, 'results'))
+    runner.add_parameter_grid('fast_ema', [5, 9])
+    first = runner.run(phase_name='first', output_filename='first.xlsx')
+    assert sorted(runs) == [5, 9], f"First run should execute both tests, ran {runs}"
+
+    runs.clear()
+    runner.add_parameter_grid('fast_ema', [5, 9, 12])
+    second = runner.run(phase_name='second', output_filename='second.xlsx')
+    assert runs == [12], f"Only the new combination should run, ran {runs}"
+    columns = ['total_trades', 'total_pnl', 'max_drawdown']
+    assert second[columns].iloc[:2].to_dict('records') == first[columns].to_dict('records'), \
+        "Cached metrics must match original metrics"
+
+    runs.clear()
+    runner.run(phase_name='third', output_filename='third.xlsx', use_cache=False)
+    assert sorted(runs) == [5, 9, 12], "use_cache=False must recompute every test"
+finally:
+    matrix_module.LiveTrader = real_live_trader
+print("✓ Refined grid ran 1 new test; --no-cache reran all 3")
+print("✅ TEST 3 PASSED")
+
+os.chdir(os.path.dirname(os.path.abspath(__file__)))
+shutil.rmtree(tmp, ignore_errors=True)
+
+print("\n" + "=" * 80)
+print("ALL RESULT CACHE TESTS PASSED")
+print("=" * 80)
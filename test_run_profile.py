@@ -0,0 +1,129 @@
+"""
+Test: LiveTrader Run Profiles (live/run_profile.py)
+Verifies that batch and benchmark runs skip exports, GUI hooks and pacing,
+return in-memory trades identical to an interactive run, and that unknown
+profiles fail fast.
+"""
+import sys
+import os
+import shutil
+import tempfile
+import time
+from datetime import datetime, timedelta
+from copy import deepcopy
+import logging
+
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '.')))
+
+from myQuant.config.defaults import DEFAULT_CONFIG
+from myQuant.utils.config_helper import freeze_config
+from myQuant.live import trader as trader_module
+from myQuant.live.trader import LiveTrader
+from myQuant.live.run_profile import RUN_PROFILES, get_run_profile
+
+logging.disable(logging.CRITICAL)
+
+print("=" * 80)
+print("RUN PROFILE TESTS")
+print("=" * 80)
+
+tmp = tempfile.mkdtemp()
+csv_path = os.path.join(tmp, 'ticks.csv')
+rng = np.random.default_rng(11)
+start = datetime(2025, 11, 3, 9, 30, 0)
+pd.DataFrame({
+    'timestamp': [(start + timedelta(seconds=3 * i)).strftime('%Y-%m-%d %H:%M:%S') for i in range(600)],
+    'close': np.round((120 + np.cumsum(rng.normal(0, 0.35, 600))) / 0.05) * 0.05,
+}).to_csv(csv_path, index=False)
+
+config = deepcopy(DEFAULT_CONFIG)
+config['data_simulation'] = {'enabled': True, 'file_path': csv_path}
+frozen_config = freeze_config(config)
+
+
+def summarize(trades):
+    return [(t.entry_time, t.exit_time, t.entry_price, t.exit_price, t.exit_reason) for t in trades]
+
+
+# Test 1: Profile lookup
+print("\n" + "=" * 80)
+print("TEST 1: Profile lookup")
+print("=" * 80)
+
+assert set(RUN_PROFILES) == {'interactive', 'batch', 'benchmark'}
+assert get_run_profile('interactive').export_results and get_run_profile('interactive').pacing
+try:
+    LiveTrader(frozen_config=frozen_config, profile='silent')
+    raise AssertionError("Unknown profile should raise")
+except ValueError as e:
+    assert 'silent' in str(e)
+print("✓ Profiles registered; unknown profile raises ValueError")
+print("✅ TEST 1 PASSED")
+
+# Test 2: Batch run has no side effects and returns trades
+print("\n" + "=" * 80)
+print("TEST 2: Batch run")
+print("=" * 80)
+
+sleeps = []
+callbacks = []
+
+
+class _RecordingTime:
+    """Stands in for the time module inside trader.py to count sleeps."""
+
+    def __getattr__(self, name):
+        return getattr(time, name)
+
+    @staticmethod
+    def sleep(seconds):
+        sleeps.append(seconds)
+
+
+trader_module.time = _RecordingTime()
+try:
+    batch = LiveTrader(frozen_config=frozen_config, profile='batch')
+    assert batch.results_exporter is None, "Batch run must not build an Excel exporter"
+    assert batch.broker.file_simulator.tick_delay == 0, "Batch run must not pace the simulator"
+    batch_trades = batch.start(performance_callback=lambda t: callbacks.append(t.tick_count))
+    assert sleeps == [], f"Batch run should not sleep, slept {len(sleeps)} times"
+    assert callbacks == [], "Batch run must ignore GUI callbacks"
+
+    interactive = LiveTrader(frozen_config=frozen_config)
+    assert interactive.results_exporter is not None
+    interactive.broker.file_simulator.tick_delay = 0
+    interactive._export_results = lambda: None  # Keep the Excel export out of the test
+    interactive_trades = interactive.start()
+    assert sleeps, "Interactive run keeps its GUI yields"
+finally:
+    trader_module.time = time
+
+assert batch_trades is batch.position_manager.completed_trades
+assert len(batch_trades) > 0, "Fixture should trade"
+assert summarize(batch_trades) == summarize(interactive_trades), "Profiles must not change trades"
+print(f"✓ {len(batch_trades)} trades returned in memory, identical to the interactive run")
+print("✅ TEST 2 PASSED")
+
+# Test 3: Benchmark run reports throughput
+print("\n" + "=" * 80)
+print("TEST 3: Benchmark run")
+print("=" * 80)
+
+bench = LiveTrader(frozen_config=frozen_config, profile='benchmark')
+bench.start()
+stats = bench.run_stats
+assert stats['ticks'] == 600, f"Expected 600 ticks, got {stats}"
+assert stats['ticks_per_second'] > 0
+assert batch.run_stats == {}, "Only benchmark runs record throughput"
+print(f"✓ {stats['ticks']} ticks at {stats['ticks_per_second']:.0f} ticks/sec")
+print("✅ TEST 3 PASSED")
+
+shutil.rmtree(tmp, ignore_errors=True)
+
+print("\n" + "=" * 80)
+print("ALL RUN PROFILE TESTS PASSED")
+print("=" * 80)
@@ -0,0 +1,171 @@
+"""
+Test: Streaming Scrip Master Parse (utils/cache_manager.py iter_scrip_master)
+Verifies that entries are decoded one at a time regardless of chunk
+boundaries, that symbol/token/exchange/lot size/tick size/expiry/strike land
+in the compact index, that a local master file refreshes the cache offline,
+and that peak memory is far below loading the whole master with json.load.
+"""
+import sys
+import os
+import json
+import shutil
+import tempfile
+import tracemalloc
+import logging
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '.')))
+
+from myQuant.utils.cache_manager import (
+    iter_scrip_master, build_instrument_index, refresh_symbol_cache, load_symbol_cache, get_symbol_index,
+    get_symbol_details, clear_symbol_index, _master_chunks, INDEX_FILE_SUFFIX
+)
+
+logging.disable(logging.CRITICAL)
+
+print("=" * 80)
+print("SCRIP MASTER STREAMING TESTS")
+print("=" * 80)
+
+tmp = tempfile.mkdtemp()
+master_path = os.path.join(tmp, 'OpenAPIScripMaster.json')
+cache_path = os.path.join(tmp, 'symbol_cache.json')
+
+# Entries shaped like the Angel One scrip master (prices in paise, all strings)
+entries = []
+token = 40000
+for underlying in ('NIFTY', 'BANKNIFTY', 'FINNIFTY'):
+    for expiry in ('28NOV2024', '26DEC2024', '30JAN2025'):
+        entries.append({'token': str(token), 'symbol': f'{underlying}{expiry[:5]}{expiry[7:]}FUT', 'name': underlying,
+                        'expiry': expiry, 'strike': '-1.000000', 'lotsize': '25', 'instrumenttype': 'FUTIDX',
+                        'exch_seg': 'NFO', 'tick_size': '5.000000'})
+        token += 1
+        for strike in range(20000, 30000, 50):
+            for kind in ('CE', 'PE'):
+                entries.append({'token': str(token), 'symbol': f'{underlying}{expiry[:5]}{expiry[7:]}{strike}{kind}',
+                                'name': underlying, 'expiry': expiry, 'strike': f'{strike * 100}.000000',
+                                'lotsize': '75', 'instrumenttype': 'OPTIDX', 'exch_seg': 'NFO',
+                                'tick_size': '5.000000'})
+                token += 1
+for i in range(40000):
+    entries.append({'token': str(token), 'symbol': f'EQ{i:05d}-EQ', 'name': f'EQ{i:05d}', 'expiry': '',
+                    'strike': '-1.000000', 'lotsize': '1', 'instrumenttype': '', 'exch_seg': 'NSE',
+                    'tick_size': '5.000000'})
+    token += 1
+entries.append({'token': '99926000', 'symbol': 'Nifty 50', 'name': 'NIFTY', 'expiry': '', 'strike': '0.000000',
+                'lotsize': '1', 'instrumenttype': 'AMXIDX', 'exch_seg': 'NSE', 'tick_size': '-1.000000'})
+with open(master_path, 'w', encoding='utf-8') as f:
+    json.dump(entries, f, indent=4)  # The published master is pretty-printed
+
+# Test 1: Chunk boundaries
+print("\n" + "=" * 80)
+print("TEST 1: Entries decoded identically for any chunk size")
+print("=" * 80)
+
+head = entries[:200]
+text = json.dumps(head, indent=4)
+for size in (1, 7, 64, 4096):
+    chunks = [text[i:i + size] for i in range(0, len(text), size)]
+    assert list(iter_scrip_master(chunks)) == head, f"chunk size {size}"
+assert list(iter_scrip_master(['[', ']'])) == []
+for broken in ('{"a": 1}', '[{"a": 1}', '[{"a": 1}, {"b"', ''):
+    try:
+        list(iter_scrip_master([broken]))
+        raise AssertionError(f"Truncated/invalid master should raise: {broken!r}")
+    except ValueError:
+        pass
+assert sum(1 for _ in iter_scrip_master(_master_chunks(master_path, chunk_size=1000))) == len(entries)
+print(f"✓ {len(head)} entries identical across chunk sizes 1..4096; truncation raises")
+print("✅ TEST 1 PASSED")
+
+# Test 2: Compact index fields
+print("\n" + "=" * 80)
+print("TEST 2: Fields extracted into the index")
+print("=" * 80)
+
+index = build_instrument_index(iter_scrip_master(_master_chunks(master_path)))
+assert len(index) == len(entries)
+assert index.symbols == sorted(e['symbol'] for e in entries)
+assert index.details('NIFTY28NOV2424000CE') == {
+    'exchange': 'NFO', 'lot_size': 75, 'tick_size': 0.05, 'expiry': '28NOV2024', 'strike': 24000.0}
+assert index.details('BANKNIFTY26DEC24FUT') == {
+    'exchange': 'NFO', 'lot_size': 25, 'tick_size': 0.05, 'expiry': '26DEC2024', 'strike': None}
+assert index.details('EQ00042-EQ')['exchange'] == 'NSE' and index.details('EQ00042-EQ')['expiry'] is None
+assert index.details('Nifty 50')['strike'] is None and index.token('Nifty 50') == '99926000'
+assert index.details('UNKNOWN') is None
+for entry in entries[::997]:
+    assert index.token(entry['symbol']) == entry['token']
+duplicate = build_instrument_index([{'symbol': 'X', 'token': '1', 'lotsize': '10'},
+                                    {'symbol': 'X', 'token': '2', 'lotsize': '20'}, {'symbol': 'Y'}])
+assert duplicate.tokens == {'X': '2'} and duplicate.details('X')['lot_size'] == 20
+print("✓ Symbol, token, exchange, lot size, tick size, expiry and strike per instrument")
+print("✅ TEST 2 PASSED")
+
+# Test 3: Offline refresh from a local file
+print("\n" + "=" * 80)
+print("TEST 3: Local-file refresh writes a backward-compatible cache")
+print("=" * 80)
+
+assert refresh_symbol_cache(cache_path, url=master_path) == len(entries)
+with open(cache_path, 'r', encoding='utf-8') as f:
+    cache_data = json.load(f)
+assert cache_data['symbols']['NIFTY28NOV2424000CE'] == index.token('NIFTY28NOV2424000CE')
+assert load_symbol_cache(cache_path) == index.tokens
+clear_symbol_index()
+details = get_symbol_details('FINNIFTY30JAN2525050PE', cache_path)
+assert details['strike'] == 25050.0 and details['lot_size'] == 75 and details['token']
+persisted = get_symbol_index(cache_path, persist=True)
+clear_symbol_index()
+reloaded = get_symbol_index(cache_path, persist=True)
+assert os.path.exists(cache_path + INDEX_FILE_SUFFIX)
+assert reloaded.symbols == persisted.symbols
+assert all(reloaded.details(s) == persisted.details(s) for s in persisted.symbols[::501])
+print("✓ Cache keeps the symbols map; instrument fields survive JSON and the binary sidecar")
+print("✅ TEST 3 PASSED")
+
+# Test 4: Peak memory
+print("\n" + "=" * 80)
+print("TEST 4: Peak memory vs json.load of the whole master")
+print("=" * 80)
+
+
+def whole_document():
+    with open(master_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return {e['symbol']: str(e['token']) for e in data if e.get('symbol') and e.get('token')}
+
+
+def streamed():
+    return build_instrument_index(iter_scrip_master(_master_chunks(master_path)))
+
+
+def memory_of(fn):
+    """(result, peak bytes, bytes still held by the result)."""
+    tracemalloc.start()
+    result = fn()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, peak, retained
+
+
+whole_map, whole_peak, whole_retained = memory_of(whole_document)
+streamed_index, streamed_peak, streamed_retained = memory_of(streamed)
+assert streamed_index.tokens == whole_map
+assert streamed_peak < whole_peak / 3, \
+    f"Streaming peak {streamed_peak / 1e6:.1f}MB vs whole document {whole_peak / 1e6:.1f}MB"
+# Working memory of the parse itself, beyond what the result keeps
+whole_working = whole_peak - whole_retained
+streamed_working = streamed_peak - streamed_retained
+assert streamed_working < whole_working / 5, \
+    f"Streaming working set {streamed_working / 1e6:.1f}MB vs {whole_working / 1e6:.1f}MB"
+print(f"✓ {len(entries)} entries: peak {whole_peak / 1e6:.1f}MB -> {streamed_peak / 1e6:.1f}MB "
+      f"({whole_peak / streamed_peak:.1f}x, index with all fields included); parse working set "
+      f"{whole_working / 1e6:.1f}MB -> {streamed_working / 1e6:.1f}MB ({whole_working / streamed_working:.1f}x)")
+print("✅ TEST 4 PASSED")
+
+clear_symbol_index()
+shutil.rmtree(tmp, ignore_errors=True)
+
+print("\n" + "=" * 80)
+print("ALL SCRIP MASTER STREAMING TESTS PASSED")
+print("=" * 80)
@@ -0,0 +1,152 @@
+"""
+Test: Precomputed Entry-Signal Arrays + Entry State Machine
+Verifies run_array_backtest() reproduces the tick-by-tick liveStrategy +
+PositionManager loop (LiveTrader polling order) trade for trade.
+"""
+import sys
+import os
+import time as _time
+from datetime import datetime, timedelta
+from copy import deepcopy
+import logging
+
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '.')))
+
+from myQuant.config.defaults import DEFAULT_CONFIG
+from myQuant.utils.config_helper import freeze_config
+from myQuant.utils.time_utils import IST
+from myQuant.core.liveStrategy import ModularIntradayStrategy
+from myQuant.core.position_manager import PositionManager
+from myQuant.core.signal_arrays import (
+    run_array_backtest, compute_green_tick_counts, compute_entry_signal_array
+)
+
+logging.disable(logging.CRITICAL)
+
+print("=" * 80)
+print("SIGNAL ARRAY EQUIVALENCE TESTS")
+print("=" * 80)
+
+
+def make_config(strategy=None, risk=None):
+    config = deepcopy(DEFAULT_CONFIG)
+    config['strategy'].update(strategy or {})
+    config['risk'].update(risk or {})
+    return freeze_config(config)
+
+
+def make_ticks(seed, n=7000, start=datetime(2025, 11, 3, 9, 30, 0)):
+    rng = np.random.default_rng(seed)
+    prices = np.round((120 + np.cumsum(rng.normal(0, 0.35, n))) / 0.05) * 0.05
+    return pd.DataFrame({
+        'timestamp': [start + timedelta(seconds=3 * i) for i in range(n)],
+        'price': prices,
+        'volume': rng.integers(1, 5000, n),
+    })
+
+
+def reference_trades(frozen_config, df):
+    """Tick-by-tick reference following LiveTrader._run_polling_loop."""
+    strategy = ModularIntradayStrategy(frozen_config)
+    pm = PositionManager(frozen_config, strategy_callback=strategy.on_position_exit)
+    active = None
+    for row in df.itertuples(index=False):
+        now = IST.localize(row.timestamp)
+        tick = {'timestamp': now, 'price': float(row.price), 'volume': int(row.volume)}
+        should_exit, _ = strategy.should_exit_for_session(now)
+        if should_exit:
+            if active and active in pm.positions:
+                pm.close_position_full(active, tick['price'], now, "Session End")
+                strategy.on_position_closed(active, "Session End")
+            break
+        signal = strategy.on_tick(tick)
+        if signal and signal.action == 'BUY' and not active:
+            active = strategy.open_long(pd.Series({'close': signal.price}), now, pm)
+        if active:
+            pm.process_positions({'close': tick['price']}, now)
+            if active not in pm.positions:
+                strategy.on_position_closed(active, "Risk Management")
+                active = None
+    return pm.completed_trades
+
+
+def summarize(trades):
+    return [(t.entry_time, t.exit_time, round(t.entry_price, 6), round(t.exit_price, 6),
+             t.quantity, t.exit_reason) for t in trades]
+
+
+# Test 1: Green tick streaks
+print("\n" + "=" * 80)
+print("TEST 1: Green tick counts match _update_green_tick_count")
+print("=" * 80)
+
+for noise in (False, True):
+    frozen = make_config(strategy={'noise_filter_enabled': noise})
+    df = make_ticks(7, n=2000)
+    strategy = ModularIntradayStrategy(frozen)
+    expected = []
+    for price in df['price']:
+        strategy._update_green_tick_count(float(price))
+        expected.append(strategy.green_bars_count)
+    actual = compute_green_tick_counts(df['price'].to_numpy(dtype=float), frozen)
+    assert list(actual) == expected, f"Green tick counts diverged (noise_filter={noise})"
+    print(f"✓ noise_filter_enabled={noise}")
+print("✅ TEST 1 PASSED")
+
+# Test 2: Stateless signal array vs entry_signal()
+print("\n" + "=" * 80)
+print("TEST 2: Entry signal array matches entry_signal()")
+print("=" * 80)
+
+frozen = make_config(strategy={'use_macd': True, 'use_vwap': True, 'use_htf_trend': True})
+df = make_ticks(11, n=3000)
+strategy = ModularIntradayStrategy(frozen)
+expected = []
+for row in df.itertuples(index=False):
+    updated = strategy.process_tick_or_bar({'price': float(row.price), 'volume': int(row.volume),
+                                            'timestamp': IST.localize(row.timestamp)})
+    expected.append(bool(strategy.entry_signal(updated)))
+actual = compute_entry_signal_array(df, frozen)
+assert list(actual) == expected, "Signal array diverged from entry_signal()"
+print(f"✓ {int(actual.sum())} / {len(actual)} ticks pass all enabled checks")
+print("✅ TEST 2 PASSED")
+
+# Test 3: Full backtest equivalence (state machine + PositionManager)
+print("\n" + "=" * 80)
+print("TEST 3: run_array_backtest matches tick-by-tick loop")
+print("=" * 80)
+
+scenarios = [
+    ({}, {}),
+    ({'use_macd': True}, {'max_positions_per_day': 5}),
+    ({'use_vwap': True, 'consecutive_green_bars': 2}, {'base_sl_points': 6.0, 'max_base_sl': 6.0,
+                                                       'min_base_sl': 2.0, 'sl_regression_step': 2.0}),
+    ({'Enable_control_base_sl_green_ticks': False}, {'price_above_exit_filter_enabled': False,
+                                                     'sl_regression_enabled': False}),
+]
+for seed, (strategy_overrides, risk_overrides) in enumerate(scenarios):
+    frozen = make_config(strategy_overrides, risk_overrides)
+    df = make_ticks(100 + seed)
+
+    start = _time.perf_counter()
+    expected = summarize(reference_trades(frozen, df))
+    reference_elapsed = _time.perf_counter() - start
+
+    start = _time.perf_counter()
+    actual = summarize(run_array_backtest(df, frozen).completed_trades)
+    array_elapsed = _time.perf_counter() - start
+
+    assert actual == expected, (
+        f"Scenario {seed} diverged: {len(expected)} reference trades vs {len(actual)} array trades"
+    )
+    print(f"✓ Scenario {seed}: {len(actual)} trades match "
+          f"(reference {reference_elapsed:.2f}s, arrays {array_elapsed:.2f}s)")
+print("✅ TEST 3 PASSED")
+
+print("\n" + "=" * 80)
+print("ALL SIGNAL ARRAY TESTS PASSED")
+print("=" * 80)
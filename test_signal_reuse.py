@@ -0,0 +1,85 @@
+"""
+Test: Signal-Stream Reuse (MatrixTestRunner reuse_signals / core/signal_arrays.replay_positions)
+Verifies a risk sweep computes one signal stream per strategy group and that
+replaying exits over it reproduces the LiveTrader results of every variant.
+"""
+import sys
+import os
+import shutil
+import tempfile
+from datetime import datetime, timedelta
+import logging
+
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '.')))
+
+import myQuant.live.matrix_forward_test as matrix_module
+from myQuant.live.matrix_forward_test import MatrixTestRunner
+
+logging.disable(logging.CRITICAL)
+
+print("=" * 80)
+print("SIGNAL REUSE TESTS")
+print("=" * 80)
+
+tmp = tempfile.mkdtemp()
+os.chdir(tmp)
+csv_path = os.path.join(tmp, 'ticks.csv')
+rng = np.random.default_rng(21)
+start = datetime(2025, 11, 3, 9, 30, 0)
+pd.DataFrame({
+    'timestamp': [(start + timedelta(seconds=3 * i)).strftime('%Y-%m-%d %H:%M:%S') for i in range(600)],
+    'close': np.round((120 + np.cumsum(rng.normal(0, 0.35, 600))) / 0.05) * 0.05,
+}).to_csv(csv_path, index=False)
+
+runner = MatrixTestRunner(csv_path, os.path.join(tmp, 'results'))
+runner.add_parameter_grid('trail_distance_points', [2.0, 4.0])
+runner.add_parameter_grid('fast_ema', [5, 9])
+runner.add_parameter_grid('sl_regression_enabled', [True, False])
+
+# Test 1: One stream per strategy group
+print("\n" + "=" * 80)
+print("TEST 1: Streams computed once per group")
+print("=" * 80)
+
+streams = []
+real_compute = matrix_module.compute_signal_stream
+
+
+def counting_compute(df, config, timestamps=None):
+    streams.append(config['strategy']['fast_ema'])
+    return real_compute(df, config, timestamps)
+
+
+matrix_module.compute_signal_stream = counting_compute
+try:
+    replayed = runner.run(phase_name='replay', output_filename='replay.xlsx', use_cache=False,
+                          deduplicate=False, reuse_signals=True)
+finally:
+    matrix_module.compute_signal_stream = real_compute
+assert len(replayed) == 8 and replayed['validation_passed'].all()
+assert sorted(streams) == [5, 9], f"Expected one stream per fast_ema group, computed {streams}"
+print(f"✓ 8 risk variants replayed over {len(streams)} signal streams")
+print("✅ TEST 1 PASSED")
+
+# Test 2: Replay matches LiveTrader
+print("\n" + "=" * 80)
+print("TEST 2: Replayed results match LiveTrader")
+print("=" * 80)
+
+live = runner.run(phase_name='live', output_filename='live.xlsx', use_cache=False, deduplicate=False)
+columns = ['test_number', 'total_trades', 'total_pnl', 'win_rate', 'max_drawdown']
+assert np.allclose(replayed[columns].to_numpy(dtype=float), live[columns].to_numpy(dtype=float)), \
+    f"Replay differs from LiveTrader:\n{replayed[columns]}\n{live[columns]}"
+print(f"✓ Trades/PnL/drawdown identical for all {len(live)} combinations")
+print("✅ TEST 2 PASSED")
+
+os.chdir(os.path.dirname(os.path.abspath(__file__)))
+shutil.rmtree(tmp, ignore_errors=True)
+
+print("\n" + "=" * 80)
+print("ALL SIGNAL REUSE TESTS PASSED")
+print("=" * 80)
@@ -0,0 +1,166 @@
+"""
+Test: Indexed Instrument Master (utils/cache_manager.py SymbolIndex)
+Verifies that the symbol cache is parsed once per process, that lookups,
+prefix and derivative queries match a brute-force scan, that editing the file
+invalidates the index, that the binary sidecar round-trips, and that
+autocomplete answers well under a millisecond.
+"""
+import sys
+import os
+import json
+import shutil
+import statistics
+import tempfile
+import time
+from datetime import date
+import logging
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '.')))
+
+from myQuant.utils import cache_manager
+from myQuant.utils.cache_manager import (
+    get_symbol_index, clear_symbol_index, get_token_for_symbol, get_symbols_list, get_symbol_details,
+    is_simple_format, parse_derivative_symbol, INDEX_FILE_SUFFIX
+)
+
+logging.disable(logging.CRITICAL)
+
+print("=" * 80)
+print("SYMBOL INDEX TESTS")
+print("=" * 80)
+
+tmp = tempfile.mkdtemp()
+cache_path = os.path.join(tmp, 'symbol_cache.json')
+
+symbols = {}
+token = 30000
+for underlying in ('NIFTY', 'BANKNIFTY', 'FINNIFTY', 'NIFTYNXT50', 'MIDCPNIFTY'):
+    for expiry in ('05NOV24', '12NOV24', '28NOV24', '26DEC24', '30JAN25'):
+        symbols[f'{underlying}{expiry}FUT'] = str(token)
+        token += 1
+        for strike in range(20000, 30000, 50):
+            for kind in ('CE', 'PE'):
+                symbols[f'{underlying}{expiry}{strike}{kind}'] = str(token)
+                token += 1
+for i in range(3000):
+    symbols[f'EQ{i:04d}-EQ'] = str(token)
+    token += 1
+
+
+def write_cache(mapping):
+    with open(cache_path, 'w', encoding='utf-8') as f:
+        json.dump({'timestamp': '2025-11-03T09:00:00', 'symbols': mapping}, f)
+
+
+write_cache(symbols)
+parses = []
+real_load = cache_manager.load_instrument_cache
+
+
+def counting_load(path=cache_manager.DEFAULT_CACHE_PATH):
+    parses.append(path)
+    return real_load(path)
+
+
+cache_manager.load_instrument_cache = counting_load
+
+# Test 1: One parse serves every accessor
+print("\n" + "=" * 80)
+print("TEST 1: Cache file parsed once for all lookups")
+print("=" * 80)
+
+assert get_token_for_symbol('NIFTY28NOV2424000CE', cache_path) == symbols['NIFTY28NOV2424000CE']
+assert get_token_for_symbol('UNKNOWN', cache_path) == ""
+assert get_symbols_list(cache_path) == sorted(symbols)
+assert get_symbol_details('BANKNIFTY26DEC24FUT', cache_path) == {
+    'token': symbols['BANKNIFTY26DEC24FUT'], 'symbol': 'BANKNIFTY26DEC24FUT'}
+assert is_simple_format(cache_path)
+assert len(parses) == 1, f"Cache parsed {len(parses)} times"
+print(f"✓ {len(symbols)} symbols, 4 accessors, 1 parse")
+print("✅ TEST 1 PASSED")
+
+# Test 2: Queries match brute force
+print("\n" + "=" * 80)
+print("TEST 2: Prefix, substring and derivative queries")
+print("=" * 80)
+
+index = get_symbol_index(cache_path)
+for prefix in ('NIFTY28NOV2424', 'BANK', 'EQ00', 'ZZZ', ''):
+    assert index.prefix(prefix) == sorted(s for s in symbols if s.startswith(prefix)), prefix
+assert index.prefix('NIFTY', limit=5) == sorted(s for s in symbols if s.startswith('NIFTY'))[:5]
+matches, total = index.search('24000CE', limit=10)
+expected = sorted(s for s in symbols if '24000CE' in s)
+assert matches == expected[:10] and total == len(expected)
+
+assert parse_derivative_symbol('NIFTYNXT5028NOV2424050PE') == {
+    'underlying': 'NIFTYNXT50', 'expiry': date(2024, 11, 28), 'strike': 24050.0, 'option_type': 'PE'}
+assert parse_derivative_symbol('EQ0001-EQ') is None
+chain = index.derivatives(underlying='NIFTY', expiry=date(2024, 11, 28), strike=24000.0)
+assert chain == ['NIFTY28NOV2424000CE', 'NIFTY28NOV2424000PE']
+futures = index.derivatives(underlying='FINNIFTY', option_type='FUT')
+assert futures == sorted(s for s in symbols if s.startswith('FINNIFTY') and s.endswith('FUT'))
+assert index.derivatives(underlying='NIFTY', strike=99999.0) == []
+assert index.expiries('MIDCPNIFTY') == [date(2024, 11, 5), date(2024, 11, 12), date(2024, 11, 28),
+                                        date(2024, 12, 26), date(2025, 1, 30)]
+print("✓ Prefix/substring results equal a full scan; chain by underlying/expiry/strike/type")
+print("✅ TEST 2 PASSED")
+
+# Test 3: Autocomplete latency
+print("\n" + "=" * 80)
+print("TEST 3: Autocomplete well under a millisecond")
+print("=" * 80)
+
+queries = ['N', 'NI', 'NIF', 'NIFTY', 'NIFTY2', 'NIFTY28', 'NIFTY28NOV', 'BANKNIFTY26DEC2425', 'EQ1', 'FIN']
+timings = []
+for _ in range(50):
+    for query in queries:
+        started = time.perf_counter()
+        index.prefix(query, limit=20)
+        timings.append(time.perf_counter() - started)
+median_us = statistics.median(timings) * 1e6
+worst_us = max(timings) * 1e6
+assert median_us < 100, f"Autocomplete median {median_us:.1f}us"
+started = time.perf_counter()
+for _ in range(1000):
+    index.token('NIFTY28NOV2424000CE')
+lookup_us = (time.perf_counter() - started) / 1000 * 1e6
+print(f"✓ Prefix query median {median_us:.1f}us (max {worst_us:.1f}us) over {len(index)} symbols; "
+      f"token lookup {lookup_us:.2f}us")
+print("✅ TEST 3 PASSED")
+
+# Test 4: Invalidation and persistence
+print("\n" + "=" * 80)
+print("TEST 4: mtime invalidation and binary sidecar")
+print("=" * 80)
+
+symbols['SENSEX28NOV2480000CE'] = '999999'
+write_cache(symbols)
+os.utime(cache_path, ns=(os.stat(cache_path).st_atime_ns, os.stat(cache_path).st_mtime_ns + 10 ** 9))
+assert get_token_for_symbol('SENSEX28NOV2480000CE', cache_path) == '999999', "Stale index after file change"
+assert len(parses) == 2
+get_symbols_list(cache_path)
+assert len(parses) == 2
+
+clear_symbol_index()
+persisted = get_symbol_index(cache_path, persist=True)
+assert os.path.exists(cache_path + INDEX_FILE_SUFFIX) and len(parses) == 3
+clear_symbol_index()
+reloaded = get_symbol_index(cache_path, persist=True)
+assert len(parses) == 3, "Fresh index should load from the sidecar, not the JSON"
+assert reloaded.symbols == persisted.symbols and reloaded.tokens == persisted.tokens
+assert os.path.getsize(cache_path + INDEX_FILE_SUFFIX) < os.path.getsize(cache_path)
+
+os.utime(cache_path, ns=(os.stat(cache_path).st_atime_ns, os.stat(cache_path).st_mtime_ns + 10 ** 9))
+clear_symbol_index()
+get_symbol_index(cache_path, persist=True)
+assert len(parses) == 4, "Sidecar of an older file version must be ignored"
+print("✓ File change re-parses; sidecar reused only for the same mtime/size")
+print("✅ TEST 4 PASSED")
+
+cache_manager.load_instrument_cache = real_load
+shutil.rmtree(tmp, ignore_errors=True)
+
+print("\n" + "=" * 80)
+print("ALL SYMBOL INDEX TESTS PASSED")
+print("=" * 80)
@@ -0,0 +1,221 @@
+"""
+Test: SPSC Tick Ring Buffer (live/tick_ring_buffer.py)
+Verifies FIFO delivery, each overflow policy and its counters, torn-read
+protection under a concurrent producer, the BrokerAdapter hand-off, and
+backlog conflation (including SL checks against the burst's extremes).
+"""
+import sys
+import os
+import threading
+import time
+from datetime import datetime
+from copy import deepcopy
+import logging
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '.')))
+
+from myQuant.config.defaults import DEFAULT_CONFIG
+from myQuant.utils.config_helper import freeze_config
+from myQuant.utils.time_utils import IST
+from myQuant.live.tick_ring_buffer import TickRingBuffer, TickConflator
+from myQuant.live.broker_adapter import BrokerAdapter
+from myQuant.live.run_profile import get_run_profile
+from myQuant.live.trader import LiveTrader, process_positions, create_tick_row
+
+logging.disable(logging.CRITICAL)
+
+print("=" * 80)
+print("TICK RING BUFFER TESTS")
+print("=" * 80)
+
+
+def tick(seq):
+    return {'timestamp': seq, 'price': seq * 0.5, 'volume': seq, 'symbol': 'NIFTY'}
+
+
+def drain(ring):
+    out = []
+    while (item := ring.pop()) is not None:
+        out.append(item['volume'])
+    return out
+
+
+# Test 1: FIFO and counters
+print("\n" + "=" * 80)
+print("TEST 1: FIFO delivery and depth counters")
+print("=" * 80)
+
+ring = TickRingBuffer(4)
+for seq in range(3):
+    assert ring.push(tick(seq))
+assert len(ring) == 3 and ring.stats()['high_water_mark'] == 3
+assert ring.pop() == tick(0)
+ring.push(tick(3))
+assert drain(ring) == [1, 2, 3]
+stats = ring.stats()
+assert (stats['produced'], stats['consumed'], stats['dropped'], stats['depth']) == (4, 4, 0, 0)
+assert stats['latency_max_us'] > 0
+try:
+    TickRingBuffer(4, 'drop_random')
+    raise AssertionError("Unknown policy should raise")
+except ValueError:
+    pass
+print("✓ Ticks delivered in order with depth/high-water/latency counters")
+print("✅ TEST 1 PASSED")
+
+# Test 2: Overflow policies
+print("\n" + "=" * 80)
+print("TEST 2: drop_oldest / drop_newest / block")
+print("=" * 80)
+
+oldest = TickRingBuffer(4, 'drop_oldest')
+for seq in range(10):
+    assert oldest.push(tick(seq))
+assert oldest.stats()['dropped_oldest'] == 6, "Overwritten ticks count as drops before they are read"
+assert drain(oldest) == [6, 7, 8, 9]
+assert oldest.stats()['dropped_oldest'] == 6 and oldest.stats()['high_water_mark'] == 4
+
+newest = TickRingBuffer(4, 'drop_newest')
+accepted = [newest.push(tick(seq)) for seq in range(10)]
+assert accepted == [True] * 4 + [False] * 6
+assert drain(newest) == [0, 1, 2, 3] and newest.stats()['dropped_newest'] == 6
+
+blocking = TickRingBuffer(2, 'block', block_timeout_seconds=5.0)
+blocking.push(tick(0))
+blocking.push(tick(1))
+threading.Timer(0.05, blocking.pop).start()
+started = time.perf_counter()
+assert blocking.push(tick(2)), "Blocked producer should succeed once the consumer frees a slot"
+assert time.perf_counter() - started >= 0.04
+assert drain(blocking) == [1, 2]
+impatient = TickRingBuffer(1, 'block', block_timeout_seconds=0.01)
+impatient.push(tick(0))
+assert not impatient.push(tick(1)) and impatient.stats()['dropped_newest'] == 1
+print("✓ Each policy keeps the expected ticks and counts every drop")
+print("✅ TEST 2 PASSED")
+
+# Test 3: Concurrent producer, no torn or duplicated ticks
+print("\n" + "=" * 80)
+print("TEST 3: Concurrent producer/consumer")
+print("=" * 80)
+
+for policy in ('drop_oldest', 'drop_newest', 'block'):
+    ring = TickRingBuffer(64, policy, block_timeout_seconds=5.0)
+    total = 100000
+    done = threading.Event()
+
+    def produce():
+        for seq in range(total):
+            ring.push(tick(seq))
+        done.set()
+
+    received = []
+    producer = threading.Thread(target=produce)
+    producer.start()
+    while not done.is_set() or len(ring):
+        item = ring.pop()
+        if item is None:
+            continue
+        assert item['price'] == item['volume'] * 0.5 == item['timestamp'] * 0.5, f"Torn tick: {item}"
+        received.append(item['volume'])
+    producer.join()
+    received.extend(drain(ring))
+    stats = ring.stats()
+    assert all(a < b for a, b in zip(received, received[1:])), "Ticks must stay in order without duplicates"
+    assert len(received) + stats['dropped'] == total, f"{policy}: lost ticks not counted ({stats})"
+    if policy == 'block':
+        assert stats['dropped'] == 0
+    print(f"✓ {policy}: {len(received)} received + {stats['dropped']} counted drops = {total}")
+print("✅ TEST 3 PASSED")
+
+# Test 4: BrokerAdapter hand-off
+print("\n" + "=" * 80)
+print("TEST 4: BrokerAdapter WebSocket ticks")
+print("=" * 80)
+
+config = deepcopy(DEFAULT_CONFIG)
+config['tick_buffer']['capacity'] = 8
+broker = BrokerAdapter(freeze_config(config), profile=get_run_profile('batch'))
+broker.streaming_mode = True
+for seq in range(1, 11):
+    broker._handle_websocket_tick({'price': float(seq), 'volume': 1, 'symbol': 'NIFTY'}, 'NIFTY')
+assert [broker.get_next_tick()['price'] for _ in range(8)] == [float(seq) for seq in range(3, 11)]
+assert broker.get_next_tick() is None
+assert broker.get_tick_buffer_stats()['dropped_oldest'] == 2
+
+broker.on_tick_callback = lambda t, symbol: None
+broker._handle_websocket_tick({'price': 11.0, 'volume': 1}, 'NIFTY')
+assert broker.get_tick_buffer_stats()['produced'] == 10, "Callback consumers bypass the ring"
+print("✓ Polling loop reads the ring; overflow is counted; callback mode bypasses it")
+print("✅ TEST 4 PASSED")
+
+# Test 5: Backlog conflation
+print("\n" + "=" * 80)
+print("TEST 5: Conflation merges a backlog into the freshest tick")
+print("=" * 80)
+
+ring = TickRingBuffer(64, conflator=TickConflator(threshold=4))
+burst = [100.0, 101.5, 97.0, 99.0, 104.0, 102.0]
+for seq, price in enumerate(burst[:3]):
+    ring.push({'timestamp': seq, 'price': price, 'volume': 10, 'symbol': 'NIFTY'})
+assert ring.pop_conflated()['price'] == 100.0, "Backlog within the threshold is delivered tick by tick"
+ring.pop_conflated(), ring.pop_conflated()
+for seq, price in enumerate(burst):
+    ring.push({'timestamp': seq, 'price': price, 'volume': 10, 'symbol': 'NIFTY'})
+merged = ring.pop_conflated()
+assert (merged['timestamp'], merged['price'], merged['volume']) == (5, 102.0, 60)
+assert (merged['open'], merged['high'], merged['low'], merged['conflated']) == (100.0, 104.0, 97.0, 6)
+assert merged['extremes'] == (97.0, 104.0), "Extremes keep the order they traded in"
+assert ring.pop_conflated() is None
+stats = ring.stats()
+assert (stats['conflation_events'], stats['conflated_ticks'], stats['consumed']) == (1, 6, 9)
+
+config = deepcopy(DEFAULT_CONFIG)
+config['tick_buffer']['conflate'] = True
+config['tick_buffer']['conflation_threshold'] = 5
+broker = BrokerAdapter(freeze_config(config), profile=get_run_profile('batch'))
+broker.streaming_mode = True
+for seq in range(1, 31):
+    broker._handle_websocket_tick({'price': float(seq), 'volume': 1, 'symbol': 'NIFTY'}, 'NIFTY')
+merged = broker.get_next_tick()
+assert merged['price'] == 30.0 and merged['conflated'] == 30 and broker.get_next_tick() is None
+assert broker.get_tick_buffer_stats()['conflation_events'] == 1
+print("✓ Latest price, summed volume, ordered high/low; counters report each conflation")
+print("✅ TEST 5 PASSED")
+
+# Test 6: Stop loss sees the intra-burst low
+print("\n" + "=" * 80)
+print("TEST 6: SL triggers on a low hidden inside a conflated tick")
+print("=" * 80)
+
+
+def open_trader():
+    live_trader = LiveTrader(frozen_config=freeze_config(deepcopy(DEFAULT_CONFIG)), profile='batch')
+    now = IST.localize(datetime(2025, 11, 3, 10, 0, 0))
+    live_trader.active_position_id = live_trader.position_manager.open_position(
+        DEFAULT_CONFIG['instrument']['symbol'], 100.0, now)
+    return live_trader, now
+
+
+conflator = TickConflator(threshold=2)
+live_trader, now = open_trader()
+stop_loss = live_trader.position_manager.positions[live_trader.active_position_id].stop_loss_price
+burst = [{'timestamp': now, 'price': price, 'volume': 10} for price in (100.0, stop_loss - 1.0, 100.5)]
+merged = conflator.merge(burst)
+process_positions(live_trader, merged, create_tick_row(merged, merged['price'], now), now)
+assert not live_trader.position_manager.positions, "SL must trigger on the burst low"
+exit_trade = live_trader.position_manager.completed_trades[-1]
+assert exit_trade.exit_price == stop_loss - 1.0 and exit_trade.exit_reason == 'Base SL'
+
+live_trader, now = open_trader()
+plain = dict(merged)
+del plain['extremes']
+process_positions(live_trader, plain, create_tick_row(plain, plain['price'], now), now)
+assert live_trader.position_manager.positions, "Last price alone is above the SL"
+print(f"✓ SL {stop_loss:.2f} hit at burst low {stop_loss - 1.0:.2f} although the merged price is 100.50")
+print("✅ TEST 6 PASSED")
+
+print("\n" + "=" * 80)
+print("ALL TICK RING BUFFER TESTS PASSED")
+print("=" * 80)
@@ -0,0 +1,207 @@
+"""
+Test: Structured Tracing (utils/logger.py TraceBuffer)
+Verifies typed event recording, ring-buffer wrap/flush semantics, strategy
+integration, the end-of-session flush in LiveTrader, lazy HighPerfLogger
+messages, the rejection log throttle, and that a disabled trace site costs
+< 50 ns.
+"""
+import sys
+import os
+import shutil
+import tempfile
+import timeit
+from datetime import datetime, timedelta
+from copy import deepcopy
+import logging
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '.')))
+
+from myQuant.config.defaults import DEFAULT_CONFIG
+from myQuant.utils.config_helper import freeze_config
+from myQuant.utils.time_utils import IST
+from myQuant.utils.logger import (
+    TraceBuffer, HighPerfLogger, get_tracer, configure_tracer, format_tick_message,
+    TRACE_TICK, TRACE_GREEN_TICK, TRACE_ENTRY_BLOCKED
+)
+from myQuant.core.liveStrategy import ModularIntradayStrategy
+from myQuant.live.trader import LiveTrader
+
+logging.disable(logging.CRITICAL)
+
+print("=" * 80)
+print("STRUCTURED TRACING TESTS")
+print("=" * 80)
+
+# Test 1: Buffer semantics
+print("\n" + "=" * 80)
+print("TEST 1: Record, wrap, flush")
+print("=" * 80)
+
+buffer = TraceBuffer(capacity=4)
+buffer.enabled = True
+for i in range(6):
+    buffer.record(TRACE_GREEN_TICK, 100.0 + i, 100.5 + i, 0.05, i)
+retained = list(buffer.events())
+assert len(retained) == 4 and retained[0][1][0] == 102.0, f"Ring buffer should keep newest 4, got {retained}"
+assert buffer.dropped == 2, f"Expected 2 dropped events, got {buffer.dropped}"
+
+messages = []
+buffer = TraceBuffer(capacity=4)
+buffer.enabled = True
+buffer.attach_sink(lambda code, fields, message: messages.append(message))
+for i in range(10):
+    buffer.record(TRACE_TICK, i, 100.0, 5)
+buffer.flush()
+assert len(messages) == 10 and buffer.dropped == 0, "Sink should receive every event (flush on wrap)"
+assert messages[3] == "[tick] Tick 3: 100.00 vol=5", f"Unexpected format: {messages[3]}"
+print(f"✓ Wrap keeps newest events; sink received {len(messages)} formatted events")
+print("✅ TEST 1 PASSED")
+
+# Test 2: Strategy hot path records typed events only when enabled
+print("\n" + "=" * 80)
+print("TEST 2: Strategy integration")
+print("=" * 80)
+
+strategy = ModularIntradayStrategy(freeze_config(deepcopy(DEFAULT_CONFIG)))
+start = datetime(2025, 11, 3, 9, 20, 0)
+ticks = [{'timestamp': IST.localize(start + timedelta(seconds=i)), 'price': 100.0 + 0.1 * (i % 7), 'volume': 10}
+         for i in range(200)]
+
+tracer = configure_tracer(False, 4096)
+for tick in ticks[:100]:
+    strategy.on_tick(tick)
+assert tracer.recorded == 0, "Disabled tracer must not record"
+
+configure_tracer(True)
+for tick in ticks[100:]:
+    strategy.on_tick(tick)
+codes = [code for code, _ in tracer.events()]
+assert codes.count(TRACE_TICK) == 100, f"Expected one TICK per on_tick, got {codes.count(TRACE_TICK)}"
+assert TRACE_ENTRY_BLOCKED in codes, "Pre-session ticks should record ENTRY_BLOCKED"
+configure_tracer(False)
+print(f"✓ {tracer.recorded} events recorded while enabled, 0 while disabled")
+print("✅ TEST 2 PASSED")
+
+# Test 3: Disabled-site overhead benchmark
+print("\n" + "=" * 80)
+print("TEST 3: Disabled site overhead")
+print("=" * 80)
+
+
+class Site:
+    def __init__(self):
+        self.tracer = get_tracer()
+        self.prev_tick_price = 100.0
+
+
+site = Site()
+price, min_movement, count = 100.25, 0.05, 3
+number = 2_000_000
+setup_ns = {'site': site, 'price': price, 'min_movement': min_movement, 'count': count,
+            'TRACE_GREEN_TICK': TRACE_GREEN_TICK, 'format_tick_message': format_tick_message}
+
+baseline = min(timeit.repeat("pass", globals=setup_ns, number=number, repeat=5))
+guarded = min(timeit.repeat(
+    "if site.tracer.enabled: site.tracer.record(TRACE_GREEN_TICK, site.prev_tick_price, price, min_movement, count)",
+    globals=setup_ns, number=number, repeat=5))
+eager = min(timeit.repeat(
+    "f'Green tick: {site.prev_tick_price:.2f} -> {price:.2f} (delta: {price - site.prev_tick_price:.2f} > {min_movement:.2f}), count={count}'",
+    globals=setup_ns, number=number, repeat=5))
+
+per_site_ns = (guarded - baseline) / number * 1e9
+eager_ns = (eager - baseline) / number * 1e9
+print(f"✓ Disabled trace site: {per_site_ns:.1f} ns (eager f-string previously: {eager_ns:.1f} ns)")
+assert per_site_ns < 50, f"Disabled trace site too slow: {per_site_ns:.1f} ns"
+print("✅ TEST 3 PASSED")
+
+# Test 4: Live sessions flush on exit
+print("\n" + "=" * 80)
+print("TEST 4: LiveTrader flushes buffered events when the session ends")
+print("=" * 80)
+
+tmp = tempfile.mkdtemp()
+csv_path = os.path.join(tmp, 'ticks.csv')
+with open(csv_path, 'w') as f:
+    f.write("timestamp,close\n")
+    for i in range(300):
+        f.write(f"{(start + timedelta(seconds=3 * i)).strftime('%Y-%m-%d %H:%M:%S')},{100.0 + 0.1 * (i % 7):.2f}\n")
+config = deepcopy(DEFAULT_CONFIG)
+config['data_simulation'] = {'enabled': True, 'file_path': csv_path}
+
+for mode in ('polling', 'callback'):
+    delivered = []
+    tracer = configure_tracer(True, 65536)
+    tracer.clear()
+    tracer.attach_sink(lambda code, fields, message: delivered.append(code))
+    trader = LiveTrader(frozen_config=freeze_config(config), profile='batch')
+    trader.use_direct_callbacks = mode == 'callback'
+    trader.start()
+    assert tracer.recorded > 0 and len(delivered) == tracer.recorded, \
+        f"{mode}: {len(delivered)} of {tracer.recorded} events reached the sink"
+    print(f"✓ {mode}: all {len(delivered)} events delivered at session end (buffer never wrapped)")
+configure_tracer(False)
+shutil.rmtree(tmp, ignore_errors=True)
+print("✅ TEST 4 PASSED")
+
+# Test 5: Lazy session messages
+print("\n" + "=" * 80)
+print("TEST 5: HighPerfLogger.session_start formats callables only when INFO is enabled")
+print("=" * 80)
+
+formatted = []
+perf = HighPerfLogger("test.lazy_session", freeze_config(deepcopy(DEFAULT_CONFIG)))
+perf.session_start(lambda: formatted.append("disabled") or "disabled")
+logging.disable(logging.NOTSET)
+perf.logger.setLevel(logging.INFO)
+perf.session_start(lambda: formatted.append("enabled") or "enabled")
+perf.logger.setLevel(logging.WARNING)
+perf.session_start(lambda: formatted.append("warning level") or "warning level")
+logging.disable(logging.CRITICAL)
+assert formatted == ["enabled"], f"Callable evaluated at the wrong levels: {formatted}"
+print("✓ Callable message skipped when INFO is off, formatted once when on")
+print("✅ TEST 5 PASSED")
+
+# Test 6: Rejection log throttle
+print("\n" + "=" * 80)
+print("TEST 6: Entry rejections logged every 300 ticks or 30s of tick time")
+print("=" * 80)
+
+
+class RejectionCounter(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+
+    def emit(self, record):
+        self.count += 'Entry REJECTED' in record.getMessage()
+
+
+strategy_logger = logging.getLogger('myQuant.core.liveStrategy')
+counter = RejectionCounter()
+strategy_logger.addHandler(counter)
+strategy_logger.propagate = False
+strategy_logger.setLevel(logging.INFO)
+logging.disable(logging.NOTSET)
+session = IST.localize(datetime(2025, 11, 3, 10, 0, 0))
+
+slow = ModularIntradayStrategy(freeze_config(deepcopy(DEFAULT_CONFIG)))
+assert not any(slow.entry_signal({'timestamp': session + timedelta(seconds=i), 'close': 100.0}) for i in range(100))
+slow_logs, counter.count = counter.count, 0
+
+burst = ModularIntradayStrategy(freeze_config(deepcopy(DEFAULT_CONFIG)))
+for _ in range(1000):
+    burst.entry_signal({'timestamp': session, 'close': 100.0})
+burst_logs = counter.count
+
+logging.disable(logging.CRITICAL)
+strategy_logger.removeHandler(counter)
+strategy_logger.propagate = True
+assert slow_logs == 4, f"1 tick/s for 100s should log at 0s, 31s, 62s, 93s; got {slow_logs}"
+assert burst_logs == 4, f"1000 ticks in one second should log at 1, 301, 601, 901; got {burst_logs}"
+print(f"✓ 100 rejections over 100s -> {slow_logs} logs; 1000 in one second -> {burst_logs} logs")
+print("✅ TEST 6 PASSED")
+
+print("\n" + "=" * 80)
+print("ALL TRACING TESTS PASSED")
+print("=" * 80)